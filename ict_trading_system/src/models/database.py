@@ -1,9 +1,10 @@
 from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 import datetime
 from ict_trading_system.config import settings
+from reasoner_service.db_engine import create_engine as create_pooled_engine
 
 Base = declarative_base()
 
@@ -80,11 +81,8 @@ elif raw_url.startswith('mysql://'):
 else:
     raise ValueError(f"Unsupported DB URL: {raw_url}")
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    future=True
-)
+# shared factory: configurable pooling and pool metrics (DB_POOL_* settings)
+engine = create_pooled_engine(DATABASE_URL, name="ict_trading_system")
 SessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 async def init_db():
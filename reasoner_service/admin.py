@@ -39,10 +39,32 @@ async def dlq_list(max_items: int = 100) -> Dict[str, Any]:
             raise HTTPException(status_code=500, detail=str(e))
     else:
         async with orch._dlq_lock:
-            items = list(orch._persist_dlq)[:max_items]
+            dlq = orch._persist_dlq
+            # PersistDLQ.peek avoids copying the whole queue; plain lists still work
+            items = dlq.peek(max_items) if hasattr(dlq, "peek") else list(dlq)[:max_items]
     return {"count": len(items), "items": items}
 
 
+@router.get("/loop")
+async def loop_health() -> Dict[str, Any]:
+    if not _bound_orchestrator:
+        raise HTTPException(status_code=500, detail="orchestrator not bound")
+    monitor = getattr(_bound_orchestrator, "_loop_monitor", None)
+    if monitor is None:
+        return {"running": False}
+    return {**monitor.snapshot(), "top_tasks": monitor.top_tasks()}
+
+
+@router.get("/db")
+async def db_pools() -> Dict[str, Any]:
+    from .db_engine import engines_status
+    result: Dict[str, Any] = {"engines": engines_status()}
+    router = getattr(_bound_orchestrator, "_read_sessionmaker", None)
+    if hasattr(router, "status"):
+        result["replica"] = router.status()
+    return result
+
+
 @router.post("/dlq/requeue")
 async def dlq_requeue_all(x_admin_token: str = Header(None, alias="X-Admin-Token")):
     if not _bound_orchestrator:
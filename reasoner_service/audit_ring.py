@@ -0,0 +1,235 @@
+"""
+Bounded in-memory audit trails.
+
+The orchestrator's policy audit, the shadow-mode audit trail and the outcome
+policy evaluator's log used to be plain lists appended on every decision, so a
+long-lived process grew without bound. AuditRing is a fixed-capacity ring of
+``__slots__`` records (sequence number, timestamp, entry):
+
+- appends are O(1); once full, the oldest record is evicted;
+- evicted records can be spilled to an append-only JSONL file. Spills are
+  batched and written on a single background thread so the decision path
+  never blocks on disk, and nothing is silently lost;
+- ``tail`` and ``page`` read a window by index/sequence number without
+  copying the whole buffer.
+
+The class keeps the list-like surface (append/extend/clear/len/iter/indexing/
+slicing and equality with lists) that callers and tests already use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+_spill_pool: Optional[ThreadPoolExecutor] = None
+_spill_pool_lock = threading.Lock()
+
+
+def _get_spill_pool() -> ThreadPoolExecutor:
+    # one writer thread keeps spill batches in order
+    global _spill_pool
+    with _spill_pool_lock:
+        if _spill_pool is None:
+            _spill_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-spill")
+        return _spill_pool
+
+
+def _jsonable(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def spill_path_for(name: str) -> Optional[str]:
+    """JSONL spill path for an audit ring under AUDIT_SPILL_DIR, or None when spilling is off."""
+    from .config import get_settings
+
+    spill_dir = getattr(get_settings(), "AUDIT_SPILL_DIR", "")
+    return os.path.join(spill_dir, f"{name}.jsonl") if spill_dir else None
+
+
+class AuditRecord:
+    """One audit entry with its ring sequence number and append time."""
+
+    __slots__ = ("seq", "ts", "entry")
+
+    def __init__(self, seq: int, ts: float, entry: Any):
+        self.seq = seq
+        self.ts = ts
+        self.entry = entry
+
+
+class AuditRing:
+    """Fixed-capacity ring buffer of audit entries with optional JSONL spill.
+
+    Not thread-safe; callers append from the event loop.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        name: str = "audit",
+        spill_path: Optional[str] = None,
+        spill_batch: int = 256,
+        entries: Optional[Iterable[Any]] = None,
+    ):
+        self.capacity = max(1, int(capacity))
+        self.name = name
+        self.spill_path = spill_path or None
+        self.spill_batch = max(1, int(spill_batch))
+        self.evicted_count = 0
+        self._buf: List[Optional[AuditRecord]] = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._next_seq = 0
+        self._pending_spill: List[AuditRecord] = []
+        if entries is not None:
+            self.extend(entries)
+
+    # --- list-compatible surface ---
+
+    def append(self, entry: Any) -> None:
+        rec = AuditRecord(self._next_seq, time.time(), entry)
+        self._next_seq += 1
+        if self._size < self.capacity:
+            self._buf[(self._head + self._size) % self.capacity] = rec
+            self._size += 1
+            return
+        evicted = self._buf[self._head]
+        self._buf[self._head] = rec
+        self._head = (self._head + 1) % self.capacity
+        self.evicted_count += 1
+        if self.spill_path and evicted is not None:
+            self._pending_spill.append(evicted)
+            if len(self._pending_spill) >= self.spill_batch:
+                self._schedule_spill()
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self) -> None:
+        """Drop buffered entries (pending spills are written first)."""
+        self.flush()
+        self._reset()
+
+    async def aclear(self) -> None:
+        """clear() for coroutines: waits for the spill writes without blocking the event loop."""
+        await self.aflush()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buf = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+
+    def _record(self, i: int) -> AuditRecord:
+        return self._buf[(self._head + i) % self.capacity]  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        # oldest first; no copy of the buffer
+        return (self._record(i).entry for i in range(self._size))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (self._record(i).entry for i in range(self._size - 1, -1, -1))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i).entry for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("audit ring index out of range")
+        return self._record(index).entry
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (AuditRing, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AuditRing(name={self.name!r}, size={self._size}, capacity={self.capacity})"
+
+    # --- windowed readers ---
+
+    def tail(self, limit: Optional[int] = None) -> List[Any]:
+        """Return up to ``limit`` most recent entries, newest first."""
+        n = self._size if limit is None else max(0, min(int(limit), self._size))
+        return [self._record(self._size - 1 - i).entry for i in range(n)]
+
+    def page(
+        self, cursor: Optional[int] = None, limit: int = 100, newest_first: bool = True
+    ) -> Tuple[List[Any], Optional[int]]:
+        """Return one page of entries and the cursor for the next page (None when done).
+
+        Cursors are record sequence numbers, so pages stay stable while new
+        entries are appended. Newest-first pages return records older than
+        ``cursor``; oldest-first pages return records from ``cursor`` on.
+        Records evicted since the cursor was issued are skipped.
+        """
+        limit = max(1, int(limit))
+        first_seq = self._next_seq - self._size
+        if newest_first:
+            end = self._size if cursor is None else max(0, min(self._size, cursor - first_seq))
+            start = max(0, end - limit)
+            entries = [self._record(i).entry for i in range(end - 1, start - 1, -1)]
+            return entries, (first_seq + start if start > 0 else None)
+        start = 0 if cursor is None else max(0, min(self._size, cursor - first_seq))
+        end = min(self._size, start + limit)
+        entries = [self._record(i).entry for i in range(start, end)]
+        return entries, (first_seq + end if end < self._size else None)
+
+    # --- spill ---
+
+    def _write_spill(self, records: List[AuditRecord]) -> None:
+        if not records:
+            return
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:  # type: ignore[arg-type]
+                for rec in records:
+                    f.write(json.dumps({"seq": rec.seq, "ts": rec.ts, "entry": rec.entry}, default=_jsonable) + "\n")
+        except Exception:
+            logger.exception("failed to spill %d %s audit records to %s", len(records), self.name, self.spill_path)
+
+    def _schedule_spill(self) -> None:
+        records, self._pending_spill = self._pending_spill, []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_spill(records)
+            return
+        _get_spill_pool().submit(self._write_spill, records)
+
+    def flush(self) -> None:
+        """Wait for queued spill batches, then write any pending evicted records."""
+        if _spill_pool is not None:
+            # a no-op queued behind earlier batches keeps the file in sequence order
+            _spill_pool.submit(lambda: None).result()
+        if self._pending_spill:
+            records, self._pending_spill = self._pending_spill, []
+            self._write_spill(records)
+
+    async def aflush(self) -> None:
+        """flush() for coroutines: pending records go to the spill thread, which is awaited."""
+        records, self._pending_spill = self._pending_spill, []
+        if not records and _spill_pool is None:
+            return
+        # queued behind earlier batches, so awaiting it also waits for them
+        await asyncio.get_running_loop().run_in_executor(_get_spill_pool(), self._write_spill, records)
@@ -0,0 +1,121 @@
+"""
+Bounded background executor for observational pipeline stages.
+
+Shadow-mode evaluation and paper trading only observe a decision; nothing on
+the persist -> notify path depends on their results. BackgroundExecutor runs
+such work on a small pool of worker tasks fed by a bounded asyncio.Queue so the
+critical path only pays for an enqueue. When the queue is full new work is
+dropped (and counted) rather than applying backpressure to decision handling.
+
+Example:
+    executor = BackgroundExecutor("observers", workers=2, max_queue=1000)
+    executor.submit(evaluate_decision_shadow, decision)
+    ...
+    await executor.close(drain_timeout=5.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from .metrics import background_queue_depth, background_tasks_dropped_total
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundExecutor:
+    """Fixed pool of worker tasks draining a bounded job queue.
+
+    Workers start lazily on the first submit, so the executor can be created
+    outside a running event loop. Job errors are logged and never propagate.
+    """
+
+    def __init__(self, name: str, workers: int = 2, max_queue: int = 1000):
+        self.name = name
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped = 0
+
+    def _ensure_started(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # (re)bind to the current loop; queues cannot be shared across loops
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._loop = loop
+            self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        return self._queue
+
+    def submit(self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> bool:
+        """Schedule ``fn(*args, **kwargs)``; returns False if the queue was full."""
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait((fn, args, kwargs))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            try:
+                background_tasks_dropped_total.labels(executor=self.name).inc()
+            except Exception:
+                pass
+            logger.warning("%s executor queue full (%d); dropping job %s", self.name, self.max_queue, getattr(fn, "__name__", fn))
+            return False
+        self._set_depth(queue)
+        return True
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued jobs have finished; returns False on timeout."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning("%s executor drain timed out with %d job(s) pending", self.name, self._queue.qsize())
+            return False
+
+    async def close(self, drain_timeout: Optional[float] = 5.0) -> None:
+        """Drain outstanding jobs (bounded by drain_timeout) and stop the workers."""
+        if self._queue is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await self.drain(drain_timeout)
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            except Exception:
+                logger.exception("error stopping %s executor worker", self.name)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+
+    def _set_depth(self, queue: asyncio.Queue) -> None:
+        try:
+            background_queue_depth.labels(executor=self.name).set(queue.qsize())
+        except Exception:
+            pass
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            fn, args, kwargs = await queue.get()
+            try:
+                await fn(*args, **kwargs)
+            except asyncio.CancelledError:
+                queue.task_done()
+                raise
+            except Exception:
+                logger.exception("%s executor job %s failed", self.name, getattr(fn, "__name__", fn))
+            queue.task_done()
+            self._set_depth(queue)
@@ -19,16 +19,102 @@ class Settings:
     DLQ_BASE_DELAY_SECONDS: float = float(os.getenv("DLQ_BASE_DELAY_SECONDS", "1"))
     DLQ_MAX_DELAY_SECONDS: float = float(os.getenv("DLQ_MAX_DELAY_SECONDS", "60"))
     DLQ_MAX_RETRIES: int = int(os.getenv("DLQ_MAX_RETRIES", "5"))
+    # max entries drained from the Redis DLQ per round-trip (1 = legacy single LPOP)
+    DLQ_BATCH_SIZE: int = int(os.getenv("DLQ_BATCH_SIZE", "100"))
+    # in-memory DLQ cap; entries beyond it are appended to a JSONL spill file and
+    # replayed on startup and when the queue drains. DLQ_SPILL_PATH overrides the
+    # default <DLQ_SPILL_DIR>/persist_dlq.jsonl; use one file per process.
+    DLQ_MEMORY_MAX_ENTRIES: int = int(os.getenv("DLQ_MEMORY_MAX_ENTRIES", "10000"))
+    DLQ_SPILL_DIR: str = os.getenv("DLQ_SPILL_DIR", os.path.join(os.path.expanduser("~"), ".reasoner_service", "dlq"))
+    DLQ_SPILL_PATH: str = os.getenv("DLQ_SPILL_PATH", "")
     # Redis dedup settings (SETNX with TTL)
     REDIS_DEDUP_ENABLED: bool = bool(int(os.getenv("REDIS_DEDUP_ENABLED", "0")))
     REDIS_DEDUP_PREFIX: str = os.getenv("REDIS_DEDUP_PREFIX", "dedup:")
     REDIS_DEDUP_TTL_SECONDS: int = int(os.getenv("REDIS_DEDUP_TTL_SECONDS", "60"))
+    # Shared orchestrator state for multi-replica deployments: local | redis
+    # ("memory" is an in-process SharedState backend, for tests and single-process runs)
+    SHARED_STATE_BACKEND: str = os.getenv("SHARED_STATE_BACKEND", "local")
+    SHARED_STATE_PREFIX: str = os.getenv("SHARED_STATE_PREFIX", "orch:")
+    # policy pass/veto/defer counts are pushed to shared state in one batch per interval
+    POLICY_COUNTER_FLUSH_SECONDS: float = float(os.getenv("POLICY_COUNTER_FLUSH_SECONDS", "1"))
     # Redis reconnect jitter and circuit-breaker
     REDIS_RECONNECT_MAX_ATTEMPTS: int = int(os.getenv("REDIS_RECONNECT_MAX_ATTEMPTS", "5"))
     REDIS_RECONNECT_BASE_DELAY: float = float(os.getenv("REDIS_RECONNECT_BASE_DELAY", "0.5"))
     REDIS_RECONNECT_MAX_DELAY: float = float(os.getenv("REDIS_RECONNECT_MAX_DELAY", "10"))
     REDIS_RECONNECT_JITTER_MS: int = int(os.getenv("REDIS_RECONNECT_JITTER_MS", "250"))
     REDIS_CIRCUIT_COOLDOWN_SECONDS: float = float(os.getenv("REDIS_CIRCUIT_COOLDOWN_SECONDS", "60"))
+    # Memory-recall outcome cache; bounds staleness from writers in other processes
+    OUTCOME_RECALL_CACHE_TTL_SECONDS: float = float(os.getenv("OUTCOME_RECALL_CACHE_TTL_SECONDS", "60"))
+    # PolicyStore result cache for remote backends (HTTP, Redis); misses use the negative TTL
+    POLICY_CACHE_TTL_SECONDS: float = float(os.getenv("POLICY_CACHE_TTL_SECONDS", "30"))
+    POLICY_CACHE_NEGATIVE_TTL_SECONDS: float = float(os.getenv("POLICY_CACHE_NEGATIVE_TTL_SECONDS", "5"))
+    POLICY_CACHE_MAX_ENTRIES: int = int(os.getenv("POLICY_CACHE_MAX_ENTRIES", "4096"))
+    # context fields a cached policy result is keyed on (backends may override); "*" keys on the
+    # whole context, which includes per-decision ids/timestamps and defeats the cache. Keep every
+    # field a policy answer reads (the killzone/regime/cooldown/exposure markers, confidence).
+    POLICY_CACHE_KEY_FIELDS: str = os.getenv(
+        "POLICY_CACHE_KEY_FIELDS",
+        "symbol,timeframe,signal_type,direction,session,model,recommendation,"
+        "killzone,regime,cooldown_until,exposure,max_exposure,confidence",
+    )
+    # HTTP policy backend: hot-path deadline, connection pool, circuit breaker, stale serving
+    POLICY_HTTP_DEADLINE_SECONDS: float = float(os.getenv("POLICY_HTTP_DEADLINE_SECONDS", "0.15"))
+    POLICY_HTTP_POOL_SIZE: int = int(os.getenv("POLICY_HTTP_POOL_SIZE", "20"))
+    POLICY_HTTP_FAILURE_THRESHOLD: int = int(os.getenv("POLICY_HTTP_FAILURE_THRESHOLD", "5"))
+    POLICY_HTTP_RESET_SECONDS: float = float(os.getenv("POLICY_HTTP_RESET_SECONDS", "30"))
+    POLICY_HTTP_MAX_STALE_SECONDS: float = float(os.getenv("POLICY_HTTP_MAX_STALE_SECONDS", "600"))
+    POLICY_HTTP_PREFETCH_INTERVAL_SECONDS: float = float(os.getenv("POLICY_HTTP_PREFETCH_INTERVAL_SECONDS", "15"))
+    # besides the configured prefetch names, at most this many keys hit since the last pass are refreshed
+    POLICY_HTTP_PREFETCH_MAX_KEYS: int = int(os.getenv("POLICY_HTTP_PREFETCH_MAX_KEYS", "32"))
+    # Database engine pooling (reasoner_service.db_engine); not applied to in-memory SQLite.
+    # DB_STATEMENT_CACHE_SIZE is asyncpg's prepared-statement cache; use 0 behind pgbouncer (transaction mode)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_PRE_PING: bool = bool(int(os.getenv("DB_POOL_PRE_PING", "1")))
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    # Optional read replica for read-only services (stats, analytics, snapshot refresher);
+    # reads fall back to the primary when its lag exceeds DB_REPLICA_MAX_LAG_SECONDS or it errors
+    DB_REPLICA_DSN: str = os.getenv("DB_REPLICA_DSN", "")
+    DB_REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))
+    DB_REPLICA_CHECK_SECONDS: float = float(os.getenv("DB_REPLICA_CHECK_SECONDS", "10"))
+    # Per-day outcome rollup tables, maintained on insert and read by OutcomeStatsService once
+    # backfilled (scripts/rebuild_outcome_rollups.py; automatic while decision_outcomes is empty)
+    OUTCOME_ROLLUPS_ENABLED: bool = bool(int(os.getenv("OUTCOME_ROLLUPS_ENABLED", "1")))
+    # Retention job (scripts/archive_decisions.py): decisions/notification logs older than
+    # this many days move to gzip JSONL archives in DECISION_ARCHIVE_DIR; 0 keeps everything
+    DECISION_RETENTION_DAYS: int = int(os.getenv("DECISION_RETENTION_DAYS", "0"))
+    DECISION_ARCHIVE_DIR: str = os.getenv("DECISION_ARCHIVE_DIR", "./archive")
+    # "binary" stores each decision's raw/decision_text as one compressed payload (msgpack+zstd when
+    # installed, else JSON+zlib); "json" keeps both columns. Readers handle rows in either format.
+    DECISION_STORAGE_FORMAT: str = os.getenv("DECISION_STORAGE_FORMAT", "json")
+    # OutcomeStatsService query cache (invalidated on outcome inserts; 0 disables the TTL layer)
+    OUTCOME_STATS_CACHE_TTL_SECONDS: float = float(os.getenv("OUTCOME_STATS_CACHE_TTL_SECONDS", "60"))
+    OUTCOME_STATS_CACHE_MAX_ENTRIES: int = int(os.getenv("OUTCOME_STATS_CACHE_MAX_ENTRIES", "4096"))
+    # Background outcome metrics snapshot for the policy hot path (0 disables the refresher)
+    OUTCOME_SNAPSHOT_REFRESH_SECONDS: float = float(os.getenv("OUTCOME_SNAPSHOT_REFRESH_SECONDS", "60"))
+    OUTCOME_SNAPSHOT_MIN_REFRESH_SECONDS: float = float(os.getenv("OUTCOME_SNAPSHOT_MIN_REFRESH_SECONDS", "5"))
+    # passes fold in only new outcomes; the running totals are rebuilt from scratch this often
+    OUTCOME_SNAPSHOT_FULL_REBUILD_SECONDS: float = float(os.getenv("OUTCOME_SNAPSHOT_FULL_REBUILD_SECONDS", "3600"))
+    # feed the refreshed snapshot to the pre-reasoning outcome veto (ignored when METRICS_SNAPSHOT_PATH is set)
+    OUTCOME_VETO_LIVE_SNAPSHOT: bool = bool(int(os.getenv("OUTCOME_VETO_LIVE_SNAPSHOT", "0")))
+    # Event-loop monitor: heartbeat interval (0 disables) and stall threshold for stack capture
+    LOOP_MONITOR_INTERVAL_SECONDS: float = float(os.getenv("LOOP_MONITOR_INTERVAL_SECONDS", "0.5"))
+    LOOP_SLOW_CALLBACK_SECONDS: float = float(os.getenv("LOOP_SLOW_CALLBACK_SECONDS", "0.1"))
+    # Observational decision stages (shadow mode, paper trade): "background" or "inline"
+    OBSERVER_STAGES_MODE: str = os.getenv("OBSERVER_STAGES_MODE", "background")
+    OBSERVER_WORKERS: int = int(os.getenv("OBSERVER_WORKERS", "2"))
+    OBSERVER_QUEUE_SIZE: int = int(os.getenv("OBSERVER_QUEUE_SIZE", "1000"))
+    # Optional JSON routing file (rules/overrides/table), hot-reloaded on mtime change
+    ROUTING_CONFIG_PATH: str = os.getenv("ROUTING_CONFIG_PATH", "")
+    ROUTING_RELOAD_INTERVAL_SECONDS: float = float(os.getenv("ROUTING_RELOAD_INTERVAL_SECONDS", "5"))
+    # In-memory audit trails are rings of this many entries; evicted entries are
+    # appended to <AUDIT_SPILL_DIR>/<trail>.jsonl when a directory is set
+    AUDIT_RING_CAPACITY: int = int(os.getenv("AUDIT_RING_CAPACITY", "10000"))
+    AUDIT_SPILL_DIR: str = os.getenv("AUDIT_SPILL_DIR", "")
+    # Optional OpenTelemetry-style span export (JSONL); empty disables export
+    TRACE_EXPORT_PATH: str = os.getenv("TRACE_EXPORT_PATH", "")
     # Admin API token for basic protection of requeue/flush endpoints
     ADMIN_TOKEN: str = os.getenv("REASONER_ADMIN_TOKEN", "")
     # Feature toggles for Plan Executor
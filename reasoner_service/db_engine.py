@@ -0,0 +1,162 @@
+"""
+Shared async engine factory with configurable pooling and pool metrics.
+
+Every engine in the tree (reasoner_service.storage, the ict_trading_system
+models) is built by ``create_engine`` so pooling is tuned in one place:
+
+- DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT_SECONDS /
+  DB_POOL_RECYCLE_SECONDS / DB_POOL_PRE_PING configure the queue pool;
+- DB_STATEMENT_CACHE_SIZE sets asyncpg's prepared-statement caches (set 0
+  behind pgbouncer in transaction mode);
+- per engine, ``db_pool_checked_out`` / ``db_pool_overflow`` /
+  ``db_pool_size`` gauges track pool occupancy and ``db_pool_wait_seconds``
+  records how long callers waited for a connection, so starvation shows up
+  before requests start timing out.
+
+In-memory SQLite keeps SQLAlchemy's single shared connection (StaticPool);
+pool sizing does not apply to it.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .config import get_settings
+from .metrics import db_pool_checked_out, db_pool_overflow, db_pool_size, db_pool_timeouts_total, db_pool_wait_seconds
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DSN = "sqlite+aiosqlite:///./decisions.db"
+
+# name -> engine, for health reporting; engines drop out when disposed of and collected
+_engines: "weakref.WeakValueDictionary[str, AsyncEngine]" = weakref.WeakValueDictionary()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    engine_name = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            try:
+                db_pool_timeouts_total.labels(self.engine_name).inc()
+            except Exception:
+                pass
+            raise
+        finally:
+            try:
+                db_pool_wait_seconds.labels(self.engine_name).observe(time.perf_counter() - started)
+            except Exception:
+                pass
+
+
+_pool_classes: Dict[str, type] = {}
+
+
+def _pool_class(name: str) -> type:
+    # the name lives on the class so it survives pool.recreate() on dispose
+    cls = _pool_classes.get(name)
+    if cls is None:
+        cls = _pool_classes[name] = type("TimedQueuePool", (TimedQueuePool,), {"engine_name": name})
+    return cls
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(dsn: str, cfg: Any = None) -> Dict[str, Any]:
+    """create_async_engine keyword arguments for ``dsn`` under the configured pool settings."""
+    cfg = cfg or get_settings()
+    url = make_url(dsn)
+    options: Dict[str, Any] = {"echo": False, "future": True}
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=int(getattr(cfg, "DB_POOL_SIZE", 5)),
+        max_overflow=int(getattr(cfg, "DB_MAX_OVERFLOW", 10)),
+        pool_timeout=float(getattr(cfg, "DB_POOL_TIMEOUT_SECONDS", 30)),
+        pool_recycle=int(getattr(cfg, "DB_POOL_RECYCLE_SECONDS", 1800)),
+        # a local SQLite file never goes stale; only ping network databases
+        pool_pre_ping=bool(getattr(cfg, "DB_POOL_PRE_PING", True)) and url.get_backend_name() != "sqlite",
+    )
+    if url.get_driver_name() == "asyncpg":
+        cache_size = int(getattr(cfg, "DB_STATEMENT_CACHE_SIZE", 100))
+        # SQLAlchemy's adapter-level cache and asyncpg's own per-connection cache
+        options["connect_args"] = {
+            "prepared_statement_cache_size": cache_size,
+            "statement_cache_size": cache_size,
+        }
+    return options
+
+
+def _instrument(engine: AsyncEngine, name: str) -> None:
+    def _publish(returning: int = 0) -> None:
+        current = engine.sync_engine.pool
+        if not isinstance(current, AsyncAdaptedQueuePool):
+            return
+        try:
+            db_pool_checked_out.labels(name).set(current.checkedout() - returning)
+            db_pool_overflow.labels(name).set(max(0, current.overflow()))
+            db_pool_size.labels(name).set(current.size())
+        except Exception:
+            pass
+
+    event.listen(engine.sync_engine, "checkout", lambda *_: _publish())
+    # checkin fires before the connection is back in the pool
+    event.listen(engine.sync_engine, "checkin", lambda *_: _publish(returning=1))
+    _publish()
+
+
+def create_engine(dsn: Optional[str] = None, name: str = "default", **overrides: Any) -> AsyncEngine:
+    """
+    Build an AsyncEngine with the configured pool settings and pool metrics.
+
+    ``overrides`` are passed to create_async_engine on top of the defaults
+    from engine_options. ``name`` labels the pool metrics and pool_status.
+    """
+    dsn = dsn or DEFAULT_DSN
+    options = engine_options(dsn)
+    if options.get("poolclass") is TimedQueuePool:
+        options["poolclass"] = _pool_class(name)
+    options.update(overrides)
+    engine = create_async_engine(dsn, **options)
+    _instrument(engine, name)
+    _engines[name] = engine
+    return engine
+
+
+def pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    """Point-in-time pool occupancy for ``engine``."""
+    pool = engine.sync_engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            checked_out=pool.checkedout(),
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    return status
+
+
+def engines_status() -> Dict[str, Dict[str, Any]]:
+    """pool_status for every live engine built by create_engine, keyed by name."""
+    return {name: pool_status(engine) for name, engine in list(_engines.items())}
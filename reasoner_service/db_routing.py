@@ -0,0 +1,237 @@
+"""
+Read/write split for the storage layer.
+
+Read-only services (OutcomeStatsService, OutcomeAnalyticsService, the outcome
+snapshot refresher, storage read helpers) take a sessionmaker. Handing them a
+ReadRouter instead sends their queries to a replica, so a heavy analytics
+report does not compete with decision persistence on the primary.
+
+Routing is lag-aware and falls back to the primary on its own:
+
+- every ``check_interval`` seconds (lazily, on the next read) the replica's lag
+  is probed; above ``max_lag`` reads go to the primary until a later probe
+  finds it caught up;
+- a probe that fails, or a connection/operational error on a replica query,
+  marks the replica down for ``check_interval`` and the query is retried once
+  on the primary (reads only, so the retry is safe).
+
+Lag probes: on Postgres, the replay delay reported by the standby
+(``pg_last_xact_replay_timestamp``; 0 when it has replayed everything it
+received). Elsewhere, how far the newest decision_outcomes.created_at on the
+replica trails the primary's, which also covers file-copy replicas such as
+two SQLite files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker as make_sessionmaker
+
+from .metrics import db_reads_routed_total, db_replica_lag_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# errors that mean "this replica cannot serve the read", not "the query is wrong"
+_REPLICA_ERRORS = (OperationalError, InterfaceError, ConnectionError, OSError)
+
+_PG_REPLAY_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+LagProbe = Callable[["ReadRouter"], Awaitable[float]]
+
+
+async def _newest_outcome(sessionmaker) -> Any:
+    from .storage import DecisionOutcome
+
+    async with sessionmaker() as session:
+        return (await session.execute(select(func.max(DecisionOutcome.created_at)))).scalar()
+
+
+async def default_lag_probe(router: "ReadRouter") -> float:
+    """Replica lag in seconds (see module docstring)."""
+    bind = router.replica.kw.get("bind")
+    if bind is not None and bind.url.get_backend_name() == "postgresql":
+        async with router.replica() as session:
+            lag = (await session.execute(_PG_REPLAY_LAG)).scalar()
+        return float(lag or 0.0)
+    replica_newest = await _newest_outcome(router.replica)
+    primary_newest = await _newest_outcome(router.primary)
+    if primary_newest is None:
+        return 0.0
+    if replica_newest is None:
+        return math.inf
+    return max(0.0, (primary_newest - replica_newest).total_seconds())
+
+
+class ReadRouter:
+    """Sessionmaker-compatible router: replica when healthy and caught up, else primary."""
+
+    def __init__(
+        self,
+        primary: Any,
+        replica: Any,
+        max_lag: float = 30.0,
+        check_interval: float = 10.0,
+        lag_probe: Optional[LagProbe] = None,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag = float(max_lag)
+        self.check_interval = float(check_interval)
+        self.lag_probe = lag_probe or default_lag_probe
+        self.lag: Optional[float] = None
+        self.replica_ok = False
+        self.last_error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._probe_lock = asyncio.Lock()
+
+    def __call__(self) -> "RoutedSession":
+        return RoutedSession(self)
+
+    async def use_replica(self) -> bool:
+        """Decide where the next read goes, probing the replica if the last check is stale."""
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.check_interval:
+            if not self._probe_lock.locked():
+                async with self._probe_lock:
+                    await self._probe()
+        return self.replica_ok
+
+    async def _probe(self) -> None:
+        try:
+            self.lag = await self.lag_probe(self)
+            self.replica_ok = self.lag <= self.max_lag
+            self.last_error = None
+            if not self.replica_ok:
+                logger.warning("replica lag %.1fs exceeds %.1fs; reading from primary", self.lag, self.max_lag)
+        except Exception as exc:
+            self.lag = None
+            self.replica_ok = False
+            self.last_error = str(exc)
+            logger.warning("replica lag probe failed (%s); reading from primary", exc)
+        self._checked_at = time.monotonic()
+        try:
+            db_replica_lag_seconds.set(self.lag if self.lag is not None and math.isfinite(self.lag) else -1)
+        except Exception:
+            pass
+
+    def mark_down(self, exc: BaseException) -> None:
+        """Route reads to the primary until the next probe (``check_interval`` from now)."""
+        logger.warning("replica read failed (%s); falling back to primary", exc)
+        self.replica_ok = False
+        self.last_error = str(exc)
+        self._checked_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "replica_ok": self.replica_ok,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "last_error": self.last_error,
+        }
+
+    async def close(self) -> None:
+        """Dispose of the replica engine (the primary belongs to its owner)."""
+        bind = self.replica.kw.get("bind")
+        if bind is not None:
+            await bind.dispose()
+
+
+class RoutedSession:
+    """Read-only session facade; opens the routed session on first use."""
+
+    def __init__(self, router: ReadRouter):
+        self._router = router
+        self._session: Optional[AsyncSession] = None
+        self._on_replica = False
+
+    async def __aenter__(self) -> "RoutedSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _target(self) -> AsyncSession:
+        if self._session is None:
+            self._on_replica = await self._router.use_replica()
+            self._session = (self._router.replica if self._on_replica else self._router.primary)()
+            try:
+                db_reads_routed_total.labels("replica" if self._on_replica else "primary").inc()
+            except Exception:
+                pass
+        return self._session
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        session = await self._target()
+        try:
+            return await getattr(session, method)(*args, **kwargs)
+        except _REPLICA_ERRORS as exc:
+            if not self._on_replica:
+                raise
+            self._router.mark_down(exc)
+            await session.close()
+            self._on_replica = False
+            self._session = self._router.primary()
+            try:
+                db_reads_routed_total.labels("fallback").inc()
+            except Exception:
+                pass
+            return await getattr(self._session, method)(*args, **kwargs)
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("execute", *args, **kwargs)
+
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("stream", *args, **kwargs)
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("scalar", *args, **kwargs)
+
+    async def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("scalars", *args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("get", *args, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def create_read_sessionmaker(primary: Any, replica_dsn: Optional[str] = None, cfg: Any = None) -> Any:
+    """
+    Sessionmaker for read-only services.
+
+    Returns ``primary`` unchanged when no replica DSN is configured
+    (DB_REPLICA_DSN), otherwise a ReadRouter over a replica engine built by
+    db_engine.create_engine.
+    """
+    if cfg is None:
+        from .config import get_settings
+
+        cfg = get_settings()
+    replica_dsn = replica_dsn if replica_dsn is not None else getattr(cfg, "DB_REPLICA_DSN", "")
+    if not replica_dsn or primary is None:
+        return primary
+    from .db_engine import create_engine
+
+    engine = create_engine(replica_dsn, name="replica")
+    replica = make_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    return ReadRouter(
+        primary,
+        replica,
+        max_lag=getattr(cfg, "DB_REPLICA_MAX_LAG_SECONDS", 30.0),
+        check_interval=getattr(cfg, "DB_REPLICA_CHECK_SECONDS", 10.0),
+    )
@@ -0,0 +1,199 @@
+"""
+Compact binary payloads for Decision rows.
+
+With DECISION_STORAGE_FORMAT=binary a decision is stored once, as a single
+compressed blob in ``decisions.payload``, instead of twice (``decision_text``
+as a JSON string plus ``raw`` as a JSON column, both including any attached
+``_shadow_policy_result``). The columns the decision is queried by (symbol,
+bias, confidence, recommendation, ...) are still written as plain columns.
+
+Payload layout: ``<version:1 byte><flags:1 byte><body>``. The flags record
+how the body was serialized (msgpack, or compact JSON when msgpack is not
+installed) and compressed (zstd, zlib when zstandard is not installed, or
+none for small payloads), so a row is decodable regardless of which
+optional packages the writer had. The body holds ``{"r": raw}`` plus
+``"t": decision_text`` only when the caller passed a text that is not simply
+``json.dumps(raw)``.
+
+Rows written before the payload column existed (or with the json format)
+keep raw/decision_text in their own columns; readers handle both, and
+DecisionRecord decodes a payload only when raw or decision_text is read.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import msgpack
+except ImportError:  # optional: compact JSON is used instead
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zlib is used instead
+    zstandard = None
+
+
+FORMAT_VERSION = 1
+
+_SER_JSON = 0x00
+_SER_MSGPACK = 0x01
+_COMP_NONE = 0x00
+_COMP_ZLIB = 0x10
+_COMP_ZSTD = 0x20
+_COMP_MASK = 0xF0
+
+# below this many serialized bytes compression costs more than it saves
+MIN_COMPRESS_BYTES = 256
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 1
+
+PAYLOAD_FIELDS = ("raw", "decision_text")
+
+_zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if zstandard is not None else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+def _serialize(body: Dict[str, Any]) -> tuple:
+    if msgpack is not None:
+        return _SER_MSGPACK, msgpack.packb(body, use_bin_type=True)
+    return _SER_JSON, json.dumps(body, separators=(",", ":")).encode()
+
+
+def _deserialize(ser: int, data: bytes) -> Dict[str, Any]:
+    if ser == _SER_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("decision payload was written with msgpack, which is not installed")
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if ser == _SER_JSON:
+        return json.loads(data)
+    raise ValueError(f"unknown decision payload serializer: {ser:#x}")
+
+
+def encode_payload(raw: Any = None, decision_text: Optional[str] = None) -> bytes:
+    """Encode a decision's raw dict (and its text, if it is not derivable from raw)."""
+    body: Dict[str, Any] = {"r": raw}
+    if decision_text is not None and (raw is None or decision_text != json.dumps(raw)):
+        body["t"] = decision_text
+    ser, data = _serialize(body)
+    comp = _COMP_NONE
+    if len(data) >= MIN_COMPRESS_BYTES:
+        if _zstd_compressor is not None:
+            comp, data = _COMP_ZSTD, _zstd_compressor.compress(data)
+        else:
+            comp, data = _COMP_ZLIB, zlib.compress(data, ZLIB_LEVEL)
+    return bytes((FORMAT_VERSION, ser | comp)) + data
+
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    """Decode a payload back to ``{"raw": ..., "decision_text": ...}``."""
+    if len(payload) < 2:
+        raise ValueError("truncated decision payload")
+    version, flags = payload[0], payload[1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported decision payload version: {version}")
+    data = bytes(payload[2:])
+    comp = flags & _COMP_MASK
+    if comp == _COMP_ZSTD:
+        if _zstd_decompressor is None:
+            raise RuntimeError("decision payload was compressed with zstd, which is not installed")
+        data = _zstd_decompressor.decompress(data)
+    elif comp == _COMP_ZLIB:
+        data = zlib.decompress(data)
+    elif comp != _COMP_NONE:
+        raise ValueError(f"unknown decision payload compression: {comp:#x}")
+    body = _deserialize(flags & ~_COMP_MASK, data)
+    raw = body.get("r")
+    text = body.get("t")
+    if text is None and raw is not None:
+        text = json.dumps(raw)
+    return {"raw": raw, "decision_text": text}
+
+
+class DecisionRecord(dict):
+    """
+    A decision row as a dict, with raw/decision_text decoded from the binary
+    payload on first access.
+
+    Listing the scalar fields (symbol, recommendation, ...) never touches the
+    payload; anything that needs the whole dict (iteration, equality,
+    json.dumps, copying) decodes it first.
+    """
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, row: Dict[str, Any], payload: Optional[bytes] = None):
+        super().__init__(row)
+        self._payload = payload
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "DecisionRecord":
+        """Build from a decisions row dict, taking the payload out of it."""
+        row = dict(row)
+        payload = row.pop("payload", None)
+        if payload is not None:
+            for field in PAYLOAD_FIELDS:
+                row.pop(field, None)
+        return cls(row, payload)
+
+    def _load(self) -> "DecisionRecord":
+        if self._payload is not None:
+            payload, self._payload = self._payload, None
+            self.update(decode_payload(payload))
+        return self
+
+    def __missing__(self, key: Any) -> Any:
+        if key in PAYLOAD_FIELDS and self._payload is not None:
+            return self._load()[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return (key in PAYLOAD_FIELDS and self._payload is not None) or super().__contains__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in PAYLOAD_FIELDS:
+            self._load()
+        return super().get(key, default)
+
+    def keys(self):
+        return super(DecisionRecord, self._load()).keys()
+
+    def values(self):
+        return super(DecisionRecord, self._load()).values()
+
+    def items(self):
+        return super(DecisionRecord, self._load()).items()
+
+    def __iter__(self):
+        return super(DecisionRecord, self._load()).__iter__()
+
+    def __len__(self) -> int:
+        return super(DecisionRecord, self._load()).__len__()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DecisionRecord):
+            other._load()
+        return super(DecisionRecord, self._load()).__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return super(DecisionRecord, self._load()).__repr__()
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self._load().items())
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+
+def expand_rows(rows: Iterable[Dict[str, Any]]) -> list:
+    """Plain dicts with any payload decoded into raw/decision_text (e.g. for archiving)."""
+    return [DecisionRecord.from_row(row).copy() for row in rows]
@@ -0,0 +1,188 @@
+"""
+Event-loop health monitor.
+
+A blocking call on the async path (a ``time.sleep`` poll, a synchronous HTTP
+request, a heavy computation) stalls every decision, notifier and background
+task at once, and nothing fails loudly. LoopMonitor makes such stalls visible:
+
+- a heartbeat task sleeps ``interval`` seconds and measures how late it wakes
+  up (scheduling lag), exported as ``event_loop_lag_seconds``;
+- on every heartbeat the number of pending tasks is exported as
+  ``event_loop_tasks`` so task leaks and saturation show up on dashboards;
+- a watchdog thread notices when the heartbeat is overdue by more than
+  ``slow_threshold`` and captures the event-loop thread's stack while it is
+  still blocked, so the log names the offending call. Each stall is counted
+  in ``event_loop_slow_callbacks_total`` and kept in a short history.
+
+Monitors are shared per event loop: ``acquire_loop_monitor`` starts one on
+first use and ``release_loop_monitor`` stops it when the last user is done.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics import event_loop_lag_seconds, event_loop_slow_callbacks_total, event_loop_tasks
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """Measures scheduling lag and pending tasks of one event loop and reports stalls."""
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        slow_threshold: float = 0.1,
+        history: int = 20,
+        stack_limit: int = 30,
+    ):
+        self.interval = max(0.001, float(interval))
+        self.slow_threshold = max(0.001, float(slow_threshold))
+        self.stack_limit = stack_limit
+        self.stalls: Deque[Dict[str, Any]] = collections.deque(maxlen=max(1, int(history)))
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.tasks = 0
+        self.slow_callbacks = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # written by the loop thread, read by the watchdog
+        self._beat = 0
+        self._beat_at = time.monotonic()
+        self._reported_beat = -1
+        self._users = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the heartbeat task on the running loop and the watchdog thread."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat_at = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self._beat_at = time.monotonic()
+            self._beat += 1
+            self._record_tick(lag, len(asyncio.all_tasks(loop)))
+
+    def _record_tick(self, lag: float, tasks: int) -> None:
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.tasks = tasks
+        try:
+            event_loop_lag_seconds.observe(lag)
+            event_loop_tasks.set(tasks)
+        except Exception:
+            pass
+        if lag >= self.slow_threshold:
+            self.slow_callbacks += 1
+            try:
+                event_loop_slow_callbacks_total.inc()
+            except Exception:
+                pass
+            # the watchdog captured the stack while the loop was blocked
+            if self.stalls and self._reported_beat == self._beat - 1:
+                self.stalls[-1]["duration"] = lag
+
+    def _watch(self) -> None:
+        poll = min(self.slow_threshold / 2, self.interval)
+        while not self._stop.wait(poll):
+            if self._loop is None or self._loop.is_closed() or not self.running:
+                # owner never called stop(); don't outlive the loop
+                return
+            beat = self._beat
+            overdue = time.monotonic() - self._beat_at - self.interval
+            if overdue >= self.slow_threshold and self._reported_beat != beat:
+                self._reported_beat = beat
+                self._report_stall(overdue)
+
+    def _report_stall(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+        stack = traceback.format_stack(frame, limit=self.stack_limit) if frame is not None else []
+        self.stalls.append({"at": time.time(), "blocked_for": blocked_for, "duration": None, "stack": stack})
+        logger.warning(
+            "event loop blocked for more than %.3fs; loop thread stack:\n%s", blocked_for, "".join(stack)
+        )
+
+    def top_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Pending tasks grouped by coroutine name, most common first."""
+        if self._loop is None:
+            return []
+        counts: collections.Counter = collections.Counter()
+        for task in asyncio.all_tasks(self._loop):
+            coro = task.get_coro()
+            counts[getattr(coro, "__qualname__", None) or repr(coro)] += 1
+        return [{"coro": name, "count": n} for name, n in counts.most_common(limit)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "slow_threshold": self.slow_threshold,
+            "lag_seconds": self.last_lag,
+            "max_lag_seconds": self.max_lag,
+            "tasks": self.tasks,
+            "slow_callbacks": self.slow_callbacks,
+            "stalls": list(self.stalls),
+        }
+
+
+_monitors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopMonitor]" = weakref.WeakKeyDictionary()
+
+
+def acquire_loop_monitor(interval: float = 0.5, slow_threshold: float = 0.1) -> LoopMonitor:
+    """Return the running loop's monitor, starting it on first use."""
+    loop = asyncio.get_running_loop()
+    monitor = _monitors.get(loop)
+    if monitor is None or not monitor.running:
+        monitor = LoopMonitor(interval=interval, slow_threshold=slow_threshold)
+        monitor.start()
+        _monitors[loop] = monitor
+    monitor._users += 1
+    return monitor
+
+
+async def release_loop_monitor(monitor: LoopMonitor) -> None:
+    """Drop one user of ``monitor``; the last release stops it."""
+    monitor._users -= 1
+    if monitor._users <= 0:
+        await monitor.stop()
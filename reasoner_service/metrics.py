@@ -56,6 +56,53 @@ redis_op_retries_total = Counter("redis_op_retries_total", "Redis operation retr
 redis_circuit_opened_total = Counter("redis_circuit_opened_total", "Redis circuit opened events")  # type: ignore
 redis_op_calls_total = Counter("redis_op_calls_total", "Redis operation calls")  # type: ignore
 
+# Per-stage latency of the decision pipeline (see reasoner_service.tracing)
+stage_latency_seconds = Histogram(
+    "decision_stage_latency_seconds",
+    "Latency of individual decision pipeline stages",
+    ["pipeline", "stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)  # type: ignore
+
+# Lock contention: time spent waiting to acquire orchestrator locks
+lock_wait_seconds = Histogram(
+    "orchestrator_lock_wait_seconds",
+    "Time spent waiting to acquire orchestrator locks",
+    ["lock"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+)  # type: ignore
+
+# Background executor for observational stages (shadow mode, paper trading)
+background_queue_depth = Gauge("background_executor_queue_depth", "Jobs waiting in a background executor", ["executor"])  # type: ignore
+background_tasks_dropped_total = Counter("background_executor_dropped_total", "Jobs dropped because the executor queue was full", ["executor"])  # type: ignore
+# Background outcome metrics snapshot (see reasoner_service.outcome_snapshot)
+outcome_snapshot_age_seconds = Gauge("outcome_snapshot_age_seconds", "Seconds since the published outcome metrics snapshot was built")  # type: ignore
+outcome_snapshot_last_refresh_timestamp = Gauge("outcome_snapshot_last_refresh_timestamp_seconds", "Unix time of the last outcome metrics snapshot build")  # type: ignore
+# Event-loop health (see reasoner_service.loop_monitor)
+event_loop_lag_seconds = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event-loop heartbeat woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)  # type: ignore
+event_loop_tasks = Gauge("event_loop_tasks", "Pending asyncio tasks on the monitored event loop")  # type: ignore
+event_loop_slow_callbacks_total = Counter("event_loop_slow_callbacks_total", "Event-loop stalls longer than the slow-callback threshold")  # type: ignore
+# Database connection pools, labelled by engine name (see reasoner_service.db_engine)
+db_pool_checked_out = Gauge("db_pool_checked_out", "Connections currently checked out of the pool", ["engine"])  # type: ignore
+db_pool_overflow = Gauge("db_pool_overflow", "Overflow connections open beyond pool_size", ["engine"])  # type: ignore
+db_pool_size = Gauge("db_pool_size", "Configured pool size", ["engine"])  # type: ignore
+db_pool_wait_seconds = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ["engine"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)  # type: ignore
+db_pool_timeouts_total = Counter("db_pool_timeouts_total", "Checkouts that gave up after pool_timeout", ["engine"])  # type: ignore
+# Read/write split (see reasoner_service.db_routing): target is replica | primary | fallback
+db_reads_routed_total = Counter("db_reads_routed_total", "Read-only sessions by routing target", ["target"])  # type: ignore
+db_replica_lag_seconds = Gauge("db_replica_lag_seconds", "Last measured replica lag (-1 when unknown)")  # type: ignore
+# HTTP policy backend lookups: ok | miss | stale | error | timeout | circuit_open
+policy_http_requests_total = Counter("policy_http_requests_total", "HTTP policy backend lookups by result", ["result"])  # type: ignore
+
 
 def start_metrics_server_if_enabled():
     cfg = get_settings()
@@ -18,6 +18,8 @@ from typing import (
     Any, Dict, List, Optional, Set, Tuple
 )
 
+from .striped_lock import StripedLock
+
 
 # ============================================================================
 # EVENT STATE MANAGEMENT
@@ -280,13 +282,18 @@ class SignalFilter:
 # ============================================================================
 
 class EventCorrelationManager:
-    """Manages event correlation and state tracking."""
+    """Manages event correlation and state tracking.
+
+    Structural changes (insert/evict) take ``_lock``; per-event updates take a
+    stripe keyed by correlation id; reads iterate a snapshot without locking.
+    """
     
     def __init__(self, max_tracked_events: int = 10000):
         """Initialize correlation manager."""
         self.max_tracked_events = max_tracked_events
         self._events: Dict[str, EventTracker] = {}
         self._lock = asyncio.Lock()
+        self._event_locks = StripedLock("event_correlation")
     
     async def create_event_tracker(
         self,
@@ -312,8 +319,7 @@ class EventCorrelationManager:
     
     async def get_event_tracker(self, correlation_id: str) -> Optional[EventTracker]:
         """Retrieve event tracker by correlation ID."""
-        async with self._lock:
-            return self._events.get(correlation_id)
+        return self._events.get(correlation_id)
     
     async def update_event_state(
         self,
@@ -322,7 +328,7 @@ class EventCorrelationManager:
         reason: Optional[str] = None
     ) -> bool:
         """Atomically update event state."""
-        async with self._lock:
+        async with self._event_locks.acquire(correlation_id):
             tracker = self._events.get(correlation_id)
             if tracker:
                 tracker.update_state(new_state, reason)
@@ -334,19 +340,17 @@ class EventCorrelationManager:
         correlation_id: str
     ) -> Optional[List[Tuple[EventState, int]]]:
         """Get event state history."""
-        async with self._lock:
-            tracker = self._events.get(correlation_id)
-            if tracker:
-                return tracker.status_history
-            return None
+        tracker = self._events.get(correlation_id)
+        if tracker:
+            return tracker.status_history
+        return None
     
     async def get_events_by_type(self, event_type: str) -> List[EventTracker]:
         """Get all events of a specific type."""
-        async with self._lock:
-            return [
-                t for t in self._events.values()
-                if t.event_type == event_type
-            ]
+        return [
+            t for t in list(self._events.values())
+            if t.event_type == event_type
+        ]
     
     async def get_recent_events(
         self,
@@ -354,11 +358,10 @@ class EventCorrelationManager:
         since_ms: int
     ) -> List[EventTracker]:
         """Get recent events of a type."""
-        async with self._lock:
-            return [
-                t for t in self._events.values()
-                if t.event_type == event_type and t.created_at_ms >= since_ms
-            ]
+        return [
+            t for t in list(self._events.values())
+            if t.event_type == event_type and t.created_at_ms >= since_ms
+        ]
 
 
 # ============================================================================
@@ -366,26 +369,53 @@ class EventCorrelationManager:
 # ============================================================================
 
 class CooldownManager:
-    """Manages cooldowns and session windows for event types."""
+    """Manages cooldowns and session windows for event types.
+
+    Configs are immutable snapshots replaced copy-on-write under ``_lock``, so
+    checks read them without locking. Tracker updates are serialized per event
+    type through a striped lock; independent event types never wait on each other.
+
+    Configs are process-local. When a shared ``state_backend`` is attached the
+    cooldown deadline and window counters live in the backend instead, so all
+    orchestrator replicas enforce the same cooldowns.
+    """
     
-    def __init__(self):
+    def __init__(self, state_backend: Optional[Any] = None):
         """Initialize cooldown manager."""
         self._cooldowns: Dict[str, CooldownTracker] = {}
         self._cooldown_configs: Dict[str, CooldownConfig] = {}
         self._session_windows: Dict[str, SessionWindow] = {}
+        # guards config writers only; readers use the current snapshot
         self._lock = asyncio.Lock()
+        self._event_locks = StripedLock("cooldown")
+        self.state_backend = state_backend
     
     async def configure_cooldown(self, config: CooldownConfig) -> None:
         """Configure cooldown for event type."""
         async with self._lock:
-            self._cooldown_configs[config.event_type] = config
+            configs = dict(self._cooldown_configs)
+            configs[config.event_type] = config
             if config.event_type not in self._cooldowns:
-                self._cooldowns[config.event_type] = CooldownTracker(config.event_type)
+                trackers = dict(self._cooldowns)
+                trackers[config.event_type] = CooldownTracker(config.event_type)
+                self._cooldowns = trackers
+            self._cooldown_configs = configs
     
     async def configure_session_window(self, window: SessionWindow) -> None:
         """Configure session window for event type."""
         async with self._lock:
-            self._session_windows[window.event_type] = window
+            windows = dict(self._session_windows)
+            windows[window.event_type] = window
+            self._session_windows = windows
+
+    async def _sync_from_backend(self, event_type: str, tracker: CooldownTracker) -> None:
+        """Refresh a local tracker from the shared backend (keeps local state on error)."""
+        try:
+            until_ms, count = await self.state_backend.get_event_window(event_type)
+            tracker.cooldown_until_ms = until_ms
+            tracker.events_in_window = count
+        except Exception:
+            pass
     
     async def check_cooldown(self, event_type: str) -> Tuple[bool, Optional[int]]:
         """
@@ -394,47 +424,61 @@ class CooldownManager:
         Returns:
             Tuple of (is_cooling_down, next_available_ms)
         """
-        async with self._lock:
-            tracker = self._cooldowns.get(event_type)
-            if not tracker:
-                return False, None
-            
-            if tracker.is_cooling_down():
-                return True, tracker.cooldown_until_ms
+        tracker = self._cooldowns.get(event_type)
+        if not tracker:
             return False, None
+        if self.state_backend is not None:
+            await self._sync_from_backend(event_type, tracker)
+        if tracker.is_cooling_down():
+            return True, tracker.cooldown_until_ms
+        return False, None
     
     async def check_session_window(self, event_type: str) -> bool:
         """Check if event type is within session window."""
-        async with self._lock:
-            window = self._session_windows.get(event_type)
-            if not window:
-                return True  # No constraint = allowed
-            return window.is_active()
+        window = self._session_windows.get(event_type)
+        if not window:
+            return True  # No constraint = allowed
+        return window.is_active()
     
     async def check_event_limit(self, event_type: str) -> bool:
         """Check if event type has exceeded limit in window."""
-        async with self._lock:
-            window = self._session_windows.get(event_type)
-            tracker = self._cooldowns.get(event_type)
-            
-            if not window or not tracker:
-                return True  # No constraint = allowed
-            
-            return tracker.events_in_window < window.max_events
+        window = self._session_windows.get(event_type)
+        tracker = self._cooldowns.get(event_type)
+        
+        if not window or not tracker:
+            return True  # No constraint = allowed
+        if self.state_backend is not None:
+            await self._sync_from_backend(event_type, tracker)
+        return tracker.events_in_window < window.max_events
     
     async def record_event(self, event_type: str) -> None:
         """Record event for cooldown tracking."""
-        async with self._lock:
-            config = self._cooldown_configs.get(event_type)
-            tracker = self._cooldowns.get(event_type)
-            
-            if config and tracker:
+        config = self._cooldown_configs.get(event_type)
+        tracker = self._cooldowns.get(event_type)
+        if not (config and tracker):
+            return
+        async with self._event_locks.acquire(event_type):
+            if self.state_backend is None:
                 tracker.events_in_window += 1
                 tracker.last_event_time_ms = int(time.time() * 1000)
                 
                 # Reset window if cooldown expired
                 if not tracker.is_cooling_down():
                     tracker.reset_window(config)
+                return
+            # shared backend: the check-and-update runs atomically on the backend
+            now_ms = int(time.time() * 1000)
+            try:
+                until_ms, count = await self.state_backend.record_event(event_type, config.cooldown_ms, now_ms)
+                tracker.cooldown_until_ms = until_ms
+                tracker.events_in_window = count
+                tracker.last_event_time_ms = now_ms
+            except Exception:
+                # fail open to local tracking if the backend is unreachable
+                tracker.events_in_window += 1
+                tracker.last_event_time_ms = now_ms
+                if not tracker.is_cooling_down():
+                    tracker.reset_window(config)
 
 
 # ============================================================================
@@ -444,10 +488,10 @@ class CooldownManager:
 class OrchestrationStateManager:
     """Manages overall orchestration state atomically."""
     
-    def __init__(self):
-        """Initialize state manager."""
+    def __init__(self, state_backend: Optional[Any] = None):
+        """Initialize state manager (optionally backed by shared state)."""
         self.event_correlation = EventCorrelationManager()
-        self.cooldown_manager = CooldownManager()
+        self.cooldown_manager = CooldownManager(state_backend=state_backend)
         self.reasoning_metrics = ReasoningMetrics()
         self.orchestration_metrics = OrchestrationMetrics()
         self._lock = asyncio.Lock()
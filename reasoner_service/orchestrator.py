@@ -4,6 +4,7 @@ import asyncio
 import json
 import os
 import time
+from functools import lru_cache, partial
 from typing import Optional, Dict, Any, List, Tuple, Union
 from types import SimpleNamespace
 from datetime import datetime, time as dt_time, timezone
@@ -19,24 +20,84 @@ from .orchestration_advanced import (
     OrchestrationStateManager, CooldownConfig, SessionWindow,
     SignalFilter, EventState
 )
-try:
-    import redis.asyncio as aioredis
-except Exception:
-    aioredis = None
-from .storage import (
-    create_engine_from_env_or_dsn, create_engine_and_sessionmaker, init_models, insert_decision, compute_decision_hash,
-    get_outcomes_by_signal_type
-)
-from .alerts import SlackNotifier, DiscordNotifier, TelegramNotifier
-from .metrics import start_metrics_server_if_enabled, decisions_processed_total, deduplicated_decisions_total, dlq_retries_total, dlq_size, redis_reconnect_attempts
+from .metrics import start_metrics_server_if_enabled, decisions_processed_total, deduplicated_decisions_total, dlq_retries_total, dlq_size, redis_reconnect_attempts, stage_latency_seconds
 from .logging_setup import logger
 from .metrics_snapshot import load_metrics_snapshot
 from .policy import outcome_policy, memory_policy
 from .allowlist_loader import AllowlistLoader
+from .audit_ring import AuditRing, spill_path_for
+from .persist_dlq import PersistDLQ
+from .policy_cache import PolicyCache
+from .background_executor import BackgroundExecutor
+from .outcome_cache import OutcomeRecallCache
+from .routing_table import RoutingConfigWatcher, RoutingTable, in_window, parse_hhmm, seconds_of_day
+from .shared_state import SharedStateBackend, create_shared_state_from_settings
+from .striped_lock import StripedLock
+from .tracing import StageTimer, get_trace_exporter
 from utils.redis_wrapper import redis_op
 
 _cfg = get_settings()
 
+# redis.asyncio is resolved in _ensure_redis(); this stays None unless a caller
+# injects a module here.
+aioredis = None
+
+
+# --- deferred storage layer ---
+# SQLAlchemy accounts for most of this module's import time, so storage is
+# imported on first use. The thin wrappers keep the module-level names that
+# callers and tests patch (e.g. reasoner_service.orchestrator.insert_decision).
+
+async def create_engine_and_sessionmaker(dsn=None):
+    from .storage import create_engine_and_sessionmaker as _impl
+    return await _impl(dsn)
+
+
+def create_engine_from_env_or_dsn(dsn=None):
+    from .storage import create_engine_from_env_or_dsn as _impl
+    return _impl(dsn)
+
+
+async def init_models(engine):
+    from .storage import init_models as _impl
+    return await _impl(engine)
+
+
+async def insert_decision(sessionmaker, **kwargs):
+    from .storage import insert_decision as _impl
+    return await _impl(sessionmaker, **kwargs)
+
+
+async def insert_decisions_bulk(sessionmaker, rows):
+    from .storage import insert_decisions_bulk as _impl
+    return await _impl(sessionmaker, rows)
+
+
+def _decision_text(decision):
+    # the binary storage format derives decision_text from raw on read; skip the second encode
+    if getattr(_cfg, "DECISION_STORAGE_FORMAT", "json") == "binary":
+        return None
+    return json.dumps(decision)
+
+
+async def get_outcomes_by_signal_type(sessionmaker, **kwargs):
+    from .storage import get_outcomes_by_signal_type as _impl
+    return await _impl(sessionmaker, **kwargs)
+
+
+def compute_decision_hash(symbol, rec, conf, ts_ms):
+    from .storage import compute_decision_hash as _impl
+    return _impl(symbol, rec, conf, ts_ms)
+
+
+@lru_cache(maxsize=16)
+def _parse_quiet_hours(spec: str) -> Tuple[dt_time, dt_time]:
+    """Parse an "HH:MM-HH:MM" window into (start, end) times."""
+    parts = spec.split("-")
+    sh, sm = map(int, parts[0].strip().split(":"))
+    eh, em = map(int, parts[1].strip().split(":"))
+    return dt_time(sh, sm), dt_time(eh, em)
+
 
 class PolicyStore:
     """Facade for pluggable policy backends with chained fallback.
@@ -44,6 +105,8 @@ class PolicyStore:
     PolicyStore coordinates multiple backends (config, HTTP, Redis, markers)
     and falls back through them in order until a policy is found. This enables
     authoritative policy services while maintaining backward-compatibility.
+    Results from backends with a positive ``cache_ttl`` are served from a
+    PolicyCache (TTL, negative caching, single-flight fetches).
     """
     def __init__(self, orch: "DecisionOrchestrator", backends=None):
         """Initialize PolicyStore with optional custom backends.
@@ -61,6 +124,57 @@ class PolicyStore:
                 DefaultPolicyBackend(),
             ]
         self.backends = backends
+        self.cache = PolicyCache(max_entries=getattr(_cfg, "POLICY_CACHE_MAX_ENTRIES", 4096))
+        self.negative_ttl = float(getattr(_cfg, "POLICY_CACHE_NEGATIVE_TTL_SECONDS", 5.0))
+        for slot, backend in enumerate(self.backends):
+            add_listener = getattr(backend, "add_invalidation_listener", None)
+            if add_listener is not None:
+                add_listener(partial(self._on_backend_invalidation, slot))
+        # pub/sub listeners for invalidations published by other processes;
+        # started on the first lookup, when an event loop is running
+        self._listen_tasks: List[asyncio.Task] = []
+        self._listening = False
+
+    def _start_invalidation_listeners(self) -> None:
+        self._listening = True
+        for backend in self.backends:
+            listen = getattr(backend, "listen_invalidations", None)
+            if listen is None or float(getattr(backend, "cache_ttl", 0) or 0) <= 0:
+                continue
+            task = asyncio.get_running_loop().create_task(listen())
+            task.add_done_callback(self._on_listener_done)
+            self._listen_tasks.append(task)
+
+    @staticmethod
+    def _on_listener_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("policy invalidation listener stopped: %s", task.exception())
+
+    def _on_backend_invalidation(self, slot: int, policy_name: Optional[str], context_key: Optional[str]) -> None:
+        self.cache.invalidate(policy_name, context_key, slot=slot)
+
+    def invalidate(self, policy_name: Optional[str] = None) -> int:
+        """Drop cached results (all, or those for one policy)."""
+        return self.cache.invalidate(policy_name)
+
+    async def close(self) -> None:
+        """Close backends that hold connections or background tasks."""
+        for task in self._listen_tasks:
+            task.cancel()
+        for task in self._listen_tasks:
+            try:
+                await task
+            except BaseException:
+                pass
+        self._listen_tasks.clear()
+        for backend in self.backends:
+            close = getattr(backend, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception:
+                logger.exception("error closing policy backend %s", type(backend).__name__)
 
     async def get_policy(self, policy_name: str, context: dict) -> dict:
         """Get policy from backends in priority order.
@@ -69,9 +183,22 @@ class PolicyStore:
         orchestrator config to override markers, HTTP services to override local
         config, and so on.
         """
-        for backend in self.backends:
+        if not self._listening:
+            self._start_invalidation_listeners()
+        for slot, backend in enumerate(self.backends):
             try:
-                result = await backend.get_policy(policy_name, context)
+                ttl = float(getattr(backend, "cache_ttl", 0) or 0)
+                if ttl > 0:
+                    neg_ttl = getattr(backend, "negative_cache_ttl", None)
+                    key = (slot, policy_name, backend.cache_key(policy_name, context or {}))
+                    result = await self.cache.get_or_fetch(
+                        key,
+                        partial(backend.get_policy, policy_name, context),
+                        ttl,
+                        self.negative_ttl if neg_ttl is None else float(neg_ttl),
+                    )
+                else:
+                    result = await backend.get_policy(policy_name, context)
                 if result:  # Non-empty dict means policy found
                     return result
             except Exception:
@@ -81,18 +208,41 @@ class PolicyStore:
 
 
 class DecisionOrchestrator:
-    def __init__(self, dsn: Optional[str] = None):
+    def __init__(self, dsn: Optional[str] = None, shared_state: Optional[SharedStateBackend] = None):
         self.dsn = dsn
         self.engine = None
         self._sessionmaker = None
+        # read-only services use this; a ReadRouter when DB_REPLICA_DSN is set
+        self._read_sessionmaker = None
         self.notifiers = {}
         self._dedup = {}  # hash -> ts
         self._lock = asyncio.Lock()
+        # per-(event_type, symbol) locks for handle_event constraint checks
+        self._event_locks = StripedLock("handle_event")
         # lock protecting the in-memory DLQ
         self._dlq_lock = asyncio.Lock()
         # in-memory DLQ for failed persistence attempts (non-blocking fallback)
         # each entry: {decision, error, ts, attempts:int, next_attempt_ts:float}
-        self._persist_dlq = []
+        _dlq_cfg = get_settings()
+        _spill_path = getattr(_dlq_cfg, "DLQ_SPILL_PATH", "") or None
+        if _spill_path is None and getattr(_dlq_cfg, "DLQ_SPILL_DIR", ""):
+            _spill_path = os.path.join(_dlq_cfg.DLQ_SPILL_DIR, "persist_dlq.jsonl")
+        self._persist_dlq = PersistDLQ(
+            max_entries=int(getattr(_dlq_cfg, "DLQ_MEMORY_MAX_ENTRIES", 10000) or 10000),
+            spill_path=_spill_path,
+        )
+        # entries spilled by a previous run come back before anything new arrives
+        self._dlq_replay_spill_if_drained()
+        # bounded worker pool for observational stages (shadow mode, paper trade)
+        self._observer_executor = BackgroundExecutor(
+            "observers",
+            workers=int(getattr(_dlq_cfg, "OBSERVER_WORKERS", 2) or 2),
+            max_queue=int(getattr(_dlq_cfg, "OBSERVER_QUEUE_SIZE", 1000) or 1000),
+        )
+        # read-through cache for memory-recall outcome lookups (invalidated on new outcomes)
+        self._outcome_recall_cache = OutcomeRecallCache(
+            ttl_seconds=float(getattr(_dlq_cfg, "OUTCOME_RECALL_CACHE_TTL_SECONDS", 60.0)),
+        )
         # redis client will be set in setup() if enabled
         self._redis = None
         # background task for retrying DLQ entries
@@ -100,15 +250,21 @@ class DecisionOrchestrator:
         # simple circuit-breaker state for redis reconnects
         self._redis_failure_count = 0
         self._redis_circuit_open_until = 0.0
-        # routing caches (safe defaults if not provided via config helpers)
-        try:
-            # some repos provide helper loaders; try importing dynamically
-            from .config import load_routing_rules as _lr, load_routing_overrides as _lo
-            self._routing_rules = _lr()
-            self._routing_overrides = _lo()
-        except Exception:
-            self._routing_rules = {}
-            self._routing_overrides = []
+        # routing config, compiled lazily into a RoutingTable; assigning
+        # _routing_rules / _routing_overrides / _routing_decision_table recompiles
+        self._routing_table: Optional[RoutingTable] = None
+        self._routing_rules_cfg: Dict[str, List[str]] = {}
+        self._routing_overrides_cfg: List[Dict[str, Any]] = []
+        self._routing_decision_table_cfg: List[Dict[str, Any]] = []
+        # hot-reloaded routing file (ROUTING_CONFIG_PATH); checked by mtime
+        _routing_path = getattr(_dlq_cfg, "ROUTING_CONFIG_PATH", "") or ""
+        self._routing_watcher: Optional[RoutingConfigWatcher] = None
+        if _routing_path:
+            self._routing_watcher = RoutingConfigWatcher(
+                _routing_path,
+                check_interval=float(getattr(_dlq_cfg, "ROUTING_RELOAD_INTERVAL_SECONDS", 5.0)),
+            )
+            self._maybe_reload_routing(force=True)
         # Lightweight reasoner adapter exposing a coroutine `call(prompt, signal, decision)`.
         # This delegates to the repository's existing reasoning path and does not bypass
         # orchestration policy or enforcement.
@@ -136,9 +292,18 @@ class DecisionOrchestrator:
         self.policy_store = PolicyStore(self)
         # policy counters and audit (permissive by default; enabled for Level-2 enforcement)
         self._policy_counters = {"pass": 0, "veto": 0, "defer": 0}
-        self._policy_audit = []
+        # increments not yet pushed to shared state, and the task that will push them
+        self._policy_counter_pending: Dict[str, int] = {}
+        self._policy_counter_flush_task: Optional[asyncio.Task] = None
+        self._policy_audit = AuditRing(
+            getattr(_cfg, "AUDIT_RING_CAPACITY", 10000), name="policy_audit", spill_path=spill_path_for("policy_audit")
+        )
         # outcome metrics snapshot (optional)
         self._metrics_snapshot = {}
+        # background-refreshed outcome metrics (started in setup when a DB is available)
+        self._outcome_snapshot = None
+        # shared event-loop health monitor (started in setup)
+        self._loop_monitor = None
         # optional constraints loaded by callers/tests (default empty)
         self._constraints = {}
         # reasoning manager for bounded advisory signal generation
@@ -153,6 +318,94 @@ class DecisionOrchestrator:
         # policy shadow mode for observational evaluation
         from .policy_shadow_mode import get_shadow_mode_manager
         self.shadow_mode_manager = get_shadow_mode_manager()
+        # optional cross-process state (cooldowns, dedup, counters, shadow audit)
+        self.shared_state: Optional[SharedStateBackend] = None
+        if shared_state is not None:
+            self.attach_shared_state(shared_state)
+
+    def attach_shared_state(self, backend: SharedStateBackend) -> None:
+        """Share cooldowns, dedup, policy counters and shadow audit via ``backend``.
+
+        Lets several orchestrator replicas enforce the same cooldown and dedup
+        guarantees. Local structures stay in place as the per-process view.
+        """
+        self.shared_state = backend
+        self.orchestration_state.cooldown_manager.state_backend = backend
+        self.shadow_mode_manager.state_backend = backend
+
+    async def _bump_policy_counter(self, result: str) -> None:
+        """Increment a policy counter locally; shared state gets it with the next batch.
+
+        Never waits on shared state: increments are summed and pushed every
+        POLICY_COUNTER_FLUSH_SECONDS by one background task.
+        """
+        self._policy_counters[result] += 1
+        if self.shared_state is None:
+            return
+        self._policy_counter_pending[result] = self._policy_counter_pending.get(result, 0) + 1
+        task = self._policy_counter_flush_task
+        if task is None or task.done():
+            self._policy_counter_flush_task = asyncio.create_task(self._flush_policy_counters_later())
+
+    async def _flush_policy_counters_later(self) -> None:
+        await asyncio.sleep(float(getattr(_cfg, "POLICY_COUNTER_FLUSH_SECONDS", 1.0) or 0.0))
+        await self._flush_policy_counters()
+
+    async def _flush_policy_counters(self) -> None:
+        """Push pending policy counter increments to shared state (best-effort).
+
+        Increments that fail to push are kept and retried with the next batch.
+        """
+        pending, self._policy_counter_pending = list(self._policy_counter_pending.items()), {}
+        for i, (result, amount) in enumerate(pending):
+            try:
+                await self.shared_state.incr_counter("policy_counters", result, amount)
+            except asyncio.CancelledError:
+                for result, amount in pending[i:]:
+                    self._policy_counter_pending[result] = self._policy_counter_pending.get(result, 0) + amount
+                raise
+            except Exception as e:
+                logger.warning("shared policy counter update failed: %s", e)
+                self._policy_counter_pending[result] = self._policy_counter_pending.get(result, 0) + amount
+
+    async def get_policy_counters(self) -> Dict[str, int]:
+        """Return policy counters, aggregated across replicas when shared state is attached.
+
+        Other replicas' counts lag by up to one flush interval.
+        """
+        if self.shared_state is not None:
+            if self._policy_counter_pending:
+                await self._flush_policy_counters()
+            try:
+                shared = await self.shared_state.get_counters("policy_counters")
+                return {k: int(shared.get(k, 0)) for k in ("pass", "veto", "defer")}
+            except Exception as e:
+                logger.warning("shared policy counter read failed, using local counters: %s", e)
+        return dict(self._policy_counters)
+
+    def get_policy_audit_page(self, cursor: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        """Return one page of the policy audit trail, newest first, plus the next cursor."""
+        entries, next_cursor = self._policy_audit.page(cursor, limit)
+        return {"entries": entries, "next_cursor": next_cursor}
+
+    async def set_global_cooldown(self, until_ms: int) -> None:
+        """Defer all events until ``until_ms`` (epoch ms) on every replica."""
+        self._global_cooldown_until = max(int(getattr(self, "_global_cooldown_until", 0) or 0), int(until_ms))
+        if self.shared_state is not None:
+            try:
+                await self.shared_state.extend_cooldown("global", int(until_ms))
+            except Exception as e:
+                logger.warning("shared global cooldown update failed: %s", e)
+
+    async def _get_global_cooldown_until(self) -> int:
+        """Effective global cooldown deadline: max of local and shared values."""
+        until = int(getattr(self, "_global_cooldown_until", 0) or 0)
+        if self.shared_state is not None:
+            try:
+                until = max(until, await self.shared_state.get_cooldown_until("global"))
+            except Exception as e:
+                logger.warning("shared global cooldown read failed (fail-open to local): %s", e)
+        return until
 
     # --- Safety helper: normalized dedup key ---
     def _compute_dedup_key(self, decision: Dict[str, Any]) -> str:
@@ -218,7 +471,7 @@ class DecisionOrchestrator:
                 if self.allowlist_loader.is_enabled():
                     group_key = AllowlistLoader.make_key_from_snapshot(snapshot)
                     if group_key and not self.allowlist_loader.is_allowed(group_key):
-                        self._policy_counters["veto"] += 1
+                        await self._bump_policy_counter("veto")
                         entry = {
                             "ts": int(time.time() * 1000),
                             "action": "veto",
@@ -239,7 +492,7 @@ class DecisionOrchestrator:
         try:
             killzone_policy = await self.policy_store.get_policy("killzone", snapshot or {})
             if killzone_policy.get("active"):
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "killzone", "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -250,7 +503,7 @@ class DecisionOrchestrator:
         except Exception:
             # fallback to marker behavior
             if snapshot.get("killzone"):
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "killzone", "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -263,7 +516,7 @@ class DecisionOrchestrator:
         try:
             regime_policy = await self.policy_store.get_policy("regime", snapshot or {})
             if regime_policy.get("regime") == "restricted":
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "regime_restricted", "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -273,7 +526,7 @@ class DecisionOrchestrator:
                 return {"result": "veto", "reason": "regime_restricted"}
         except Exception:
             if snapshot.get("regime") == "restricted":
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "regime_restricted", "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -289,7 +542,7 @@ class DecisionOrchestrator:
             now_ms = int(time.time() * 1000)
             if cooldown and cooldown > now_ms:
                 # record defer and enqueue to in-memory DLQ for retry
-                self._policy_counters["defer"] += 1
+                await self._bump_policy_counter("defer")
                 entry = {"ts": int(time.time() * 1000), "action": "defer", "reason": "cooldown", "next_attempt_ts": cooldown, "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -316,7 +569,7 @@ class DecisionOrchestrator:
                 now_ms = int(time.time() * 1000)
                 cooldown = int(snapshot.get("cooldown_until", 0) or 0)
                 if cooldown and cooldown > now_ms:
-                    self._policy_counters["defer"] += 1
+                    await self._bump_policy_counter("defer")
                     entry = {"ts": int(time.time() * 1000), "action": "defer", "reason": "cooldown", "next_attempt_ts": cooldown, "id": snapshot.get("id")}
                     try:
                         self._policy_audit.append(entry)
@@ -345,7 +598,7 @@ class DecisionOrchestrator:
             exposure = float(exp_policy.get("exposure", 0) or 0)
             max_exposure = float(exp_policy.get("max_exposure", 0) or 0)
             if max_exposure and exposure > max_exposure:
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "risk_limit_exceeded", "exposure": exposure, "max_exposure": max_exposure, "id": snapshot.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -358,7 +611,7 @@ class DecisionOrchestrator:
                 exposure = float(snapshot.get("exposure", 0) or 0)
                 max_exposure = float(snapshot.get("max_exposure", 0) or 0)
                 if max_exposure and exposure > max_exposure:
-                    self._policy_counters["veto"] += 1
+                    await self._bump_policy_counter("veto")
                     entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "risk_limit_exceeded", "exposure": exposure, "max_exposure": max_exposure, "id": snapshot.get("id")}
                     try:
                         self._policy_audit.append(entry)
@@ -381,7 +634,7 @@ class DecisionOrchestrator:
                 win_rate_threshold=float(outcome_cfg.get("win_rate_threshold", 0.45)),
             )
             if result.get("result") == "veto":
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 self._policy_audit.append({"type": "outcome", **result, "decision_id": snapshot.get("id")})
                 return {"result": "veto", "reason": result.get("reason", "outcome_underperformance")}
         except Exception:
@@ -399,7 +652,7 @@ class DecisionOrchestrator:
                 positive_threshold=float(mem_cfg.get("positive_threshold", 0.10)),
             )
             if mem_res.get("result") == "veto":
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 self._policy_audit.append({"type": "memory", **mem_res, "decision_id": snapshot.get("id")})
                 return {"result": "veto", "reason": mem_res.get("reason", "memory_underperformance")}
             if mem_res.get("result") == "promote":
@@ -427,29 +680,22 @@ class DecisionOrchestrator:
                     suppress_expectancy = float(outcome_adapt_cfg.get("suppress_if", {}).get("expectancy_r", -0.05))
                     suppress_win_rate = float(outcome_adapt_cfg.get("suppress_if", {}).get("win_rate", 0.45))
                     
-                    # Query recent outcomes for this symbol + signal_type (+ optional model/session/direction)
-                    outcomes = await get_outcomes_by_signal_type(
+                    # Recent outcomes for this symbol + signal_type (+ optional model/session/direction).
+                    # Served from the recall cache, which keeps expectancy / win rate over
+                    # outcomes with a numeric r_multiple up to date as trades close.
+                    window = await self._outcome_recall_cache.get_window(
+                        get_outcomes_by_signal_type,
                         self._sessionmaker,
-                        symbol=symbol,
-                        signal_type=signal_type,
-                        limit=window_n,
+                        symbol,
+                        signal_type,
+                        window_n,
                         model=model,
                         session_id=session,
                         direction=direction,
                     )
                     
-                    if outcomes:
-                        # Extract only outcomes with valid r_multiple (ignore missing/invalid)
-                        outcome_list = []
-                        for o in outcomes:
-                            r_mult = o.get("r_multiple")
-                            outcome_type = o.get("outcome", "").lower()
-                            # Only include if r_multiple is present and numeric
-                            if r_mult is not None and isinstance(r_mult, (int, float)):
-                                outcome_list.append({"r_multiple": float(r_mult), "outcome": outcome_type})
-                        
-                        # Compute metrics for all outcomes with valid r_multiple
-                        expectancy, win_rate, sample_size = self._compute_expectancy_and_win_rate(outcome_list)
+                    if window.rows:
+                        expectancy, win_rate, sample_size = window.stats()
                         details = {
                             "expectancy": expectancy,
                             "win_rate": win_rate,
@@ -463,7 +709,7 @@ class DecisionOrchestrator:
                         # Veto only if we have sufficient sample size of valid outcomes AND poor performance
                         if sample_size >= min_sample:
                             if expectancy < suppress_expectancy or win_rate < suppress_win_rate:
-                                self._policy_counters["veto"] += 1
+                                await self._bump_policy_counter("veto")
                                 self._policy_audit.append({
                                     "type": "memory_recall",
                                     "reason": "memory_underperformance",
@@ -492,7 +738,7 @@ class DecisionOrchestrator:
             logger.warning(f"Memory recall veto check failed: {e}", exc_info=True)
             # Fail open: log warning but continue
 
-        self._policy_counters["pass"] += 1
+        await self._bump_policy_counter("pass")
         # Return pass with empty details if no memory adaptation occurred
         return {"result": "pass", "details": {"sample_size": 0, "expectancy": 0.0, "win_rate": 0.0}}
 
@@ -553,36 +799,41 @@ class DecisionOrchestrator:
                 return []
             
             symbol, signal_type, session = key
-            outcomes = await get_outcomes_by_signal_type(
+            window = await self._outcome_recall_cache.get_window(
+                get_outcomes_by_signal_type,
                 self._sessionmaker,
-                symbol=symbol,
-                signal_type=signal_type,
-                limit=top_n,
+                symbol,
+                signal_type,
+                top_n,
             )
-            # Convert outcome field to r_multiple-like metric: 1.0 for win, -1.0 for loss, 0.0 for breakeven
-            results = []
-            for outcome in outcomes:
-                outcome_type = outcome.get("outcome", "").lower()
-                if outcome_type == "win":
-                    r_multiple = max(1.0, float(outcome.get("pnl", 0.0)) / 10.0)  # Normalize PnL to r_multiple
-                elif outcome_type == "loss":
-                    r_multiple = min(-1.0, float(outcome.get("pnl", 0.0)) / 10.0)
-                else:
-                    r_multiple = 0.0
-                
-                results.append({
-                    "r_multiple": r_multiple,
-                    "outcome": outcome_type,
-                    "pnl": outcome.get("pnl", 0.0),
-                    "timestamp": outcome.get("closed_at"),
-                    "signal_type": outcome.get("signal_type"),
-                    "symbol": outcome.get("symbol"),
-                })
-            return results
+            # converted rows are memoized on the window until a new outcome lands
+            return list(window.similar_signals(self._to_similar_signal))
         except Exception as e:
             logger.warning(f"Memory recall DB query failed: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def _to_similar_signal(outcome: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an outcome row to the r_multiple-like record used by memory policy.
+
+        r_multiple is 1.0+ for win, -1.0- for loss, 0.0 for breakeven.
+        """
+        outcome_type = (outcome.get("outcome") or "").lower()
+        if outcome_type == "win":
+            r_multiple = max(1.0, float(outcome.get("pnl", 0.0)) / 10.0)  # Normalize PnL to r_multiple
+        elif outcome_type == "loss":
+            r_multiple = min(-1.0, float(outcome.get("pnl", 0.0)) / 10.0)
+        else:
+            r_multiple = 0.0
+        return {
+            "r_multiple": r_multiple,
+            "outcome": outcome_type,
+            "pnl": outcome.get("pnl", 0.0),
+            "timestamp": outcome.get("closed_at"),
+            "signal_type": outcome.get("signal_type"),
+            "symbol": outcome.get("symbol"),
+        }
+
     # --- Policy gate: post-reasoning hook ---
     async def post_reasoning_policy_check(self, reasoning_output: Dict[str, Any], state: Optional[Dict[str, Any]] = None, ctx: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Post-reasoning policy gate: checks confidence and other advisory outputs.
@@ -612,7 +863,7 @@ class DecisionOrchestrator:
             conf_policy = await self.policy_store.get_policy("confidence_threshold", reasoning_output or {})
             min_conf = float(conf_policy.get("min_confidence", 0.5) or 0.5)
             if rec == "enter" and confidence < min_conf:
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "low_confidence", "confidence": confidence, "id": reasoning_output.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -622,7 +873,7 @@ class DecisionOrchestrator:
                 return {"result": "veto", "reason": "low_confidence"}
         except Exception:
             if rec == "enter" and confidence < 0.5:
-                self._policy_counters["veto"] += 1
+                await self._bump_policy_counter("veto")
                 entry = {"ts": int(time.time() * 1000), "action": "veto", "reason": "low_confidence", "confidence": confidence, "id": reasoning_output.get("id")}
                 try:
                     self._policy_audit.append(entry)
@@ -632,7 +883,7 @@ class DecisionOrchestrator:
                 return {"result": "veto", "reason": "low_confidence"}
 
         # Allow other advisory outputs
-        self._policy_counters["pass"] += 1
+        await self._bump_policy_counter("pass")
         return {"result": "pass"}
 
     async def _execute_paper_trade_if_enabled(self, decision: Dict[str, Any]) -> Optional[str]:
@@ -722,6 +973,58 @@ class DecisionOrchestrator:
             logger.exception(f"Paper trade execution error (non-blocking): {e}")
             return None
 
+    async def _paper_trade_stage(self, decision: Dict[str, Any]) -> None:
+        """Paper Execution: simulate trade execution after PASS (observational)."""
+        started = time.perf_counter()
+        try:
+            await self._execute_paper_trade_if_enabled(decision)
+        except Exception as e:
+            logger.exception("Paper trade execution error (non-blocking): %s", e)
+        stage_latency_seconds.labels(pipeline="observer", stage="paper_trade").observe(time.perf_counter() - started)
+
+    async def _shadow_mode_stage(self, decision: Dict[str, Any]) -> None:
+        """SHADOW MODE: evaluate policies in observation-only mode.
+
+        Captures VETO decisions for the audit trail, never blocks execution.
+        """
+        started = time.perf_counter()
+        try:
+            from .policy_shadow_mode import evaluate_decision_shadow
+            shadow_result = await evaluate_decision_shadow(
+                decision,
+                signal_type=decision.get("signal_type"),
+                symbol=decision.get("symbol"),
+                timeframe=decision.get("timeframe"),
+            )
+            # Attach shadow result to decision for downstream logging/analysis
+            if shadow_result:
+                decision["_shadow_policy_result"] = shadow_result
+        except Exception as e:
+            # CRITICAL: Never block execution due to shadow mode errors
+            logger.exception("Shadow mode evaluation error (non-blocking): %s", e)
+        stage_latency_seconds.labels(pipeline="observer", stage="shadow_mode").observe(time.perf_counter() - started)
+
+    async def _run_observer_stages(self, decision: Dict[str, Any]) -> None:
+        """Run the observational stages of process_decision.
+
+        In "background" mode (default) they are queued on the bounded observer
+        executor and process_decision does not wait for them; they work on a
+        shallow copy so later pipeline mutations don't race them. In "inline"
+        mode they run concurrently and are awaited, and the shadow result is
+        attached to the decision before it is persisted.
+        """
+        mode = str(getattr(_cfg, "OBSERVER_STAGES_MODE", "background") or "background").lower()
+        if mode == "inline":
+            await asyncio.gather(self._paper_trade_stage(decision), self._shadow_mode_stage(decision))
+            return
+        observed = dict(decision)
+        self._observer_executor.submit(self._paper_trade_stage, observed)
+        self._observer_executor.submit(self._shadow_mode_stage, observed)
+
+    async def drain_observers(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued shadow-mode / paper-trade work; returns False on timeout."""
+        return await self._observer_executor.drain(timeout)
+
     def _load_paper_adapter_config(self) -> Dict[str, Any]:
         """Load paper_execution_adapter config from constraints."""
         return getattr(self, "_constraints", {}).get("paper_execution_adapter", {})
@@ -805,16 +1108,29 @@ class DecisionOrchestrator:
             self.engine = engine
             self._sessionmaker = sessionmaker
             await init_models(self.engine)
+            self._read_sessionmaker = self._create_read_sessionmaker()
         except Exception:
             # Fallback to older helper (engine-only). This keeps changes additive and safe.
             self.engine = create_engine_from_env_or_dsn(self.dsn)
             await init_models(self.engine)
+        # alert notifiers pull in aiohttp; import them only when wiring them up
+        from .alerts import SlackNotifier, DiscordNotifier, TelegramNotifier
         self.notifiers = {
             "slack": SlackNotifier(_cfg.SLACK_WEBHOOK_URL, engine=self.engine),
             "discord": DiscordNotifier(_cfg.DISCORD_WEBHOOK_URL, engine=self.engine),
             "telegram": TelegramNotifier(_cfg.TELEGRAM_TOKEN, _cfg.TELEGRAM_CHAT_ID, engine=self.engine),
         }
         start_metrics_server_if_enabled()
+        if getattr(_cfg, "LOOP_MONITOR_INTERVAL_SECONDS", 0) > 0 and self._loop_monitor is None:
+            try:
+                from .loop_monitor import acquire_loop_monitor
+
+                self._loop_monitor = acquire_loop_monitor(
+                    interval=_cfg.LOOP_MONITOR_INTERVAL_SECONDS,
+                    slow_threshold=_cfg.LOOP_SLOW_CALLBACK_SECONDS,
+                )
+            except Exception:
+                logger.exception("failed to start event loop monitor")
         # load optional metrics snapshot for outcome-aware policy
         try:
             metrics_path = os.getenv("METRICS_SNAPSHOT_PATH", "")
@@ -824,16 +1140,27 @@ class DecisionOrchestrator:
             pass
         # setup optional Redis DLQ with backoff
         try:
-            if _cfg.REDIS_DLQ_ENABLED and aioredis is not None:
+            if _cfg.REDIS_DLQ_ENABLED:
                 await self._ensure_redis()
         except Exception:
             logger.exception("error while configuring Redis DLQ")
 
+        # optional shared state for multi-replica deployments
+        if self.shared_state is None:
+            try:
+                backend = create_shared_state_from_settings()
+                if backend is not None:
+                    self.attach_shared_state(backend)
+            except Exception:
+                logger.exception("failed to configure shared state backend (using local state)")
+
         # Initialize policy shadow mode for observational evaluation
         try:
             from .policy_shadow_mode import initialize_shadow_mode
             from .outcome_stats import create_stats_service
-            stats_service = create_stats_service(self._sessionmaker or self.engine)
+            stats_service = self._start_outcome_snapshot(
+                create_stats_service(self._read_sessionmaker or self._sessionmaker or self.engine)
+            )
             success = await initialize_shadow_mode(stats_service)
             if success:
                 logger.info("Policy shadow mode initialized successfully")
@@ -856,14 +1183,9 @@ class DecisionOrchestrator:
             return False
         try:
             now = now or datetime.utcnow()
-            parts = q.split("-")
-            start = parts[0].strip()
-            end = parts[1].strip()
-            sh, sm = map(int, start.split(":"))
-            eh, em = map(int, end.split(":"))
+            # parsed once per distinct config value; lock-free read afterwards
+            start_t, end_t = _parse_quiet_hours(q)
             t = now.time()
-            start_t = dt_time(sh, sm)
-            end_t = dt_time(eh, em)
             if start_t < end_t:
                 return start_t <= t <= end_t
             else:
@@ -921,59 +1243,76 @@ class DecisionOrchestrator:
             end = override.get("end")
             if not start or not end:
                 return False
-            sh, sm = map(int, start.split(":"))
-            eh, em = map(int, end.split(":"))
-            start_t = dt_time(sh, sm)
-            end_t = dt_time(eh, em)
-            t = now.time()
-            if start_t < end_t:
-                return start_t <= t <= end_t
-            else:
-                return t >= start_t or t <= end_t
+            # "HH:MM" parsing is memoized
+            return in_window(parse_hhmm(start), parse_hhmm(end), seconds_of_day(now))
         except Exception:
             return False
 
+    @property
+    def _routing_rules(self) -> Dict[str, List[str]]:
+        return self._routing_rules_cfg
+
+    @_routing_rules.setter
+    def _routing_rules(self, value: Dict[str, List[str]]) -> None:
+        self._routing_rules_cfg = value or {}
+        self._routing_table = None
+
+    @property
+    def _routing_overrides(self) -> List[Dict[str, Any]]:
+        return self._routing_overrides_cfg
+
+    @_routing_overrides.setter
+    def _routing_overrides(self, value: List[Dict[str, Any]]) -> None:
+        self._routing_overrides_cfg = value or []
+        self._routing_table = None
+
+    @property
+    def _routing_decision_table(self) -> List[Dict[str, Any]]:
+        return self._routing_decision_table_cfg
+
+    @_routing_decision_table.setter
+    def _routing_decision_table(self, value: List[Dict[str, Any]]) -> None:
+        self._routing_decision_table_cfg = value or []
+        self._routing_table = None
+
+    def reload_routing(self, config: Dict[str, Any]) -> None:
+        """Replace routing rules, overrides and decision table, compiling them at once.
+
+        The new table is built before it is swapped in, so concurrent lookups
+        see either the old or the new configuration.
+        """
+        table = RoutingTable.from_config(config)
+        self._routing_rules_cfg = config.get("rules") or {}
+        self._routing_overrides_cfg = config.get("overrides") or []
+        self._routing_decision_table_cfg = config.get("table") or []
+        self._routing_table = table
+
+    def _maybe_reload_routing(self, force: bool = False) -> None:
+        if self._routing_watcher is None:
+            return
+        data = self._routing_watcher.poll(force=force)
+        if data is not None:
+            try:
+                self.reload_routing(data)
+            except Exception as e:
+                logger.warning("invalid routing config, keeping previous table: %s", e)
+
     def _get_routing_for_decision(self, decision: Dict[str, Any]) -> List[str]:
         """Resolve routing channels for a decision using:
            1) time-based overrides for the symbol (UTC)
-           2) exact symbol routing rules
-           3) tag-based routing rules (key format tag1|tag2 matches if all tags present)
-           4) wildcard symbol patterns ending with '*'
+           2) decision table entries by recommendation, symbol and confidence band
+           3) exact symbol routing rules
+           4) tag-based routing rules (key format tag1|tag2 matches if all tags present)
+           5) wildcard symbol patterns ending with '*'
+        Rules are compiled into a RoutingTable on first use / reload.
         """
-        symbol = decision.get("symbol", "")
-        tags = set(decision.get("tags", []) or [])
-
-        # 1) overrides
-        for ov in self._routing_overrides:
-            if ov.get("symbol") == symbol:
-                if self._in_override_window(ov):
-                    chs = ov.get("channels") or []
-                    if isinstance(chs, list) and chs:
-                        return chs
-
-        # 2) exact symbol
-        rules = self._routing_rules or {}
-        if symbol in rules:
-            return rules[symbol]
-
-        # 3) tag-based
-        matched = []
-        for key, chs in rules.items():
-            if "|" in key:
-                required = {p.strip() for p in key.split("|") if p.strip()}
-                if required and required.issubset(tags):
-                    matched.extend(chs)
-        if matched:
-            # return unique preserving order
-            return list(dict.fromkeys(matched))
-
-        # 4) wildcard symbol patterns
-        for key, chs in rules.items():
-            if key.endswith("*") and symbol.startswith(key[:-1]):
-                return chs
-
-        # default fallback: all channels
-        return ["slack", "discord", "telegram"]
+        self._maybe_reload_routing()
+        table = self._routing_table
+        if table is None:
+            table = self._routing_table = RoutingTable(
+                self._routing_rules_cfg, self._routing_overrides_cfg, self._routing_decision_table_cfg
+            )
+        return table.resolve(decision)
 
     async def execute_plan_if_enabled(self, plan: Dict[str, Any], execution_ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a plan if enabled, returning a PlanResult.
@@ -1040,166 +1379,218 @@ class DecisionOrchestrator:
             return {}
 
     async def process_decision(self, decision: Dict[str, Any], persist: bool = True, channels: Optional[List[str]] = None) -> Dict[str, Any]:
-        # Policy gate: pre-reasoning hook (placeholder)
+        # per-stage latency (decision_stage_latency_seconds{pipeline="process_decision"})
+        timer = StageTimer("process_decision")
         try:
-            # pass the raw incoming snapshot as-is; state/ctx are intentionally empty for now
-            _ = await self.pre_reasoning_policy_check(decision, state={}, ctx=None)
-        except Exception as e:
-            logger.exception("pre_reasoning_policy_check error: %s", e)
+            # Policy gate: pre-reasoning hook (placeholder)
+            try:
+                # pass the raw incoming snapshot as-is; state/ctx are intentionally empty for now
+                _ = await self.pre_reasoning_policy_check(decision, state={}, ctx=None)
+            except Exception as e:
+                logger.exception("pre_reasoning_policy_check error: %s", e)
+            timer.lap("pre_policy")
 
-        d = self._normalize_decision(decision)
-        # Policy gate: post-reasoning hook (placeholder)
-        try:
-            # pass the normalized decision as the reasoning output
-            _ = await self.post_reasoning_policy_check(d, state={}, ctx=None)
-        except Exception as e:
-            logger.exception("post_reasoning_policy_check error: %s", e)
-        
-        # Paper Execution: If enabled, simulate trade execution after PASS
-        # This is non-blocking and only executes if feature flag enabled
-        try:
-            await self._execute_paper_trade_if_enabled(d)
-        except Exception as e:
-            logger.exception("Paper trade execution error (non-blocking): %s", e)
-        
-        # SHADOW MODE: Evaluate policies in observation-only mode (non-blocking)
-        # Captures VETO decisions for audit trail, does NOT block execution
-        shadow_result = None
-        try:
-            from .policy_shadow_mode import evaluate_decision_shadow
-            shadow_result = await evaluate_decision_shadow(
-                d,
-                signal_type=d.get("signal_type"),
-                symbol=d.get("symbol"),
-                timeframe=d.get("timeframe"),
-            )
-            # Attach shadow result to decision for downstream logging/analysis
-            if shadow_result:
-                d["_shadow_policy_result"] = shadow_result
-        except Exception as e:
-            logger.exception("Shadow mode evaluation error (non-blocking): %s", e)
-            # CRITICAL: Never block execution due to shadow mode errors
+            d = self._normalize_decision(decision)
+            timer.lap("normalize")
+            # Policy gate: post-reasoning hook (placeholder)
+            try:
+                # pass the normalized decision as the reasoning output
+                _ = await self.post_reasoning_policy_check(d, state={}, ctx=None)
+            except Exception as e:
+                logger.exception("post_reasoning_policy_check error: %s", e)
+            timer.lap("post_policy")
+
+            # Observational stages (paper trade, shadow mode) don't feed the
+            # dedup -> persist -> notify path, so they run off the critical path
+            await self._run_observer_stages(d)
+            timer.lap("observers")
         
-        symbol = d["symbol"]
-        rec = d.get("recommendation")
-        conf = float(d.get("confidence", 0.0))
-        ts_ms = int(d.get("timestamp_ms", int(time.time() * 1000)))
-        # Use normalized dedup key which avoids raw timestamp/float sensitivity
-        decision_hash = self._compute_dedup_key(d)
-        now_ts = time.time()
-
-        # dedup in-memory
-        skipped = False
-        if _cfg.DEDUP_ENABLED:
-            # try optional Redis-based dedup first (SETNX + EXPIRE)
-            if _cfg.REDIS_DEDUP_ENABLED and getattr(self, "_redis", None) is not None:
-                try:
-                    key = f"{_cfg.REDIS_DEDUP_PREFIX}{decision_hash}"
-                    # SETNX equivalent: set with nx=True and expire
+            symbol = d["symbol"]
+            rec = d.get("recommendation")
+            conf = float(d.get("confidence", 0.0))
+            ts_ms = int(d.get("timestamp_ms", int(time.time() * 1000)))
+            # Use normalized dedup key which avoids raw timestamp/float sensitivity
+            decision_hash = self._compute_dedup_key(d)
+            now_ts = time.time()
+
+            # dedup in-memory
+            skipped = False
+            if _cfg.DEDUP_ENABLED:
+                # try optional Redis-based dedup first (SETNX + EXPIRE)
+                if _cfg.REDIS_DEDUP_ENABLED and getattr(self, "_redis", None) is not None:
                     try:
-                        from utils.redis_wrapper import RedisUnavailable, RedisOpFailed
-                        _rres = await redis_op(self, lambda r, k, v, ex, nx: r.set(k, v, ex=ex, nx=nx), key, "1", ex=int(_cfg.REDIS_DEDUP_TTL_SECONDS), nx=True)
-                        # redis_op returns a dict {ok: True, value: <raw>} for success
-                        r = _rres.get("value") if isinstance(_rres, dict) else _rres
-                        # many redis clients return True/False for set nx; treat falsy as already present
-                        if not r:
-                            deduplicated_decisions_total.inc()
-                            skipped = True
-                    except (RedisUnavailable, RedisOpFailed):
-                        # fallback to in-memory dedup if redis op fails
-                        pass
+                        key = f"{_cfg.REDIS_DEDUP_PREFIX}{decision_hash}"
+                        # SETNX equivalent: set with nx=True and expire
+                        try:
+                            from utils.redis_wrapper import RedisUnavailable, RedisOpFailed
+                            _rres = await redis_op(self, lambda r, k, v, ex, nx: r.set(k, v, ex=ex, nx=nx), key, "1", ex=int(_cfg.REDIS_DEDUP_TTL_SECONDS), nx=True)
+                            # redis_op returns a dict {ok: True, value: <raw>} for success
+                            r = _rres.get("value") if isinstance(_rres, dict) else _rres
+                            # many redis clients return True/False for set nx; treat falsy as already present
+                            if not r:
+                                deduplicated_decisions_total.inc()
+                                skipped = True
+                        except (RedisUnavailable, RedisOpFailed):
+                            # fallback to in-memory dedup if redis op fails
+                            pass
+                        except Exception:
+                            # any other redis error -> fallback to in-memory
+                            pass
+                        else:
+                            # marked in redis; continue processing
+                            pass
                     except Exception:
-                        # any other redis error -> fallback to in-memory
-                        pass
-                    else:
-                        # marked in redis; continue processing
+                        # fallback to in-memory dedup on redis error
                         pass
-                except Exception:
-                    # fallback to in-memory dedup on redis error
-                    pass
+                elif self.shared_state is not None:
+                    # shared dedup so replicas never notify the same decision twice
+                    try:
+                        if not await self.shared_state.check_and_set_dedup(decision_hash, int(_cfg.DEDUP_WINDOW_SECONDS)):
+                            deduplicated_decisions_total.inc()
+                            skipped = True
+                    except Exception as e:
+                        logger.warning("shared dedup check failed (fail-open): %s", e)
+            timer.lap("dedup")
 
-        # persist
-        dec_id = None
-        if persist:
-            try:
-                # Prefer sessionmaker-based persistence (sessionmaker is created in setup)
-                session_arg = self._sessionmaker if self._sessionmaker is not None else self.engine
-                dec_id = await insert_decision(session_arg, symbol=symbol, decision_text=json.dumps(d), raw=d, bias=d.get("bias","neutral"), confidence=conf, recommendation=rec, repair_used=bool(d.get("repair_used")), fallback_used=bool(d.get("fallback_used")), duration_ms=int(d.get("duration_ms",0)), ts_ms=ts_ms)
-                decisions_processed_total.labels(result="persisted").inc()
-            except Exception as e:
-                decisions_processed_total.labels(result="failed").inc()
-                logger.exception("persist failure: %s", e)
-                # Non-blocking fallback: enqueue decision to in-memory DLQ for later retry
+            # persist
+            dec_id = None
+            if persist:
                 try:
-                    # annotate DLQ entry with attempts and schedule for immediate retry
-                    entry = {"decision": d, "error": str(e), "ts": int(time.time() * 1000), "attempts": 0, "next_attempt_ts": 0.0}
-                    if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
-                        # push JSON serialized entry to Redis list (RPUSH)
-                        try:
-                            from utils.redis_wrapper import RedisUnavailable, RedisOpFailed
-                            await redis_op(self, lambda r, key, v: r.rpush(key, v), _cfg.REDIS_DLQ_KEY, json.dumps(entry))
-                            # update dlq size metric if available
-                            try:
-                                llen = await redis_op(self, lambda r, key: r.llen(key), _cfg.REDIS_DLQ_KEY)
-                                try:
-                                    dlq_size.set(llen)
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-                            logger.warning("Decision persisted to Redis DLQ (will retry later)")
-                        except (RedisUnavailable, RedisOpFailed) as re:
-                            logger.exception("failed to push to redis DLQ, falling back to in-memory: %s", re)
-                            async with self._dlq_lock:
-                                self._persist_dlq.append(entry)
-                    else:
-                        async with self._dlq_lock:
-                            self._persist_dlq.append(entry)
-                            logger.warning("Decision persisted to in-memory DLQ (will retry later)")
-                            try:
-                                dlq_size.set(len(self._persist_dlq))
-                            except Exception:
-                                pass
-                except Exception as dlq_e:
-                    logger.error("Failed to enqueue to in-memory DLQ: %s", dlq_e)
-                dec_id = None
-        else:
-            decisions_processed_total.labels(result="skipped_persist").inc()
+                    # Prefer sessionmaker-based persistence (sessionmaker is created in setup)
+                    session_arg = self._sessionmaker if self._sessionmaker is not None else self.engine
+                    dec_id = await insert_decision(session_arg, symbol=symbol, decision_text=_decision_text(d), raw=d, bias=d.get("bias","neutral"), confidence=conf, recommendation=rec, repair_used=bool(d.get("repair_used")), fallback_used=bool(d.get("fallback_used")), duration_ms=int(d.get("duration_ms",0)), ts_ms=ts_ms)
+                    decisions_processed_total.labels(result="persisted").inc()
+                except Exception as e:
+                    decisions_processed_total.labels(result="failed").inc()
+                    logger.exception("persist failure: %s", e)
+                    await self._enqueue_persist_failure(d, e)
+                    dec_id = None
+            else:
+                decisions_processed_total.labels(result="skipped_persist").inc()
+            timer.lap("persist")
 
-        # channel selection
-        if channels is None:
-            routed = self._get_routing_for_decision(d)
-        else:
-            routed = channels
+            # channel selection
+            if channels is None:
+                routed = self._get_routing_for_decision(d)
+            else:
+                routed = channels
+            timer.lap("routing")
 
-        # quiet hours check
-        if self._is_quiet_hours() and not d.get("urgent", False):
-            results = {ch: {"ok": False, "skipped": True, "reason": "quiet_hours"} for ch in routed}
-            return {"id": dec_id, "skipped": skipped, "notify_results": results}
+            # quiet hours check
+            if self._is_quiet_hours() and not d.get("urgent", False):
+                results = {ch: {"ok": False, "skipped": True, "reason": "quiet_hours"} for ch in routed}
+                return {"id": dec_id, "skipped": skipped, "notify_results": results}
 
-        # concurrent notify
-        tasks = []
-        for ch in routed:
-            notifier = self.notifiers.get(ch)
-            if not notifier:
-                continue
-            tasks.append(notifier.notify(d, decision_id=dec_id))
-        notify_results = {}
-        if tasks and not skipped:
-            # Use return_exceptions=True so one notifier failure doesn't cancel others
-            res_list = await asyncio.gather(*tasks, return_exceptions=True)
-            for ch, r in zip(routed, res_list):
-                if isinstance(r, Exception):
-                    # Normalize exception into a notifier result dict, preserve exception text
-                    logger.error(f"Notifier {ch} raised: {r}")
-                    notify_results[ch] = {"ok": False, "error": str(r)}
-                else:
-                    notify_results[ch] = r
-        else:
+            # concurrent notify
+            tasks = []
             for ch in routed:
-                notify_results[ch] = {"ok": False, "skipped": True}
+                notifier = self.notifiers.get(ch)
+                if not notifier:
+                    continue
+                tasks.append(notifier.notify(d, decision_id=dec_id))
+            notify_results = {}
+            if tasks and not skipped:
+                # Use return_exceptions=True so one notifier failure doesn't cancel others
+                res_list = await asyncio.gather(*tasks, return_exceptions=True)
+                for ch, r in zip(routed, res_list):
+                    if isinstance(r, Exception):
+                        # Normalize exception into a notifier result dict, preserve exception text
+                        logger.error(f"Notifier {ch} raised: {r}")
+                        notify_results[ch] = {"ok": False, "error": str(r)}
+                    else:
+                        notify_results[ch] = r
+            else:
+                for ch in routed:
+                    notify_results[ch] = {"ok": False, "skipped": True}
+            timer.lap("notify")
+
+            return {"id": dec_id, "skipped": skipped, "notify_results": notify_results}
+        finally:
+            timer.finish()
 
-        return {"id": dec_id, "skipped": skipped, "notify_results": notify_results}
+    def _start_outcome_snapshot(self, stats_service: Any) -> Any:
+        """Start the outcome metrics refresher and return a snapshot-backed stats service.
+
+        Returns ``stats_service`` unchanged when the refresher is disabled, no
+        sessionmaker is available or the database is in-memory SQLite.
+        """
+        if self._sessionmaker is None or _cfg.OUTCOME_SNAPSHOT_REFRESH_SECONDS <= 0:
+            return stats_service
+        url = getattr(self.engine, "url", None)
+        if url is not None and url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            # one shared in-memory connection cannot serve a concurrent background reader
+            return stats_service
+        try:
+            from .outcome_snapshot import OutcomeSnapshotRefresher, SnapshotStatsService
+
+            self._outcome_snapshot = OutcomeSnapshotRefresher(
+                self._read_sessionmaker or self._sessionmaker,
+                interval=_cfg.OUTCOME_SNAPSHOT_REFRESH_SECONDS,
+                min_interval=_cfg.OUTCOME_SNAPSHOT_MIN_REFRESH_SECONDS,
+                full_interval=getattr(_cfg, "OUTCOME_SNAPSHOT_FULL_REBUILD_SECONDS", 3600.0),
+            )
+            # opt-in: the live snapshot replaces the (empty or file-loaded) outcome veto metrics;
+            # an explicit METRICS_SNAPSHOT_PATH file keeps feeding the veto
+            if getattr(_cfg, "OUTCOME_VETO_LIVE_SNAPSHOT", False) and not os.getenv("METRICS_SNAPSHOT_PATH", ""):
+                self._outcome_snapshot.add_listener(self._on_outcome_snapshot)
+            self._outcome_snapshot.start()
+            return SnapshotStatsService(self._outcome_snapshot, fallback=stats_service)
+        except Exception:
+            logger.exception("failed to start outcome metrics snapshot refresher")
+            self._outcome_snapshot = None
+            return stats_service
+
+    def _create_read_sessionmaker(self) -> Any:
+        """Route read-only services to DB_REPLICA_DSN when configured, else share the primary."""
+        replica_dsn = getattr(_cfg, "DB_REPLICA_DSN", "")
+        if not replica_dsn:
+            return self._sessionmaker
+        try:
+            from .db_routing import create_read_sessionmaker
+
+            return create_read_sessionmaker(self._sessionmaker, replica_dsn, cfg=_cfg)
+        except Exception:
+            logger.exception("failed to configure read replica; reads use the primary")
+            return self._sessionmaker
+
+    def _on_outcome_snapshot(self, snapshot: Any) -> None:
+        # reference swap; pre_reasoning_policy_check reads whichever mapping is current
+        self._metrics_snapshot = snapshot.by_model_session
+
+    async def _enqueue_persist_failure(self, d: Dict[str, Any], e: Exception) -> None:
+        """Non-blocking fallback: enqueue a decision that failed to persist for later retry."""
+        try:
+            # annotate DLQ entry with attempts and schedule for immediate retry
+            entry = {"decision": d, "error": str(e), "ts": int(time.time() * 1000), "attempts": 0, "next_attempt_ts": 0.0}
+            if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
+                # push JSON serialized entry to Redis list (RPUSH)
+                try:
+                    from utils.redis_wrapper import RedisUnavailable, RedisOpFailed
+                    await redis_op(self, lambda r, key, v: r.rpush(key, v), _cfg.REDIS_DLQ_KEY, json.dumps(entry))
+                    # update dlq size metric if available
+                    try:
+                        llen = await redis_op(self, lambda r, key: r.llen(key), _cfg.REDIS_DLQ_KEY)
+                        try:
+                            dlq_size.set(llen)
+                        except Exception:
+                            pass
+                    except Exception:
+                        pass
+                    logger.warning("Decision persisted to Redis DLQ (will retry later)")
+                except (RedisUnavailable, RedisOpFailed) as re:
+                    logger.exception("failed to push to redis DLQ, falling back to in-memory: %s", re)
+                    async with self._dlq_lock:
+                        self._persist_dlq.append(entry)
+            else:
+                async with self._dlq_lock:
+                    self._persist_dlq.append(entry)
+                    logger.warning("Decision persisted to in-memory DLQ (will retry later)")
+                    try:
+                        dlq_size.set(len(self._persist_dlq))
+                    except Exception:
+                        pass
+        except Exception as dlq_e:
+            logger.error("Failed to enqueue to in-memory DLQ: %s", dlq_e)
 
     async def notify(self, channel: str, payload: Dict[str, Any], ctx: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Adapter to route a single notification through configured notifiers.
@@ -1424,6 +1815,7 @@ class DecisionOrchestrator:
         Returns:
             EventResult with status, reason, decision_id, and metadata
         """
+        timer = StageTimer("handle_event")
         try:
             # 1. Pre-Validation: Check event structure and system state
             if not isinstance(event, Event):
@@ -1432,21 +1824,25 @@ class DecisionOrchestrator:
             if not event.event_type or not isinstance(event.payload, dict):
                 return EventResult(status="error", reason="malformed_event")
 
-            # Check system state constraints (cooldowns, session windows)
-            async with self._lock:
+            # Check system state constraints (cooldowns, session windows).
+            # Striped by event type + symbol so independent symbols don't serialize.
+            global_cooldown_until = await self._get_global_cooldown_until()
+            stripe_key = (event.event_type, str(event.payload.get("symbol", "")).upper())
+            async with self._event_locks.acquire(stripe_key):
                 now_ms = int(time.time() * 1000)
 
-                # Check global cooldowns
-                if hasattr(self, '_global_cooldown_until') and self._global_cooldown_until > now_ms:
+                # Check global cooldowns (local or shared across replicas)
+                if global_cooldown_until > now_ms:
                     return EventResult(
                         status="deferred",
                         reason="global_cooldown_active",
-                        metadata={"next_attempt_ts": self._global_cooldown_until}
+                        metadata={"next_attempt_ts": global_cooldown_until}
                     )
 
                 # Check session windows (quiet hours, etc.)
                 if self._is_quiet_hours():
                     return EventResult(status="deferred", reason="quiet_hours_active")
+            timer.lap("constraints")
 
             # 2. Policy Check: Route based on event type and enforce constraints
             if event.event_type == "decision":
@@ -1457,6 +1853,7 @@ class DecisionOrchestrator:
 
                 # Apply pre-reasoning policy checks
                 policy_result = await self.pre_reasoning_policy_check(decision)
+                timer.lap("pre_policy")
                 if policy_result.get("result") == "veto":
                     return EventResult(
                         status="rejected",
@@ -1513,6 +1910,7 @@ class DecisionOrchestrator:
                     except Exception as e:
                         advisory_errors.append(f"reasoning_exception: {str(e)}")
                         logger.warning("Reasoning exception (non-fatal): %s", e)
+                    timer.lap("reasoning")
 
                 # 3. Plan Execution: If decision contains plan, execute it
                 plan_result = None
@@ -1542,10 +1940,12 @@ class DecisionOrchestrator:
                             )
                     except Exception as e:
                         advisory_errors.append(f"plan_execution_error: {str(e)}")
+                    timer.lap("plan_execution")
 
                 # 4. Process the decision through normal flow
                 try:
                     await self.process_decision(decision)
+                    timer.lap("process_decision")
                     decision_id = decision.get("id") or event.correlation_id
                     return EventResult(
                         status="accepted",
@@ -1604,23 +2004,218 @@ class DecisionOrchestrator:
 
         except Exception as e:
             # 5. State Update: Record any errors atomically
-            async with self._lock:
+            await self._record_event_error(event, e)
+            return EventResult(status="error", reason=f"unexpected_error: {str(e)}")
+        finally:
+            timer.finish()
+
+    async def _record_event_error(self, event: Any, e: Exception) -> None:
+        async with self._lock:
+            try:
+                if not hasattr(self, '_event_errors'):
+                    self._event_errors = []
+                self._event_errors.append({
+                    "ts": int(time.time() * 1000),
+                    "event_type": getattr(event, 'event_type', 'unknown'),
+                    "correlation_id": getattr(event, 'correlation_id', 'unknown'),
+                    "error": str(e)
+                })
+                # Keep only recent errors
+                if len(self._event_errors) > 100:
+                    self._event_errors = self._event_errors[-100:]
+            except Exception:
+                pass  # Never fail on error recording
+
+    async def handle_events_batch(self, events: List[Event]) -> List[EventResult]:
+        """Bulk form of handle_event for replays and catch-up after downtime.
+
+        Plain decision events are validated and policy-checked per event, then
+        deduplicated in one round-trip, persisted with one bulk insert and
+        notified in per-channel groups. Events that need the full per-event
+        path (non-decision types, plans, reasoning) are delegated to
+        handle_event. Results are returned in input order.
+
+        Args:
+            events: Events to ingest
+
+        Returns:
+            One EventResult per input event, in the same order
+        """
+        timer = StageTimer("handle_events_batch")
+        results: List[Optional[EventResult]] = [None] * len(events)
+        try:
+            # 1. Pre-Validation; system constraints are evaluated once per batch
+            now_ms = int(time.time() * 1000)
+            global_cooldown_until = await self._get_global_cooldown_until()
+            quiet = self._is_quiet_hours()
+            candidates: List[Tuple[int, Event]] = []
+            for i, event in enumerate(events):
+                if not isinstance(event, Event):
+                    results[i] = EventResult(status="error", reason="invalid_event_type")
+                elif not event.event_type or not isinstance(event.payload, dict):
+                    results[i] = EventResult(status="error", reason="malformed_event")
+                elif global_cooldown_until > now_ms:
+                    results[i] = EventResult(
+                        status="deferred",
+                        reason="global_cooldown_active",
+                        metadata={"next_attempt_ts": global_cooldown_until}
+                    )
+                elif quiet:
+                    results[i] = EventResult(status="deferred", reason="quiet_hours_active")
+                elif (
+                    event.event_type != "decision"
+                    or self.reasoning_manager is not None
+                    or ("plan" in event.payload and "execution_context" in event.payload)
+                ):
+                    results[i] = await self.handle_event(event)
+                else:
+                    candidates.append((i, event))
+            timer.lap("validate")
+
+            # 2. Policy Check per event, then the process_decision pre-persist stages
+            batch: List[Tuple[int, Event, Dict[str, Any]]] = []
+            for i, event in candidates:
+                policy_result = await self.pre_reasoning_policy_check(event.payload)
+                if policy_result.get("result") == "veto":
+                    results[i] = EventResult(
+                        status="rejected",
+                        reason=policy_result.get("reason", "policy_veto"),
+                        metadata={"policy_result": policy_result}
+                    )
+                    continue
+                if policy_result.get("result") == "defer":
+                    results[i] = EventResult(
+                        status="deferred",
+                        reason=policy_result.get("reason", "policy_defer"),
+                        metadata={"policy_result": policy_result}
+                    )
+                    continue
+                d = self._normalize_decision(event.payload)
                 try:
-                    if not hasattr(self, '_event_errors'):
-                        self._event_errors = []
-                    self._event_errors.append({
-                        "ts": int(time.time() * 1000),
-                        "event_type": getattr(event, 'event_type', 'unknown'),
-                        "correlation_id": getattr(event, 'correlation_id', 'unknown'),
-                        "error": str(e)
-                    })
-                    # Keep only recent errors
-                    if len(self._event_errors) > 100:
-                        self._event_errors = self._event_errors[-100:]
-                except Exception:
-                    pass  # Never fail on error recording
+                    _ = await self.post_reasoning_policy_check(d, state={}, ctx=None)
+                except Exception as e:
+                    logger.exception("post_reasoning_policy_check error: %s", e)
+                batch.append((i, event, d))
+            await asyncio.gather(*(self._run_observer_stages(d) for _, _, d in batch))
+            timer.lap("policy")
+
+            if batch:
+                decisions = [d for _, _, d in batch]
+                # 3. one dedup round-trip, 4. one bulk insert, 5. grouped notify
+                fresh = await self._dedup_many([self._compute_dedup_key(d) for d in decisions])
+                timer.lap("dedup")
+                dec_ids = await self._persist_many(decisions)
+                timer.lap("persist")
+                notify_results = await self._notify_grouped(decisions, dec_ids, fresh)
+                timer.lap("notify")
+                for (i, event, d), dec_id, is_new, notified in zip(batch, dec_ids, fresh, notify_results):
+                    results[i] = EventResult(
+                        status="accepted",
+                        decision_id=event.payload.get("id") or event.correlation_id,
+                        metadata={
+                            "plan_result": None,
+                            "advisory_signals": [],
+                            "advisory_errors": [],
+                            "record_id": dec_id,
+                            "deduplicated": not is_new,
+                            "notify_results": notified,
+                        }
+                    )
+        except Exception as e:
+            await self._record_event_error(SimpleNamespace(event_type="batch", correlation_id=f"batch[{len(events)}]"), e)
+            for i, res in enumerate(results):
+                if res is None:
+                    results[i] = EventResult(status="error", reason=f"unexpected_error: {str(e)}")
+        finally:
+            timer.finish()
+        return results
+
+    async def _dedup_many(self, hashes: List[str]) -> List[bool]:
+        """Check-and-set dedup keys for a batch; True means first sighting (fail-open)."""
+        if not hashes or not _cfg.DEDUP_ENABLED:
+            return [True] * len(hashes)
+        fresh: Optional[List[bool]] = None
+        if _cfg.REDIS_DEDUP_ENABLED and getattr(self, "_redis", None) is not None:
+            keys = [f"{_cfg.REDIS_DEDUP_PREFIX}{h}" for h in hashes]
+            ttl = int(_cfg.REDIS_DEDUP_TTL_SECONDS)
+
+            async def _set_nx_all(r):
+                if hasattr(r, "pipeline"):
+                    pipe = r.pipeline(transaction=False)
+                    for k in keys:
+                        pipe.set(k, "1", ex=ttl, nx=True)
+                    return await pipe.execute()
+                return [await r.set(k, "1", ex=ttl, nx=True) for k in keys]
 
-            return EventResult(status="error", reason=f"unexpected_error: {str(e)}")
+            try:
+                _rres = await redis_op(self, _set_nx_all)
+                raw = _rres.get("value") if isinstance(_rres, dict) else _rres
+                fresh = [bool(v) for v in raw]
+            except Exception as e:
+                logger.warning("batch redis dedup failed (fail-open): %s", e)
+        elif self.shared_state is not None:
+            try:
+                fresh = await self.shared_state.check_and_set_dedup_many(hashes, int(_cfg.DEDUP_WINDOW_SECONDS))
+            except Exception as e:
+                logger.warning("batch shared dedup failed (fail-open): %s", e)
+        if fresh is None or len(fresh) != len(hashes):
+            return [True] * len(hashes)
+        dupes = fresh.count(False)
+        if dupes:
+            deduplicated_decisions_total.inc(dupes)
+        return fresh
+
+    async def _persist_many(self, decisions: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Persist decisions with one bulk insert; on failure every row goes to the DLQ."""
+        session_arg = self._sessionmaker if self._sessionmaker is not None else self.engine
+        try:
+            ids = await insert_decisions_bulk(session_arg, [self._decision_insert_kwargs(d) for d in decisions])
+            decisions_processed_total.labels(result="persisted").inc(len(decisions))
+            return list(ids)
+        except Exception as e:
+            decisions_processed_total.labels(result="failed").inc(len(decisions))
+            logger.exception("bulk persist failure (%d decisions): %s", len(decisions), e)
+            for d in decisions:
+                await self._enqueue_persist_failure(d, e)
+            return [None] * len(decisions)
+
+    async def _notify_grouped(
+        self, decisions: List[Dict[str, Any]], dec_ids: List[Optional[str]], fresh: List[bool]
+    ) -> List[Dict[str, Any]]:
+        """Notify a batch grouped by channel; uses a notifier's notify_batch when it has one."""
+        per_decision: List[Dict[str, Any]] = [{} for _ in decisions]
+        by_channel: Dict[str, List[int]] = {}
+        for idx, d in enumerate(decisions):
+            for ch in self._get_routing_for_decision(d):
+                if fresh[idx]:
+                    by_channel.setdefault(ch, []).append(idx)
+                else:
+                    per_decision[idx][ch] = {"ok": False, "skipped": True}
+
+        async def _send(ch: str, idxs: List[int]) -> None:
+            notifier = self.notifiers.get(ch)
+            if not notifier:
+                return
+            try:
+                notify_batch = getattr(notifier, "notify_batch", None)
+                if notify_batch is not None:
+                    res_list = await notify_batch([(decisions[i], dec_ids[i]) for i in idxs])
+                else:
+                    res_list = await asyncio.gather(
+                        *(notifier.notify(decisions[i], decision_id=dec_ids[i]) for i in idxs),
+                        return_exceptions=True,
+                    )
+            except Exception as e:
+                res_list = [e] * len(idxs)
+            for i, r in zip(idxs, res_list):
+                if isinstance(r, Exception):
+                    logger.error(f"Notifier {ch} raised: {r}")
+                    per_decision[i][ch] = {"ok": False, "error": str(r)}
+                else:
+                    per_decision[i][ch] = r
+
+        await asyncio.gather(*(_send(ch, idxs) for ch, idxs in by_channel.items()))
+        return per_decision
 
     async def close(self):
         # stop DLQ retry task
@@ -1632,6 +2227,13 @@ class DecisionOrchestrator:
                 pass
             except Exception:
                 logger.exception("error stopping DLQ task")
+        # let queued observer work finish before tearing down its dependencies
+        await self._observer_executor.close()
+        if self._outcome_snapshot is not None:
+            await self._outcome_snapshot.stop()
+        close_policies = getattr(self.policy_store, "close", None)
+        if close_policies is not None:
+            await close_policies()
         # close redis client if present
         if self._redis:
             try:
@@ -1643,6 +2245,33 @@ class DecisionOrchestrator:
                     pass
             except Exception:
                 logger.exception("error closing redis client")
+        if self.shared_state is not None:
+            task = self._policy_counter_flush_task
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            if self._policy_counter_pending:
+                await self._flush_policy_counters()
+            await self.shared_state.close()
+        exporter = get_trace_exporter()
+        if exporter is not None:
+            exporter.flush()
+        if isinstance(self._policy_audit, AuditRing):
+            await self._policy_audit.aflush()
+        if self._loop_monitor is not None:
+            from .loop_monitor import release_loop_monitor
+
+            await release_loop_monitor(self._loop_monitor)
+            self._loop_monitor = None
+        read_sessionmaker = getattr(self, "_read_sessionmaker", None)
+        if read_sessionmaker is not None and read_sessionmaker is not self._sessionmaker:
+            try:
+                await read_sessionmaker.close()
+            except Exception:
+                logger.exception("error closing read replica engine")
         if self.engine:
             await self.engine.dispose()
 
@@ -1653,12 +2282,15 @@ class DecisionOrchestrator:
         """
         poll_interval = max(0.5, float(get_settings().DLQ_POLL_INTERVAL_SECONDS or 5))
         while True:
+            drained = 0
             try:
-                await self._dlq_retry_once()
+                drained = await self._dlq_retry_once() or 0
             except Exception:
                 logger.exception("error during DLQ retry iteration")
+            # a full batch means a backlog remains: keep draining without waiting
+            batch_size = max(1, int(getattr(get_settings(), "DLQ_BATCH_SIZE", 1) or 1))
             try:
-                await asyncio.sleep(poll_interval)
+                await asyncio.sleep(0 if batch_size > 1 and drained >= batch_size else poll_interval)
             except asyncio.CancelledError:
                 break
 
@@ -1733,11 +2365,12 @@ class DecisionOrchestrator:
         self._redis_circuit_open_until = time.time() + cooldown
         logger.error("could not establish redis connection for DLQ after %d attempts, circuit open for %.1fs", max_attempts, cooldown)
 
-    async def _dlq_retry_once(self) -> None:
-        """Process the in-memory DLQ once: try eligible entries whose next_attempt_ts <= now.
+    async def _dlq_retry_once(self) -> Optional[int]:
+        """Process the DLQ once: try eligible entries whose next_attempt_ts <= now.
 
         Uses exponential backoff and removes successful entries. Entries exceeding
-        max attempts will be logged and dropped.
+        max attempts will be logged and dropped. Returns the number of due
+        entries processed so the retry loop can keep draining a backlog.
         """
         now = time.time()
         base_delay = float(get_settings().DLQ_BASE_DELAY_SECONDS or 1.0)
@@ -1749,6 +2382,9 @@ class DecisionOrchestrator:
         if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
             try:
                 from utils.redis_wrapper import RedisUnavailable, RedisOpFailed
+                batch_size = max(1, int(getattr(get_settings(), "DLQ_BATCH_SIZE", 1) or 1))
+                if batch_size > 1 and hasattr(self._redis, "pipeline"):
+                    return await self._dlq_retry_redis_batch(batch_size, now, base_delay, max_delay, max_retries)
                 # use LPOP to get oldest entry
                 _raw_res = await redis_op(self, lambda r, key: r.lpop(key), _cfg.REDIS_DLQ_KEY)
                 raw = _raw_res.get("value") if isinstance(_raw_res, dict) else _raw_res
@@ -1762,79 +2398,211 @@ class DecisionOrchestrator:
                 entries = [entry]
             except (RedisUnavailable, RedisOpFailed):
                 logger.exception("error reading from redis DLQ, falling back to in-memory for this iteration")
-                async with self._dlq_lock:
-                    entries = list(self._persist_dlq)
+                return await self._dlq_retry_memory(now, base_delay, max_delay, max_retries)
         else:
-            # copy indices to avoid mutation during iteration
-            async with self._dlq_lock:
-                entries = list(self._persist_dlq)
-
-        if not entries:
-            return
+            return await self._dlq_retry_memory(now, base_delay, max_delay, max_retries)
 
-        for idx, entry in enumerate(entries):
+        processed = 0
+        for entry in entries:
             try:
-                attempts = int(entry.get("attempts", 0))
-                next_ts = float(entry.get("next_attempt_ts", 0.0) or 0.0)
-                if next_ts > now:
-                    continue
-
-                decision = entry.get("decision")
-                # choose session arg like primary flow
-                session_arg = self._sessionmaker if self._sessionmaker is not None else self.engine
-                try:
-                    dec_id = await insert_decision(session_arg, symbol=decision.get("symbol"), decision_text=json.dumps(decision), raw=decision, bias=decision.get("bias","neutral"), confidence=float(decision.get("confidence",0.0)), recommendation=decision.get("recommendation"), repair_used=bool(decision.get("repair_used")), fallback_used=bool(decision.get("fallback_used")), duration_ms=int(decision.get("duration_ms",0)), ts_ms=int(decision.get("timestamp_ms", int(time.time()*1000))))
-                    logger.info("DLQ retry success for symbol=%s attempts=%d dec_id=%s", decision.get("symbol"), attempts, dec_id)
-                    # if using redis we already popped the entry; nothing else to do
-                    if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
-                        # success: already removed via LPOP
-                        pass
-                    else:
-                        # remove entry from in-memory list
-                        async with self._dlq_lock:
-                            try:
-                                self._persist_dlq.remove(entry)
-                            except ValueError:
-                                pass
+                if float(entry.get("next_attempt_ts", 0.0) or 0.0) > now:
+                    # popped before it was due: put it back untouched
+                    await redis_op(self, lambda r, key, v: r.rpush(key, v), _cfg.REDIS_DLQ_KEY, json.dumps(entry))
                     continue
-                except Exception as e:
-                    attempts += 1
-                    # compute next attempt ts with exponential backoff
-                    delay = min(max_delay, base_delay * (2 ** (attempts - 1)))
-                    next_attempt = now + delay
-                    entry["attempts"] = attempts
-                    entry["error"] = str(e)
-                    entry["next_attempt_ts"] = next_attempt
-                    if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
+                processed += 1
+                for failed, err in await self._dlq_persist_batch([entry]):
+                    if self._dlq_schedule_retry(failed, err, now, base_delay, max_delay, max_retries):
                         # push back to redis with updated metadata (RPUSH)
                         try:
-                            await redis_op(self, lambda r, key, v: r.rpush(key, v), _cfg.REDIS_DLQ_KEY, json.dumps(entry))
+                            await redis_op(self, lambda r, key, v: r.rpush(key, v), _cfg.REDIS_DLQ_KEY, json.dumps(failed))
                         except Exception:
                             logger.exception("failed to push failed entry back to redis DLQ")
-                    else:
-                        async with self._dlq_lock:
-                            # update stored entry (if still present)
-                            for i, stored in enumerate(self._persist_dlq):
-                                if stored is entry or stored.get("ts") == entry.get("ts"):
-                                    self._persist_dlq[i] = entry
-                                    break
-                        try:
-                            dlq_retries_total.inc()
-                        except Exception:
-                            pass
-                    if attempts >= max_retries:
-                        logger.error("DLQ entry exceeded max retries and will be dropped symbol=%s attempts=%d error=%s", decision.get("symbol"), attempts, str(e))
-                        if _cfg.REDIS_DLQ_ENABLED and self._redis is not None:
-                            # entry already popped; nothing to remove
-                            pass
-                        else:
-                            async with self._dlq_lock:
-                                try:
-                                    self._persist_dlq.remove(entry)
-                                except ValueError:
-                                    pass
-                    else:
-                        logger.warning("DLQ retry failed for symbol=%s attempts=%d next_attempt_in=%.1fs error=%s", decision.get("symbol"), attempts, delay, str(e))
             except Exception:
                 logger.exception("unexpected error processing DLQ entry")
+        return processed
+
+    async def _dlq_retry_memory(self, now: float, base_delay: float, max_delay: float, max_retries: int) -> int:
+        """Retry due entries of the in-memory DLQ.
+
+        Only entries whose ``next_attempt_ts <= now`` are popped from the heap
+        (O(k log n)); failures are pushed back with their new backoff.
+
+        Returns:
+            Number of due entries processed in this iteration.
+        """
+        batch_size = max(1, int(getattr(get_settings(), "DLQ_BATCH_SIZE", 1) or 1))
+        async with self._dlq_lock:
+            self._dlq_replay_spill_if_drained()
+            due = self._persist_dlq.pop_due(now, limit=batch_size)
+        if not due:
+            return 0
+        try:
+            failures = await self._dlq_persist_batch(due)
+        except asyncio.CancelledError:
+            # cancelled mid-flight: keep the entries (at-least-once)
+            async with self._dlq_lock:
+                self._persist_dlq.extend(due)
+            raise
+        requeue = [entry for entry, err in failures if self._dlq_schedule_retry(entry, err, now, base_delay, max_delay, max_retries)]
+        async with self._dlq_lock:
+            self._persist_dlq.extend(requeue)
+            self._dlq_replay_spill_if_drained()
+            try:
+                dlq_size.set(len(self._persist_dlq))
+            except Exception:
+                pass
+        return len(due)
+
+    def _dlq_replay_spill_if_drained(self) -> None:
+        """Pull spilled overflow back into the in-memory DLQ once it has drained (caller holds the DLQ lock)."""
+        dlq = self._persist_dlq
+        if len(dlq) or not getattr(dlq, "spill_pending", False):
+            return
+        try:
+            dlq.replay_spill()
+        except Exception:
+            logger.exception("failed to replay DLQ spill file")
+
+    def _dlq_schedule_retry(self, entry: Dict[str, Any], err: Exception, now: float, base_delay: float, max_delay: float, max_retries: int) -> bool:
+        """Record a failed DLQ attempt on ``entry`` with exponential backoff.
+
+        Returns:
+            True if the entry should be requeued, False if it exceeded max retries.
+        """
+        decision = entry.get("decision") or {}
+        attempts = int(entry.get("attempts", 0)) + 1
+        delay = min(max_delay, base_delay * (2 ** (attempts - 1)))
+        entry["attempts"] = attempts
+        entry["error"] = str(err)
+        entry["next_attempt_ts"] = now + delay
+        try:
+            dlq_retries_total.inc()
+        except Exception:
+            pass
+        if attempts >= max_retries:
+            logger.error("DLQ entry exceeded max retries and will be dropped symbol=%s attempts=%d error=%s", decision.get("symbol"), attempts, str(err))
+            return False
+        logger.warning("DLQ retry failed for symbol=%s attempts=%d next_attempt_in=%.1fs error=%s", decision.get("symbol"), attempts, delay, str(err))
+        return True
+
+    @staticmethod
+    def _decision_insert_kwargs(decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Build insert_decision keyword arguments for a normalized decision dict."""
+        return dict(
+            symbol=decision.get("symbol"),
+            decision_text=_decision_text(decision),
+            raw=decision,
+            bias=decision.get("bias", "neutral"),
+            confidence=float(decision.get("confidence", 0.0)),
+            recommendation=decision.get("recommendation"),
+            repair_used=bool(decision.get("repair_used")),
+            fallback_used=bool(decision.get("fallback_used")),
+            duration_ms=int(decision.get("duration_ms", 0)),
+            ts_ms=int(decision.get("timestamp_ms", int(time.time() * 1000))),
+        )
+
+    async def _dlq_persist_batch(self, entries: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Exception]]:
+        """Re-persist DLQ entries, returning the (entry, error) pairs that failed.
+
+        Multiple entries go through one bulk insert; if that fails the entries are
+        retried individually so a single bad decision cannot hold back the batch.
+        """
+        if not entries:
+            return []
+        session_arg = self._sessionmaker if self._sessionmaker is not None else self.engine
+        if len(entries) > 1:
+            try:
+                ids = await insert_decisions_bulk(session_arg, [self._decision_insert_kwargs(e.get("decision") or {}) for e in entries])
+                logger.info("DLQ batch retry success count=%d", len(ids))
+                return []
+            except Exception as e:
+                logger.warning("DLQ bulk insert failed, retrying %d entries individually: %s", len(entries), e)
+        failed = []
+        for entry in entries:
+            decision = entry.get("decision") or {}
+            try:
+                dec_id = await insert_decision(session_arg, **self._decision_insert_kwargs(decision))
+                logger.info("DLQ retry success for symbol=%s attempts=%d dec_id=%s", decision.get("symbol"), int(entry.get("attempts", 0)), dec_id)
+            except Exception as e:
+                failed.append((entry, e))
+        return failed
+
+    async def _dlq_retry_redis_batch(self, batch_size: int, now: float, base_delay: float, max_delay: float, max_retries: int) -> int:
+        """Drain up to ``batch_size`` Redis DLQ entries in a single round-trip.
+
+        Entries are taken atomically with a MULTI/EXEC pipeline (LRANGE + LTRIM + LLEN),
+        due entries are re-persisted through one bulk insert, and everything that must
+        stay queued (not yet due, or failed with backoff) is pushed back in one more
+        pipeline. ``dlq_size`` is refreshed from the LLEN of each pipeline. If
+        the bulk persist is cancelled or raises, the whole batch is pushed back.
+
+        Returns:
+            Number of due entries processed in this iteration. Entries that were
+            only rotated back because they are not due yet do not count, so a
+            backed-off backlog does not keep the retry loop from sleeping.
+        """
+        key = _cfg.REDIS_DLQ_KEY
+
+        async def _pop_batch(r, k, n):
+            pipe = r.pipeline(transaction=True)
+            pipe.lrange(k, 0, n - 1)
+            pipe.ltrim(k, n, -1)
+            pipe.llen(k)
+            return await pipe.execute()
+
+        async def _push_batch(r, k, values):
+            pipe = r.pipeline(transaction=True)
+            pipe.rpush(k, *values)
+            pipe.llen(k)
+            return await pipe.execute()
+
+        _res = await redis_op(self, _pop_batch, key, batch_size)
+        raw_items, _, remaining = _res.get("value") if isinstance(_res, dict) else _res
+        try:
+            dlq_size.set(remaining)
+        except Exception:
+            pass
+        if not raw_items:
+            return 0
+
+        due: List[Dict[str, Any]] = []
+        requeue: List[Dict[str, Any]] = []
+        for raw in raw_items:
+            try:
+                entry = json.loads(raw)
+            except Exception:
+                logger.exception("invalid DLQ entry in redis, skipping")
+                continue
+            if float(entry.get("next_attempt_ts", 0.0) or 0.0) > now:
+                requeue.append(entry)
+            else:
+                due.append(entry)
+
+        async def _push_back(entries):
+            if not entries:
+                return
+            try:
+                _res = await redis_op(self, _push_batch, key, [json.dumps(e) for e in entries])
+                res = _res.get("value") if isinstance(_res, dict) else _res
+                try:
+                    dlq_size.set(res[-1])
+                except Exception:
+                    pass
+            except Exception:
+                logger.exception("failed to push %d entries back to redis DLQ, keeping them in-memory", len(entries))
+                async with self._dlq_lock:
+                    self._persist_dlq.extend(entries)
+
+        # the batch is already trimmed from Redis: if persisting is cancelled
+        # (close()) or blows up, put every entry back rather than lose it
+        try:
+            failures = await self._dlq_persist_batch(due)
+        except BaseException:
+            await _push_back(requeue + due)
+            raise
+        for entry, err in failures:
+            if self._dlq_schedule_retry(entry, err, now, base_delay, max_delay, max_retries):
+                requeue.append(entry)
 
+        await _push_back(requeue)
+        return len(due)
@@ -33,18 +33,39 @@ NON-BREAKING DESIGN:
 """
 
 import logging
-from typing import Optional, Dict, Any, List
-from collections import defaultdict
+from typing import Optional, Dict, Any, AsyncIterator, List
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.future import select
-from sqlalchemy import func
-
-from .storage import DecisionOutcome
+from .storage import iter_outcome_batches
+from .outcome_columns import COLUMNS, OutcomeColumns, crosstab, grouped_counts
 from .outcome_stats import OutcomeStatsService
 
 logger = logging.getLogger(__name__)
 
+# Columns the analytics read; everything else stays in the database
+ANALYSIS_COLUMNS = ("id", "symbol", "signal_type", "timeframe", "pnl", "outcome", "exit_reason", "closed_at")
+
+
+def _as_columns(outcomes) -> OutcomeColumns:
+    """Accept either a prebuilt OutcomeColumns or a list of outcome dicts."""
+    if isinstance(outcomes, OutcomeColumns):
+        return outcomes
+    return OutcomeColumns.from_dicts(outcomes or [])
+
+
+def _veto_keys(shadow_evaluations: Optional[List[Dict[str, Any]]]):
+    """(signal_type, symbol, timeframe) and (signal_type, timeframe) keys of VETO evaluations."""
+    full_keys, signal_tf_keys = set(), set()
+    for eval_result in shadow_evaluations or []:
+        if eval_result.get("decision") == "veto":
+            full_keys.add((
+                eval_result.get("signal_type"),
+                eval_result.get("symbol"),
+                eval_result.get("timeframe"),
+            ))
+            signal_tf_keys.add((eval_result.get("signal_type"), eval_result.get("timeframe")))
+    return full_keys, signal_tf_keys
+
 
 class OutcomeAnalyticsService:
     """
@@ -105,40 +126,83 @@ class OutcomeAnalyticsService:
         FAIL-SILENT: Returns empty list on any error, logs exception
         """
         try:
-            async with self.sessionmaker() as session:
-                query = select(DecisionOutcome)
-                
-                if symbol:
-                    query = query.where(DecisionOutcome.symbol == symbol)
-                if signal_type:
-                    query = query.where(DecisionOutcome.signal_type == signal_type)
-                if timeframe:
-                    query = query.where(DecisionOutcome.timeframe == timeframe)
-                
-                if last_n_days:
-                    cutoff = datetime.now(timezone.utc) - timedelta(days=last_n_days)
-                    query = query.where(DecisionOutcome.closed_at >= cutoff)
-                
-                result = await session.execute(query.order_by(DecisionOutcome.closed_at))
-                outcomes = result.scalars().all()
-                
-                return [
-                    {
-                        "id": o.id,
-                        "symbol": o.symbol,
-                        "signal_type": o.signal_type,
-                        "timeframe": o.timeframe,
-                        "pnl": o.pnl,
-                        "outcome": o.outcome,  # "win", "loss", "breakeven"
-                        "exit_reason": o.exit_reason,
-                        "closed_at": o.closed_at,
-                    }
-                    for o in outcomes
-                ]
+            outcomes: List[Dict[str, Any]] = []
+            async for batch in self.iter_outcomes_for_analysis(
+                symbol=symbol, signal_type=signal_type, timeframe=timeframe, last_n_days=last_n_days,
+            ):
+                outcomes.extend(batch)
+            return outcomes
         except Exception as e:
             logger.exception("Error retrieving outcomes for analysis: %s", e)
             return []
     
+    async def iter_outcomes_for_analysis(
+        self,
+        symbol: Optional[str] = None,
+        signal_type: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        last_n_days: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream outcomes for analysis in batches, oldest first (read-only).
+        
+        Same filters and dict shape as get_outcomes_for_analysis, but only one
+        batch is held in memory at a time, so full-history analytics can fold
+        over the batches instead of loading everything. Errors propagate to
+        the caller.
+        """
+        since = None
+        if last_n_days:
+            since = datetime.now(timezone.utc) - timedelta(days=last_n_days)
+        async for batch in iter_outcome_batches(
+            self.sessionmaker,
+            columns=ANALYSIS_COLUMNS,
+            symbol=symbol,
+            signal_type=signal_type,
+            timeframe=timeframe,
+            since=since,
+            batch_size=batch_size,
+        ):
+            yield [dict(row._mapping) for row in batch]
+    
+    async def get_outcome_columns(
+        self,
+        symbol: Optional[str] = None,
+        signal_type: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        last_n_days: Optional[int] = None,
+        batch_size: int = 5000,
+    ) -> OutcomeColumns:
+        """
+        Load outcomes as columns for the analyses (read-only).
+        
+        Reads only the analysed columns in columnar batches and appends them to
+        typed arrays, so no per-row dicts are built.
+        
+        FAIL-SILENT: Returns empty columns on any error, logs exception
+        """
+        cols = OutcomeColumns()
+        try:
+            since = None
+            if last_n_days:
+                since = datetime.now(timezone.utc) - timedelta(days=last_n_days)
+            async for batch in iter_outcome_batches(
+                self.sessionmaker,
+                columns=COLUMNS,
+                symbol=symbol,
+                signal_type=signal_type,
+                timeframe=timeframe,
+                since=since,
+                batch_size=batch_size,
+                columnar=True,
+            ):
+                cols.extend_columnar(batch)
+            return cols
+        except Exception as e:
+            logger.exception("Error loading outcome columns for analysis: %s", e)
+            return OutcomeColumns()
+    
     def policy_veto_impact(
         self,
         outcomes: Optional[List[Dict[str, Any]]] = None,
@@ -151,7 +215,7 @@ class OutcomeAnalyticsService:
         have been blocked and how those trades performed.
         
         Args:
-            outcomes: List of DecisionOutcome dicts (if None, retrieved from DB)
+            outcomes: List of DecisionOutcome dicts or an OutcomeColumns
             shadow_evaluations: List of policy shadow mode evaluation results
         
         Returns:
@@ -179,49 +243,22 @@ class OutcomeAnalyticsService:
         - Dashboard: Visualize false positive rate (winners blocked)
         - Decision: Should we enforce this policy? What's the trade-off?
         """
-        if outcomes is None:
-            outcomes = []  # Would retrieve from DB in real usage
+        cols = _as_columns(outcomes)
+        full_keys, _ = _veto_keys(shadow_evaluations)
+        flags = cols.veto_flags(full_keys)
         
-        if shadow_evaluations is None:
-            shadow_evaluations = []
+        # Counts per outcome code: all trades, and those a veto would have blocked
+        outcome = cols["outcome"]
+        totals, vetoed = grouped_counts(outcome.codes, len(outcome.categories), flags)
+        win, loss = cols.code_of("outcome", "win"), cols.code_of("outcome", "loss")
         
-        # Build index: signal_type → shadow evaluation results
-        veto_index = {}
-        for eval_result in shadow_evaluations:
-            if eval_result.get("decision") == "veto":
-                key = (
-                    eval_result.get("signal_type"),
-                    eval_result.get("symbol"),
-                    eval_result.get("timeframe"),
-                )
-                if key not in veto_index:
-                    veto_index[key] = []
-                veto_index[key].append(eval_result)
-        
-        # Analyze veto impact
-        total_trades = len(outcomes)
-        would_have_been_vetoed = 0
-        vetoed_winners = 0
-        vetoed_losers = 0
-        
-        for outcome in outcomes:
-            key = (
-                outcome.get("signal_type"),
-                outcome.get("symbol"),
-                outcome.get("timeframe"),
-            )
-            
-            if key in veto_index:
-                would_have_been_vetoed += 1
-                
-                if outcome.get("outcome") == "win":
-                    vetoed_winners += 1
-                elif outcome.get("outcome") == "loss":
-                    vetoed_losers += 1
+        total_trades = len(cols)
+        would_have_been_vetoed = sum(vetoed)
+        vetoed_winners = vetoed[win] if win >= 0 else 0
+        vetoed_losers = vetoed[loss] if loss >= 0 else 0
+        total_losers = totals[loss] if loss >= 0 else 0
         
         # Calculate metrics
-        total_losers = sum(1 for o in outcomes if o.get("outcome") == "loss")
-        
         veto_precision = (
             vetoed_losers / would_have_been_vetoed
             if would_have_been_vetoed > 0
@@ -263,7 +300,7 @@ class OutcomeAnalyticsService:
         the performance characteristics of those vetoed trades.
         
         Args:
-            outcomes: List of DecisionOutcome dicts
+            outcomes: List of DecisionOutcome dicts or an OutcomeColumns
             shadow_evaluations: List of policy shadow mode evaluation results
         
         Returns:
@@ -299,111 +336,67 @@ class OutcomeAnalyticsService:
         - Decision: Which signal types need different policies?
         - Tuning: Parameter adjustment based on observed impact
         """
-        if outcomes is None:
-            outcomes = []
-        if shadow_evaluations is None:
-            shadow_evaluations = []
-        
-        # Build veto index - support both (signal, symbol, tf) and (signal, tf) keys
-        veto_index = set()
-        veto_index_by_signal_tf = set()
-        for eval_result in shadow_evaluations:
-            if eval_result.get("decision") == "veto":
-                key = (
-                    eval_result.get("signal_type"),
-                    eval_result.get("symbol"),
-                    eval_result.get("timeframe"),
-                )
-                veto_index.add(key)
-                # Also index by signal + timeframe only for cases where symbol might be missing
-                signal_tf_key = (
-                    eval_result.get("signal_type"),
-                    eval_result.get("timeframe"),
-                )
-                veto_index_by_signal_tf.add(signal_tf_key)
-        
-        # Aggregate by signal type
-        by_signal_type = defaultdict(lambda: {
-            "total_trades": 0,
-            "vetoed_trades": 0,
-            "performance_if_vetoed": {"wins": 0, "losses": 0, "breakeven": 0},
-            "performance_if_allowed": {"wins": 0, "losses": 0, "breakeven": 0},
-        })
-        
-        for outcome in outcomes:
-            signal = outcome.get("signal_type", "unknown")
-            key = (
-                outcome.get("signal_type"),
-                outcome.get("symbol"),
-                outcome.get("timeframe"),
-            )
-            signal_tf_key = (
-                outcome.get("signal_type"),
-                outcome.get("timeframe"),
-            )
-            
-            by_signal_type[signal]["total_trades"] += 1
-            
-            # Check both full key and signal+timeframe key
-            is_vetoed = key in veto_index or (outcome.get("symbol") is None and signal_tf_key in veto_index_by_signal_tf)
-            if is_vetoed:
-                by_signal_type[signal]["vetoed_trades"] += 1
-                perf_key = outcome.get("outcome", "breakeven")
-                if perf_key not in by_signal_type[signal]["performance_if_vetoed"]:
-                    by_signal_type[signal]["performance_if_vetoed"][perf_key] = 0
-                by_signal_type[signal]["performance_if_vetoed"][perf_key] += 1
-            else:
-                perf_key = outcome.get("outcome", "breakeven")
-                if perf_key not in by_signal_type[signal]["performance_if_allowed"]:
-                    by_signal_type[signal]["performance_if_allowed"][perf_key] = 0
-                by_signal_type[signal]["performance_if_allowed"][perf_key] += 1
+        cols = _as_columns(outcomes)
+        full_keys, signal_tf_keys = _veto_keys(shadow_evaluations)
+        # Signal rows also match on (signal, timeframe) when the outcome has no symbol
+        vetoed = cols.veto_flags(full_keys, signal_tf_keys)
+        allowed = bytes(1 - v for v in vetoed)
+        
+        signal, tf, outcome = cols["signal_type"], cols["timeframe"], cols["outcome"]
+        signal_label, signal_labels = signal.relabel("unknown")
+        outcome_label, outcome_labels = outcome.relabel("breakeven")
+        n_outcomes = len(outcome.categories)
+        
+        # Aggregate by signal type: grouped counts on raw codes, merged into labels
+        totals, vetoed_counts = grouped_counts(signal.codes, len(signal.categories), vetoed)
+        perf_vetoed = crosstab(signal.codes, outcome.codes, n_outcomes, vetoed)
+        perf_allowed = crosstab(signal.codes, outcome.codes, n_outcomes, allowed)
+        
+        by_signal_type = {
+            label: {
+                "total_trades": 0,
+                "vetoed_trades": 0,
+                "performance_if_vetoed": {"wins": 0, "losses": 0, "breakeven": 0},
+                "performance_if_allowed": {"wins": 0, "losses": 0, "breakeven": 0},
+            }
+            for label in signal_labels
+        }
+        for code, label_code in enumerate(signal_label):
+            stats = by_signal_type[signal_labels[label_code]]
+            stats["total_trades"] += totals[code]
+            stats["vetoed_trades"] += vetoed_counts[code]
+            for perf, table in (("performance_if_vetoed", perf_vetoed), ("performance_if_allowed", perf_allowed)):
+                for outcome_code, n in enumerate(table.get(code, ())):
+                    if n:
+                        perf_key = outcome_labels[outcome_label[outcome_code]]
+                        stats[perf][perf_key] = stats[perf].get(perf_key, 0) + n
         
         # Compute veto rates
         result_by_signal = {}
-        for signal, stats in by_signal_type.items():
-            veto_rate = (
-                stats["vetoed_trades"] / stats["total_trades"]
-                if stats["total_trades"] > 0
-                else 0.0
-            )
-            result_by_signal[signal] = {
+        for label, stats in by_signal_type.items():
+            result_by_signal[label] = {
                 "total_trades": stats["total_trades"],
                 "vetoed_trades": stats["vetoed_trades"],
-                "veto_rate": round(veto_rate, 4),
+                "veto_rate": round(stats["vetoed_trades"] / stats["total_trades"], 4),
                 "performance_if_vetoed": stats["performance_if_vetoed"],
                 "performance_if_allowed": stats["performance_if_allowed"],
             }
         
-        # Aggregate by timeframe (similar pattern)
-        by_timeframe = defaultdict(lambda: {
-            "total_trades": 0,
-            "vetoed_trades": 0,
-            "veto_rate": 0.0,
-        })
-        
-        for outcome in outcomes:
-            tf = outcome.get("timeframe", "unknown")
-            key = (
-                outcome.get("signal_type"),
-                outcome.get("symbol"),
-                outcome.get("timeframe"),
-            )
-            
-            by_timeframe[tf]["total_trades"] += 1
-            if key in veto_index:
-                by_timeframe[tf]["vetoed_trades"] += 1
-        
-        for tf, stats in by_timeframe.items():
-            stats["veto_rate"] = round(
-                stats["vetoed_trades"] / stats["total_trades"]
-                if stats["total_trades"] > 0
-                else 0.0,
-                4,
-            )
+        # Aggregate by timeframe (full-key vetoes only)
+        tf_label, tf_labels = tf.relabel("unknown")
+        tf_totals, tf_vetoed = grouped_counts(tf.codes, len(tf.categories), cols.veto_flags(full_keys))
+        by_timeframe = {label: {"total_trades": 0, "vetoed_trades": 0, "veto_rate": 0.0} for label in tf_labels}
+        for code, label_code in enumerate(tf_label):
+            stats = by_timeframe[tf_labels[label_code]]
+            stats["total_trades"] += tf_totals[code]
+            stats["vetoed_trades"] += tf_vetoed[code]
+        
+        for stats in by_timeframe.values():
+            stats["veto_rate"] = round(stats["vetoed_trades"] / stats["total_trades"], 4)
         
         return {
             "by_signal_type": result_by_signal,
-            "by_timeframe": dict(by_timeframe),
+            "by_timeframe": by_timeframe,
             "analysis_period": datetime.now(timezone.utc).isoformat(),
             "note": "Heatmap of policy veto rates by dimension. "
                     "This service does not influence decisions.",
@@ -420,7 +413,7 @@ class OutcomeAnalyticsService:
         conditions (trending, ranging, high volatility).
         
         Args:
-            outcomes: List of DecisionOutcome dicts
+            outcomes: List of DecisionOutcome dicts or an OutcomeColumns
         
         Returns:
             {
@@ -452,10 +445,9 @@ class OutcomeAnalyticsService:
         - Dashboard: Show regime-specific policy metrics
         - Decision: Should policies be different for each regime?
         """
-        if outcomes is None:
-            outcomes = []
+        cols = _as_columns(outcomes)
         
-        if not outcomes:
+        if not len(cols):
             return {
                 "trending_market": {"trades_in_regime": 0},
                 "ranging_market": {"trades_in_regime": 0},
@@ -466,9 +458,9 @@ class OutcomeAnalyticsService:
             }
         
         # Calculate overall statistics
-        pnls = [o.get("pnl", 0) for o in outcomes]
-        mean_pnl = sum(pnls) / len(pnls) if pnls else 0
-        variance = sum((p - mean_pnl) ** 2 for p in pnls) / len(pnls) if pnls else 0
+        pnls = cols.pnl
+        mean_pnl = sum(pnls) / len(pnls)
+        variance = sum((p - mean_pnl) ** 2 for p in pnls) / len(pnls)
         std_dev = variance ** 0.5
         
         # Define regime thresholds
@@ -476,40 +468,36 @@ class OutcomeAnalyticsService:
         ranging_threshold = mean_pnl - std_dev
         volatility_threshold = std_dev * 1.5
         
-        # Categorize outcomes by regime
-        regimes = {
-            "trending_market": [],
-            "ranging_market": [],
-            "high_volatility": [],
-        }
-        
-        for outcome in outcomes:
-            pnl = outcome.get("pnl", 0)
-            
+        # One pass: classify each row and reduce count / wins / losses / pnl per regime
+        regime_names = ("trending_market", "ranging_market", "high_volatility")
+        counts, wins, losses, totals = [0] * 3, [0] * 3, [0] * 3, [0.0] * 3
+        win, loss = cols.code_of("outcome", "win"), cols.code_of("outcome", "loss")
+        for pnl, code in zip(pnls, cols["outcome"].codes):
             if abs(pnl) > volatility_threshold:
-                regimes["high_volatility"].append(outcome)
+                r = 2
             elif pnl > trending_threshold:
-                regimes["trending_market"].append(outcome)
+                r = 0
             elif pnl < ranging_threshold:
-                regimes["ranging_market"].append(outcome)
+                r = 1
+            else:
+                continue
+            counts[r] += 1
+            totals[r] += pnl
+            if code == win:
+                wins[r] += 1
+            elif code == loss:
+                losses[r] += 1
         
         # Compute regime statistics
         result = {}
-        for regime_name, regime_outcomes in regimes.items():
-            if regime_outcomes:
-                regime_pnls = [o.get("pnl", 0) for o in regime_outcomes]
-                wins = sum(1 for o in regime_outcomes if o.get("outcome") == "win")
-                losses = sum(1 for o in regime_outcomes if o.get("outcome") == "loss")
-                
-                win_rate = wins / len(regime_outcomes) if regime_outcomes else 0.0
-                avg_pnl = sum(regime_pnls) / len(regime_pnls) if regime_pnls else 0.0
-                
+        for r, regime_name in enumerate(regime_names):
+            if counts[r]:
                 result[regime_name] = {
-                    "trades_in_regime": len(regime_outcomes),
-                    "win_rate": round(win_rate, 4),
-                    "loss_rate": round(losses / len(regime_outcomes), 4),
-                    "avg_pnl": round(avg_pnl, 2),
-                    "total_pnl": round(sum(regime_pnls), 2),
+                    "trades_in_regime": counts[r],
+                    "win_rate": round(wins[r] / counts[r], 4),
+                    "loss_rate": round(losses[r] / counts[r], 4),
+                    "avg_pnl": round(totals[r] / counts[r], 2),
+                    "total_pnl": round(totals[r], 2),
                 }
             else:
                 result[regime_name] = {
@@ -538,8 +526,8 @@ class OutcomeAnalyticsService:
         FAIL-SILENT: Returns partial report on any error
         """
         try:
-            # Retrieve outcomes
-            outcomes = await self.get_outcomes_for_analysis(last_n_days=last_n_days)
+            # Load outcomes once, as columns shared by every analysis
+            outcomes = await self.get_outcome_columns(last_n_days=last_n_days)
             
             # Mock shadow evaluations (in real usage, would query from audit trail)
             shadow_evaluations = []
@@ -0,0 +1,200 @@
+"""
+Read-through cache for memory-recall outcome lookups.
+
+Memory recall asks for the most recent N outcomes of a (symbol, signal_type)
+pair, optionally narrowed by model/session/direction, on every decision. The
+outcome table only changes when a trade closes, so OutcomeRecallCache keeps one
+RecallWindow per query key and maintains it incrementally:
+
+- storage.insert_decision_outcome notifies every live cache; matching windows
+  insert the new row in closed_at order and drop the oldest one, updating the
+  running r_multiple sum and win count, so expectancy / win rate stay O(1).
+- Windows whose position cannot be determined (e.g. mixed naive/aware
+  timestamps) are dropped and refetched on the next lookup.
+- A TTL bounds staleness from writers in other processes.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# (symbol, signal_type, limit, model, session, direction)
+RecallKey = Tuple[Any, Any, int, Any, Any, Any]
+
+
+def _valid_r(row: Dict[str, Any]) -> Optional[float]:
+    r = row.get("r_multiple")
+    if r is not None and isinstance(r, (int, float)):
+        return float(r)
+    return None
+
+
+def _is_win(row: Dict[str, Any]) -> bool:
+    return (row.get("outcome") or "").lower() == "win"
+
+
+class RecallWindow:
+    """The newest ``limit`` outcome rows for one key plus running statistics."""
+
+    __slots__ = ("limit", "rows", "loaded_at", "_sum_r", "_valid", "_wins", "_similar")
+
+    def __init__(self, rows: List[Dict[str, Any]], limit: int):
+        self.limit = limit
+        self.rows = list(rows)
+        self.loaded_at = time.monotonic()
+        self._sum_r = 0.0
+        self._valid = 0
+        self._wins = 0
+        self._similar: Optional[List[Dict[str, Any]]] = None
+        for row in self.rows:
+            self._account(row, 1)
+
+    def _account(self, row: Dict[str, Any], sign: int) -> None:
+        r = _valid_r(row)
+        if r is None:
+            return
+        self._sum_r += sign * r
+        self._valid += sign
+        if _is_win(row):
+            self._wins += sign
+
+    def stats(self) -> Tuple[float, float, int]:
+        """(expectancy, win_rate, sample_size) over rows with a numeric r_multiple."""
+        if self._valid <= 0:
+            return 0.0, 0.0, 0
+        return self._sum_r / self._valid, self._wins / self._valid, self._valid
+
+    def similar_signals(self, convert: Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rows converted once with ``convert`` (memoized until the window changes)."""
+        if self._similar is None:
+            self._similar = [convert(row) for row in self.rows]
+        return self._similar
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """Insert a newly closed outcome; returns False if the window must be refetched."""
+        closed_at = row.get("closed_at")
+        try:
+            pos = len(self.rows)
+            for i, existing in enumerate(self.rows):
+                if closed_at >= existing.get("closed_at"):
+                    pos = i
+                    break
+        except TypeError:
+            return False
+        if pos >= self.limit:
+            # older than everything in a full window; not part of the top-N
+            return True
+        self.rows.insert(pos, row)
+        self._account(row, 1)
+        if len(self.rows) > self.limit:
+            self._account(self.rows.pop(), -1)
+        self._similar = None
+        return True
+
+
+_live_caches: "weakref.WeakSet[OutcomeRecallCache]" = weakref.WeakSet()
+
+
+class OutcomeRecallCache:
+    """Per-orchestrator cache of RecallWindows keyed by RecallKey."""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_keys: int = 1024):
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_keys = max(1, int(max_keys))
+        self._windows: Dict[RecallKey, RecallWindow] = {}
+        self.hits = 0
+        self.misses = 0
+        _live_caches.add(self)
+
+    async def get_window(
+        self,
+        fetch: Callable[..., Awaitable[List[Dict[str, Any]]]],
+        sessionmaker: Any,
+        symbol: Any,
+        signal_type: Any,
+        limit: int,
+        model: Any = None,
+        session_id: Any = None,
+        direction: Any = None,
+    ) -> RecallWindow:
+        """Return the cached window for the key, fetching it with ``fetch`` on a miss.
+
+        ``fetch`` has the signature of storage.get_outcomes_by_signal_type.
+        """
+        key: RecallKey = (symbol, signal_type, int(limit), model, session_id, direction)
+        window = self._windows.get(key)
+        if window is not None and (self.ttl_seconds <= 0 or time.monotonic() - window.loaded_at < self.ttl_seconds):
+            self.hits += 1
+            return window
+        self.misses += 1
+        # windows are about to exist: from now on they must hear about new outcomes
+        _ensure_listener()
+        kwargs: Dict[str, Any] = {"symbol": symbol, "signal_type": signal_type, "limit": int(limit)}
+        # only pass the optional filters that are set so simple fetchers keep working
+        if model is not None:
+            kwargs["model"] = model
+        if session_id is not None:
+            kwargs["session_id"] = session_id
+        if direction is not None:
+            kwargs["direction"] = direction
+        rows = await fetch(sessionmaker, **kwargs)
+        window = RecallWindow(rows or [], int(limit))
+        if key not in self._windows and len(self._windows) >= self.max_keys:
+            # drop the oldest-loaded window
+            oldest = min(self._windows, key=lambda k: self._windows[k].loaded_at)
+            del self._windows[oldest]
+        self._windows[key] = window
+        return window
+
+    def on_outcome_inserted(self, row: Dict[str, Any]) -> None:
+        """Fold a newly inserted outcome row into every matching window."""
+        for key in list(self._windows):
+            symbol, signal_type, _limit, model, session_id, direction = key
+            if symbol != row.get("symbol") or signal_type != row.get("signal_type"):
+                continue
+            if (model is not None and model != row.get("model")) or \
+               (session_id is not None and session_id != row.get("session")) or \
+               (direction is not None and direction != row.get("direction")):
+                continue
+            window = self._windows.get(key)
+            if window is not None and not window.add(row):
+                del self._windows[key]
+
+    def invalidate(self, symbol: Any = None, signal_type: Any = None) -> None:
+        """Drop cached windows (all, or those for one symbol / signal_type)."""
+        if symbol is None and signal_type is None:
+            self._windows.clear()
+            return
+        for key in list(self._windows):
+            if (symbol is None or key[0] == symbol) and (signal_type is None or key[1] == signal_type):
+                del self._windows[key]
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+
+def _broadcast_outcome(row: Dict[str, Any]) -> None:
+    for cache in list(_live_caches):
+        try:
+            cache.on_outcome_inserted(row)
+        except Exception:
+            logger.exception("outcome recall cache update failed; invalidating")
+            cache.invalidate(row.get("symbol"), row.get("signal_type"))
+
+
+_listener_registered = False
+
+
+def _ensure_listener() -> None:
+    # storage (SQLAlchemy) is imported on the first fetch, not when a cache is created
+    global _listener_registered
+    if not _listener_registered:
+        from .storage import add_outcome_insert_listener
+        add_outcome_insert_listener(_broadcast_outcome)
+        _listener_registered = True
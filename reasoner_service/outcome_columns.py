@@ -0,0 +1,163 @@
+"""
+Columnar outcome data for OutcomeAnalyticsService.
+
+OutcomeColumns holds outcomes as parallel typed columns instead of a list of
+dicts: pnl as an ``array('d')`` and the categorical fields (signal_type,
+symbol, timeframe, outcome) dictionary-encoded as ``array('i')`` codes with a
+small category table each. Grouped reductions then work on integer codes:
+counts are accumulated in code-indexed lists in a single pass, and per-row
+predicates (e.g. "would this trade have been vetoed") are evaluated once per
+distinct category combination rather than once per row.
+
+full_analytics_report loads one OutcomeColumns straight from the database's
+columnar batches and hands it to every analysis, so the data is read and
+encoded once per report.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class _Missing:
+    """Marks a field absent from an input dict (distinct from an explicit None)."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+CATEGORICAL = ("signal_type", "symbol", "timeframe", "outcome")
+COLUMNS = CATEGORICAL + ("pnl",)
+
+
+class CategoryColumn:
+    """A dictionary-encoded column: one int code per row plus the category table."""
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: List[Any] = []
+        self._index: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def extend(self, values: Iterable[Any]) -> None:
+        encode = self.encode
+        self.codes.extend(encode(v) for v in values)
+
+    def relabel(self, default: Any) -> Tuple[List[int], List[Any]]:
+        """Map codes to output labels (MISSING becomes ``default``), merging equal labels.
+
+        Returns (label code per category code, labels in first-seen order).
+        """
+        labels: List[Any] = []
+        index: Dict[Any, int] = {}
+        mapping = []
+        for value in self.categories:
+            label = default if value is MISSING else value
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+            mapping.append(index[label])
+        return mapping, labels
+
+    def key_values(self) -> List[Any]:
+        """Category values as a dict.get() lookup would see them (MISSING -> None)."""
+        return [None if v is MISSING else v for v in self.categories]
+
+
+class OutcomeColumns:
+    """Outcomes as typed, dictionary-encoded columns."""
+
+    def __init__(self) -> None:
+        self.pnl = array("d")
+        self.columns: Dict[str, CategoryColumn] = {name: CategoryColumn() for name in CATEGORICAL}
+        self._veto_cache: Dict[Tuple[frozenset, frozenset], bytearray] = {}
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    def __getitem__(self, name: str) -> CategoryColumn:
+        return self.columns[name]
+
+    @classmethod
+    def from_dicts(cls, outcomes: Sequence[Mapping[str, Any]]) -> "OutcomeColumns":
+        cols = cls()
+        for name, column in cols.columns.items():
+            column.extend(o.get(name, MISSING) for o in outcomes)
+        cols.pnl.extend(o.get("pnl", 0) for o in outcomes)
+        return cols
+
+    def extend_columnar(self, batch: Mapping[str, Sequence[Any]]) -> None:
+        """Append a ``{column: [values]}`` batch (see storage.iter_outcome_batches)."""
+        for name, column in self.columns.items():
+            column.extend(batch[name])
+        self.pnl.extend(batch["pnl"])
+        self._veto_cache.clear()
+
+    def veto_flags(self, full_keys: Set[tuple], signal_tf_keys: Optional[Set[tuple]] = None) -> bytearray:
+        """
+        Per-row flag: 1 if (signal_type, symbol, timeframe) is in ``full_keys``,
+        or, when ``signal_tf_keys`` is given, the row has no symbol and its
+        (signal_type, timeframe) is in ``signal_tf_keys``.
+
+        Evaluated once per distinct code combination and cached per key set.
+        """
+        cache_key = (frozenset(full_keys), frozenset(signal_tf_keys) if signal_tf_keys is not None else None)
+        flags = self._veto_cache.get(cache_key)
+        if flags is not None:
+            return flags
+        sig, sym, tf = self["signal_type"], self["symbol"], self["timeframe"]
+        sig_v, sym_v, tf_v = sig.key_values(), sym.key_values(), tf.key_values()
+        verdicts: Dict[Tuple[int, int, int], int] = {}
+        flags = bytearray(len(self))
+        for i, combo in enumerate(zip(sig.codes, sym.codes, tf.codes)):
+            verdict = verdicts.get(combo)
+            if verdict is None:
+                s, y, t = sig_v[combo[0]], sym_v[combo[1]], tf_v[combo[2]]
+                verdict = int(
+                    (s, y, t) in full_keys
+                    or (signal_tf_keys is not None and y is None and (s, t) in signal_tf_keys)
+                )
+                verdicts[combo] = verdict
+            flags[i] = verdict
+        self._veto_cache[cache_key] = flags
+        return flags
+
+    def code_of(self, name: str, value: Any) -> int:
+        """Code of ``value`` in column ``name``, or -1 if it never occurs."""
+        return self.columns[name]._index.get(value, -1)
+
+
+def grouped_counts(group_codes: Sequence[int], n_groups: int, *masks: Sequence[int]) -> List[List[int]]:
+    """Row counts per group: the total, then one list per mask (rows where mask is truthy)."""
+    totals = [0] * n_groups
+    per_mask = [[0] * n_groups for _ in masks]
+    for g in group_codes:
+        totals[g] += 1
+    for counts, mask in zip(per_mask, masks):
+        for g, m in zip(group_codes, mask):
+            if m:
+                counts[g] += 1
+    return [totals, *per_mask]
+
+
+def crosstab(a_codes: Sequence[int], b_codes: Sequence[int], n_b: int, mask: Sequence[int]) -> Dict[int, List[int]]:
+    """Counts of (a, b) code pairs over the rows selected by ``mask``: {a: [count per b]}."""
+    table: Dict[int, List[int]] = {}
+    for a, b, m in zip(a_codes, b_codes, mask):
+        if m:
+            row = table.get(a)
+            if row is None:
+                row = table[a] = [0] * n_b
+            row[b] += 1
+    return table
@@ -39,7 +39,10 @@ from logging import getLogger
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from .audit_ring import AuditRing, spill_path_for
+from .config import get_settings
 from .outcome_stats import OutcomeStatsService
+from .stats_cache import request_scope
 
 logger = getLogger(__name__)
 
@@ -539,6 +542,18 @@ class OutcomePolicyEvaluator:
         self.stats_service = stats_service
         self.rules: List[PolicyRule] = []
         self._evaluation_log: List[PolicyEvaluation] = []
+
+    @property
+    def _evaluation_log(self) -> AuditRing:
+        return self._evaluation_ring
+
+    @_evaluation_log.setter
+    def _evaluation_log(self, entries) -> None:
+        # bounded: a long-lived evaluator must not grow with every veto
+        self._evaluation_ring = AuditRing(
+            get_settings().AUDIT_RING_CAPACITY, name="policy_evaluations",
+            spill_path=spill_path_for("policy_evaluations"), entries=entries,
+        )
     
     def add_rule(self, rule: PolicyRule) -> None:
         """
@@ -589,29 +604,31 @@ class OutcomePolicyEvaluator:
             PolicyEvaluation with VETO if any rule fires, None if all ALLOW
         """
         try:
-            for rule in self.rules:
-                result = await rule.evaluate(
-                    self.stats_service,
-                    signal_type=signal_type,
-                    symbol=symbol,
-                    timeframe=timeframe,
-                )
-                
-                if result and result.decision == PolicyDecision.VETO:
-                    # Log veto
-                    self._evaluation_log.append(result)
-                    logger.info(
-                        f"policy_evaluation_veto",
-                        extra={
-                            "rule": result.rule_name,
-                            "signal_type": result.signal_type,
-                            "symbol": result.symbol,
-                            "timeframe": result.timeframe,
-                            "reason": result.reason,
-                        },
+            # rules share one memo so overlapping stats queries hit the DB once per pass
+            with request_scope():
+                for rule in self.rules:
+                    result = await rule.evaluate(
+                        self.stats_service,
+                        signal_type=signal_type,
+                        symbol=symbol,
+                        timeframe=timeframe,
                     )
-                    # Return first veto
-                    return result
+                
+                    if result and result.decision == PolicyDecision.VETO:
+                        # Log veto
+                        self._evaluation_log.append(result)
+                        logger.info(
+                            f"policy_evaluation_veto",
+                            extra={
+                                "rule": result.rule_name,
+                                "signal_type": result.signal_type,
+                                "symbol": result.symbol,
+                                "timeframe": result.timeframe,
+                                "reason": result.reason,
+                            },
+                        )
+                        # Return first veto
+                        return result
             
             # All rules allowed (or no rules matched)
             logger.debug(
@@ -0,0 +1,435 @@
+"""
+Precomputed outcome metrics snapshot, refreshed in the background.
+
+Shadow-mode outcome rules used to query the DecisionOutcome table on every
+decision, and the outcome-aware veto read a metrics snapshot loaded once at
+startup. OutcomeSnapshotRefresher periodically publishes one immutable
+OutcomeMetricsSnapshot by swapping a single reference (copy-on-write), so
+readers on the policy hot path never take a lock or touch the database:
+
+- ``metrics``: per (symbol, timeframe, signal_type) win rate, avg pnl, current
+  and max loss streak, max drawdown and expectancy. Every row also feeds the
+  roll-ups where any of the three is ANY ("*"), so unfiltered queries are
+  lookups too;
+- ``by_signal`` / ``by_symbol``: the groupings OutcomeStatsService's
+  aggregate_by_signal_type / aggregate_by_symbol return;
+- ``by_model_session``: (symbol, model, session) -> count/expectancy/win_rate,
+  the shape outcome_policy.check_performance reads.
+
+The refresher keeps the running per-key accumulators (SnapshotBuilder)
+between passes and only streams outcomes after the last (closed_at, id) it
+has seen, so a pass costs the new rows, not the whole history. A full rebuild,
+itself streamed in keyset batches, runs at start, every ``full_interval`` and
+after an insert that lands before that position (a late close, which changes
+streak and drawdown order). A newly inserted outcome marks the snapshot dirty
+and triggers an early pass (no more often than ``min_interval``).
+
+SnapshotStatsService serves the
+OutcomeStatsService read API from the current snapshot and falls back to the
+database for windowed queries or before the first build. Staleness is
+exported as ``outcome_snapshot_age_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .metrics import outcome_snapshot_age_seconds, outcome_snapshot_last_refresh_timestamp
+
+
+logger = logging.getLogger(__name__)
+
+ANY = "*"
+
+MetricsKey = Tuple[str, str, str]  # (symbol, timeframe, signal_type), ANY for "all"
+
+SNAPSHOT_COLUMNS = ("symbol", "timeframe", "signal_type", "model", "session", "pnl", "r_multiple", "outcome")
+
+
+class _Accumulator:
+    """Streaming per-key metrics; rows must be added in closed_at order."""
+
+    __slots__ = (
+        "count", "wins", "losses", "breakevens", "total_pnl",
+        "current_streak", "max_streak", "cum_pnl", "peak", "max_drawdown",
+        "sum_r", "n_r", "wins_r",
+    )
+
+    def __init__(self) -> None:
+        self.count = self.wins = self.losses = self.breakevens = 0
+        self.current_streak = self.max_streak = 0
+        self.total_pnl = self.cum_pnl = self.peak = self.max_drawdown = 0.0
+        self.sum_r = 0.0
+        self.n_r = self.wins_r = 0
+
+    def add(self, outcome: str, pnl: float, r_multiple: Any) -> None:
+        self.count += 1
+        self.total_pnl += pnl
+        if outcome == "win":
+            self.wins += 1
+        elif outcome == "loss":
+            self.losses += 1
+        else:
+            self.breakevens += 1
+        if outcome == "loss":
+            self.current_streak += 1
+            if self.current_streak > self.max_streak:
+                self.max_streak = self.current_streak
+        else:
+            self.current_streak = 0
+        self.cum_pnl += pnl
+        if self.cum_pnl > self.peak:
+            self.peak = self.cum_pnl
+        elif self.peak - self.cum_pnl > self.max_drawdown:
+            self.max_drawdown = self.peak - self.cum_pnl
+        if isinstance(r_multiple, (int, float)):
+            self.sum_r += float(r_multiple)
+            self.n_r += 1
+            if outcome == "win":
+                self.wins_r += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        n = self.count
+        return {
+            "count": n,
+            "wins": self.wins,
+            "losses": self.losses,
+            "breakevens": self.breakevens,
+            "total_pnl": self.total_pnl,
+            "win_rate": self.wins / n if n else 0.0,
+            "avg_pnl": self.total_pnl / n if n else 0.0,
+            "current_loss_streak": self.current_streak,
+            "max_loss_streak": self.max_streak,
+            "max_drawdown": self.max_drawdown,
+            "expectancy": self.sum_r / self.n_r if self.n_r else 0.0,
+        }
+
+    def to_policy_dict(self) -> Dict[str, Any]:
+        # outcome_policy semantics: only rows with a numeric r_multiple count
+        n = self.n_r
+        return {"count": n, "expectancy": self.sum_r / n if n else 0.0, "win_rate": self.wins_r / n if n else 0.0}
+
+
+class OutcomeMetricsSnapshot:
+    """Immutable metrics snapshot; treat every mapping it returns as read-only."""
+
+    __slots__ = ("metrics", "by_signal", "by_symbol", "by_model_session", "built_at", "row_count")
+
+    def __init__(
+        self,
+        metrics: Optional[Dict[MetricsKey, Dict[str, Any]]] = None,
+        by_model_session: Optional[Dict[Tuple[Any, Any, Any], Dict[str, Any]]] = None,
+        built_at: float = 0.0,
+        row_count: int = 0,
+    ):
+        self.metrics = metrics or {}
+        self.by_model_session = by_model_session or {}
+        self.built_at = built_at
+        self.row_count = row_count
+        by_signal: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        by_symbol: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        for (sym, tf, sig), m in self.metrics.items():
+            if sig != ANY:
+                by_signal.setdefault((sym, tf), {})[sig] = m
+            if sym != ANY:
+                by_symbol.setdefault((tf, sig), {})[sym] = m
+        self.by_signal = by_signal
+        self.by_symbol = by_symbol
+
+    @classmethod
+    def build(cls, rows: Iterable[Dict[str, Any]], built_at: Optional[float] = None) -> "OutcomeMetricsSnapshot":
+        """Build a snapshot from outcome rows sorted by closed_at ascending."""
+        builder = SnapshotBuilder()
+        builder.add_rows(rows)
+        return builder.snapshot(built_at)
+
+    def get(self, symbol: Optional[str] = None, timeframe: Optional[str] = None,
+            signal_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Metrics for a filter combination (falsy filters mean "all")."""
+        return self.metrics.get((symbol or ANY, timeframe or ANY, signal_type or ANY))
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at > 0
+
+
+class SnapshotBuilder:
+    """Running accumulators behind a snapshot; rows must arrive in closed_at order."""
+
+    def __init__(self) -> None:
+        self.accs: Dict[MetricsKey, _Accumulator] = {}
+        self.policy_accs: Dict[Tuple[Any, Any, Any], _Accumulator] = {}
+        self.row_count = 0
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        accs, policy_accs = self.accs, self.policy_accs
+        for row in rows:
+            self.row_count += 1
+            sym, tf, sig = row.get("symbol"), row.get("timeframe"), row.get("signal_type")
+            outcome = row.get("outcome")
+            pnl = float(row.get("pnl") or 0.0)
+            r = row.get("r_multiple")
+            for key in (
+                (sym, tf, sig), (sym, tf, ANY), (sym, ANY, sig), (sym, ANY, ANY),
+                (ANY, tf, sig), (ANY, tf, ANY), (ANY, ANY, sig), (ANY, ANY, ANY),
+            ):
+                acc = accs.get(key)
+                if acc is None:
+                    acc = accs[key] = _Accumulator()
+                acc.add(outcome, pnl, r)
+            pkey = (sym, row.get("model"), row.get("session"))
+            acc = policy_accs.get(pkey)
+            if acc is None:
+                acc = policy_accs[pkey] = _Accumulator()
+            acc.add(outcome, pnl, r)
+
+    def snapshot(self, built_at: Optional[float] = None) -> OutcomeMetricsSnapshot:
+        """An immutable snapshot of the current totals (the builder keeps accumulating)."""
+        return OutcomeMetricsSnapshot(
+            metrics={k: a.to_dict() for k, a in self.accs.items()},
+            by_model_session={k: a.to_policy_dict() for k, a in self.policy_accs.items()},
+            built_at=time.time() if built_at is None else built_at,
+            row_count=self.row_count,
+        )
+
+
+def _naive_utc(ts: datetime) -> datetime:
+    # SQLite hands closed_at back naive; inserts may pass it tz-aware
+    return ts.astimezone(timezone.utc).replace(tzinfo=None) if ts.tzinfo is not None else ts
+
+
+class OutcomeSnapshotRefresher:
+    """Rebuilds and publishes OutcomeMetricsSnapshot in a background task."""
+
+    def __init__(
+        self,
+        sessionmaker: Any,
+        interval: float = 60.0,
+        min_interval: float = 5.0,
+        full_interval: float = 3600.0,
+        batch_size: int = 1000,
+    ):
+        self.sessionmaker = sessionmaker
+        self.interval = max(0.1, float(interval))
+        self.min_interval = max(0.0, float(min_interval))
+        self.full_interval = max(0.0, float(full_interval))
+        self.batch_size = max(1, int(batch_size))
+        self.snapshot = OutcomeMetricsSnapshot()
+        self._builder: Optional[SnapshotBuilder] = None
+        # (closed_at, id) of the last row folded into _builder
+        self._cursor: Optional[Tuple[Any, Any]] = None
+        self._full_at = 0.0
+        self._needs_full = True
+        self._listeners: List[Callable[[OutcomeMetricsSnapshot], None]] = []
+        self._dirty: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        _live_refreshers.add(self)
+        _ensure_listener()
+        try:
+            outcome_snapshot_age_seconds.set_function(_oldest_snapshot_age)
+        except Exception:
+            pass
+
+    def add_listener(self, callback: Callable[[OutcomeMetricsSnapshot], None]) -> None:
+        """Call ``callback(snapshot)`` after each publish."""
+        self._listeners.append(callback)
+
+    def age_seconds(self) -> float:
+        """Seconds since the published snapshot was built (inf before the first build)."""
+        if not self.snapshot.ready:
+            return float("inf")
+        return max(0.0, time.time() - self.snapshot.built_at)
+
+    async def _fetch_batches(self, after: Optional[Tuple[Any, Any]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Outcome rows after the (closed_at, id) position ``after``, in keyset batches."""
+        from .storage import iter_outcome_batches
+
+        async for page in iter_outcome_batches(
+            self.sessionmaker, columns=SNAPSHOT_COLUMNS, after=after, batch_size=self.batch_size,
+        ):
+            yield [dict(row._mapping) for row in page]
+
+    async def refresh(self) -> OutcomeMetricsSnapshot:
+        """
+        Fold new outcomes into the running totals (or rebuild them) and publish.
+
+        Keeps the previous snapshot on error; rows already folded in by an
+        incremental pass stay counted and the next pass resumes after them.
+        """
+        full = (
+            self._builder is None
+            or self._needs_full
+            or (self.full_interval > 0 and time.monotonic() - self._full_at >= self.full_interval)
+        )
+        try:
+            if full:
+                self._needs_full = False
+                started = time.monotonic()
+                builder, cursor = SnapshotBuilder(), None
+            else:
+                builder, cursor = self._builder, self._cursor
+            loop = asyncio.get_running_loop()
+            async for batch in self._fetch_batches(cursor):
+                if not batch:
+                    continue
+                await loop.run_in_executor(None, builder.add_rows, batch)
+                cursor = (batch[-1].get("closed_at"), batch[-1].get("id"))
+                if not full:
+                    self._cursor = cursor
+            if full:
+                self._builder, self._cursor, self._full_at = builder, cursor, started
+            snapshot = builder.snapshot()
+        except Exception:
+            if full:
+                self._needs_full = True
+            logger.exception("outcome metrics snapshot refresh failed; keeping previous snapshot")
+            return self.snapshot
+        self.publish(snapshot)
+        return snapshot
+
+    def publish(self, snapshot: OutcomeMetricsSnapshot) -> None:
+        # a single reference swap: readers see the old or the new snapshot, never a mix
+        self.snapshot = snapshot
+        try:
+            outcome_snapshot_last_refresh_timestamp.set(snapshot.built_at)
+        except Exception:
+            pass
+        for cb in list(self._listeners):
+            try:
+                cb(snapshot)
+            except Exception:
+                logger.exception("outcome snapshot listener failed")
+
+    def mark_dirty(self, row: Optional[Dict[str, Any]] = None) -> None:
+        """Request an early pass (e.g. after ``row`` was inserted).
+
+        An outcome that closed at or before the last folded-in position cannot
+        be appended to the running totals in order, so it forces a full rebuild.
+        """
+        closed_at = (row or {}).get("closed_at")
+        cursor = self._cursor
+        if isinstance(closed_at, datetime) and cursor is not None and isinstance(cursor[0], datetime):
+            if _naive_utc(closed_at) <= _naive_utc(cursor[0]):
+                self._needs_full = True
+        if self._dirty is not None:
+            self._dirty.set()
+
+    def start(self) -> "asyncio.Task[None]":
+        if self._task is None or self._task.done():
+            self._dirty = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def _run(self) -> None:
+        while True:
+            self._dirty.clear()
+            started = time.monotonic()
+            await self.refresh()
+            try:
+                await asyncio.wait_for(self._dirty.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                continue
+            # debounce bursts of inserts
+            remaining = self.min_interval - (time.monotonic() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+
+class SnapshotStatsService:
+    """OutcomeStatsService read API served from the refresher's current snapshot.
+
+    Windowed queries (last_n_trades / last_n_days), queries issued before the
+    first build and any other method go to ``fallback``.
+    """
+
+    def __init__(self, refresher: OutcomeSnapshotRefresher, fallback: Any = None):
+        self.refresher = refresher
+        self.fallback = fallback
+
+    def __getattr__(self, name: str) -> Any:
+        fallback = self.__dict__.get("fallback")
+        if fallback is None:
+            raise AttributeError(name)
+        return getattr(fallback, name)
+
+    def _snapshot(self, *window: Any) -> Optional[OutcomeMetricsSnapshot]:
+        snap = self.refresher.snapshot
+        if (snap.ready and not any(window)) or self.fallback is None:
+            return snap
+        return None
+
+    async def aggregate_by_signal_type(self, symbol=None, timeframe=None, last_n_trades=None, last_n_days=None):
+        snap = self._snapshot(last_n_trades, last_n_days)
+        if snap is None:
+            return await self.fallback.aggregate_by_signal_type(symbol, timeframe, last_n_trades, last_n_days)
+        stats = snap.by_signal.get((symbol or ANY, timeframe or ANY))
+        return dict(stats) if stats else None
+
+    async def aggregate_by_symbol(self, timeframe=None, signal_type=None, last_n_trades=None, last_n_days=None):
+        snap = self._snapshot(last_n_trades, last_n_days)
+        if snap is None:
+            return await self.fallback.aggregate_by_symbol(timeframe, signal_type, last_n_trades, last_n_days)
+        stats = snap.by_symbol.get((timeframe or ANY, signal_type or ANY))
+        return dict(stats) if stats else None
+
+    async def get_loss_streak(self, symbol=None, timeframe=None, signal_type=None):
+        snap = self._snapshot()
+        if snap is None:
+            return await self.fallback.get_loss_streak(symbol, timeframe, signal_type)
+        m = snap.get(symbol, timeframe, signal_type)
+        if not m:
+            return None
+        return {"current": m["current_loss_streak"], "max": m["max_loss_streak"]}
+
+    async def get_win_rate(self, symbol=None, timeframe=None, signal_type=None, last_n_trades=None, last_n_days=None):
+        snap = self._snapshot(last_n_trades, last_n_days)
+        if snap is None:
+            return await self.fallback.get_win_rate(symbol, timeframe, signal_type, last_n_trades, last_n_days)
+        m = snap.get(symbol, timeframe, signal_type)
+        return m["win_rate"] if m else None
+
+    async def get_avg_pnl(self, symbol=None, timeframe=None, signal_type=None, last_n_trades=None, last_n_days=None):
+        snap = self._snapshot(last_n_trades, last_n_days)
+        if snap is None:
+            return await self.fallback.get_avg_pnl(symbol, timeframe, signal_type, last_n_trades, last_n_days)
+        m = snap.get(symbol, timeframe, signal_type)
+        return m["avg_pnl"] if m else None
+
+
+_live_refreshers: "weakref.WeakSet[OutcomeSnapshotRefresher]" = weakref.WeakSet()
+
+
+def _oldest_snapshot_age() -> float:
+    ages = [r.age_seconds() for r in list(_live_refreshers)]
+    return max(ages) if ages else 0.0
+
+
+def _on_outcome_inserted(row: Dict[str, Any]) -> None:
+    for refresher in list(_live_refreshers):
+        refresher.mark_dirty(row)
+
+
+_listener_registered = False
+
+
+def _ensure_listener() -> None:
+    # storage (SQLAlchemy) is imported when the first refresher is created, not at import time
+    global _listener_registered
+    if not _listener_registered:
+        from .storage import add_outcome_insert_listener
+        add_outcome_insert_listener(_on_outcome_inserted)
+        _listener_registered = True
@@ -35,19 +35,51 @@ Non-Breaking Design:
 """
 
 import asyncio
+import functools
+import inspect
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from collections import defaultdict, deque
 
 from sqlalchemy.future import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func
+from sqlalchemy import case, func
 
-from .storage import DecisionOutcome
+from .config import get_settings
+from .stats_cache import StatsCache, request_scope
+from .storage import DecisionOutcome, OutcomeRollup, rollups_backfilled
 
 logger = getLogger(__name__)
 
+# how often a service re-checks for the rollup backfill marker while it is missing
+ROLLUP_STATE_RECHECK_SECONDS = 30.0
+
+
+def _cached(method):
+    """Serve a stats query through the service's StatsCache.
+
+    The key is (method name, symbol, timeframe, signal_type, remaining
+    arguments) so that write invalidation can match on the three filters.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop("self")
+        key = (
+            method.__name__,
+            arguments.pop("symbol", None) or None,
+            arguments.pop("timeframe", None) or None,
+            arguments.pop("signal_type", None) or None,
+            *arguments.values(),
+        )
+        return await self._cache.get_or_fetch(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
 
 class OutcomeStatsService:
     """
@@ -65,17 +97,36 @@ class OutcomeStatsService:
     Non-blocking: DB errors are caught, logged, and empty results returned.
     """
 
-    def __init__(self, sessionmaker):
+    def __init__(self, sessionmaker, use_rollups: Optional[bool] = None):
         """
         Initialize the OutcomeStatsService.
         
         Args:
             sessionmaker: Async SQLAlchemy sessionmaker bound to database
+            use_rollups: Answer unwindowed queries from the outcome_rollups
+                table (defaults to OUTCOME_ROLLUPS_ENABLED)
         """
         self.sessionmaker = sessionmaker
-        self._cache: Dict[str, Any] = {}  # Simple cache for repeated queries
-        self._cache_ttl_seconds = 60
+        cfg = get_settings()
+        if use_rollups is None:
+            use_rollups = getattr(cfg, "OUTCOME_ROLLUPS_ENABLED", False)
+        self.use_rollups = bool(use_rollups)
+        self._rollups_ready = False
+        self._rollups_checked_at: Optional[float] = None
+        self._cache_ttl_seconds = getattr(cfg, "OUTCOME_STATS_CACHE_TTL_SECONDS", 60)
+        # TTL + write invalidation + single-flight; see stats_cache
+        self._cache = StatsCache(self._cache_ttl_seconds, getattr(cfg, "OUTCOME_STATS_CACHE_MAX_ENTRIES", 4096))
 
+    def request_scope(self):
+        """
+        Memoize queries for one request (e.g. one rule pass in OutcomePolicyEvaluator).
+        
+        Inside the scope each distinct query hits the database at most once,
+        even with the TTL cache disabled.
+        """
+        return request_scope()
+
+    @_cached
     async def get_win_rate(
         self,
         symbol: Optional[str] = None,
@@ -111,20 +162,20 @@ class OutcomeStatsService:
             >>> print(f"EURUSD bullish_choch win rate: {wr:.2%}")
         """
         try:
-            outcomes = await self._get_filtered_outcomes(
+            row = (await self._aggregate(
+                None,
                 symbol=symbol,
                 timeframe=timeframe,
                 signal_type=signal_type,
                 last_n_trades=last_n_trades,
                 last_n_days=last_n_days,
-            )
-            if not outcomes:
+            ))[0]
+            total = int(row.count)
+            if not total:
                 return None
             
-            wins = sum(1 for o in outcomes if o["outcome"] == "win")
-            total = len(outcomes)
-            
-            wr = wins / total if total > 0 else None
+            wins = int(row.wins)
+            wr = wins / total
             logger.debug(
                 f"computed_win_rate",
                 extra={
@@ -141,6 +192,7 @@ class OutcomeStatsService:
             logger.error(f"Error computing win rate: {e}", exc_info=True)
             return None
 
+    @_cached
     async def get_avg_pnl(
         self,
         symbol: Optional[str] = None,
@@ -173,17 +225,19 @@ class OutcomeStatsService:
             >>> print(f"Average P&L: {avg:.2f}")
         """
         try:
-            outcomes = await self._get_filtered_outcomes(
+            row = (await self._aggregate(
+                None,
                 symbol=symbol,
                 timeframe=timeframe,
                 signal_type=signal_type,
                 last_n_trades=last_n_trades,
                 last_n_days=last_n_days,
-            )
-            if not outcomes:
+            ))[0]
+            count = int(row.count)
+            if not count:
                 return None
             
-            avg = sum(o["pnl"] for o in outcomes) / len(outcomes)
+            avg = float(row.total_pnl) / count
             logger.debug(
                 f"computed_avg_pnl",
                 extra={
@@ -191,7 +245,7 @@ class OutcomeStatsService:
                     "timeframe": timeframe,
                     "signal_type": signal_type,
                     "avg_pnl": avg,
-                    "count": len(outcomes),
+                    "count": count,
                 },
             )
             return avg
@@ -199,6 +253,7 @@ class OutcomeStatsService:
             logger.error(f"Error computing average P&L: {e}", exc_info=True)
             return None
 
+    @_cached
     async def get_loss_streak(
         self,
         symbol: Optional[str] = None,
@@ -229,6 +284,11 @@ class OutcomeStatsService:
             >>> print(f"Current loss streak: {streaks['current']}, Max: {streaks['max']}")
         """
         try:
+            if symbol and timeframe and signal_type and await self._read_rollups():
+                # a single rollup key: stitch per-day streak state instead of walking history
+                result = await self._loss_streak_from_rollups(symbol, timeframe, signal_type)
+                if result is not None:
+                    return result
             outcomes = await self._get_filtered_outcomes(
                 symbol=symbol,
                 timeframe=timeframe,
@@ -277,6 +337,7 @@ class OutcomeStatsService:
             logger.error(f"Error computing loss streak: {e}", exc_info=True)
             return None
 
+    @_cached
     async def aggregate_by_signal_type(
         self,
         symbol: Optional[str] = None,
@@ -309,47 +370,18 @@ class OutcomeStatsService:
             ...     print(f"{sig_type}: WR={metrics['win_rate']:.2%}, AvgPnL={metrics['avg_pnl']:.2f}")
         """
         try:
-            outcomes = await self._get_filtered_outcomes(
+            rows = await self._aggregate(
+                "signal_type",
                 symbol=symbol,
                 timeframe=timeframe,
                 signal_type=None,
                 last_n_trades=last_n_trades,
                 last_n_days=last_n_days,
             )
-            if not outcomes:
+            if not rows:
                 return None
             
-            stats: Dict[str, Dict[str, Any]] = defaultdict(
-                lambda: {
-                    "count": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "breakevens": 0,
-                    "total_pnl": 0.0,
-                }
-            )
-            
-            for outcome in outcomes:
-                sig_type = outcome["signal_type"]
-                stats[sig_type]["count"] += 1
-                stats[sig_type]["total_pnl"] += outcome["pnl"]
-                
-                if outcome["outcome"] == "win":
-                    stats[sig_type]["wins"] += 1
-                elif outcome["outcome"] == "loss":
-                    stats[sig_type]["losses"] += 1
-                else:
-                    stats[sig_type]["breakevens"] += 1
-            
-            # Add computed metrics
-            for sig_type in stats:
-                count = stats[sig_type]["count"]
-                stats[sig_type]["win_rate"] = (
-                    stats[sig_type]["wins"] / count if count > 0 else 0.0
-                )
-                stats[sig_type]["avg_pnl"] = (
-                    stats[sig_type]["total_pnl"] / count if count > 0 else 0.0
-                )
+            stats = {row.key: self._stats_from_row(row) for row in rows}
             
             logger.debug(
                 f"aggregated_by_signal_type",
@@ -360,6 +392,7 @@ class OutcomeStatsService:
             logger.error(f"Error aggregating by signal type: {e}", exc_info=True)
             return None
 
+    @_cached
     async def aggregate_by_symbol(
         self,
         timeframe: Optional[str] = None,
@@ -392,47 +425,18 @@ class OutcomeStatsService:
             ...     print(f"{symbol}: {metrics['count']} trades, WR={metrics['win_rate']:.2%}")
         """
         try:
-            outcomes = await self._get_filtered_outcomes(
+            rows = await self._aggregate(
+                "symbol",
                 symbol=None,
                 timeframe=timeframe,
                 signal_type=signal_type,
                 last_n_trades=last_n_trades,
                 last_n_days=last_n_days,
             )
-            if not outcomes:
+            if not rows:
                 return None
             
-            stats: Dict[str, Dict[str, Any]] = defaultdict(
-                lambda: {
-                    "count": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "breakevens": 0,
-                    "total_pnl": 0.0,
-                }
-            )
-            
-            for outcome in outcomes:
-                symbol = outcome["symbol"]
-                stats[symbol]["count"] += 1
-                stats[symbol]["total_pnl"] += outcome["pnl"]
-                
-                if outcome["outcome"] == "win":
-                    stats[symbol]["wins"] += 1
-                elif outcome["outcome"] == "loss":
-                    stats[symbol]["losses"] += 1
-                else:
-                    stats[symbol]["breakevens"] += 1
-            
-            # Add computed metrics
-            for symbol in stats:
-                count = stats[symbol]["count"]
-                stats[symbol]["win_rate"] = (
-                    stats[symbol]["wins"] / count if count > 0 else 0.0
-                )
-                stats[symbol]["avg_pnl"] = (
-                    stats[symbol]["total_pnl"] / count if count > 0 else 0.0
-                )
+            stats = {row.key: self._stats_from_row(row) for row in rows}
             
             logger.debug(
                 f"aggregated_by_symbol",
@@ -443,6 +447,7 @@ class OutcomeStatsService:
             logger.error(f"Error aggregating by symbol: {e}", exc_info=True)
             return None
 
+    @_cached
     async def aggregate_by_timeframe(
         self,
         symbol: Optional[str] = None,
@@ -475,47 +480,18 @@ class OutcomeStatsService:
             ...     print(f"{tf}: {metrics['count']} trades, AvgPnL={metrics['avg_pnl']:.2f}")
         """
         try:
-            outcomes = await self._get_filtered_outcomes(
+            rows = await self._aggregate(
+                "timeframe",
                 symbol=symbol,
                 timeframe=None,
                 signal_type=signal_type,
                 last_n_trades=last_n_trades,
                 last_n_days=last_n_days,
             )
-            if not outcomes:
+            if not rows:
                 return None
             
-            stats: Dict[str, Dict[str, Any]] = defaultdict(
-                lambda: {
-                    "count": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "breakevens": 0,
-                    "total_pnl": 0.0,
-                }
-            )
-            
-            for outcome in outcomes:
-                timeframe = outcome["timeframe"]
-                stats[timeframe]["count"] += 1
-                stats[timeframe]["total_pnl"] += outcome["pnl"]
-                
-                if outcome["outcome"] == "win":
-                    stats[timeframe]["wins"] += 1
-                elif outcome["outcome"] == "loss":
-                    stats[timeframe]["losses"] += 1
-                else:
-                    stats[timeframe]["breakevens"] += 1
-            
-            # Add computed metrics
-            for timeframe in stats:
-                count = stats[timeframe]["count"]
-                stats[timeframe]["win_rate"] = (
-                    stats[timeframe]["wins"] / count if count > 0 else 0.0
-                )
-                stats[timeframe]["avg_pnl"] = (
-                    stats[timeframe]["total_pnl"] / count if count > 0 else 0.0
-                )
+            stats = {row.key: self._stats_from_row(row) for row in rows}
             
             logger.debug(
                 f"aggregated_by_timeframe",
@@ -572,40 +548,34 @@ class OutcomeStatsService:
             if session_end is None:
                 session_end = datetime.now(timezone.utc)
             
-            async with self.sessionmaker() as session:
-                query = select(DecisionOutcome).where(
+            window = (
+                select(DecisionOutcome.outcome, DecisionOutcome.pnl)
+                .where(
                     (DecisionOutcome.closed_at >= session_start)
                     & (DecisionOutcome.closed_at <= session_end)
                 )
-                result = await session.execute(query)
-                outcomes_orm = result.scalars().all()
+                .subquery("session_window")
+            )
+            query = select(
+                *self._aggregate_columns(window),
+                func.sum(case((window.c.outcome == "breakeven", 1), else_=0)).label("breakevens"),
+                func.min(window.c.pnl).label("max_loss"),
+                func.max(window.c.pnl).label("max_win"),
+            )
+            async with self.sessionmaker() as session:
+                row = (await session.execute(query)).one()
             
-            if not outcomes_orm:
+            count = int(row.count)
+            if not count:
                 return None
             
-            # Convert ORM to dicts
-            outcomes = [
-                {c.name: getattr(o, c.name) for c in DecisionOutcome.__table__.columns}
-                for o in outcomes_orm
-            ]
-            
-            wins = sum(1 for o in outcomes if o["outcome"] == "win")
-            losses = sum(1 for o in outcomes if o["outcome"] == "loss")
-            breakevens = sum(1 for o in outcomes if o["outcome"] == "breakeven")
-            pnls = [o["pnl"] for o in outcomes]
-            
             result_dict = {
                 "session_start": session_start,
                 "session_end": session_end,
-                "count": len(outcomes),
-                "wins": wins,
-                "losses": losses,
-                "breakevens": breakevens,
-                "win_rate": wins / len(outcomes) if len(outcomes) > 0 else 0.0,
-                "avg_pnl": sum(pnls) / len(outcomes) if len(outcomes) > 0 else 0.0,
-                "total_pnl": sum(pnls),
-                "max_loss": min(pnls) if pnls else None,
-                "max_win": max(pnls) if pnls else None,
+                **self._stats_from_row(row),
+                "breakevens": int(row.breakevens),
+                "max_loss": row.max_loss,
+                "max_win": row.max_win,
             }
             
             logger.debug(
@@ -627,6 +597,187 @@ class OutcomeStatsService:
     # PRIVATE HELPER METHODS
     # ========================================================================
 
+    @staticmethod
+    def _window(
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        signal_type: Optional[str] = None,
+        last_n_trades: Optional[int] = None,
+        last_n_days: Optional[int] = None,
+    ):
+        """
+        Filtered outcome rows as a subquery for SQL-side aggregation.
+        
+        Selects only the columns the aggregates need. Filters, the last_n_days
+        cutoff and the last_n_trades window (closed_at DESC + LIMIT) are applied
+        by the database, so only aggregate rows cross the wire.
+        """
+        query = select(
+            DecisionOutcome.symbol,
+            DecisionOutcome.timeframe,
+            DecisionOutcome.signal_type,
+            DecisionOutcome.outcome,
+            DecisionOutcome.pnl,
+        )
+        if symbol:
+            query = query.where(DecisionOutcome.symbol == symbol)
+        if timeframe:
+            query = query.where(DecisionOutcome.timeframe == timeframe)
+        if signal_type:
+            query = query.where(DecisionOutcome.signal_type == signal_type)
+        if last_n_days:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=last_n_days)
+            query = query.where(DecisionOutcome.closed_at >= cutoff)
+        if last_n_trades:
+            query = query.order_by(DecisionOutcome.closed_at.desc()).limit(last_n_trades)
+        return query.subquery("outcome_window")
+
+    @staticmethod
+    def _aggregate_columns(window) -> tuple:
+        """COUNT / win and loss CASE sums / SUM(pnl) over a window subquery."""
+        return (
+            func.count().label("count"),
+            func.coalesce(func.sum(case((window.c.outcome == "win", 1), else_=0)), 0).label("wins"),
+            func.coalesce(func.sum(case((window.c.outcome == "loss", 1), else_=0)), 0).label("losses"),
+            func.coalesce(func.sum(window.c.pnl), 0.0).label("total_pnl"),
+        )
+
+    @staticmethod
+    def _stats_from_row(row) -> Dict[str, Any]:
+        """Aggregate row -> the stats dict returned by the aggregate_by_* methods."""
+        count = int(row.count)
+        wins = int(row.wins)
+        losses = int(row.losses)
+        total_pnl = float(row.total_pnl)
+        return {
+            "count": count,
+            "wins": wins,
+            "losses": losses,
+            # anything that is neither a win nor a loss counts as breakeven
+            "breakevens": count - wins - losses,
+            "total_pnl": total_pnl,
+            "win_rate": wins / count if count > 0 else 0.0,
+            "avg_pnl": total_pnl / count if count > 0 else 0.0,
+        }
+
+    async def _aggregate(
+        self,
+        group_by: Optional[str],
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        signal_type: Optional[str] = None,
+        last_n_trades: Optional[int] = None,
+        last_n_days: Optional[int] = None,
+    ) -> list:
+        """
+        Run one aggregate query over the filtered window.
+        
+        With ``group_by`` (a column name) returns one row per group, labelled
+        ``key`` and ordered by it; without it returns a single total row.
+        Unwindowed queries are answered from outcome_rollups when enabled;
+        an empty rollup result falls back to the raw table (e.g. before a
+        backfill). Errors propagate to the public caller, which logs and degrades.
+        """
+        if not last_n_trades and not last_n_days and await self._read_rollups():
+            rows = await self._aggregate_rollups(group_by, symbol, timeframe, signal_type)
+            if rows and int(sum(row.count for row in rows)):
+                return rows
+        window = self._window(symbol, timeframe, signal_type, last_n_trades, last_n_days)
+        columns = self._aggregate_columns(window)
+        if group_by is None:
+            query = select(*columns)
+        else:
+            key = window.c[group_by]
+            query = select(key.label("key"), *columns).group_by(key).order_by(key)
+        async with self.sessionmaker() as session:
+            result = await session.execute(query)
+            return list(result.all())
+
+    async def _read_rollups(self) -> bool:
+        """
+        Whether rollups may answer a query: enabled and backfilled.
+
+        Rollups created on a database that already had outcomes only cover
+        later inserts until rebuild_outcome_rollups has run; the marker is
+        re-checked at most every ROLLUP_STATE_RECHECK_SECONDS until it appears.
+        """
+        if not self.use_rollups:
+            return False
+        if self._rollups_ready:
+            return True
+        now = time.monotonic()
+        if self._rollups_checked_at is not None and now - self._rollups_checked_at < ROLLUP_STATE_RECHECK_SECONDS:
+            return False
+        self._rollups_checked_at = now
+        try:
+            self._rollups_ready = await rollups_backfilled(self.sessionmaker)
+        except Exception as e:
+            logger.debug("rollup backfill marker unavailable, reading outcomes: %s", e)
+        return self._rollups_ready
+
+    async def _aggregate_rollups(
+        self,
+        group_by: Optional[str],
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        signal_type: Optional[str] = None,
+    ) -> list:
+        """Same rows as _aggregate, summed from the per-day outcome_rollups table."""
+        columns = (
+            func.coalesce(func.sum(OutcomeRollup.count), 0).label("count"),
+            func.coalesce(func.sum(OutcomeRollup.wins), 0).label("wins"),
+            func.coalesce(func.sum(OutcomeRollup.losses), 0).label("losses"),
+            func.coalesce(func.sum(OutcomeRollup.total_pnl), 0.0).label("total_pnl"),
+        )
+        if group_by is None:
+            query = select(*columns)
+        else:
+            key = getattr(OutcomeRollup, group_by)
+            query = select(key.label("key"), *columns).group_by(key).order_by(key)
+        if symbol:
+            query = query.where(OutcomeRollup.symbol == symbol)
+        if timeframe:
+            query = query.where(OutcomeRollup.timeframe == timeframe)
+        if signal_type:
+            query = query.where(OutcomeRollup.signal_type == signal_type)
+        async with self.sessionmaker() as session:
+            result = await session.execute(query)
+            return list(result.all())
+
+    async def _loss_streak_from_rollups(
+        self, symbol: str, timeframe: str, signal_type: str
+    ) -> Optional[Dict[str, int]]:
+        """
+        Current and max loss streak for one (symbol, timeframe, signal_type).
+        
+        Reads one small row per day and stitches runs across day boundaries:
+        a day made only of losses extends the running streak, otherwise the
+        streak restarts from that day's trailing losses.
+        """
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                select(
+                    OutcomeRollup.count,
+                    OutcomeRollup.leading_losses,
+                    OutcomeRollup.trailing_losses,
+                    OutcomeRollup.max_loss_streak,
+                )
+                .where(
+                    (OutcomeRollup.symbol == symbol)
+                    & (OutcomeRollup.timeframe == timeframe)
+                    & (OutcomeRollup.signal_type == signal_type)
+                )
+                .order_by(OutcomeRollup.day.asc())
+            )
+            days = result.all()
+        if not days:
+            return None
+        current = max_streak = 0
+        for day in days:
+            max_streak = max(max_streak, day.max_loss_streak, current + day.leading_losses)
+            current = current + day.count if day.leading_losses == day.count else day.trailing_losses
+        return {"current": current, "max": max(max_streak, current)}
+
     async def _get_filtered_outcomes(
         self,
         symbol: Optional[str] = None,
@@ -0,0 +1,180 @@
+"""
+In-memory dead-letter queue for failed decision persistence.
+
+Entries are kept in a min-heap ordered by ``next_attempt_ts`` so the retry loop
+only touches entries that are due (O(k log n) for k due entries) instead of
+copying and scanning the whole queue on every poll. The queue has a size cap;
+entries arriving while it is full are appended to a local JSONL spill file so
+they are never silently lost, and are read back into the queue (up to its cap)
+on startup and whenever the queue has drained.
+
+The class keeps the list-like surface (append/extend/remove/clear/len/iter and
+equality with lists) that the orchestrator, admin API and tests already use.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class PersistDLQ:
+    """Bounded min-heap of DLQ entries keyed on ``next_attempt_ts``.
+
+    Each entry is a dict: {decision, error, ts, attempts, next_attempt_ts}.
+    Not thread-safe; callers serialize access with the orchestrator's DLQ lock.
+    """
+
+    def __init__(self, max_entries: int = 10000, spill_path: Optional[str] = None):
+        self.max_entries = max(1, int(max_entries))
+        self.spill_path = spill_path or None
+        self.spilled_count = 0
+        # heap items: (next_attempt_ts, seq, entry); seq keeps FIFO order for ties
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        # set while the spill file may hold entries not yet read back
+        self.spill_pending = bool(self.spill_path and os.path.exists(self.spill_path))
+
+    @staticmethod
+    def _due_ts(entry: Dict[str, Any]) -> float:
+        try:
+            return float(entry.get("next_attempt_ts", 0.0) or 0.0)
+        except Exception:
+            return 0.0
+
+    def _spill(self, entry: Dict[str, Any]) -> None:
+        self.spilled_count += 1
+        self.spill_pending = bool(self.spill_path)
+        if not self.spill_path:
+            logger.error("in-memory DLQ full (%d entries) and no spill path configured; dropping entry", self.max_entries)
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+            logger.warning("in-memory DLQ full (%d entries); entry spilled to %s", self.max_entries, self.spill_path)
+        except Exception:
+            logger.exception("failed to spill DLQ entry to %s", self.spill_path)
+
+    def replay_spill(self) -> int:
+        """Move spilled entries back into the queue, up to its free capacity.
+
+        Entries that do not fit stay in the spill file (rewritten in place) for a
+        later replay. Unparseable lines are logged and dropped.
+
+        Returns:
+            Number of entries moved back into the queue.
+        """
+        if not self.spill_path:
+            self.spill_pending = False
+            return 0
+        room = self.max_entries - len(self._heap)
+        if room <= 0:
+            return 0
+        try:
+            with open(self.spill_path, "r", encoding="utf-8") as f:
+                lines = [line for line in f.read().splitlines() if line.strip()]
+        except FileNotFoundError:
+            self.spill_pending = False
+            return 0
+        except Exception:
+            logger.exception("failed to read DLQ spill file %s", self.spill_path)
+            return 0
+        loaded = 0
+        for line in lines[:room]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logger.warning("dropping unparseable DLQ spill line from %s", self.spill_path)
+                continue
+            heapq.heappush(self._heap, (self._due_ts(entry), next(self._seq), entry))
+            loaded += 1
+        rest = lines[room:]
+        try:
+            if rest:
+                tmp = self.spill_path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write("\n".join(rest) + "\n")
+                os.replace(tmp, self.spill_path)
+            else:
+                os.remove(self.spill_path)
+        except Exception:
+            logger.exception("failed to rewrite DLQ spill file %s", self.spill_path)
+        self.spill_pending = bool(rest)
+        if loaded:
+            logger.info("replayed %d DLQ entries from %s (%d left)", loaded, self.spill_path, len(rest))
+        return loaded
+
+    # --- list-compatible surface ---
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        if len(self._heap) >= self.max_entries:
+            self._spill(entry)
+            return
+        heapq.heappush(self._heap, (self._due_ts(entry), next(self._seq), entry))
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def remove(self, entry: Dict[str, Any]) -> None:
+        """Remove a specific entry (O(n)); raises ValueError if absent like list.remove."""
+        for i, item in enumerate(self._heap):
+            if item[2] is entry:
+                break
+        else:
+            for i, item in enumerate(self._heap):
+                if item[2] == entry:
+                    break
+            else:
+                raise ValueError("entry not in DLQ")
+        self._heap[i] = self._heap[-1]
+        self._heap.pop()
+        if i < len(self._heap):
+            heapq.heapify(self._heap)
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # heap order (roughly due-first); no copy of the underlying storage
+        return (item[2] for item in self._heap)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistDLQ):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PersistDLQ(size={len(self._heap)}, max_entries={self.max_entries})"
+
+    # --- due-time access ---
+
+    def next_due_ts(self) -> Optional[float]:
+        """Return the earliest ``next_attempt_ts`` or None when empty."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Pop entries whose ``next_attempt_ts <= now`` (earliest first)."""
+        due: List[Dict[str, Any]] = []
+        while self._heap and self._heap[0][0] <= now:
+            if limit is not None and len(due) >= limit:
+                break
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def peek(self, max_items: int) -> List[Dict[str, Any]]:
+        """Return up to ``max_items`` entries without copying the whole queue."""
+        return [item[2] for item in itertools.islice(self._heap, max(0, int(max_items)))]
@@ -1,11 +1,40 @@
 """Pluggable policy backends for PolicyStore."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Callable, Hashable, Iterable, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from .config import get_settings
+from .metrics import policy_http_requests_total
+from .policy_cache import default_context_fields, normalize_context
+
+
+logger = logging.getLogger(__name__)
+
 
 class PolicyBackend(ABC):
-    """Abstract base class for policy data sources."""
+    """Abstract base class for policy data sources.
+
+    PolicyStore caches a backend's results when ``cache_ttl`` is positive;
+    local backends keep the default of 0 so changes are seen immediately.
+    """
+
+    # seconds a found policy is served from PolicyStore's cache (0 disables caching)
+    cache_ttl: float = 0.0
+    # seconds an empty result is cached; None uses POLICY_CACHE_NEGATIVE_TTL_SECONDS
+    negative_cache_ttl: Optional[float] = None
+    # context fields the result depends on; None uses POLICY_CACHE_KEY_FIELDS
+    cache_key_fields: Optional[Tuple[str, ...]] = None
+
+    def cache_key(self, policy_name: str, context: dict) -> Hashable:
+        """Normalized context key used by PolicyStore's cache."""
+        fields = self.cache_key_fields if self.cache_key_fields is not None else default_context_fields()
+        return normalize_context(context, fields)
 
     @abstractmethod
     async def get_policy(self, policy_name: str, context: dict) -> dict:
@@ -59,39 +88,278 @@ class OrchestratorConfigBackend(PolicyBackend):
         return {}
 
 
+class PolicyBackendUnavailable(Exception):
+    """Raised when a backend cannot answer in time; PolicyStore moves on to the next backend."""
+
+
+class _CircuitBreaker:
+    """Consecutive-failure breaker: open for ``reset_timeout`` seconds, then allow one trial."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.failures = 0
+        self.open_until = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.open_until > 0
+
+    def allow(self) -> bool:
+        if self.open_until <= 0:
+            return True
+        if time.monotonic() < self.open_until or self._trial_in_flight:
+            return False
+        # half-open: let a single request probe the service
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.open_until <= 0:
+                logger.warning("policy service circuit opened after %d failures", self.failures)
+            self.open_until = time.monotonic() + self.reset_timeout
+
+
 class HttpPolicyBackend(PolicyBackend):
     """HTTP-based policy backend for remote policy services.
 
+    Built for the decision hot path:
+
+    - one pooled aiohttp session per backend (keep-alive, bounded connections);
+    - callers wait at most ``deadline`` seconds; a slower request keeps running
+      in the background and its answer is used by later lookups;
+    - a circuit breaker stops calling a failing service and raises
+      PolicyBackendUnavailable so PolicyStore falls through to the next backend;
+    - the last good answer per (policy, context) is served while it is
+      refreshed in the background (stale-while-revalidate), up to ``max_stale``;
+    - the ``prefetch`` names, plus up to ``prefetch_max_keys`` keys that were
+      looked up again since the previous pass, are refreshed every
+      ``prefetch_interval`` seconds so hot lookups rarely wait at all; keys
+      seen once (e.g. one decision's context) are never prefetched.
+
     Example:
-        backend = HttpPolicyBackend("http://policy-service:8080")
+        backend = HttpPolicyBackend("http://policy-service:8080", prefetch=["killzone"])
         policy = await backend.get_policy("killzone", {"symbol": "AAPL"})
     """
 
-    def __init__(self, base_url: str, timeout: float = 5.0):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5.0,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+        cache_key_fields: Optional[Tuple[str, ...]] = None,
+        deadline: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        max_stale: Optional[float] = None,
+        prefetch: Optional[Iterable[str]] = None,
+        prefetch_interval: Optional[float] = None,
+        prefetch_max_keys: Optional[int] = None,
+        max_entries: int = 1024,
+    ):
         """Initialize HTTP backend.
 
         Args:
             base_url: Base URL of policy service (e.g., http://localhost:8080)
-            timeout: Request timeout in seconds
+            timeout: Total timeout of one HTTP request in seconds
+            cache_ttl: PolicyStore cache TTL; None uses POLICY_CACHE_TTL_SECONDS
+            negative_cache_ttl: TTL for empty results; None uses the store default
+            cache_key_fields: Context fields the service's answer depends on
+                (None uses POLICY_CACHE_KEY_FIELDS)
+            deadline: Longest a lookup waits for the service (POLICY_HTTP_DEADLINE_SECONDS)
+            pool_size: Max pooled connections (POLICY_HTTP_POOL_SIZE)
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+            max_stale: Oldest last-good answer that may still be served, in seconds
+            prefetch: Policy names refreshed in the background with an empty context
+            prefetch_interval: Seconds between background refreshes (0 disables)
+            prefetch_max_keys: Most recently hit keys refreshed per pass
+                (POLICY_HTTP_PREFETCH_MAX_KEYS)
+            max_entries: Max remembered last-good answers
         """
+        cfg = get_settings()
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache_ttl = float(cfg.POLICY_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl)
+        self.negative_cache_ttl = negative_cache_ttl
+        self.cache_key_fields = cache_key_fields
+        self.deadline = float(cfg.POLICY_HTTP_DEADLINE_SECONDS if deadline is None else deadline)
+        self.pool_size = int(cfg.POLICY_HTTP_POOL_SIZE if pool_size is None else pool_size)
+        self.max_stale = float(cfg.POLICY_HTTP_MAX_STALE_SECONDS if max_stale is None else max_stale)
+        self.prefetch = list(prefetch or [])
+        self.prefetch_interval = float(
+            cfg.POLICY_HTTP_PREFETCH_INTERVAL_SECONDS if prefetch_interval is None else prefetch_interval
+        )
+        self.prefetch_max_keys = max(0, int(
+            getattr(cfg, "POLICY_HTTP_PREFETCH_MAX_KEYS", 32) if prefetch_max_keys is None else prefetch_max_keys
+        ))
+        self.max_entries = max(1, int(max_entries))
+        self.breaker = _CircuitBreaker(
+            cfg.POLICY_HTTP_FAILURE_THRESHOLD if failure_threshold is None else failure_threshold,
+            cfg.POLICY_HTTP_RESET_SECONDS if reset_timeout is None else reset_timeout,
+        )
+        # (policy_name, stale key) -> (fetched_at monotonic, policy, context); see _stale_key
+        self._last_good: "OrderedDict[Tuple[str, Hashable], Tuple[float, dict, dict]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable], "asyncio.Task[dict]"] = {}
+        # keys served from _last_good since the last prefetch pass, most recent last
+        self._hot: "OrderedDict[Tuple[str, Hashable], None]" = OrderedDict()
+        self._session = None
+        self._session_loop = None
+        self._prefetch_task: Optional["asyncio.Task[None]"] = None
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _request(self, policy_name: str, context: dict) -> dict:
+        """POST the context to the policy service; 4xx is a miss, 5xx an error."""
+        session = await self._get_session()
+        url = f"{self.base_url}/policies/{policy_name}"
+        async with session.post(url, json=context) as resp:
+            if resp.status == 200:
+                return await resp.json() or {}
+            if resp.status >= 500:
+                raise PolicyBackendUnavailable(f"policy service returned {resp.status}")
+            return {}
+
+    async def _fetch(self, key: Tuple[str, Hashable], policy_name: str, context: dict) -> dict:
+        try:
+            result = await self._request(policy_name, context)
+        except Exception:
+            self.breaker.record_failure()
+            policy_http_requests_total.labels(result="error").inc()
+            raise
+        self.breaker.record_success()
+        policy_http_requests_total.labels(result="ok" if result else "miss").inc()
+        if result:
+            self._last_good[key] = (time.monotonic(), result, dict(context or {}))
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > self.max_entries:
+                self._last_good.popitem(last=False)
+        else:
+            self._last_good.pop(key, None)
+        return result
+
+    def _refresh(self, key: Tuple[str, Hashable], policy_name: str, context: dict) -> "asyncio.Task[dict]":
+        """Start (or join) the background fetch for ``key``."""
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            return task
+        task = asyncio.get_running_loop().create_task(self._fetch(key, policy_name, context))
+        self._inflight[key] = task
+
+        def _done(t: "asyncio.Task[dict]") -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+            if not t.cancelled() and t.exception() is not None:
+                logger.debug("policy refresh for %s failed: %s", policy_name, t.exception())
+
+        task.add_done_callback(_done)
+        return task
+
+    def _stale_key(self, policy_name: str, context: dict) -> Tuple[str, Hashable]:
+        """Key of the last-good map: every policy-relevant field, even ones ``cache_key_fields`` leaves out.
+
+        A stale answer is served when the service is down or slow, so it must
+        never come from a context that differs in an input such as exposure.
+        """
+        fields = default_context_fields()
+        if fields is not None and self.cache_key_fields is not None:
+            fields = tuple(dict.fromkeys(tuple(self.cache_key_fields) + fields))
+        return policy_name, normalize_context(context, fields)
 
     async def get_policy(self, policy_name: str, context: dict) -> dict:
-        """Fetch policy from HTTP service."""
+        """Fetch policy from HTTP service without ever waiting past ``deadline``."""
+        self._ensure_prefetch()
+        key = self._stale_key(policy_name, context or {})
+        cached = self._last_good.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] <= self.max_stale:
+            self._mark_hot(key)
+            if now - cached[0] >= self.cache_ttl and self.breaker.allow():
+                self._refresh(key, policy_name, context)
+            policy_http_requests_total.labels(result="stale").inc()
+            return cached[1]
+        if not self.breaker.allow():
+            policy_http_requests_total.labels(result="circuit_open").inc()
+            raise PolicyBackendUnavailable("policy service circuit open")
         try:
-            import aiohttp
+            return await asyncio.wait_for(asyncio.shield(self._refresh(key, policy_name, context)), self.deadline)
+        except asyncio.TimeoutError:
+            policy_http_requests_total.labels(result="timeout").inc()
+            raise PolicyBackendUnavailable(f"policy service exceeded {self.deadline:.3f}s deadline")
+
+    def _mark_hot(self, key: Tuple[str, Hashable]) -> None:
+        if self.prefetch_max_keys <= 0:
+            return
+        self._hot[key] = None
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.prefetch_max_keys:
+            self._hot.popitem(last=False)
+
+    def _ensure_prefetch(self) -> None:
+        if self.prefetch_interval <= 0 or not (self.prefetch or self._hot):
+            return
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            return
+        try:
+            self._prefetch_task = asyncio.get_running_loop().create_task(self._prefetch_loop())
+        except RuntimeError:
+            self._prefetch_task = None
+
+    async def _prefetch_loop(self) -> None:
+        """Refresh configured policy names and recently hit keys until cancelled."""
+        while True:
+            if self.breaker.allow():
+                targets = {self._stale_key(name, {}): (name, {}) for name in self.prefetch}
+                hot, self._hot = self._hot, OrderedDict()
+                for key in hot:
+                    cached = self._last_good.get(key)
+                    if cached is not None:
+                        targets.setdefault(key, (key[0], cached[2]))
+                items = list(targets.items())
+                if self.breaker.is_open:
+                    # half-open: a single probe decides whether the service is back
+                    items = items[:1]
+                tasks = [self._refresh(key, name, ctx) for key, (name, ctx) in items]
+                if tasks:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.sleep(self.prefetch_interval)
 
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.base_url}/policies/{policy_name}"
-                async with session.post(
-                    url, json=context, timeout=self.timeout
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    return {}
-        except Exception:
-            return {}
+    async def close(self):
+        """Stop background refreshes and close the pooled session."""
+        tasks = [t for t in [self._prefetch_task, *self._inflight.values()] if t is not None]
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._prefetch_task = None
+        self._inflight.clear()
+        if self._session is not None:
+            try:
+                await self._session.close()
+            except Exception:
+                pass
+            self._session = None
 
 
 class RedisPolicyBackend(PolicyBackend):
@@ -102,17 +370,30 @@ class RedisPolicyBackend(PolicyBackend):
         policy = await backend.get_policy("killzone", {"symbol": "AAPL"})
     """
 
-    def __init__(self, redis_url: str, key_prefix: str = "policy:", ttl: int = 300):
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "policy:",
+        ttl: int = 300,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+    ):
         """Initialize Redis backend.
 
         Args:
             redis_url: Redis connection URL
             key_prefix: Prefix for Redis keys
             ttl: TTL for cached policies in seconds
+            cache_ttl: PolicyStore cache TTL; None uses POLICY_CACHE_TTL_SECONDS
+            negative_cache_ttl: TTL for empty results; None uses the store default
         """
         self.redis_url = redis_url
         self.key_prefix = key_prefix
         self.ttl = ttl
+        self.cache_ttl = float(get_settings().POLICY_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl)
+        self.negative_cache_ttl = negative_cache_ttl
+        self.invalidation_channel = f"{key_prefix}invalidate"
+        self._invalidation_listeners: List[Callable[[Optional[str], Optional[str]], None]] = []
         self._redis = None
 
     async def _ensure_connection(self):
@@ -126,6 +407,19 @@ class RedisPolicyBackend(PolicyBackend):
             except Exception:
                 self._redis = None
 
+    def context_hash(self, policy_name: str, context: dict) -> str:
+        """Hash of the whole context, used for Redis keys and in invalidation messages.
+
+        PolicyStore's cache uses ``cache_key`` (the normalized key fields)
+        instead; a per-decision id or timestamp would make every entry unique.
+        """
+        return hashlib.md5(
+            json.dumps(context, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _key(self, policy_name: str, context: dict) -> str:
+        return f"{self.key_prefix}{policy_name}:{self.context_hash(policy_name, context)}"
+
     async def get_policy(self, policy_name: str, context: dict) -> dict:
         """Get policy from Redis cache, fall back to empty."""
         try:
@@ -134,13 +428,7 @@ class RedisPolicyBackend(PolicyBackend):
                 return {}
 
             # Build cache key from policy name and context hash
-            import hashlib
-            import json
-
-            context_hash = hashlib.md5(
-                json.dumps(context, sort_keys=True, default=str).encode()
-            ).hexdigest()
-            key = f"{self.key_prefix}{policy_name}:{context_hash}"
+            key = self._key(policy_name, context)
 
             # Try to get from cache
             cached = await self._redis.get(key)
@@ -158,21 +446,81 @@ class RedisPolicyBackend(PolicyBackend):
             if self._redis is None:
                 return False
 
-            import hashlib
-            import json
-
-            context_hash = hashlib.md5(
-                json.dumps(context, sort_keys=True, default=str).encode()
-            ).hexdigest()
-            key = f"{self.key_prefix}{policy_name}:{context_hash}"
-
             await self._redis.setex(
-                key, self.ttl, json.dumps(policy_data)
+                self._key(policy_name, context), self.ttl, json.dumps(policy_data)
             )
+            await self._publish_invalidation(policy_name, context)
             return True
         except Exception:
             return False
 
+    async def delete_policy(self, policy_name: str, context: dict) -> bool:
+        """Remove a cached policy decision from Redis."""
+        try:
+            await self._ensure_connection()
+            if self._redis is None:
+                return False
+            await self._redis.delete(self._key(policy_name, context))
+            await self._publish_invalidation(policy_name, context)
+            return True
+        except Exception:
+            return False
+
+    def add_invalidation_listener(self, callback: Callable[[Optional[str], Optional[str]], None]) -> None:
+        """Register ``callback(policy_name, context_key)`` for policy changes.
+
+        Called for writes made through this backend and, while
+        ``listen_invalidations`` runs, for writes published by other processes.
+        ``None`` arguments mean "all".
+        """
+        self._invalidation_listeners.append(callback)
+
+    def _dispatch_invalidation(self, policy_name: Optional[str], context_key: Optional[str]) -> None:
+        for cb in list(self._invalidation_listeners):
+            try:
+                cb(policy_name, context_key)
+            except Exception:
+                logger.exception("policy invalidation listener failed")
+
+    async def _publish_invalidation(self, policy_name: str, context: dict) -> None:
+        # listeners match on the store's cache key; the full hash identifies the Redis entry
+        context_key = self.cache_key(policy_name, context)
+        self._dispatch_invalidation(policy_name, context_key)
+        try:
+            await self._redis.publish(
+                self.invalidation_channel,
+                json.dumps({
+                    "policy": policy_name,
+                    "context_key": context_key,
+                    "context_hash": self.context_hash(policy_name, context),
+                }),
+            )
+        except Exception as e:
+            logger.debug("policy invalidation publish failed: %s", e)
+
+    async def listen_invalidations(self) -> None:
+        """Apply invalidations published by other processes until cancelled."""
+        await self._ensure_connection()
+        if self._redis is None:
+            return
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self.invalidation_channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message.get("data") or "{}")
+                except Exception:
+                    data = {}
+                self._dispatch_invalidation(data.get("policy"), data.get("context_key"))
+        finally:
+            try:
+                await pubsub.unsubscribe(self.invalidation_channel)
+                await pubsub.close()
+            except Exception:
+                pass
+
     async def close(self):
         """Close Redis connection."""
         if self._redis:
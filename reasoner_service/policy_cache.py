@@ -0,0 +1,156 @@
+"""
+Result cache for PolicyStore backend lookups.
+
+The pre/post reasoning policy gates and SignalFilter ask PolicyStore for the
+same handful of policies several times per decision, and every lookup used to
+walk the whole backend chain. PolicyCache sits in front of each backend that
+opts in (``cache_ttl > 0``):
+
+- entries are keyed by (backend slot, policy name, normalized context key);
+  the key covers only the context fields a backend's answer depends on
+  (POLICY_CACHE_KEY_FIELDS by default), not per-decision ids or timestamps;
+- hits are served until the backend's TTL expires; misses (empty results) are
+  cached for the shorter negative TTL so an unconfigured policy does not hit
+  a remote service on every call;
+- concurrent lookups for the same key share one in-flight fetch
+  (single-flight), so a burst of decisions produces one backend call; the
+  fetch runs in its own task, so cancelling the caller that started it does
+  not cancel the others;
+- backends that can push invalidations (RedisPolicyBackend) drop matching
+  entries through ``invalidate``; a fetch that was in flight when an
+  invalidation arrived returns its result but does not cache it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# (backend slot, policy name, context key)
+PolicyCacheKey = Tuple[int, str, Hashable]
+
+
+def default_context_fields() -> Optional[Tuple[str, ...]]:
+    """POLICY_CACHE_KEY_FIELDS as a tuple; None (``*``) keys on the whole context."""
+    from .config import get_settings
+
+    raw = str(getattr(get_settings(), "POLICY_CACHE_KEY_FIELDS", "") or "").strip()
+    if raw == "*":
+        return None
+    return tuple(f.strip() for f in raw.split(",") if f.strip())
+
+
+def normalize_context(context: Optional[dict], fields: Optional[Tuple[str, ...]] = None) -> str:
+    """Stable string key for a policy context (optionally restricted to ``fields``)."""
+    if not context:
+        return ""
+    if fields is not None:
+        context = {k: context.get(k) for k in fields}
+    return json.dumps(context, sort_keys=True, default=str, separators=(",", ":"))
+
+
+class PolicyCache:
+    """TTL cache with negative caching and single-flight fetches."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max(1, int(max_entries))
+        # key -> (expires_at monotonic, result)
+        self._entries: "OrderedDict[PolicyCacheKey, Tuple[float, dict]]" = OrderedDict()
+        self._inflight: Dict[PolicyCacheKey, "asyncio.Task[dict]"] = {}
+        # bumped by invalidate(); fetches started under an older generation are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: PolicyCacheKey) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def _store(self, key: PolicyCacheKey, result: dict, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: PolicyCacheKey,
+        fetch: Callable[[], Awaitable[dict]],
+        ttl: float,
+        negative_ttl: float,
+    ) -> dict:
+        """Return the cached result for ``key`` or run ``fetch`` once for all waiters.
+
+        Exceptions from ``fetch`` propagate to every waiter and are not cached.
+        The fetch runs in a task of its own and waiters are shielded from it, so
+        a cancelled caller (including the one that started the fetch) only
+        stops waiting; the others still get the result.
+        """
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.get_running_loop().create_task(self._fetch(key, fetch, ttl, negative_ttl))
+            # a fetch error nobody is left waiting for is not logged as unretrieved
+            pending.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = pending
+        else:
+            self.hits += 1
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self,
+        key: PolicyCacheKey,
+        fetch: Callable[[], Awaitable[dict]],
+        ttl: float,
+        negative_ttl: float,
+    ) -> dict:
+        generation = self._generation
+        try:
+            result = await fetch() or {}
+            if generation == self._generation:
+                self._store(key, result, ttl if result else negative_ttl)
+            return result
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def invalidate(self, policy_name: Optional[str] = None, context_key: Optional[Hashable] = None,
+                   slot: Optional[int] = None) -> int:
+        """Drop cached entries matching the given filters (all entries when none are given)."""
+        self._generation += 1
+        if policy_name is None and context_key is None and slot is None:
+            n = len(self._entries)
+            self._entries.clear()
+            return n
+        doomed = [
+            k for k in self._entries
+            if (slot is None or k[0] == slot)
+            and (policy_name is None or k[1] == policy_name)
+            and (context_key is None or k[2] == context_key)
+        ]
+        for k in doomed:
+            del self._entries[k]
+        return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
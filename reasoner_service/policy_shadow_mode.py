@@ -27,6 +27,9 @@ import logging
 from typing import Any, Dict, Optional
 from datetime import datetime, timezone
 
+from .audit_ring import AuditRing, spill_path_for
+from .config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,13 +57,44 @@ class PolicyShadowModeManager:
     - Decision enforcement rules can be developed from observations
     """
     
-    def __init__(self):
-        """Initialize shadow mode manager (evaluator created on demand)."""
+    # cap for the audit list kept in a shared state backend
+    SHARED_AUDIT_MAX_LEN = 10000
+    SHARED_AUDIT_NAME = "shadow_audit"
+
+    def __init__(self, state_backend: Optional[Any] = None):
+        """Initialize shadow mode manager (evaluator created on demand).
+
+        Args:
+            state_backend: Optional SharedStateBackend; when set, audit entries are
+                also published there so every orchestrator replica sees one trail.
+        """
         self._evaluator = None
-        self._audit_trail = []  # In-memory log of all evaluations
+        self._audit_trail = []  # Bounded in-memory log of evaluations (AuditRing)
         self._lock = asyncio.Lock()
         self._initialized = False
         self._init_error = None
+        self.state_backend = state_backend
+
+    @property
+    def _audit_trail(self) -> AuditRing:
+        return self._audit_ring
+
+    @_audit_trail.setter
+    def _audit_trail(self, entries) -> None:
+        # assigning a list (tests, resets) keeps the trail bounded
+        self._audit_ring = AuditRing(
+            get_settings().AUDIT_RING_CAPACITY, name=self.SHARED_AUDIT_NAME,
+            spill_path=spill_path_for(self.SHARED_AUDIT_NAME), entries=entries,
+        )
+
+    async def _record_audit(self, audit_entry: Dict[str, Any]) -> None:
+        """Append to the local trail and publish to the shared backend (best-effort)."""
+        self._audit_trail.append(audit_entry)
+        if self.state_backend is not None:
+            try:
+                await self.state_backend.append_audit(self.SHARED_AUDIT_NAME, audit_entry, self.SHARED_AUDIT_MAX_LEN)
+            except Exception as e:
+                logger.warning("Failed to publish shadow audit entry to shared state: %s", e)
     
     async def initialize(self, stats_service: Any, config: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -190,7 +224,7 @@ class PolicyShadowModeManager:
                     "confidence": decision.get("confidence"),
                 }
                 result["audit_entry"] = audit_entry
-                self._audit_trail.append(audit_entry)
+                await self._record_audit(audit_entry)
                 
                 logger.warning(
                     "POLICY VETO (shadow mode): rule=%s, signal_type=%s, symbol=%s, reason=%s",
@@ -214,7 +248,7 @@ class PolicyShadowModeManager:
                     "confidence": decision.get("confidence"),
                 }
                 result["audit_entry"] = audit_entry
-                self._audit_trail.append(audit_entry)
+                await self._record_audit(audit_entry)
                 
                 logger.debug(
                     "POLICY ALLOW (shadow mode): signal_type=%s, symbol=%s",
@@ -245,10 +279,28 @@ class PolicyShadowModeManager:
         - Analytics can analyze VETO patterns
         - Testing framework can validate policies
         """
+        if self.state_backend is not None:
+            try:
+                return await self.state_backend.read_audit(self.SHARED_AUDIT_NAME, limit)
+            except Exception as e:
+                logger.warning("Shared audit read failed, using local trail: %s", e)
+        async with self._lock:
+            return self._audit_trail.tail(limit)
+
+    async def get_audit_page(self, cursor: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Read the local audit trail one page at a time, most recent first.
+
+        Args:
+            cursor: ``next_cursor`` from the previous page (None for the newest page)
+            limit: Page size
+
+        Returns:
+            Dict with ``entries`` and ``next_cursor`` (None on the last page)
+        """
         async with self._lock:
-            if limit is None:
-                return list(reversed(self._audit_trail))
-            return list(reversed(self._audit_trail[-limit:]))
+            entries, next_cursor = self._audit_trail.page(cursor, limit)
+        return {"entries": entries, "next_cursor": next_cursor}
     
     async def clear_audit_trail(self) -> int:
         """
@@ -259,7 +311,7 @@ class PolicyShadowModeManager:
         """
         async with self._lock:
             count = len(self._audit_trail)
-            self._audit_trail.clear()
+            await self._audit_trail.aclear()
             logger.info("Cleared %d audit trail entries", count)
             return count
     
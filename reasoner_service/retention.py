@@ -0,0 +1,188 @@
+"""
+Retention and archival for the decisions and notification_logs tables.
+
+Both tables grow by one row per decision forever, and decision rows carry the
+full decision_text and raw JSON (or the binary payload). The retention job keeps them to a rolling
+window: rows older than the cutoff are appended, month by month, to gzip
+JSON Lines archives (``<archive_dir>/<table>-YYYY-MM.jsonl.gz``) and removed
+from the hot tables, so insert and recent-query cost track the window, not
+total history.
+
+Decisions still referenced by a decision_outcomes or notification_logs row
+stay in the table (the foreign keys point at them), but their decision_text,
+raw and payload are cleared once archived. Binary payloads are decoded back
+to raw/decision_text in the archive, so archives read the same either way.
+
+The archive is written and fsynced before the rows are deleted. A crash in
+between leaves rows that are archived again on the next run, and
+``iter_archived_rows`` drops such duplicates by id.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import logging
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import and_, delete, null, or_, select, update
+
+from .decision_codec import expand_rows
+from .storage import Decision, DecisionOutcome, NotificationLog
+
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_TABLES = {"decisions": Decision, "notification_logs": NotificationLog}
+
+
+def archive_path(archive_dir: str, table: str, month: datetime.date) -> str:
+    return os.path.join(archive_dir, f"{table}-{month:%Y-%m}.jsonl.gz")
+
+
+def _month(ts: datetime.datetime) -> datetime.date:
+    return datetime.date(ts.year, ts.month, 1)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def _append_archive(archive_dir: str, table: str, rows: List[Dict[str, Any]]) -> None:
+    """Append rows to their monthly archive files (one gzip member per call) and fsync."""
+    by_month: Dict[datetime.date, List[Dict[str, Any]]] = {}
+    for row in rows:
+        by_month.setdefault(_month(row["created_at"]), []).append(row)
+    os.makedirs(archive_dir, exist_ok=True)
+    for month, month_rows in sorted(by_month.items()):
+        with open(archive_path(archive_dir, table, month), "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                for row in month_rows:
+                    gz.write(json.dumps({k: _encode(v) for k, v in row.items()}).encode() + b"\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+
+
+async def _archive_table(
+    sessionmaker,
+    table: str,
+    cutoff: datetime.datetime,
+    archive_dir: str,
+    batch_size: int,
+) -> Dict[str, int]:
+    model = ARCHIVED_TABLES[table]
+    columns = list(model.__table__.columns)
+    counts = {"archived": 0, "deleted": 0, "stubbed": 0}
+    last = None
+    while True:
+        query = select(*columns).where(model.created_at < cutoff)
+        if model is Decision:
+            # payload already cleared on an earlier run
+            query = query.where(or_(
+                Decision.decision_text.is_not(None), Decision.raw.is_not(null()), Decision.payload.is_not(None),
+            ))
+        if last is not None:
+            query = query.where(or_(
+                model.created_at > last[0],
+                and_(model.created_at == last[0], model.id > last[1]),
+            ))
+        query = query.order_by(model.created_at, model.id).limit(batch_size)
+        async with sessionmaker() as session:
+            rows = [dict(r) for r in (await session.execute(query)).mappings()]
+            if not rows:
+                return counts
+            _append_archive(archive_dir, table, expand_rows(rows) if model is Decision else rows)
+            ids = [r["id"] for r in rows]
+            keep = set()
+            if model is Decision:
+                for ref in (DecisionOutcome.decision_id, NotificationLog.decision_id):
+                    keep.update((await session.execute(select(ref).where(ref.in_(ids)).distinct())).scalars())
+            doomed = [i for i in ids if i not in keep]
+            if doomed:
+                await session.execute(delete(model).where(model.id.in_(doomed)))
+            if keep:
+                await session.execute(
+                    update(Decision).where(Decision.id.in_(keep)).values(decision_text=None, raw=null(), payload=None)
+                )
+            await session.commit()
+        counts["archived"] += len(rows)
+        counts["deleted"] += len(doomed)
+        counts["stubbed"] += len(keep)
+        last = (rows[-1]["created_at"], rows[-1]["id"])
+
+
+async def archive_old_rows(
+    sessionmaker,
+    archive_dir: str,
+    retention_days: int,
+    now: Optional[datetime.datetime] = None,
+    batch_size: int = 1000,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Move decisions and notification logs older than ``retention_days`` to the archive.
+
+    Notification logs go first, so decisions they referenced can then be
+    deleted rather than stubbed. Returns per-table counts of archived,
+    deleted and stubbed rows.
+    """
+    if retention_days <= 0:
+        raise ValueError("retention_days must be positive")
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    # created_at is stored naive UTC (func.now())
+    cutoff = now.astimezone(datetime.timezone.utc).replace(tzinfo=None) - datetime.timedelta(days=retention_days)
+    result = {}
+    for table in ("notification_logs", "decisions"):
+        result[table] = await _archive_table(sessionmaker, table, cutoff, archive_dir, batch_size)
+        logger.info("archived %s rows older than %s: %s", table, cutoff.isoformat(), result[table])
+    return result
+
+
+def iter_archived_rows(
+    archive_dir: str,
+    table: str = "decisions",
+    since: Optional[datetime.datetime] = None,
+    until: Optional[datetime.datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield archived rows of ``table`` in month order, with created_at parsed back.
+
+    ``since``/``until`` (naive UTC, until exclusive) skip whole month files
+    outside the range before filtering rows, so reading a recent range does
+    not decompress all history.
+    """
+    if table not in ARCHIVED_TABLES:
+        raise ValueError(f"unknown archived table: {table}")
+    if not os.path.isdir(archive_dir):
+        return
+    prefix, suffix = f"{table}-", ".jsonl.gz"
+    months = []
+    for name in os.listdir(archive_dir):
+        if name.startswith(prefix) and name.endswith(suffix):
+            try:
+                months.append(datetime.datetime.strptime(name[len(prefix):-len(suffix)], "%Y-%m").date())
+            except ValueError:
+                continue
+    for month in sorted(months):
+        if (since is not None and month < _month(since)) or (until is not None and month > _month(until)):
+            continue
+        seen = set()
+        with gzip.open(archive_path(archive_dir, table, month), "rt") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if row["id"] in seen:
+                    continue
+                seen.add(row["id"])
+                created = row.get("created_at")
+                if created:
+                    row["created_at"] = datetime.datetime.fromisoformat(created)
+                    if since is not None and row["created_at"] < since:
+                        continue
+                    if until is not None and row["created_at"] >= until:
+                        continue
+                yield row
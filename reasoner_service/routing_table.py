@@ -0,0 +1,224 @@
+"""
+Compiled notification routing table.
+
+Routing rules and time-based overrides are compiled once into index structures
+so resolving the channels for a decision does not re-scan every rule or
+re-parse "HH:MM" strings:
+
+- overrides: symbol -> [(start_s, end_s, channels)] with windows as seconds
+  of the UTC day
+- table: (recommendation, symbol) -> confidence bands sorted by lower bound
+  ("*" matches any symbol / recommendation)
+- rules: exact symbol dict, tag rules (``tag1|tag2``) and wildcard prefixes
+  (``EUR*``) kept in config order
+
+The time-independent part of a resolution is memoized per (symbol,
+recommendation, confidence band, tags), so steady-state routing is a couple of
+dict lookups. RoutingConfigWatcher reloads the JSON routing file when its mtime
+changes so routing changes never need a restart.
+
+Routing file format (ROUTING_CONFIG_PATH):
+    {
+      "rules": {"EURUSD": ["slack"], "fx|major": ["discord"], "BTC*": ["telegram"]},
+      "overrides": [{"symbol": "EURUSD", "start": "22:00", "end": "06:00", "channels": ["telegram"]}],
+      "table": [{"recommendation": "enter", "symbol": "*", "min_confidence": 0.8, "channels": ["slack", "telegram"]}]
+    }
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNELS: Tuple[str, ...] = ("slack", "discord", "telegram")
+_SECONDS_PER_DAY = 24 * 3600
+_MEMO_MAX = 4096
+
+
+@lru_cache(maxsize=256)
+def parse_hhmm(value: str) -> int:
+    """Parse "HH:MM" into seconds since midnight."""
+    h, m = map(int, value.split(":"))
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise ValueError(f"invalid time of day: {value!r}")
+    return h * 3600 + m * 60
+
+
+def in_window(start_s: int, end_s: int, t_s: float) -> bool:
+    """Inclusive window check that wraps past midnight when start >= end."""
+    if start_s < end_s:
+        return start_s <= t_s <= end_s
+    return t_s >= start_s or t_s <= end_s
+
+
+def seconds_of_day(now: datetime) -> float:
+    return now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+
+
+class RoutingTable:
+    """Immutable compiled form of routing rules, overrides and the decision table."""
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, List[str]]] = None,
+        overrides: Optional[List[Dict[str, Any]]] = None,
+        table: Optional[List[Dict[str, Any]]] = None,
+        default: Tuple[str, ...] = DEFAULT_CHANNELS,
+    ):
+        self.default = list(default)
+        self._exact: Dict[str, List[str]] = {}
+        self._tag_rules: List[Tuple[FrozenSet[str], List[str]]] = []
+        self._prefixes: List[Tuple[str, List[str]]] = []
+        for key, chs in (rules or {}).items():
+            if "|" in key:
+                required = frozenset(p.strip() for p in key.split("|") if p.strip())
+                if required:
+                    self._tag_rules.append((required, chs))
+            else:
+                # exact lookup wins over the wildcard interpretation, as before
+                self._exact[key] = chs
+                if key.endswith("*"):
+                    self._prefixes.append((key[:-1], chs))
+
+        self._overrides: Dict[str, List[Tuple[int, int, List[str]]]] = {}
+        for ov in overrides or []:
+            chs = ov.get("channels") or []
+            if not isinstance(chs, list) or not chs:
+                continue
+            try:
+                window = (parse_hhmm(ov["start"]), parse_hhmm(ov["end"]), chs)
+            except Exception:
+                logger.warning("ignoring routing override with invalid window: %s", ov)
+                continue
+            self._overrides.setdefault(ov.get("symbol"), []).append(window)
+
+        # (recommendation, symbol) -> (sorted lower bounds, [(min, max, channels)])
+        bands: Dict[Tuple[str, str], List[Tuple[float, float, List[str]]]] = {}
+        for entry in table or []:
+            chs = entry.get("channels") or []
+            if not isinstance(chs, list) or not chs:
+                continue
+            key = (str(entry.get("recommendation", "*")), str(entry.get("symbol", "*")))
+            lo = float(entry.get("min_confidence", 0.0))
+            hi = float(entry.get("max_confidence", 1.0))
+            bands.setdefault(key, []).append((lo, hi, chs))
+        self._bands: Dict[Tuple[str, str], Tuple[List[float], List[Tuple[float, float, List[str]]]]] = {}
+        for key, entries in bands.items():
+            entries.sort(key=lambda e: e[0])
+            self._bands[key] = ([e[0] for e in entries], entries)
+
+        self._memo: Dict[Tuple[Any, ...], List[str]] = {}
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any]) -> "RoutingTable":
+        return cls(rules=data.get("rules") or {}, overrides=data.get("overrides") or [], table=data.get("table") or [])
+
+    def override_for(self, symbol: str, now: Optional[datetime] = None) -> Optional[List[str]]:
+        windows = self._overrides.get(symbol)
+        if not windows:
+            return None
+        t_s = seconds_of_day(now or datetime.utcnow())
+        for start_s, end_s, chs in windows:
+            if in_window(start_s, end_s, t_s):
+                return chs
+        return None
+
+    def _band_lookup(self, recommendation: str, symbol: str, confidence: float) -> Optional[List[str]]:
+        for key in ((recommendation, symbol), (recommendation, "*"), ("*", symbol), ("*", "*")):
+            indexed = self._bands.get(key)
+            if indexed is None:
+                continue
+            lows, entries = indexed
+            i = bisect.bisect_right(lows, confidence) - 1
+            # overlapping bands: the highest lower bound that still covers confidence wins
+            while i >= 0:
+                lo, hi, chs = entries[i]
+                if confidence <= hi:
+                    return chs
+                i -= 1
+        return None
+
+    def _resolve_static(self, symbol: str, recommendation: str, confidence: float, tags: FrozenSet[str]) -> List[str]:
+        if self._bands:
+            chs = self._band_lookup(recommendation, symbol, confidence)
+            if chs:
+                return chs
+        if symbol in self._exact:
+            return self._exact[symbol]
+        matched: List[str] = []
+        for required, chs in self._tag_rules:
+            if required.issubset(tags):
+                matched.extend(chs)
+        if matched:
+            # unique, preserving order
+            return list(dict.fromkeys(matched))
+        for prefix, chs in self._prefixes:
+            if symbol.startswith(prefix):
+                return chs
+        return self.default
+
+    def resolve(self, decision: Dict[str, Any], now: Optional[datetime] = None) -> List[str]:
+        """Resolve channels: override window > decision table > exact > tags > wildcard > default."""
+        symbol = decision.get("symbol", "")
+        if self._overrides:
+            chs = self.override_for(symbol, now)
+            if chs:
+                return chs
+        tags = frozenset(decision.get("tags", []) or [])
+        recommendation = str(decision.get("recommendation") or "")
+        try:
+            confidence = float(decision.get("confidence", 0.0))
+        except Exception:
+            confidence = 0.0
+        # confidence only matters when a decision table is configured
+        memo_key = (symbol, recommendation, confidence if self._bands else None, tags)
+        chs = self._memo.get(memo_key)
+        if chs is None:
+            chs = self._resolve_static(symbol, recommendation, confidence, tags)
+            if len(self._memo) >= _MEMO_MAX:
+                self._memo.clear()
+            self._memo[memo_key] = chs
+        return chs
+
+
+class RoutingConfigWatcher:
+    """Reloads a JSON routing file when its mtime changes (checked at most every interval)."""
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = max(0.0, float(check_interval))
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+
+    def poll(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the parsed config when the file changed since the last poll, else None."""
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return None
+        self._next_check = now + self.check_interval
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return None
+        if not force and mtime == self._mtime:
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            # keep serving the last good table
+            logger.warning("failed to reload routing config %s: %s", self.path, e)
+            self._mtime = mtime
+            return None
+        self._mtime = mtime
+        logger.info("routing config loaded from %s", self.path)
+        return data if isinstance(data, dict) else None
@@ -0,0 +1,308 @@
+"""Pluggable shared state backends for horizontally scaled orchestrators.
+
+Cooldowns, the global cooldown, dedup keys, policy counters and the shadow-mode
+audit trail normally live in one process's memory. When several orchestrator
+replicas run behind a load balancer they must agree on that state, so the
+structures can be backed by a SharedStateBackend:
+
+- InMemorySharedState: in-process implementation. It is the test fake and can be
+  shared between several DecisionOrchestrator instances in one process.
+- RedisSharedState: Redis implementation. Every check-and-update runs as a single
+  Lua script or atomic command so replicas never race each other.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedStateBackend(ABC):
+    """Abstract base class for orchestrator state shared across processes."""
+
+    @abstractmethod
+    async def get_cooldown_until(self, key: str) -> int:
+        """Return the cooldown deadline (epoch ms) for key, or 0 if none."""
+        pass
+
+    @abstractmethod
+    async def extend_cooldown(self, key: str, until_ms: int) -> int:
+        """Atomically raise the cooldown deadline for key to until_ms.
+
+        Never shortens an existing cooldown. Returns the effective deadline.
+        """
+        pass
+
+    @abstractmethod
+    async def get_event_window(self, key: str) -> Tuple[int, int]:
+        """Return (cooldown_until_ms, events_in_window) for an event type key."""
+        pass
+
+    @abstractmethod
+    async def record_event(self, key: str, cooldown_ms: int, now_ms: Optional[int] = None) -> Tuple[int, int]:
+        """Atomically record an event for cooldown tracking.
+
+        Mirrors CooldownTracker semantics: the window counter is incremented and,
+        when the previous cooldown has expired, a new cooldown window starts.
+        Returns (cooldown_until_ms, events_in_window).
+        """
+        pass
+
+    @abstractmethod
+    async def check_and_set_dedup(self, key: str, ttl_seconds: int) -> bool:
+        """Mark key as seen for ttl_seconds. Returns True if it was not seen yet."""
+        pass
+
+    async def check_and_set_dedup_many(self, keys: List[str], ttl_seconds: int) -> List[bool]:
+        """Batch form of check_and_set_dedup; results are in key order.
+
+        A key repeated within the batch is only "new" at its first position.
+        """
+        return [await self.check_and_set_dedup(k, ttl_seconds) for k in keys]
+
+    @abstractmethod
+    async def incr_counter(self, name: str, field: str, amount: int = 1) -> int:
+        """Increment a named counter field and return its new value."""
+        pass
+
+    @abstractmethod
+    async def get_counters(self, name: str) -> Dict[str, int]:
+        """Return all fields of a named counter."""
+        pass
+
+    @abstractmethod
+    async def append_audit(self, name: str, entry: Dict[str, Any], max_len: int) -> None:
+        """Append an entry to a capped audit list (oldest entries are trimmed)."""
+        pass
+
+    @abstractmethod
+    async def read_audit(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return audit entries, most recent first."""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources (no-op by default)."""
+        return None
+
+
+class InMemorySharedState(SharedStateBackend):
+    """Process-local backend; each operation runs without awaiting so it is atomic on the event loop."""
+
+    def __init__(self):
+        self._cooldowns: Dict[str, int] = {}
+        self._windows: Dict[str, Dict[str, int]] = {}
+        self._dedup: Dict[str, float] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._audit: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def get_cooldown_until(self, key: str) -> int:
+        return int(self._cooldowns.get(key, 0))
+
+    async def extend_cooldown(self, key: str, until_ms: int) -> int:
+        current = self._cooldowns.get(key, 0)
+        if until_ms > current:
+            self._cooldowns[key] = int(until_ms)
+        return self._cooldowns.get(key, current)
+
+    async def get_event_window(self, key: str) -> Tuple[int, int]:
+        window = self._windows.get(key)
+        if not window:
+            return 0, 0
+        return window["until"], window["count"]
+
+    async def record_event(self, key: str, cooldown_ms: int, now_ms: Optional[int] = None) -> Tuple[int, int]:
+        now_ms = int(now_ms if now_ms is not None else time.time() * 1000)
+        window = self._windows.setdefault(key, {"until": 0, "count": 0, "last": 0})
+        window["count"] += 1
+        window["last"] = now_ms
+        if now_ms >= window["until"]:
+            window["until"] = now_ms + int(cooldown_ms)
+            window["count"] = 0
+        return window["until"], window["count"]
+
+    async def check_and_set_dedup(self, key: str, ttl_seconds: int) -> bool:
+        now = time.monotonic()
+        expires = self._dedup.get(key)
+        if expires is not None and expires > now:
+            return False
+        self._dedup[key] = now + max(1, int(ttl_seconds))
+        # opportunistic cleanup keeps the map bounded by live keys
+        if len(self._dedup) > 10000:
+            self._dedup = {k: v for k, v in self._dedup.items() if v > now}
+        return True
+
+    async def incr_counter(self, name: str, field: str, amount: int = 1) -> int:
+        counters = self._counters.setdefault(name, {})
+        counters[field] = counters.get(field, 0) + int(amount)
+        return counters[field]
+
+    async def get_counters(self, name: str) -> Dict[str, int]:
+        return dict(self._counters.get(name, {}))
+
+    async def append_audit(self, name: str, entry: Dict[str, Any], max_len: int) -> None:
+        trail = self._audit.setdefault(name, [])
+        trail.append(entry)
+        if len(trail) > max_len:
+            del trail[: len(trail) - max_len]
+
+    async def read_audit(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        trail = self._audit.get(name, [])
+        if limit is None:
+            return list(reversed(trail))
+        return list(reversed(trail[-limit:])) if limit > 0 else []
+
+
+# KEYS[1] cooldown key; ARGV[1] candidate deadline ms; ARGV[2] now ms
+_EXTEND_COOLDOWN_LUA = """
+local cur = tonumber(redis.call('GET', KEYS[1]) or '0')
+local v = tonumber(ARGV[1])
+if v > cur then
+  local ttl = v - tonumber(ARGV[2])
+  if ttl < 1 then ttl = 1 end
+  redis.call('SET', KEYS[1], v, 'PX', ttl)
+  return v
+end
+return cur
+"""
+
+# KEYS[1] window hash; ARGV[1] now ms; ARGV[2] cooldown ms
+_RECORD_EVENT_LUA = """
+local until_ms = tonumber(redis.call('HGET', KEYS[1], 'until') or '0')
+local count = redis.call('HINCRBY', KEYS[1], 'count', 1)
+redis.call('HSET', KEYS[1], 'last', ARGV[1])
+local now = tonumber(ARGV[1])
+if now >= until_ms then
+  until_ms = now + tonumber(ARGV[2])
+  count = 0
+  redis.call('HSET', KEYS[1], 'until', until_ms, 'count', 0)
+end
+return {until_ms, count}
+"""
+
+# KEYS[1] audit list; ARGV[1] JSON entry; ARGV[2] max length
+_APPEND_AUDIT_LUA = """
+redis.call('LPUSH', KEYS[1], ARGV[1])
+redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+return 1
+"""
+
+
+class RedisSharedState(SharedStateBackend):
+    """Redis backend using Lua scripts for atomic check-and-update.
+
+    Example:
+        import redis.asyncio as aioredis
+        backend = RedisSharedState(aioredis.from_url("redis://localhost:6379/0"))
+        orch = DecisionOrchestrator(shared_state=backend)
+    """
+
+    def __init__(self, client: Any, prefix: str = "orch:"):
+        """Initialize Redis backend.
+
+        Args:
+            client: redis.asyncio client
+            prefix: Key prefix so several deployments can share one Redis
+        """
+        self.client = client
+        self.prefix = prefix
+        self._scripts: Dict[str, Any] = {}
+
+    def _key(self, *parts: str) -> str:
+        return self.prefix + ":".join(parts)
+
+    def _script(self, source: str) -> Any:
+        # register_script uses EVALSHA and transparently reloads on NOSCRIPT
+        script = self._scripts.get(source)
+        if script is None:
+            script = self.client.register_script(source)
+            self._scripts[source] = script
+        return script
+
+    async def get_cooldown_until(self, key: str) -> int:
+        raw = await self.client.get(self._key("cooldown", key))
+        return int(raw or 0)
+
+    async def extend_cooldown(self, key: str, until_ms: int) -> int:
+        now_ms = int(time.time() * 1000)
+        res = await self._script(_EXTEND_COOLDOWN_LUA)(keys=[self._key("cooldown", key)], args=[int(until_ms), now_ms])
+        return int(res or 0)
+
+    async def get_event_window(self, key: str) -> Tuple[int, int]:
+        until_raw, count_raw = await self.client.hmget(self._key("window", key), "until", "count")
+        return int(until_raw or 0), int(count_raw or 0)
+
+    async def record_event(self, key: str, cooldown_ms: int, now_ms: Optional[int] = None) -> Tuple[int, int]:
+        now_ms = int(now_ms if now_ms is not None else time.time() * 1000)
+        until_ms, count = await self._script(_RECORD_EVENT_LUA)(keys=[self._key("window", key)], args=[now_ms, int(cooldown_ms)])
+        return int(until_ms), int(count)
+
+    async def check_and_set_dedup(self, key: str, ttl_seconds: int) -> bool:
+        res = await self.client.set(self._key("dedup", key), "1", ex=max(1, int(ttl_seconds)), nx=True)
+        return bool(res)
+
+    async def check_and_set_dedup_many(self, keys: List[str], ttl_seconds: int) -> List[bool]:
+        # one round-trip; SET NX inside the pipeline also dedups repeats within the batch
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(self._key("dedup", key), "1", ex=max(1, int(ttl_seconds)), nx=True)
+        return [bool(r) for r in await pipe.execute()]
+
+    async def incr_counter(self, name: str, field: str, amount: int = 1) -> int:
+        return int(await self.client.hincrby(self._key("counters", name), field, int(amount)))
+
+    async def get_counters(self, name: str) -> Dict[str, int]:
+        raw = await self.client.hgetall(self._key("counters", name)) or {}
+        out: Dict[str, int] = {}
+        for k, v in raw.items():
+            out[k.decode() if isinstance(k, bytes) else str(k)] = int(v)
+        return out
+
+    async def append_audit(self, name: str, entry: Dict[str, Any], max_len: int) -> None:
+        await self._script(_APPEND_AUDIT_LUA)(keys=[self._key("audit", name)], args=[json.dumps(entry, default=str), int(max_len)])
+
+    async def read_audit(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        if limit is not None and limit <= 0:
+            return []
+        end = -1 if limit is None else int(limit) - 1
+        raw = await self.client.lrange(self._key("audit", name), 0, end)
+        entries = []
+        for r in raw or []:
+            try:
+                entries.append(json.loads(r))
+            except Exception:
+                logger.warning("skipping invalid shared audit entry")
+        return entries
+
+    async def close(self) -> None:
+        try:
+            await self.client.close()
+        except Exception:
+            logger.exception("error closing shared state redis client")
+
+
+def create_shared_state_from_settings() -> Optional[SharedStateBackend]:
+    """Build the backend selected by SHARED_STATE_BACKEND ("local", "redis" or "memory").
+
+    Returns None for "local" so the orchestrator keeps its process-local state;
+    "memory" exercises the SharedState code paths with an in-process backend.
+    """
+    from .config import get_settings
+
+    cfg = get_settings()
+    kind = str(getattr(cfg, "SHARED_STATE_BACKEND", "local") or "local").lower()
+    if kind == "redis":
+        try:
+            import redis.asyncio as aioredis
+        except Exception:
+            logger.error("SHARED_STATE_BACKEND=redis but redis.asyncio is not installed; using local state")
+            return None
+        return RedisSharedState(aioredis.from_url(cfg.REDIS_URL), prefix=getattr(cfg, "SHARED_STATE_PREFIX", "orch:"))
+    if kind == "memory":
+        return InMemorySharedState()
+    return None
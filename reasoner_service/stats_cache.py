@@ -0,0 +1,159 @@
+"""
+Query cache for OutcomeStatsService.
+
+A shadow-mode evaluation runs several outcome rules, and each one asks the
+stats service for nearly the same aggregate (WinRateThresholdRule and
+AvgPnLThresholdRule both read aggregate_by_signal_type for the same filters).
+StatsCache sits in front of the stats queries:
+
+- request scope: inside ``request_scope()`` every distinct query runs at most
+  once, whatever the TTL, so one rule pass never repeats a round-trip;
+- TTL: non-None results are kept for ``ttl`` seconds across requests; ``None``
+  (no data, or an error the service already logged) is never cached;
+- write invalidation: storage.insert_decision_outcome notifies every live
+  cache, which drops the entries whose symbol/timeframe/signal_type filters
+  match the new row. The TTL bounds staleness from writers in other processes;
+- single-flight: concurrent identical queries share one in-flight fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# (method, symbol, timeframe, signal_type, *other arguments)
+StatsKey = Tuple[Any, ...]
+
+_request_memo: "contextvars.ContextVar[Optional[Dict[Tuple[int, StatsKey], asyncio.Future]]]" = (
+    contextvars.ContextVar("outcome_stats_request_memo", default=None)
+)
+
+
+@contextlib.contextmanager
+def request_scope() -> Iterator[None]:
+    """Memoize stats queries for the duration of one request (nests; the outermost scope wins)."""
+    if _request_memo.get() is not None:
+        yield
+        return
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+class StatsCache:
+    """TTL + request-scoped cache with write invalidation and single-flight fetches."""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 4096):
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        # key -> (expires_at monotonic, value)
+        self._entries: "OrderedDict[StatsKey, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[StatsKey, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+        # bumped by invalidate so a fetch that raced a write is not stored
+        self._generation = 0
+        _live_caches.add(self)
+        _ensure_listener()
+
+    def _lookup(self, key: StatsKey) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: StatsKey, value: Any) -> None:
+        if self.ttl <= 0 or value is None:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key: StatsKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key`` or run ``fetch`` once for all concurrent callers."""
+        memo = _request_memo.get()
+        if memo is not None:
+            scoped = memo.get((id(self), key))
+            if scoped is not None:
+                self.hits += 1
+                return await asyncio.shield(scoped)
+        found, value = self._lookup(key)
+        if found:
+            self.hits += 1
+            return value
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.get_running_loop().create_task(self._fetch(key, fetch))
+            self._inflight[key] = pending
+        else:
+            self.hits += 1
+        if memo is not None:
+            memo[(id(self), key)] = pending
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, key: StatsKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generation
+        try:
+            value = await fetch()
+            if generation == self._generation:
+                self._store(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, symbol: Any = None, timeframe: Any = None, signal_type: Any = None) -> int:
+        """Drop entries whose filters could include a row with these values (all when none given)."""
+        self._generation += 1
+        if symbol is None and timeframe is None and signal_type is None:
+            n = len(self._entries)
+            self._entries.clear()
+            return n
+        doomed = [
+            k for k in self._entries
+            if (k[1] is None or symbol is None or k[1] == symbol)
+            and (k[2] is None or timeframe is None or k[2] == timeframe)
+            and (k[3] is None or signal_type is None or k[3] == signal_type)
+        ]
+        for k in doomed:
+            del self._entries[k]
+        return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_live_caches: "weakref.WeakSet[StatsCache]" = weakref.WeakSet()
+
+
+def _on_outcome_inserted(row: Dict[str, Any]) -> None:
+    for cache in list(_live_caches):
+        cache.invalidate(row.get("symbol"), row.get("timeframe"), row.get("signal_type"))
+
+
+_listener_registered = False
+
+
+def _ensure_listener() -> None:
+    global _listener_registered
+    if not _listener_registered:
+        from .storage import add_outcome_insert_listener
+        add_outcome_insert_listener(_on_outcome_inserted)
+        _listener_registered = True
@@ -47,14 +47,23 @@ async def log_notification(engine, decision_id, channel, status, http_status, er
     return "logid123"
 
 import asyncio
-from typing import Any, Optional, List
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from typing import Any, AsyncIterator, Callable, Optional, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, String, Float, Integer, Boolean, Text, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Boolean, Text, JSON, LargeBinary, Date, DateTime, ForeignKey, Index, and_, delete, inspect, or_, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
 import uuid
 import datetime
+import logging
+import re
+
+from .db_engine import create_engine
+from .decision_codec import DecisionRecord, encode_payload
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
@@ -64,13 +73,17 @@ class Decision(Base):
     symbol = Column(String)
     decision_text = Column(Text)
     raw = Column(JSON, nullable=True)
+    # DECISION_STORAGE_FORMAT=binary: raw + decision_text as one compressed blob (see decision_codec)
+    payload = Column(LargeBinary, nullable=True)
     bias = Column(String)
     confidence = Column(Float)
     recommendation = Column(String)
     repair_used = Column(Boolean)
     fallback_used = Column(Boolean)
     duration_ms = Column(Integer)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=func.now(), index=True)  # get_recent_decisions
+
+_DECISION_COLUMNS = frozenset(Decision.__table__.columns.keys())
 
 class NotificationLog(Base):
     __tablename__ = "notification_logs"
@@ -129,16 +142,78 @@ class DecisionOutcome(Base):
     closed_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=func.now(), index=True)
 
+    __table_args__ = (
+        # get_outcomes_by_signal_type: equality on both, newest first
+        Index(
+            "ix_decision_outcomes_symbol_signal_closed",
+            "symbol", "signal_type", closed_at.desc(),
+        ),
+        # OutcomeStatsService filters; outcome/pnl trail the key so stats
+        # windows are answered from the index alone
+        Index(
+            "ix_decision_outcomes_stats",
+            "symbol", "timeframe", "signal_type", "closed_at", "outcome", "pnl",
+        ),
+        # keyset pagination order for the streaming readers
+        Index("ix_decision_outcomes_closed_id", "closed_at", "id"),
+    )
+
+
+class OutcomeRollup(Base):
+    """
+    Per-day outcome aggregates maintained alongside DecisionOutcome inserts.
+
+    One row per (symbol, timeframe, signal_type, day) with running counts and
+    sums, so stats are answered by summing a few rows instead of scanning
+    history. Loss-streak state per day:
+    - leading_losses: losses before the day's first non-loss
+    - trailing_losses: losses since the day's last non-loss
+    - max_loss_streak: longest run of losses inside the day
+    Runs that span days are stitched together in day order.
+    """
+    __tablename__ = "outcome_rollups"
+    symbol = Column(String, primary_key=True)
+    timeframe = Column(String, primary_key=True)
+    signal_type = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    breakevens = Column(Integer, nullable=False, default=0)
+    total_pnl = Column(Float, nullable=False, default=0.0)
+    r_count = Column(Integer, nullable=False, default=0)
+    r_sum = Column(Float, nullable=False, default=0.0)
+    leading_losses = Column(Integer, nullable=False, default=0)
+    trailing_losses = Column(Integer, nullable=False, default=0)
+    max_loss_streak = Column(Integer, nullable=False, default=0)
+    last_closed_at = Column(DateTime, nullable=True)
+
+
+class OutcomeRollupState(Base):
+    """
+    Markers for the outcome_rollups table.
+
+    ``backfilled`` is written by a full rebuild_outcome_rollups (or by
+    init_models while decision_outcomes is still empty). Until it exists the
+    rollups may only cover outcomes inserted since they were enabled, so
+    OutcomeStatsService keeps reading the raw table.
+    """
+    __tablename__ = "outcome_rollup_state"
+    name = Column(String, primary_key=True)
+    completed_at = Column(DateTime, nullable=False)
+
+
+ROLLUPS_BACKFILLED = "backfilled"
+
 
 def get_engine_and_session(dsn=None):
-    dsn = dsn or "sqlite+aiosqlite:///./decisions.db"
-    engine = create_async_engine(dsn, echo=False, future=True)
+    engine = create_engine(dsn, name="reasoner")
     async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
     return engine, async_session
 
 async def create_engine_and_sessionmaker(dsn=None):
-    dsn = dsn or "sqlite+aiosqlite:///./decisions.db"
-    engine = create_async_engine(dsn, echo=False, future=True)
+    # pool sizing, pre-ping, asyncpg statement cache and pool metrics: see db_engine
+    engine = create_engine(dsn, name="reasoner")
     async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
     return engine, async_session
 
@@ -146,31 +221,165 @@ async def create_engine_from_env_or_dsn(dsn=None):
     engine, _ = await create_engine_and_sessionmaker(dsn)
     return engine
 
+def _missing_indexes(conn) -> list:
+    """Model indexes on existing tables that the database does not have yet.
+
+    create_all skips tables that already exist, and with them any index added
+    to the model since.
+    """
+    inspector = inspect(conn)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        present = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        missing.extend(index for index in table.indexes if index.name not in present)
+    return missing
+
+
+def _create_missing_indexes(conn) -> None:
+    """Add indexes declared after a table was first created.
+
+    On Postgres a plain CREATE INDEX here would lock the table for writes
+    inside the startup transaction, so the missing indexes are only logged;
+    build them offline with scripts/create_missing_indexes.py (CREATE INDEX
+    CONCURRENTLY). Elsewhere they are created with IF NOT EXISTS / checkfirst
+    so replicas starting together do not fail on each other's index.
+    """
+    missing = _missing_indexes(conn)
+    if not missing:
+        return
+    if conn.dialect.name == "postgresql":
+        logger.warning(
+            "missing indexes %s; run scripts/create_missing_indexes.py to build them",
+            ", ".join(index.name for index in missing),
+        )
+        return
+    for index in missing:
+        if conn.dialect.name == "sqlite":
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        else:
+            index.create(conn, checkfirst=True)
+
+
+async def create_missing_indexes(engine) -> List[str]:
+    """Build missing model indexes without blocking writes; returns their names.
+
+    Postgres indexes are built one at a time with CREATE INDEX CONCURRENTLY IF
+    NOT EXISTS outside a transaction; other databases use the init_models path.
+    """
+    async with engine.connect() as conn:
+        missing = await conn.run_sync(_missing_indexes)
+    if not missing:
+        return []
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            await conn.run_sync(_create_missing_indexes)
+        return [index.name for index in missing]
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for index in missing:
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+            ddl = re.sub(r"^CREATE (UNIQUE )?INDEX", r"CREATE \1INDEX CONCURRENTLY", ddl, count=1)
+            await conn.exec_driver_sql(ddl)
+    return [index.name for index in missing]
+
+
+def _create_missing_columns(conn) -> None:
+    """Add nullable columns declared after a table was first created (e.g. decisions.payload)."""
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        present = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in present and column.nullable and column.server_default is None:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                ))
+
+
+def _mark_empty_rollups_backfilled(conn) -> None:
+    """Rollups of an empty outcome table are complete; anything else needs a rebuild."""
+    if conn.execute(select(OutcomeRollupState.name).where(OutcomeRollupState.name == ROLLUPS_BACKFILLED)).first():
+        return
+    if conn.execute(select(DecisionOutcome.id).limit(1)).first() is None:
+        conn.execute(OutcomeRollupState.__table__.insert().values(
+            name=ROLLUPS_BACKFILLED, completed_at=datetime.datetime.utcnow(),
+        ))
+    else:
+        logger.warning(
+            "outcome_rollups not backfilled; stats read decision_outcomes until "
+            "scripts/rebuild_outcome_rollups.py has run"
+        )
+
+
 async def init_models(engine):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_mark_empty_rollups_backfilled)
+
+def _binary_payloads_enabled() -> bool:
+    from .config import get_settings
+
+    return getattr(get_settings(), "DECISION_STORAGE_FORMAT", "json") == "binary"
+
+
+def _decision_columns(kwargs: dict, binary: bool) -> dict:
+    """Decision constructor arguments: known columns only, raw/text packed into payload if ``binary``."""
+    # callers pass decision-level extras such as ts_ms; Decision(**kwargs) would
+    # raise TypeError on them and every insert would land in the DLQ
+    row = {k: v for k, v in kwargs.items() if k in _DECISION_COLUMNS}
+    if binary:
+        raw, decision_text = row.pop("raw", None), row.pop("decision_text", None)
+        if raw is not None or decision_text is not None:
+            row["payload"] = encode_payload(raw, decision_text)
+    return row
+
 
 async def insert_decision(sessionmaker, **kwargs):
+    """Insert one decision; keys that are not Decision columns (e.g. ``ts_ms``) are ignored."""
     async with sessionmaker() as session:
-        dec = Decision(**kwargs)
+        dec = Decision(**_decision_columns(kwargs, _binary_payloads_enabled()))
         session.add(dec)
         await session.commit()
         await session.refresh(dec)
         return dec.id
 
+async def insert_decisions_bulk(sessionmaker, rows: List[dict]) -> List[str]:
+    """Insert many decisions in a single transaction and return their ids.
+
+    Used by the DLQ drain so a backlog is re-persisted with one commit instead
+    of one round-trip per decision. Keys that are not Decision columns (e.g.
+    ``ts_ms``) are ignored.
+    """
+    if not rows:
+        return []
+    binary = _binary_payloads_enabled()
+    async with sessionmaker() as session:
+        decs = [Decision(**_decision_columns(kwargs, binary)) for kwargs in rows]
+        session.add_all(decs)
+        await session.commit()
+        return [dec.id for dec in decs]
+
 async def get_decision_by_id(sessionmaker, id1):
     async with sessionmaker() as session:
         result = await session.execute(select(Decision).where(Decision.id == id1))
         dec = result.scalar_one_or_none()
         if not dec:
             return None
-        return {c.name: getattr(dec, c.name) for c in Decision.__table__.columns}
+        return DecisionRecord.from_row({c.name: getattr(dec, c.name) for c in Decision.__table__.columns})
 
 async def get_recent_decisions(sessionmaker, limit=10):
     async with sessionmaker() as session:
         result = await session.execute(select(Decision).order_by(Decision.created_at.desc()).limit(limit))
         decs = result.scalars().all()
-        return [{c.name: getattr(dec, c.name) for c in Decision.__table__.columns} for dec in decs]
+        return [DecisionRecord.from_row({c.name: getattr(dec, c.name) for c in Decision.__table__.columns}) for dec in decs]
 
 async def log_notification(sessionmaker, decision_id, channel, status, http_status, error):
     async with sessionmaker() as session:
@@ -197,6 +406,26 @@ def compute_decision_hash(symbol, rec, conf, ts_ms):
 # decision tracking without learning logic yet.
 # ============================================================================
 
+# Callables invoked with the inserted row dict after insert_decision_outcome
+# commits (e.g. the memory-recall cache in outcome_cache).
+_outcome_insert_listeners: List[Callable[[dict], None]] = []
+
+
+def add_outcome_insert_listener(listener: Callable[[dict], None]) -> None:
+    """Register a callback for newly inserted DecisionOutcome rows."""
+    if listener not in _outcome_insert_listeners:
+        _outcome_insert_listeners.append(listener)
+
+
+def _notify_outcome_inserted(row: dict) -> None:
+    for listener in list(_outcome_insert_listeners):
+        try:
+            listener(row)
+        except Exception:
+            # listeners are caches; never fail the write because of them
+            pass
+
+
 async def insert_decision_outcome(
     sessionmaker,
     decision_id: str,
@@ -248,27 +477,179 @@ async def insert_decision_outcome(
     if exit_reason not in ("tp", "sl", "manual", "timeout"):
         raise ValueError(f"Invalid exit_reason '{exit_reason}'; must be 'tp', 'sl', 'manual', or 'timeout'")
     
-    async with sessionmaker() as session:
-        outcome_rec = DecisionOutcome(
-            decision_id=decision_id,
-            symbol=symbol,
-            timeframe=timeframe,
-            signal_type=signal_type,
-            entry_price=entry_price,
-            exit_price=exit_price,
-            pnl=pnl,
-            outcome=outcome,
-            exit_reason=exit_reason,
-            closed_at=closed_at,
-            model=model,
-            session=session_id,
-            direction=direction,
-            r_multiple=r_multiple,
+    rollups = _rollups_enabled()
+    for attempt in range(2):
+        try:
+            async with sessionmaker() as session:
+                outcome_rec = DecisionOutcome(
+                    decision_id=decision_id,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type=signal_type,
+                    entry_price=entry_price,
+                    exit_price=exit_price,
+                    pnl=pnl,
+                    outcome=outcome,
+                    exit_reason=exit_reason,
+                    closed_at=closed_at,
+                    model=model,
+                    session=session_id,
+                    direction=direction,
+                    r_multiple=r_multiple,
+                )
+                session.add(outcome_rec)
+                if rollups:
+                    # same transaction: the rollup never disagrees with the outcome table
+                    await _apply_outcome_to_rollup(session, outcome_rec)
+                await session.commit()
+                await session.refresh(outcome_rec)
+                break
+        except IntegrityError:
+            # a concurrent writer created the same rollup row first; retry updates it
+            if not rollups or attempt:
+                raise
+    if _outcome_insert_listeners:
+        _notify_outcome_inserted({c.name: getattr(outcome_rec, c.name) for c in DecisionOutcome.__table__.columns})
+    return outcome_rec.id
+
+
+def _rollups_enabled() -> bool:
+    from .config import get_settings
+
+    return bool(getattr(get_settings(), "OUTCOME_ROLLUPS_ENABLED", True))
+
+
+def _rollup_day(closed_at: datetime.datetime) -> datetime.date:
+    if closed_at.tzinfo is not None:
+        closed_at = closed_at.astimezone(datetime.timezone.utc)
+    return closed_at.date()
+
+
+def _new_rollup(symbol: str, timeframe: str, signal_type: str, day: datetime.date) -> "OutcomeRollup":
+    return OutcomeRollup(
+        symbol=symbol, timeframe=timeframe, signal_type=signal_type, day=day,
+        count=0, wins=0, losses=0, breakevens=0, total_pnl=0.0, r_count=0, r_sum=0.0,
+        leading_losses=0, trailing_losses=0, max_loss_streak=0,
+    )
+
+
+def _rollup_add(rollup: "OutcomeRollup", outcome: str, pnl: float, r_multiple: Optional[float],
+                closed_at: datetime.datetime) -> None:
+    """Fold one outcome into a rollup; outcomes must arrive in closed_at order."""
+    if outcome == "loss":
+        if rollup.leading_losses == rollup.count:
+            rollup.leading_losses += 1
+        rollup.trailing_losses += 1
+        rollup.max_loss_streak = max(rollup.max_loss_streak, rollup.trailing_losses)
+        rollup.losses += 1
+    else:
+        rollup.trailing_losses = 0
+        if outcome == "win":
+            rollup.wins += 1
+        else:
+            rollup.breakevens += 1
+    rollup.count += 1
+    rollup.total_pnl += pnl or 0.0
+    if r_multiple is not None:
+        rollup.r_count += 1
+        rollup.r_sum += r_multiple
+    rollup.last_closed_at = closed_at
+
+
+def _comparable(a: datetime.datetime, b: datetime.datetime) -> tuple:
+    # SQLite returns naive datetimes even for tz-aware inserts
+    if (a.tzinfo is None) != (b.tzinfo is None):
+        a, b = a.replace(tzinfo=None), b.replace(tzinfo=None)
+    return a, b
+
+
+async def _apply_outcome_to_rollup(session, rec: "DecisionOutcome") -> None:
+    day = _rollup_day(rec.closed_at)
+    key = (rec.symbol, rec.timeframe, rec.signal_type, day)
+    rollup = (await session.execute(
+        select(OutcomeRollup).where(
+            (OutcomeRollup.symbol == rec.symbol)
+            & (OutcomeRollup.timeframe == rec.timeframe)
+            & (OutcomeRollup.signal_type == rec.signal_type)
+            & (OutcomeRollup.day == day)
+        ).with_for_update()
+    )).scalar_one_or_none()
+    if rollup is None:
+        rollup = _new_rollup(*key)
+        session.add(rollup)
+    elif rollup.last_closed_at is not None:
+        new, last = _comparable(rec.closed_at, rollup.last_closed_at)
+        if new < last:
+            # late arrival: streak state depends on order, so rebuild this one day
+            await _recompute_rollup_day(session, rollup, rec)
+            return
+    _rollup_add(rollup, rec.outcome, rec.pnl, rec.r_multiple, rec.closed_at)
+
+
+async def _recompute_rollup_day(session, rollup: "OutcomeRollup", rec: "DecisionOutcome") -> None:
+    start = datetime.datetime.combine(rollup.day, datetime.time.min)
+    if rec.closed_at.tzinfo is not None:
+        start = start.replace(tzinfo=datetime.timezone.utc)
+    await session.flush()
+    result = await session.execute(
+        select(DecisionOutcome.outcome, DecisionOutcome.pnl, DecisionOutcome.r_multiple, DecisionOutcome.closed_at)
+        .where(
+            (DecisionOutcome.symbol == rollup.symbol)
+            & (DecisionOutcome.timeframe == rollup.timeframe)
+            & (DecisionOutcome.signal_type == rollup.signal_type)
+            & (DecisionOutcome.closed_at >= start)
+            & (DecisionOutcome.closed_at < start + datetime.timedelta(days=1))
         )
-        session.add(outcome_rec)
+        .order_by(DecisionOutcome.closed_at.asc())
+    )
+    fresh = _new_rollup(rollup.symbol, rollup.timeframe, rollup.signal_type, rollup.day)
+    for row in result:
+        _rollup_add(fresh, row.outcome, row.pnl, row.r_multiple, row.closed_at)
+    for col in OutcomeRollup.__table__.columns.keys():
+        setattr(rollup, col, getattr(fresh, col))
+
+
+async def rebuild_outcome_rollups(sessionmaker, since: Optional[datetime.date] = None) -> int:
+    """
+    Recompute outcome_rollups from decision_outcomes (backfill or repair).
+
+    Rebuilds every day (or days from ``since`` on) in one transaction, streaming
+    only the columns the rollups need. A full rebuild marks the rollups as
+    backfilled, which is what lets OutcomeStatsService read them. Returns the
+    number of rollup rows written.
+    """
+    query = select(
+        DecisionOutcome.symbol, DecisionOutcome.timeframe, DecisionOutcome.signal_type,
+        DecisionOutcome.outcome, DecisionOutcome.pnl, DecisionOutcome.r_multiple, DecisionOutcome.closed_at,
+    ).order_by(DecisionOutcome.closed_at.asc())
+    wipe = delete(OutcomeRollup)
+    if since is not None:
+        query = query.where(DecisionOutcome.closed_at >= datetime.datetime.combine(since, datetime.time.min))
+        wipe = wipe.where(OutcomeRollup.day >= since)
+    rollups = {}
+    async with sessionmaker() as session:
+        await session.execute(wipe)
+        result = await session.stream(query)
+        async for row in result:
+            key = (row.symbol, row.timeframe, row.signal_type, _rollup_day(row.closed_at))
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = _new_rollup(*key)
+            _rollup_add(rollup, row.outcome, row.pnl, row.r_multiple, row.closed_at)
+        session.add_all(rollups.values())
+        if since is None:
+            await session.merge(OutcomeRollupState(name=ROLLUPS_BACKFILLED, completed_at=datetime.datetime.utcnow()))
         await session.commit()
-        await session.refresh(outcome_rec)
-        return outcome_rec.id
+    return len(rollups)
+
+
+async def rollups_backfilled(sessionmaker) -> bool:
+    """True once outcome_rollups covers all of decision_outcomes (see OutcomeRollupState)."""
+    async with sessionmaker() as session:
+        result = await session.execute(
+            select(OutcomeRollupState.name).where(OutcomeRollupState.name == ROLLUPS_BACKFILLED)
+        )
+        return result.first() is not None
 
 
 async def get_decision_outcome_by_id(sessionmaker, outcome_id: str) -> Optional[dict]:
@@ -305,16 +686,12 @@ async def get_recent_decision_outcomes(
         List of outcome dicts, ordered by created_at DESC
     """
     async with sessionmaker() as session:
-        query = select(DecisionOutcome)
+        query = select(*DecisionOutcome.__table__.columns)
         if symbol:
             query = query.where(DecisionOutcome.symbol == symbol)
         query = query.order_by(DecisionOutcome.created_at.desc()).limit(limit)
         result = await session.execute(query)
-        outcomes = result.scalars().all()
-        return [
-            {c.name: getattr(outcome, c.name) for c in DecisionOutcome.__table__.columns}
-            for outcome in outcomes
-        ]
+        return [dict(row) for row in result.mappings()]
 
 
 async def get_outcomes_by_decision_id(sessionmaker, decision_id: str) -> List[dict]:
@@ -348,16 +725,12 @@ async def get_outcomes_by_symbol(
     """
     async with sessionmaker() as session:
         result = await session.execute(
-            select(DecisionOutcome)
+            select(*DecisionOutcome.__table__.columns)
             .where(DecisionOutcome.symbol == symbol)
             .order_by(DecisionOutcome.closed_at.desc())
             .limit(limit)
         )
-        outcomes = result.scalars().all()
-        return [
-            {c.name: getattr(outcome, c.name) for c in DecisionOutcome.__table__.columns}
-            for outcome in outcomes
-        ]
+        return [dict(row) for row in result.mappings()]
 
 
 async def get_outcomes_by_signal_type(
@@ -413,4 +786,96 @@ async def get_outcomes_by_signal_type(
         return [
             {c.name: getattr(outcome, c.name) for c in DecisionOutcome.__table__.columns}
             for outcome in outcomes
-        ]
\ No newline at end of file
+        ]
+
+
+async def iter_outcome_batches(
+    sessionmaker,
+    columns: Optional[Sequence[str]] = None,
+    symbol: Optional[str] = None,
+    timeframe: Optional[str] = None,
+    signal_type: Optional[str] = None,
+    since: Optional[datetime.datetime] = None,
+    descending: bool = False,
+    batch_size: int = 1000,
+    columnar: bool = False,
+    after: Optional[tuple] = None,
+) -> AsyncIterator[Any]:
+    """
+    Stream decision outcomes in bounded batches, ordered by (closed_at, id).
+
+    Pages are fetched with keyset pagination: each page is a fresh
+    ``WHERE (closed_at, id) > last_seen ORDER BY closed_at, id LIMIT n`` query
+    streamed through a server-side cursor, so memory stays at one page however
+    much history there is, no transaction is held between pages and late
+    pages cost the same as early ones (no OFFSET scan).
+
+    Args:
+        sessionmaker: Async session factory
+        columns: Column names to select (default: all columns); closed_at
+            and id are appended when missing since pagination needs them
+        symbol / timeframe / signal_type: Optional equality filters
+        since: Only outcomes with closed_at >= since
+        descending: Newest first instead of oldest first
+        batch_size: Rows per page
+        columnar: Yield {column: [values]} dicts instead of lists of row tuples
+        after: Resume after this (closed_at, id) keyset position (e.g. the
+            last row of an earlier pass)
+
+    Yields:
+        Lists of named row tuples (``row.pnl``), or column dicts when columnar.
+    """
+    names = list(columns) if columns else [c.name for c in DecisionOutcome.__table__.columns]
+    names += [k for k in ("closed_at", "id") if k not in names]
+    table = DecisionOutcome.__table__
+    base = select(*(table.c[name] for name in names))
+    if symbol:
+        base = base.where(DecisionOutcome.symbol == symbol)
+    if timeframe:
+        base = base.where(DecisionOutcome.timeframe == timeframe)
+    if signal_type:
+        base = base.where(DecisionOutcome.signal_type == signal_type)
+    if since is not None:
+        base = base.where(DecisionOutcome.closed_at >= since)
+    if descending:
+        base = base.order_by(DecisionOutcome.closed_at.desc(), DecisionOutcome.id.desc())
+    else:
+        base = base.order_by(DecisionOutcome.closed_at.asc(), DecisionOutcome.id.asc())
+    base = base.limit(batch_size).execution_options(yield_per=batch_size)
+    closed_idx, id_idx = names.index("closed_at"), names.index("id")
+
+    last = tuple(after) if after is not None else None
+    while True:
+        query = base
+        if last is not None:
+            closed_at, last_id = last
+            if descending:
+                seek = or_(
+                    DecisionOutcome.closed_at < closed_at,
+                    and_(DecisionOutcome.closed_at == closed_at, DecisionOutcome.id < last_id),
+                )
+            else:
+                seek = or_(
+                    DecisionOutcome.closed_at > closed_at,
+                    and_(DecisionOutcome.closed_at == closed_at, DecisionOutcome.id > last_id),
+                )
+            query = query.where(seek)
+        async with sessionmaker() as session:
+            result = await session.stream(query)
+            page = [row async for row in result]
+        if not page:
+            return
+        last = (page[-1][closed_idx], page[-1][id_idx])
+        if columnar:
+            yield {name: [row[i] for row in page] for i, name in enumerate(names)}
+        else:
+            yield page
+        if len(page) < batch_size:
+            return
+
+
+async def iter_outcomes(sessionmaker, **kwargs) -> AsyncIterator[Any]:
+    """Row-at-a-time view over iter_outcome_batches (same arguments, minus columnar)."""
+    async for batch in iter_outcome_batches(sessionmaker, **kwargs):
+        for row in batch:
+            yield row
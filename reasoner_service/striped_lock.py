@@ -0,0 +1,45 @@
+"""
+Striped asyncio locks.
+
+A StripedLock maps keys (event type, symbol, correlation id, ...) onto a fixed
+pool of asyncio.Lock objects. Work on independent keys proceeds concurrently
+while work on the same key stays serialized, without one global critical
+section. Time spent waiting for a stripe is exported through the
+``orchestrator_lock_wait_seconds`` histogram labelled by lock name.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable, List
+
+from .metrics import lock_wait_seconds
+
+
+class StripedLock:
+    """Fixed pool of asyncio locks selected by ``hash(key) % stripes``."""
+
+    def __init__(self, name: str, stripes: int = 64):
+        self.name = name
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(max(1, int(stripes)))]
+
+    def lock_for(self, key: Hashable) -> asyncio.Lock:
+        """Return the lock guarding ``key``."""
+        return self._locks[hash(key) % len(self._locks)]
+
+    @asynccontextmanager
+    async def acquire(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the stripe for ``key``, recording how long acquisition waited."""
+        lock = self.lock_for(key)
+        start = time.perf_counter()
+        await lock.acquire()
+        try:
+            lock_wait_seconds.labels(lock=self.name).observe(time.perf_counter() - start)
+        except Exception:
+            pass
+        try:
+            yield
+        finally:
+            lock.release()
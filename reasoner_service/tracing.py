@@ -0,0 +1,171 @@
+"""
+Lightweight stage-level latency tracing for the decision pipeline.
+
+A StageTimer measures consecutive stages of one pipeline run with lap-style
+marks: each ``lap(stage)`` records the time since the previous mark into the
+``decision_stage_latency_seconds`` histogram (labels: pipeline, stage). The cost
+is one perf_counter call plus one histogram observation per stage.
+
+When TRACE_EXPORT_PATH is set, finished runs are also written as
+OpenTelemetry-style spans (one JSON object per line) so slow stages can be
+inspected offline. Nested runs (process_decision inside handle_event) share a
+trace id and link to their parent span through a context variable.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .config import get_settings
+from .metrics import stage_latency_seconds
+
+
+logger = logging.getLogger(__name__)
+
+_current_timer: contextvars.ContextVar[Optional["StageTimer"]] = contextvars.ContextVar("reasoner_stage_timer", default=None)
+
+
+class TraceFileExporter:
+    """Buffered JSONL span exporter (OpenTelemetry span field names)."""
+
+    def __init__(self, path: str, flush_every: int = 200):
+        self.path = path
+        self.flush_every = max(1, int(flush_every))
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        lines = [json.dumps(span, default=str) for span in spans]
+        with self._lock:
+            self._buffer.extend(lines)
+            if len(self._buffer) < self.flush_every:
+                return
+            pending, self._buffer = self._buffer, []
+        self._write(pending)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._buffer = self._buffer, []
+        if pending:
+            self._write(pending)
+
+    def _write(self, lines: List[str]) -> None:
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception:
+            logger.exception("failed to export trace spans to %s", self.path)
+
+
+_exporter: Optional[TraceFileExporter] = None
+_exporter_path: Optional[str] = None
+
+
+def get_trace_exporter() -> Optional[TraceFileExporter]:
+    """Return the exporter for TRACE_EXPORT_PATH, or None when export is disabled."""
+    global _exporter, _exporter_path
+    path = getattr(get_settings(), "TRACE_EXPORT_PATH", "") or ""
+    if not path:
+        return None
+    if _exporter is None or _exporter_path != path:
+        if _exporter is not None:
+            _exporter.flush()
+        _exporter = TraceFileExporter(path)
+        _exporter_path = path
+    return _exporter
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+class StageTimer:
+    """Lap timer for one pipeline run.
+
+    Example:
+        timer = StageTimer("process_decision")
+        try:
+            ...pre-policy...
+            timer.lap("pre_policy")
+            ...normalize...
+            timer.lap("normalize")
+        finally:
+            timer.finish()
+    """
+
+    __slots__ = ("pipeline", "attributes", "_start", "_mark", "_wall_start_ns", "_spans",
+                 "_exporter", "trace_id", "span_id", "parent_span_id", "_token", "_finished")
+
+    def __init__(self, pipeline: str, attributes: Optional[Dict[str, Any]] = None):
+        self.pipeline = pipeline
+        self.attributes = attributes or {}
+        self._start = self._mark = time.perf_counter()
+        self._finished = False
+        self._exporter = get_trace_exporter()
+        self._spans: Optional[List[Dict[str, Any]]] = None
+        self.trace_id = self.span_id = self.parent_span_id = None
+        self._token = None
+        if self._exporter is not None:
+            parent = _current_timer.get()
+            self.trace_id = parent.trace_id if parent is not None and parent.trace_id else _new_id(16)
+            self.parent_span_id = parent.span_id if parent is not None else None
+            self.span_id = _new_id(8)
+            self._wall_start_ns = time.time_ns()
+            self._spans = []
+            self._token = _current_timer.set(self)
+
+    def lap(self, stage: str) -> float:
+        """Close the current stage, returning its duration in seconds."""
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        try:
+            stage_latency_seconds.labels(pipeline=self.pipeline, stage=stage).observe(elapsed)
+        except Exception:
+            pass
+        if self._spans is not None:
+            self._spans.append({
+                "traceId": self.trace_id,
+                "spanId": _new_id(8),
+                "parentSpanId": self.span_id,
+                "name": f"{self.pipeline}.{stage}",
+                "startTimeUnixNano": self._wall_start_ns + int((self._mark - self._start) * 1e9),
+                "endTimeUnixNano": self._wall_start_ns + int((now - self._start) * 1e9),
+            })
+        self._mark = now
+        return elapsed
+
+    def finish(self) -> float:
+        """Record the total duration and export spans; safe to call more than once."""
+        if self._finished:
+            return 0.0
+        self._finished = True
+        now = time.perf_counter()
+        total = now - self._start
+        try:
+            stage_latency_seconds.labels(pipeline=self.pipeline, stage="total").observe(total)
+        except Exception:
+            pass
+        if self._spans is not None:
+            if self._token is not None:
+                try:
+                    _current_timer.reset(self._token)
+                except ValueError:
+                    # finished from a different context; leave the var alone
+                    pass
+            root = {
+                "traceId": self.trace_id,
+                "spanId": self.span_id,
+                "parentSpanId": self.parent_span_id,
+                "name": self.pipeline,
+                "startTimeUnixNano": self._wall_start_ns,
+                "endTimeUnixNano": self._wall_start_ns + int(total * 1e9),
+                "attributes": self.attributes,
+            }
+            self._exporter.export([root] + self._spans)
+        return total
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Archive decisions and notification logs older than the retention window.
+
+Rows older than --days are appended to monthly gzip JSON Lines files in
+--archive-dir and removed from the hot tables (decisions still referenced by
+outcomes keep their row with the payload cleared). Run it from cron; it is
+safe to re-run.
+
+Usage:
+    python -m scripts.archive_decisions --days 90
+    python -m scripts.archive_decisions --dsn postgresql+asyncpg://... --days 30 --archive-dir /var/lib/ict/archive
+"""
+
+import argparse
+import asyncio
+
+from reasoner_service.config import get_settings
+from reasoner_service.retention import archive_old_rows
+from reasoner_service.storage import create_engine_and_sessionmaker
+
+
+async def run(dsn, days, archive_dir):
+    engine, sessionmaker = await create_engine_and_sessionmaker(dsn)
+    try:
+        counts = await archive_old_rows(sessionmaker, archive_dir, days)
+    finally:
+        await engine.dispose()
+    for table, c in counts.items():
+        print(f"{table}: archived {c['archived']}, deleted {c['deleted']}, payload cleared {c['stubbed']}")
+
+
+def main():
+    """Main entry point."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Archive old decisions and notification logs")
+    parser.add_argument("--dsn", default=None, help="Database DSN (default: sqlite+aiosqlite:///./decisions.db)")
+    parser.add_argument("--days", type=int, default=settings.DECISION_RETENTION_DAYS,
+                        help="Keep this many days in the hot tables (default: DECISION_RETENTION_DAYS)")
+    parser.add_argument("--archive-dir", default=settings.DECISION_ARCHIVE_DIR,
+                        help="Directory for the monthly archives (default: DECISION_ARCHIVE_DIR)")
+    args = parser.parse_args()
+    if args.days <= 0:
+        parser.error("retention is disabled; pass --days or set DECISION_RETENTION_DAYS")
+    asyncio.run(run(args.dsn, args.days, args.archive_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Build indexes added to the models after the tables were created.
+
+init_models creates missing indexes itself on SQLite, but on Postgres it only
+logs them: a plain CREATE INDEX would block writes to the table while the
+service starts. Run this as an offline/deploy step instead; on Postgres each
+index is built with CREATE INDEX CONCURRENTLY IF NOT EXISTS, so it is safe
+against live traffic and can be re-run.
+
+Usage:
+    python -m scripts.create_missing_indexes --dsn postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+
+from reasoner_service.storage import create_engine_and_sessionmaker, create_missing_indexes
+
+
+async def run(dsn):
+    engine, _ = await create_engine_and_sessionmaker(dsn)
+    try:
+        created = await create_missing_indexes(engine)
+    finally:
+        await engine.dispose()
+    print(f"created {len(created)} missing indexes" + (f": {', '.join(created)}" if created else ""))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build model indexes missing from the database")
+    parser.add_argument("--dsn", default=None, help="Database DSN (default: sqlite+aiosqlite:///./decisions.db)")
+    args = parser.parse_args()
+    asyncio.run(run(args.dsn))
+
+
+if __name__ == "__main__":
+    main()
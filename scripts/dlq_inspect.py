@@ -6,16 +6,17 @@ import sys
 import json
 
 from reasoner_service.config import get_settings
-try:
-    import redis.asyncio as aioredis
-except Exception:
-    aioredis = None
 
 async def main():
     cfg = get_settings()
     if not cfg.REDIS_DLQ_ENABLED:
         print("Redis DLQ not enabled in config")
         return
+    # imported here so the disabled/--help paths start without loading redis
+    try:
+        import redis.asyncio as aioredis
+    except Exception:
+        aioredis = None
     if aioredis is None:
         print("redis.asyncio not installed")
         return
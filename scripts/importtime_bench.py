@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for reasoner_service entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter for
+each target, reports the cumulative import time, and fails when a target
+exceeds its budget or eagerly imports a deferred heavy dependency.
+
+Usage:
+    python scripts/importtime_bench.py            # check all targets
+    python scripts/importtime_bench.py --runs 5   # best-of-5 per target
+    python scripts/importtime_bench.py --module reasoner_service.orchestrator
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# module -> cumulative import budget in milliseconds (best of N runs)
+BUDGETS_MS = {
+    "reasoner_service.config": 25,
+    "reasoner_service.tracing": 150,
+    "reasoner_service.orchestrator": 350,
+}
+
+# dependencies that must only load on first use, never at import time
+DEFERRED = ("sqlalchemy", "redis", "aiohttp")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(module):
+    """Return (cumulative_us, set of imported top-level packages) for one cold import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+    cumulative = None
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        name = m.group(4)
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(m.group(2))
+    if cumulative is None:
+        raise RuntimeError(f"no importtime record for {module}")
+    return cumulative, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="cold imports per module; the best is reported")
+    parser.add_argument("--module", action="append", help="limit to these modules")
+    args = parser.parse_args(argv)
+
+    targets = args.module or list(BUDGETS_MS)
+    failed = False
+    print(f"{'module':<40} {'best ms':>9} {'budget':>8}  deferred deps loaded")
+    for module in targets:
+        results = [measure(module) for _ in range(max(1, args.runs))]
+        best_us = min(r[0] for r in results)
+        eager = sorted(set(DEFERRED) & results[0][1])
+        budget = BUDGETS_MS.get(module)
+        over = budget is not None and best_us / 1000.0 > budget
+        failed = failed or over or bool(eager)
+        print(f"{module:<40} {best_us / 1000.0:>9.1f} {budget if budget is not None else '-':>8}  {', '.join(eager) or '-'}"
+              + ("  OVER BUDGET" if over else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
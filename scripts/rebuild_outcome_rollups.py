@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Rebuild the per-day outcome_rollups table from decision_outcomes.
+
+Rollups are maintained on every insert_decision_outcome; run this after
+enabling them on an existing database, after bulk imports that bypass
+insert_decision_outcome, or to repair a range of days.
+
+Usage:
+    python -m scripts.rebuild_outcome_rollups --dsn sqlite+aiosqlite:///./decisions.db
+    python -m scripts.rebuild_outcome_rollups --dsn postgresql+asyncpg://... --since 2025-01-01
+"""
+
+import argparse
+import asyncio
+import datetime
+
+from reasoner_service.storage import create_engine_and_sessionmaker, init_models, rebuild_outcome_rollups
+
+
+async def run(dsn, since):
+    engine, sessionmaker = await create_engine_and_sessionmaker(dsn)
+    try:
+        await init_models(engine)
+        written = await rebuild_outcome_rollups(sessionmaker, since=since)
+    finally:
+        await engine.dispose()
+    scope = f"from {since.isoformat()}" if since else "all days"
+    print(f"rebuilt {written} outcome rollup rows ({scope})")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Rebuild outcome_rollups from decision_outcomes")
+    parser.add_argument("--dsn", default=None, help="Database DSN (default: sqlite+aiosqlite:///./decisions.db)")
+    parser.add_argument(
+        "--since",
+        type=datetime.date.fromisoformat,
+        default=None,
+        help="Only rebuild days on or after this date (YYYY-MM-DD); default rebuilds everything",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.dsn, args.since))
+
+
+if __name__ == "__main__":
+    main()
@@ -136,3 +136,15 @@ import pytest
 @pytest.fixture(autouse=True)
 def repo_root():
     return ROOT
+
+
+@pytest.fixture
+def shared():
+    """In-memory SharedState backend shared by the orchestrators of one test."""
+    from reasoner_service.shared_state import InMemorySharedState
+
+    backend = InMemorySharedState()
+    yield backend
+    # the shadow mode manager is a process-wide singleton: detach after each test
+    from reasoner_service.policy_shadow_mode import get_shadow_mode_manager
+    get_shadow_mode_manager().state_backend = None
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from reasoner_service.audit_ring import AuditRing
+from reasoner_service.config import get_settings
+from reasoner_service.orchestrator import DecisionOrchestrator
+from reasoner_service.policy_shadow_mode import PolicyShadowModeManager
+
+
+def test_ring_is_bounded_and_list_compatible():
+    ring = AuditRing(capacity=3)
+    assert ring == []
+    ring.extend({"n": i} for i in range(5))
+    assert len(ring) == 3
+    assert ring == [{"n": 2}, {"n": 3}, {"n": 4}]
+    assert ring[0] == {"n": 2} and ring[-1] == {"n": 4}
+    assert ring[-2:] == [{"n": 3}, {"n": 4}]
+    assert list(reversed(ring)) == [{"n": 4}, {"n": 3}, {"n": 2}]
+    assert ring.tail(2) == [{"n": 4}, {"n": 3}]
+    assert ring.evicted_count == 2
+    with pytest.raises(IndexError):
+        ring[3]
+
+
+def test_pages_are_stable_while_appending():
+    ring = AuditRing(capacity=100)
+    ring.extend(range(10))
+    page, cursor = ring.page(limit=4)
+    assert page == [9, 8, 7, 6]
+    ring.extend([10, 11])
+    page, cursor = ring.page(cursor, limit=4)
+    assert page == [5, 4, 3, 2]
+    page, cursor = ring.page(cursor, limit=4)
+    assert page == [1, 0] and cursor is None
+
+    page, cursor = ring.page(limit=5, newest_first=False)
+    assert page == [0, 1, 2, 3, 4]
+    page, cursor = ring.page(cursor, limit=10, newest_first=False)
+    assert page == [5, 6, 7, 8, 9, 10, 11] and cursor is None
+
+
+def test_evicted_records_spill_in_order(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    ring = AuditRing(capacity=2, spill_path=str(path), spill_batch=2)
+    ring.extend({"n": i} for i in range(7))
+    ring.flush()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [rec["entry"]["n"] for rec in lines] == [0, 1, 2, 3, 4]
+    assert [rec["seq"] for rec in lines] == [0, 1, 2, 3, 4]
+    assert ring == [{"n": 5}, {"n": 6}]
+
+
+@pytest.mark.asyncio
+async def test_shadow_and_orchestrator_trails_use_bounded_rings():
+    s = get_settings()
+    old = s.AUDIT_RING_CAPACITY
+    s.AUDIT_RING_CAPACITY = 5
+    try:
+        manager = PolicyShadowModeManager()
+        manager._audit_trail = [{"signal_type": f"s{i}"} for i in range(8)]
+        assert len(manager._audit_trail) == 5
+        first = await manager.get_audit_page(limit=3)
+        assert [e["signal_type"] for e in first["entries"]] == ["s7", "s6", "s5"]
+        second = await manager.get_audit_page(first["next_cursor"], limit=3)
+        assert [e["signal_type"] for e in second["entries"]] == ["s4", "s3"]
+        assert second["next_cursor"] is None
+
+        orch = DecisionOrchestrator(dsn=None)
+        for i in range(8):
+            orch._policy_audit.append({"reason": f"r{i}"})
+        assert len(orch._policy_audit) == 5
+        assert orch.get_policy_audit_page(limit=1)["entries"] == [{"reason": "r7"}]
+    finally:
+        s.AUDIT_RING_CAPACITY = old
+
+
+@pytest.mark.asyncio
+async def test_clearing_from_the_event_loop_does_not_wait_on_disk(tmp_path, monkeypatch):
+    path = tmp_path / "shadow.jsonl"
+    ring = AuditRing(capacity=2, spill_path=str(path), spill_batch=100)
+    ring.extend({"n": i} for i in range(5))
+    real_write = ring._write_spill
+
+    def slow_write(records):
+        time.sleep(0.2)
+        real_write(records)
+
+    monkeypatch.setattr(ring, "_write_spill", slow_write)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await ring.aclear()
+    task.cancel()
+    # the loop kept running while the spill thread wrote
+    assert ticks >= 5
+    assert len(ring) == 0
+    assert [json.loads(line)["entry"]["n"] for line in path.read_text().splitlines()] == [0, 1, 2]
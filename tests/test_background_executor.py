@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from reasoner_service.background_executor import BackgroundExecutor
+from reasoner_service.config import get_settings
+from reasoner_service.orchestrator import DecisionOrchestrator
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_jobs_and_drains():
+    executor = BackgroundExecutor("test", workers=2, max_queue=10)
+    done = []
+
+    async def job(i):
+        await asyncio.sleep(0)
+        done.append(i)
+
+    for i in range(5):
+        assert executor.submit(job, i)
+    assert await executor.drain(timeout=1.0)
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_drops_when_queue_full_and_survives_job_errors():
+    executor = BackgroundExecutor("test", workers=1, max_queue=1)
+    gate = asyncio.Event()
+
+    async def blocked():
+        await gate.wait()
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    assert executor.submit(blocked)
+    await asyncio.sleep(0)  # worker picks up the blocked job
+    assert executor.submit(boom)
+    assert executor.submit(blocked) is False
+    assert executor.dropped == 1
+    gate.set()
+    assert await executor.drain(timeout=1.0)
+    await executor.close()
+
+
+@pytest.fixture
+def observer_mode():
+    s = get_settings()
+    old = s.OBSERVER_STAGES_MODE
+    yield s
+    s.OBSERVER_STAGES_MODE = old
+
+
+@pytest.mark.asyncio
+async def test_process_decision_does_not_wait_for_background_observers(observer_mode):
+    observer_mode.OBSERVER_STAGES_MODE = "background"
+    orch = DecisionOrchestrator(dsn=None)
+    gate = asyncio.Event()
+    seen = []
+
+    async def slow_shadow(decision):
+        await gate.wait()
+        seen.append(decision["symbol"])
+
+    orch._shadow_mode_stage = slow_shadow
+    res = await asyncio.wait_for(orch.process_decision({"symbol": "EURUSD", "confidence": 0.5}, persist=False), timeout=1.0)
+    assert "notify_results" in res
+    assert seen == []
+    gate.set()
+    assert await orch.drain_observers(timeout=1.0)
+    assert seen == ["EURUSD"]
+    await orch.close()
+
+
+@pytest.mark.asyncio
+async def test_inline_observers_run_concurrently_before_persist(observer_mode):
+    observer_mode.OBSERVER_STAGES_MODE = "inline"
+    orch = DecisionOrchestrator(dsn=None)
+    started = []
+    both_started = asyncio.Event()
+
+    async def stage(name, decision):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        decision.setdefault("_observed", []).append(name)
+
+    async def paper(decision):
+        await stage("paper", decision)
+
+    async def shadow(decision):
+        await stage("shadow", decision)
+
+    orch._paper_trade_stage = paper
+    orch._shadow_mode_stage = shadow
+    await orch.process_decision({"symbol": "EURUSD", "confidence": 0.5}, persist=False)
+    assert sorted(started) == ["paper", "shadow"]
+    await orch.close()
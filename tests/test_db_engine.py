@@ -0,0 +1,97 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from reasoner_service import db_engine
+from reasoner_service import storage as st
+
+
+class _Recorder:
+    """Stands in for a labelled prometheus metric; keeps the last value / all observations."""
+
+    def __init__(self):
+        self.values = {}
+
+    def labels(self, *labels):
+        self._key = labels
+        return self
+
+    def set(self, value):
+        self.values[self._key] = value
+
+    def inc(self, amount=1):
+        self.values[self._key] = self.values.get(self._key, 0) + amount
+
+    def observe(self, value):
+        self.values.setdefault(self._key, []).append(value)
+
+CFG = SimpleNamespace(
+    DB_POOL_SIZE=3, DB_MAX_OVERFLOW=2, DB_POOL_TIMEOUT_SECONDS=7, DB_POOL_RECYCLE_SECONDS=600,
+    DB_POOL_PRE_PING=True, DB_STATEMENT_CACHE_SIZE=0,
+)
+
+
+def test_engine_options_per_backend():
+    # in-memory SQLite keeps SQLAlchemy's shared single connection
+    assert "poolclass" not in db_engine.engine_options("sqlite+aiosqlite:///:memory:", CFG)
+
+    sqlite_file = db_engine.engine_options("sqlite+aiosqlite:///./x.db", CFG)
+    assert issubclass(sqlite_file["poolclass"], db_engine.TimedQueuePool)
+    assert (sqlite_file["pool_size"], sqlite_file["max_overflow"], sqlite_file["pool_timeout"]) == (3, 2, 7.0)
+    assert sqlite_file["pool_pre_ping"] is False and "connect_args" not in sqlite_file
+
+    pg = db_engine.engine_options("postgresql+asyncpg://u:p@db/app", CFG)
+    assert pg["pool_pre_ping"] is True and pg["pool_recycle"] == 600
+    assert pg["connect_args"] == {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    recorders = {}
+    for metric in ("db_pool_checked_out", "db_pool_overflow", "db_pool_size", "db_pool_timeouts_total", "db_pool_wait_seconds"):
+        recorders[metric] = _Recorder()
+        monkeypatch.setattr(db_engine, metric, recorders[metric])
+    return recorders
+
+
+@pytest.mark.asyncio
+async def test_pool_gauges_and_wait_metrics(tmp_path, metrics):
+    name = "test_pool_gauges"
+    engine = db_engine.create_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", name=name, pool_size=1, max_overflow=0, pool_timeout=0.2,
+    )
+    key = (name,)
+    try:
+        assert type(engine.sync_engine.pool).engine_name == name
+        async with engine.connect() as held:
+            await held.execute(text("SELECT 1"))
+            assert metrics["db_pool_checked_out"].values[key] == 1
+            assert db_engine.engines_status()[name]["checked_out"] == 1
+
+            # the only connection is busy: the next checkout waits, then times out
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect() as starved:
+                    await starved.execute(text("SELECT 1"))
+            assert metrics["db_pool_timeouts_total"].values[key] == 1
+
+        assert metrics["db_pool_checked_out"].values[key] == 0
+        assert metrics["db_pool_size"].values[key] == 1
+        waits = metrics["db_pool_wait_seconds"].values[key]
+        assert len(waits) == 2 and max(waits) >= 0.2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_storage_engines_use_the_shared_factory(tmp_path):
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'd.db'}")
+    try:
+        await st.init_models(engine)
+        assert isinstance(engine.sync_engine.pool, db_engine.TimedQueuePool)
+        await asyncio.gather(*(st.get_recent_decisions(sessionmaker) for _ in range(4)))
+        assert db_engine.pool_status(engine)["checked_out"] == 0
+    finally:
+        await engine.dispose()
@@ -0,0 +1,107 @@
+"""Read/write split with two local SQLite files standing in for primary and replica."""
+
+import shutil
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, text
+
+from reasoner_service import storage as st
+from reasoner_service.db_routing import ReadRouter, create_read_sessionmaker
+from reasoner_service.outcome_analytics_service import OutcomeAnalyticsService
+from reasoner_service.outcome_stats import OutcomeStatsService
+
+
+async def _insert(sessionmaker, i, outcome="win"):
+    await st.insert_decision_outcome(
+        sessionmaker, decision_id=f"d{i}", symbol="EURUSD", timeframe="4H", signal_type="bullish_choch",
+        entry_price=1.0, exit_price=1.0, pnl=10.0 if outcome == "win" else -10.0, outcome=outcome,
+        exit_reason="tp", closed_at=datetime(2025, 3, 1, i, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+async def primary(tmp_path):
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    await st.init_models(engine)
+    for i in range(3):
+        await _insert(sessionmaker, i)
+    yield engine, sessionmaker
+    await engine.dispose()
+
+
+async def _replica_of(tmp_path, primary_engine):
+    """Snapshot the primary file into a replica file (a file-copy 'replica')."""
+    await primary_engine.dispose()
+    shutil.copy(tmp_path / "primary.db", tmp_path / "replica.db")
+    return f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+
+
+def _count_queries(engine):
+    queries = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, params, ctx, many: queries.append(sql))
+    return queries
+
+
+def test_no_replica_configured_returns_primary():
+    primary = object()
+    assert create_read_sessionmaker(primary, "") is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_caught_up_replica(primary, tmp_path):
+    engine, sessionmaker = primary
+    router = create_read_sessionmaker(sessionmaker, await _replica_of(tmp_path, engine))
+    assert isinstance(router, ReadRouter)
+    try:
+        replica_queries = _count_queries(router.replica.kw["bind"])
+        stats = OutcomeStatsService(router, use_rollups=False)
+        assert await stats.get_win_rate(symbol="EURUSD") == 1.0
+        assert router.replica_ok and router.lag == 0.0
+        outcomes = await OutcomeAnalyticsService(router).get_outcomes_for_analysis()
+        assert len(outcomes) == 3
+        assert any("decision_outcomes" in q for q in replica_queries)
+    finally:
+        await router.close()
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary(primary, tmp_path):
+    engine, sessionmaker = primary
+    router = create_read_sessionmaker(sessionmaker, await _replica_of(tmp_path, engine))
+    try:
+        # the primary moves on; the replica copy does not
+        async with engine.begin() as conn:
+            await conn.execute(text("UPDATE decision_outcomes SET created_at = '2030-01-01 00:00:00' WHERE decision_id = 'd2'"))
+        router.max_lag = 60
+        stats = OutcomeStatsService(router, use_rollups=False)
+        await _insert(sessionmaker, 5, outcome="loss")
+        # only the primary has the loss
+        assert await stats.get_win_rate(symbol="EURUSD") == 0.75
+        assert not router.replica_ok and router.lag > 60
+    finally:
+        await router.close()
+
+
+@pytest.mark.asyncio
+async def test_broken_replica_query_retries_on_primary(primary, tmp_path):
+    _, sessionmaker = primary
+    # replica "caught up" by the probe but missing the table entirely
+    async def caught_up(router):
+        return 0.0
+
+    missing = ReadRouter(
+        sessionmaker,
+        create_read_sessionmaker(object(), f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}").replica,
+        lag_probe=caught_up,
+        check_interval=3600,
+    )
+    try:
+        outcomes = await OutcomeAnalyticsService(missing).get_outcomes_for_analysis()
+        assert len(outcomes) == 3
+        assert not missing.replica_ok and "no such table" in missing.last_error
+        # stays on the primary until the next probe
+        assert await missing.use_replica() is False
+    finally:
+        await missing.close()
@@ -0,0 +1,141 @@
+import json
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from reasoner_service import decision_codec as codec
+from reasoner_service import storage as st
+from reasoner_service.config import get_settings
+from reasoner_service.retention import archive_old_rows, iter_archived_rows
+
+
+def _decision(i=0):
+    return {
+        "symbol": "EURUSD",
+        "recommendation": "enter",
+        "confidence": 0.8,
+        "_shadow_policy_result": {"rules": [{"name": f"rule_{n}", "veto": False, "reason": "ok"} for n in range(20)]},
+        "i": i,
+    }
+
+
+def test_payload_round_trip_and_header():
+    d = _decision()
+    payload = codec.encode_payload(d, json.dumps(d))
+    assert payload[0] == codec.FORMAT_VERSION
+    # text equal to json.dumps(raw) is not stored twice, and a large body is compressed
+    assert len(payload) < len(json.dumps(d)) // 2
+    assert codec.decode_payload(payload) == {"raw": d, "decision_text": json.dumps(d)}
+    # a text that is not derivable from raw is kept as given
+    small = codec.encode_payload({"a": 1}, '{"ok": true}')
+    assert codec.decode_payload(small) == {"raw": {"a": 1}, "decision_text": '{"ok": true}'}
+    assert codec.decode_payload(codec.encode_payload(None, "t")) == {"raw": None, "decision_text": "t"}
+    with pytest.raises(ValueError):
+        codec.decode_payload(bytes((99, 0)) + b"{}")
+
+
+def test_record_decodes_payload_on_first_access(monkeypatch):
+    calls = []
+    real = codec.decode_payload
+    monkeypatch.setattr(codec, "decode_payload", lambda p: calls.append(1) or real(p))
+    row = {"id": "d1", "symbol": "EURUSD", "raw": None, "decision_text": None,
+           "payload": codec.encode_payload(_decision())}
+    record = codec.DecisionRecord.from_row(row)
+    assert record["symbol"] == "EURUSD" and "raw" in record
+    assert calls == []
+    assert record["raw"]["i"] == 0
+    assert json.loads(record.get("decision_text")) == _decision()
+    assert calls == [1]
+    assert record == {"id": "d1", "symbol": "EURUSD", "raw": _decision(), "decision_text": json.dumps(_decision())}
+
+    # whole-dict operations decode first
+    assert "raw" in list(codec.DecisionRecord.from_row(row))
+    for use in (dict, json.dumps, lambda r: pickle.loads(pickle.dumps(r))):
+        assert "rule_19" in str(use(codec.DecisionRecord.from_row(row)))
+
+
+@pytest.fixture
+async def db():
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    yield engine, sessionmaker
+    await engine.dispose()
+
+
+@pytest.fixture
+def binary_format(monkeypatch):
+    monkeypatch.setattr(get_settings(), "DECISION_STORAGE_FORMAT", "binary", raising=False)
+
+
+@pytest.mark.asyncio
+async def test_binary_rows_and_legacy_rows_read_the_same(db, monkeypatch):
+    engine, sessionmaker = db
+    d = _decision()
+    legacy = await st.insert_decision(sessionmaker, id="legacy", symbol="EURUSD", decision_text=json.dumps(d),
+                                      raw=d, recommendation="enter", ts_ms=1)
+    monkeypatch.setattr(get_settings(), "DECISION_STORAGE_FORMAT", "binary", raising=False)
+    packed = await st.insert_decision(sessionmaker, id="packed", symbol="EURUSD", decision_text=None,
+                                      raw=d, recommendation="enter", ts_ms=1)
+    await st.insert_decisions_bulk(sessionmaker, [{"id": "bulk", "symbol": "GBPUSD", "raw": d, "ts_ms": 1}])
+
+    async with engine.connect() as conn:
+        rows = {r.id: r for r in (await conn.execute(text("SELECT id, raw, decision_text, payload FROM decisions"))).all()}
+    assert rows["packed"].raw is None and rows["packed"].decision_text is None
+    assert rows["legacy"].payload is None
+    assert len(rows["packed"].payload) < len(rows["legacy"].raw) + len(rows["legacy"].decision_text)
+
+    for id_ in (legacy, packed, "bulk"):
+        got = await st.get_decision_by_id(sessionmaker, id_)
+        assert got["raw"] == d and json.loads(got["decision_text"]) == d
+        assert "payload" not in got
+    recent = await st.get_recent_decisions(sessionmaker, limit=5)
+    assert sorted(r["id"] for r in recent) == ["bulk", "legacy", "packed"]
+
+
+@pytest.mark.asyncio
+async def test_init_models_adds_payload_column(tmp_path):
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    await st.init_models(engine)
+    await st.insert_decision(sessionmaker, id="d1", symbol="EURUSD", raw={"a": 1})
+    # a database created before the payload column existed
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE decisions DROP COLUMN payload"))
+    await st.init_models(engine)
+    async with engine.connect() as conn:
+        columns = {row[1] for row in (await conn.execute(text("PRAGMA table_info(decisions)"))).all()}
+    assert "payload" in columns
+    assert (await st.get_decision_by_id(sessionmaker, "d1"))["raw"] == {"a": 1}
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_missing_columns_are_added_with_quoted_identifiers(monkeypatch):
+    from types import SimpleNamespace
+    from sqlalchemy import Column, MetaData, String, Table
+
+    engine, _ = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text('CREATE TABLE "order" (id VARCHAR PRIMARY KEY)'))
+    metadata = MetaData()
+    Table("order", metadata, Column("id", String, primary_key=True), Column("group", String, nullable=True))
+    monkeypatch.setattr(st, "Base", SimpleNamespace(metadata=metadata))
+    async with engine.begin() as conn:
+        await conn.run_sync(st._create_missing_columns)
+        columns = {row[1] for row in (await conn.execute(text('PRAGMA table_info("order")'))).all()}
+    assert columns == {"id", "group"}
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_archive_decodes_binary_payloads(db, tmp_path, binary_format):
+    _, sessionmaker = db
+    old = datetime(2025, 1, 10)
+    await st.insert_decision(sessionmaker, id="d-old", symbol="EURUSD", raw=_decision(), created_at=old)
+    result = await archive_old_rows(sessionmaker, str(tmp_path), retention_days=30,
+                                    now=datetime(2025, 6, 1, tzinfo=timezone.utc))
+    assert result["decisions"]["deleted"] == 1
+    [row] = list(iter_archived_rows(str(tmp_path)))
+    assert row["raw"] == _decision() and json.loads(row["decision_text"]) == _decision()
+    assert "payload" not in row
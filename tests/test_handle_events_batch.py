@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+
+import reasoner_service.orchestrator as orch_mod
+from reasoner_service.orchestrator import DecisionOrchestrator
+from reasoner_service.orchestrator_events import Event
+
+
+def _event(symbol, conf=0.8, rec="enter", cid=None):
+    payload = {"symbol": symbol, "recommendation": rec, "confidence": conf, "bias": "bullish"}
+    return Event(event_type="decision", payload=payload, timestamp=datetime.utcnow(), correlation_id=cid or f"c-{symbol}")
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.calls = []
+
+    async def notify(self, decision, decision_id=None):
+        self.calls.append((decision["symbol"], decision_id))
+        return {"ok": True}
+
+
+class BatchNotifier(RecordingNotifier):
+    async def notify_batch(self, items):
+        self.calls.append([d["symbol"] for d, _ in items])
+        return [{"ok": True, "batched": True} for _ in items]
+
+
+@pytest.fixture
+def bulk_insert(monkeypatch):
+    calls = []
+
+    async def fake_bulk(sessionmaker, rows):
+        calls.append(rows)
+        return [f"id-{i}" for i in range(len(rows))]
+
+    monkeypatch.setattr(orch_mod, "insert_decisions_bulk", fake_bulk)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batch_results_keep_input_order_with_one_bulk_insert(bulk_insert):
+    orch = DecisionOrchestrator(dsn=None)
+    orch.notifiers = {"slack": RecordingNotifier()}
+    orch._routing_rules = {"*": ["slack"]}
+    bad = Event(event_type="", payload={}, timestamp=datetime.utcnow(), correlation_id="bad")
+
+    results = await orch.handle_events_batch([_event("EURUSD"), "nope", bad, _event("GBPUSD")])
+
+    assert [r.status for r in results] == ["accepted", "error", "error", "accepted"]
+    assert results[1].reason == "invalid_event_type"
+    assert results[2].reason == "malformed_event"
+    assert len(bulk_insert) == 1 and [r["symbol"] for r in bulk_insert[0]] == ["EURUSD", "GBPUSD"]
+    assert results[3].metadata["record_id"] == "id-1"
+    assert results[3].metadata["notify_results"] == {"slack": {"ok": True}}
+    await orch.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_dedups_in_one_call_and_skips_duplicate_notifies(bulk_insert, shared):
+    orch = DecisionOrchestrator(dsn=None, shared_state=shared)
+    notifier = RecordingNotifier()
+    orch.notifiers = {"slack": notifier}
+    orch._routing_rules = {"*": ["slack"]}
+
+    results = await orch.handle_events_batch([_event("EURUSD", cid="a"), _event("EURUSD", cid="b")])
+
+    assert [r.metadata["deduplicated"] for r in results] == [False, True]
+    assert results[1].metadata["notify_results"] == {"slack": {"ok": False, "skipped": True}}
+    assert notifier.calls == [("EURUSD", "id-0")]
+    await orch.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_notify_groups_by_channel(bulk_insert):
+    orch = DecisionOrchestrator(dsn=None)
+    batch_notifier = BatchNotifier()
+    orch.notifiers = {"slack": batch_notifier}
+    orch._routing_rules = {"*": ["slack"]}
+
+    results = await orch.handle_events_batch([_event("EURUSD"), _event("GBPUSD"), _event("USDJPY")])
+
+    assert batch_notifier.calls == [["EURUSD", "GBPUSD", "USDJPY"]]
+    assert all(r.metadata["notify_results"]["slack"]["batched"] for r in results)
+    await orch.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_persist_failure_falls_back_to_dlq(monkeypatch):
+    async def failing_bulk(sessionmaker, rows):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(orch_mod, "insert_decisions_bulk", failing_bulk)
+    orch = DecisionOrchestrator(dsn=None)
+
+    results = await orch.handle_events_batch([_event("EURUSD"), _event("GBPUSD")])
+
+    assert [r.status for r in results] == ["accepted", "accepted"]
+    assert [r.metadata["record_id"] for r in results] == [None, None]
+    assert sorted(e["decision"]["symbol"] for e in orch._persist_dlq) == ["EURUSD", "GBPUSD"]
+    await orch.close()
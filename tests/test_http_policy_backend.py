@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+
+from reasoner_service.orchestrator import DecisionOrchestrator, PolicyStore
+from reasoner_service.policy_backends import DefaultPolicyBackend, HttpPolicyBackend, PolicyBackendUnavailable
+
+
+class FakeService:
+    def __init__(self, answer=None, delay=0.0, fail=False):
+        self.answer = answer if answer is not None else {"active": True}
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    async def __call__(self, policy_name, context):
+        self.calls.append(policy_name)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("policy service down")
+        return dict(self.answer)
+
+
+def _backend(service, **kwargs):
+    kwargs.setdefault("deadline", 0.05)
+    kwargs.setdefault("prefetch_interval", 0)
+    backend = HttpPolicyBackend("http://policy.invalid", **kwargs)
+    backend._request = service
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_slow_service_never_exceeds_deadline_and_falls_through():
+    service = FakeService({"active": True}, delay=0.2)
+    http = _backend(service, deadline=0.02, cache_ttl=60)
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[http, DefaultPolicyBackend()])
+
+    started = time.monotonic()
+    assert await store.get_policy("killzone", {"killzone": False}) == {"active": False}
+    assert time.monotonic() - started < 0.15
+
+    # the slow request finished in the background and is served from then on
+    await asyncio.sleep(0.25)
+    assert await store.get_policy("killzone", {"killzone": False}) == {"active": True}
+    assert len(service.calls) == 1
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures_and_recovers_with_one_probe():
+    service = FakeService(fail=True)
+    http = _backend(service, failure_threshold=2, reset_timeout=0.05)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await http.get_policy("regime", {})
+    with pytest.raises(PolicyBackendUnavailable):
+        await http.get_policy("regime", {})
+    assert len(service.calls) == 2
+
+    await asyncio.sleep(0.06)
+    service.fail = False
+    assert await http.get_policy("regime", {}) == {"active": True}
+    assert not http.breaker.is_open
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_answer_is_served_while_revalidating():
+    service = FakeService({"regime": "normal"})
+    http = _backend(service, cache_ttl=0, max_stale=60)
+    assert await http.get_policy("regime", {"symbol": "EURUSD"}) == {"regime": "normal"}
+
+    service.answer, service.delay = {"regime": "restricted"}, 0.05
+    assert await http.get_policy("regime", {"symbol": "EURUSD"}) == {"regime": "normal"}
+    await asyncio.sleep(0.08)
+    assert await http.get_policy("regime", {"symbol": "EURUSD"}) == {"regime": "restricted"}
+
+    # an outage keeps serving the last good answer
+    service.fail, service.delay = True, 0.0
+    assert await http.get_policy("regime", {"symbol": "EURUSD"}) == {"regime": "restricted"}
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_background_prefetch_warms_known_policies():
+    service = FakeService({"min_confidence": 0.6})
+    http = _backend(service, prefetch=["confidence_threshold"], prefetch_interval=0.01, cache_ttl=60)
+    await http.get_policy("killzone", {})
+    await asyncio.sleep(0.03)
+    assert "confidence_threshold" in service.calls
+
+    # served from the prefetched answer even though the service is now slow
+    service.delay = 1.0
+    started = time.monotonic()
+    assert await http.get_policy("confidence_threshold", {}) == {"min_confidence": 0.6}
+    assert time.monotonic() - started < 0.05
+    await http.close()
+
+
+
+@pytest.mark.asyncio
+async def test_prefetch_skips_one_off_keys_and_bounds_hot_keys():
+    service = FakeService({"active": True})
+    http = _backend(service, prefetch_interval=0.01, prefetch_max_keys=2, cache_ttl=60)
+    # per-decision contexts seen once: remembered, but never refreshed in the background
+    for i in range(20):
+        await http.get_policy("killzone", {"symbol": f"S{i}"})
+    assert len(service.calls) == 20
+    await asyncio.sleep(0.03)
+    assert len(service.calls) == 20
+
+    # keys looked up again are refreshed, at most prefetch_max_keys of them per pass
+    for i in range(5):
+        await http.get_policy("killzone", {"symbol": f"S{i}"})
+    await asyncio.sleep(0.015)
+    assert 20 < len(service.calls) <= 22
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_answer_is_not_served_for_a_different_exposure():
+    service = FakeService({"allowed": True})
+    # the backend's own cache key ignores exposure; the stale map must not
+    http = _backend(service, cache_ttl=0, max_stale=60, cache_key_fields=("symbol",))
+    ctx = {"symbol": "EURUSD", "exposure": 1.0, "max_exposure": 5.0}
+    assert await http.get_policy("exposure", ctx) == {"allowed": True}
+
+    service.delay = 1.0
+    assert await http.get_policy("exposure", ctx) == {"allowed": True}
+    with pytest.raises(PolicyBackendUnavailable):
+        await http.get_policy("exposure", dict(ctx, exposure=6.0))
+    await http.close()
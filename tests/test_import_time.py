@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _loaded_after_import(module):
+    code = (
+        f"import sys, {module}; "
+        "print(','.join(sorted({m.split('.')[0] for m in sys.modules})))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(out.stdout.strip().split(","))
+
+
+def test_orchestrator_import_defers_heavy_dependencies():
+    loaded = _loaded_after_import("reasoner_service.orchestrator")
+    assert not {"sqlalchemy", "redis", "aiohttp"} & loaded
+
+
+def test_orchestrator_construction_defers_heavy_dependencies():
+    loaded = _loaded_after_import("reasoner_service.orchestrator; reasoner_service.orchestrator.DecisionOrchestrator()")
+    assert "sqlalchemy" not in loaded
+
+
+def test_storage_loads_on_first_use():
+    from reasoner_service import orchestrator
+
+    assert orchestrator.compute_decision_hash("EURUSD", "enter", 0.5, 1)
+    assert "reasoner_service.storage" in sys.modules
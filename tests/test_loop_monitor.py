@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from reasoner_service.loop_monitor import LoopMonitor, acquire_loop_monitor, release_loop_monitor
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def _blocking_poll():
+    # stands in for a synchronous poll/sleep on the async path
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_measured_and_blocking_call_is_captured():
+    monitor = LoopMonitor(interval=0.02, slow_threshold=0.1)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        _blocking_poll()
+        await _wait_for(lambda: monitor.slow_callbacks >= 1)
+
+        assert monitor.slow_callbacks == 1
+        assert monitor.max_lag >= 0.2
+        stall = monitor.stalls[-1]
+        assert stall["duration"] >= 0.2
+        assert any("_blocking_poll" in line for line in stall["stack"])
+    finally:
+        await monitor.stop()
+    assert not monitor.running
+
+
+@pytest.mark.asyncio
+async def test_pending_tasks_are_counted_and_grouped():
+    monitor = LoopMonitor(interval=0.01, slow_threshold=1.0)
+    monitor.start()
+
+    async def idle():
+        await asyncio.sleep(10)
+
+    tasks = [asyncio.create_task(idle()) for _ in range(25)]
+    try:
+        await _wait_for(lambda: monitor.tasks >= 25)
+        assert monitor.tasks >= 25
+        top = monitor.top_tasks(limit=1)[0]
+        assert top["count"] == 25 and top["coro"].endswith("idle")
+        assert monitor.snapshot()["slow_callbacks"] == 0
+    finally:
+        for t in tasks:
+            t.cancel()
+        await monitor.stop()
+
+
+@pytest.mark.asyncio
+async def test_monitor_is_shared_per_loop_until_last_release():
+    first = acquire_loop_monitor(interval=0.01)
+    second = acquire_loop_monitor(interval=0.01)
+    assert first is second and first.running
+    await release_loop_monitor(first)
+    assert second.running
+    await release_loop_monitor(second)
+    assert not second.running
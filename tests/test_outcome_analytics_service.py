@@ -579,3 +579,78 @@ class TestNonInfluenceGuarantee:
             assert "note" in output
             note = output["note"].lower()
             assert "analyt" in note or "does not influence" in note
+
+
+class TestColumnarCore:
+    """Analyses over OutcomeColumns match the list-of-dicts path; reports load once."""
+    
+    OUTCOMES = [
+        {"signal_type": "s1", "symbol": "EUR", "timeframe": "4H", "outcome": "win", "pnl": 120.0},
+        {"signal_type": "s1", "symbol": "EUR", "timeframe": "4H", "outcome": "loss", "pnl": -40.0},
+        {"signal_type": "s1", "timeframe": "4H", "outcome": "loss", "pnl": -45.0},  # no symbol
+        {"signal_type": "s2", "symbol": "GBP", "timeframe": "1H", "outcome": "win", "pnl": 30.0},
+        {"signal_type": "s2", "symbol": "GBP", "timeframe": "1H", "outcome": "breakeven", "pnl": 0.0},
+        {"outcome": "loss", "pnl": -200.0},  # missing dimensions
+    ]
+    EVALUATIONS = [
+        {"decision": "veto", "signal_type": "s1", "symbol": "EUR", "timeframe": "4H"},
+        {"decision": "allow", "signal_type": "s2", "symbol": "GBP", "timeframe": "1H"},
+    ]
+    
+    def test_columns_and_dicts_agree(self):
+        from reasoner_service.outcome_columns import OutcomeColumns
+        
+        service = OutcomeAnalyticsService(AsyncMock())
+        cols = OutcomeColumns.from_dicts(self.OUTCOMES)
+        strip = lambda d: {k: v for k, v in d.items() if k != "analysis_period"}
+        
+        for method, args in (
+            ("policy_veto_impact", (self.EVALUATIONS,)),
+            ("signal_policy_heatmap", (self.EVALUATIONS,)),
+            ("regime_policy_performance", ()),
+        ):
+            from_dicts = getattr(service, method)(self.OUTCOMES, *args)
+            assert strip(getattr(service, method)(cols, *args)) == strip(from_dicts)
+        
+        heatmap = service.signal_policy_heatmap(cols, self.EVALUATIONS)
+        s1 = heatmap["by_signal_type"]["s1"]
+        # the symbol-less s1 row matches the veto on (signal_type, timeframe)
+        assert (s1["total_trades"], s1["vetoed_trades"]) == (3, 3)
+        assert s1["performance_if_vetoed"] == {"wins": 0, "losses": 0, "breakeven": 0, "win": 1, "loss": 2}
+        assert heatmap["by_signal_type"]["unknown"]["total_trades"] == 1
+        assert heatmap["by_timeframe"]["4H"] == {"total_trades": 3, "vetoed_trades": 2, "veto_rate": 0.6667}
+        
+        impact = service.policy_veto_impact(cols, self.EVALUATIONS)
+        assert (impact["would_have_been_vetoed"], impact["vetoed_losers"], impact["veto_false_negatives"]) == (2, 1, 2)
+    
+    @pytest.mark.asyncio
+    async def test_full_report_loads_outcomes_once(self):
+        from sqlalchemy import event
+        from reasoner_service import storage as st
+        
+        engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+        await st.init_models(engine)
+        try:
+            now = datetime.now(timezone.utc)
+            for i, o in enumerate(self.OUTCOMES[:5]):
+                await st.insert_decision_outcome(
+                    sessionmaker, decision_id=f"d{i}", symbol=o.get("symbol", "XAU"), timeframe=o["timeframe"],
+                    signal_type=o["signal_type"], entry_price=1.0, exit_price=1.0, pnl=o["pnl"],
+                    outcome=o["outcome"], exit_reason="tp", closed_at=now - timedelta(hours=i),
+                )
+            selects = []
+            event.listen(engine.sync_engine, "before_cursor_execute",
+                         lambda conn, cursor, sql, params, ctx, many: selects.append(sql) if "decision_outcomes" in sql else None)
+            
+            report = await OutcomeAnalyticsService(sessionmaker).full_analytics_report(last_n_days=7)
+            
+            assert len(selects) == 1
+            assert report["total_outcomes_analyzed"] == 5
+            assert report["policy_veto_impact"]["total_trades"] == 5
+            assert report["signal_policy_heatmap"]["by_timeframe"]["1H"]["total_trades"] == 2
+            assert sum(
+                report["regime_policy_performance"][r]["trades_in_regime"]
+                for r in ("trending_market", "ranging_market", "high_volatility")
+            ) >= 1
+        finally:
+            await engine.dispose()
@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+
+from reasoner_service.outcome_cache import OutcomeRecallCache, RecallWindow
+from reasoner_service.storage import _notify_outcome_inserted
+
+
+def _row(minute, outcome="win", r=1.0, symbol="EURUSD", signal_type="bos", **extra):
+    row = {
+        "symbol": symbol,
+        "signal_type": signal_type,
+        "outcome": outcome,
+        "r_multiple": r,
+        "pnl": 10.0 if outcome == "win" else -10.0,
+        "closed_at": datetime.datetime(2024, 1, 1, 12, minute),
+    }
+    row.update(extra)
+    return row
+
+
+class CountingFetch:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    async def __call__(self, sessionmaker, symbol, signal_type, limit, **filters):
+        self.calls += 1
+        return [r for r in self.rows if r["symbol"] == symbol and r["signal_type"] == signal_type][:limit]
+
+
+def test_window_stats_match_full_recompute():
+    rows = [_row(3, "win", 2.0), _row(2, "loss", -1.0), _row(1, "loss", None)]
+    window = RecallWindow(rows, limit=3)
+    expectancy, win_rate, n = window.stats()
+    assert n == 2
+    assert expectancy == pytest.approx(0.5)
+    assert win_rate == pytest.approx(0.5)
+
+
+def test_window_add_keeps_top_n_incrementally():
+    window = RecallWindow([_row(3, "win", 2.0), _row(2, "loss", -1.0)], limit=2)
+    assert window.add(_row(4, "loss", -1.0))
+    assert [r["closed_at"].minute for r in window.rows] == [4, 3]
+    assert window.stats() == (pytest.approx(0.5), pytest.approx(0.5), 2)
+    # older than everything in a full window: ignored
+    assert window.add(_row(1, "win", 5.0))
+    assert [r["closed_at"].minute for r in window.rows] == [4, 3]
+    # unorderable timestamp forces a refetch
+    assert window.add(_row(5) | {"closed_at": None}) is False
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_updates_on_insert():
+    fetch = CountingFetch([_row(2, "loss", -1.0), _row(1, "loss", -1.0)])
+    cache = OutcomeRecallCache(ttl_seconds=0)
+    w1 = await cache.get_window(fetch, None, "EURUSD", "bos", 10)
+    w2 = await cache.get_window(fetch, None, "EURUSD", "bos", 10)
+    assert w1 is w2 and fetch.calls == 1
+    assert w1.stats()[0] == pytest.approx(-1.0)
+
+    # a closed trade for the pair is folded in without another query
+    _notify_outcome_inserted(_row(3, "win", 3.0))
+    w3 = await cache.get_window(fetch, None, "EURUSD", "bos", 10)
+    assert fetch.calls == 1
+    assert w3.stats() == (pytest.approx(1 / 3), pytest.approx(1 / 3), 3)
+
+    # other pairs and non-matching filters are untouched
+    await cache.get_window(fetch, None, "EURUSD", "bos", 10, model="m1")
+    _notify_outcome_inserted(_row(4, "win", 1.0, model="m2"))
+    filtered = await cache.get_window(fetch, None, "EURUSD", "bos", 10, model="m1")
+    assert len(filtered.rows) == 2
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_similar_signals_conversion_is_memoized():
+    fetch = CountingFetch([_row(1, "win", 1.0)])
+    cache = OutcomeRecallCache()
+    window = await cache.get_window(fetch, None, "EURUSD", "bos", 5)
+    calls = []
+
+    def convert(row):
+        calls.append(row)
+        return {"outcome": row["outcome"]}
+
+    assert window.similar_signals(convert) == [{"outcome": "win"}]
+    assert window.similar_signals(convert) == [{"outcome": "win"}]
+    assert len(calls) == 1
+    window.add(_row(2, "loss", -1.0))
+    assert window.similar_signals(convert) == [{"outcome": "loss"}, {"outcome": "win"}]
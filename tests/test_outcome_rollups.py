@@ -0,0 +1,152 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, event, select, update
+
+from reasoner_service import storage as st
+from reasoner_service.outcome_stats import OutcomeStatsService
+
+BASE = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+# (hours after BASE, symbol, signal_type, outcome, pnl); spans three days
+TRADES = [
+    (0, "EURUSD", "bullish_choch", "win", 50.0),
+    (1, "EURUSD", "bullish_choch", "loss", -20.0),
+    (2, "EURUSD", "bullish_choch", "loss", -20.0),
+    (25, "EURUSD", "bullish_choch", "loss", -25.0),
+    (26, "EURUSD", "bullish_choch", "loss", -25.0),
+    (27, "GBPUSD", "bearish_bos", "win", 40.0),
+    (49, "EURUSD", "bullish_choch", "breakeven", 0.0),
+    (50, "EURUSD", "bullish_choch", "loss", -10.0),
+    (51, "GBPUSD", "bearish_bos", "loss", -15.0),
+]
+
+
+async def _insert(sessionmaker, hours, symbol, signal_type, outcome, pnl, r=None):
+    return await st.insert_decision_outcome(
+        sessionmaker, decision_id=f"d-{symbol}-{hours}", symbol=symbol, timeframe="4H",
+        signal_type=signal_type, entry_price=1.0, exit_price=1.0, pnl=pnl, outcome=outcome,
+        exit_reason="tp", closed_at=BASE + timedelta(hours=hours), r_multiple=r,
+    )
+
+
+async def _rollup_rows(sessionmaker):
+    async with sessionmaker() as session:
+        rows = (await session.execute(select(st.OutcomeRollup).order_by(
+            st.OutcomeRollup.symbol, st.OutcomeRollup.day))).scalars().all()
+        cols = [c for c in st.OutcomeRollup.__table__.columns.keys() if c != "last_closed_at"]
+        return [{c: getattr(r, c) for c in cols} for r in rows]
+
+
+@pytest.fixture
+async def db():
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    yield engine, sessionmaker
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_inserts_maintain_rollups_and_stats_match_raw_queries(db):
+    _, sessionmaker = db
+    # the day-2 trades arrive late, after day 3 was recorded
+    order = TRADES[:3] + TRADES[6:] + TRADES[4:6] + TRADES[3:4]
+    for trade in order:
+        await _insert(sessionmaker, *trade)
+
+    rows = await _rollup_rows(sessionmaker)
+    assert [(r["symbol"], r["day"], r["count"]) for r in rows] == [
+        ("EURUSD", date(2025, 3, 1), 3), ("EURUSD", date(2025, 3, 2), 2), ("EURUSD", date(2025, 3, 3), 2),
+        ("GBPUSD", date(2025, 3, 2), 1), ("GBPUSD", date(2025, 3, 3), 1),
+    ]
+    day2 = rows[1]
+    assert (day2["leading_losses"], day2["trailing_losses"], day2["max_loss_streak"]) == (2, 2, 2)
+
+    rolled, raw = OutcomeStatsService(sessionmaker, use_rollups=True), OutcomeStatsService(sessionmaker, use_rollups=False)
+    for method, kwargs in (
+        ("aggregate_by_signal_type", {}),
+        ("aggregate_by_symbol", {"timeframe": "4H"}),
+        ("aggregate_by_timeframe", {"symbol": "EURUSD"}),
+        ("get_win_rate", {"symbol": "GBPUSD"}),
+        ("get_avg_pnl", {}),
+        ("get_loss_streak", {"symbol": "EURUSD", "timeframe": "4H", "signal_type": "bullish_choch"}),
+    ):
+        assert await getattr(rolled, method)(**kwargs) == await getattr(raw, method)(**kwargs), method
+    # a loss run crossing the day boundary: 2 on day 1 + 2 on day 2
+    assert await rolled.get_loss_streak("EURUSD", "4H", "bullish_choch") == {"current": 1, "max": 4}
+
+
+@pytest.mark.asyncio
+async def test_unwindowed_queries_read_only_rollups(db):
+    engine, sessionmaker = db
+    for trade in TRADES:
+        await _insert(sessionmaker, *trade)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, params, ctx, many: statements.append(sql))
+    service = OutcomeStatsService(sessionmaker, use_rollups=True)
+
+    await service.aggregate_by_symbol()
+    await service.get_win_rate(symbol="EURUSD")
+    await service.get_loss_streak("EURUSD", "4H", "bullish_choch")
+    assert statements and not any("decision_outcomes" in sql for sql in statements)
+
+    # windows need trade order, so they still go to the outcome table
+    statements.clear()
+    await service.get_win_rate(symbol="EURUSD", last_n_trades=3)
+    assert any("decision_outcomes" in sql for sql in statements)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_backfills_and_repairs(db):
+    _, sessionmaker = db
+    for trade in TRADES:
+        await _insert(sessionmaker, *trade)
+    expected = await _rollup_rows(sessionmaker)
+
+    async with sessionmaker() as session:
+        await session.execute(delete(st.OutcomeRollup).where(st.OutcomeRollup.day < date(2025, 3, 3)))
+        await session.execute(update(st.OutcomeRollup).values(count=99))
+        await session.commit()
+    # a full rebuild restores deleted and corrupted days
+    assert await st.rebuild_outcome_rollups(sessionmaker) == len(expected)
+    assert await _rollup_rows(sessionmaker) == expected
+
+    async with sessionmaker() as session:
+        await session.execute(update(st.OutcomeRollup).values(count=99))
+        await session.commit()
+    assert await st.rebuild_outcome_rollups(sessionmaker, since=date(2025, 3, 2)) == 4
+    rows = await _rollup_rows(sessionmaker)
+    assert [r["count"] for r in rows if r["day"] >= date(2025, 3, 2)] == [
+        r["count"] for r in expected if r["day"] >= date(2025, 3, 2)
+    ]
+    assert [r["count"] for r in rows if r["day"] < date(2025, 3, 2)] == [99]
+
+
+@pytest.mark.asyncio
+async def test_rollups_unused_until_backfilled(tmp_path, monkeypatch):
+    from reasoner_service.config import get_settings
+
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    # history recorded before rollups existed
+    monkeypatch.setattr(get_settings(), "OUTCOME_ROLLUPS_ENABLED", False)
+    async with engine.begin() as conn:
+        await conn.run_sync(st.DecisionOutcome.__table__.create)
+    for hours in range(9):
+        await _insert(sessionmaker, hours, "EURUSD", "bullish_choch", "loss", -10.0)
+    monkeypatch.setattr(get_settings(), "OUTCOME_ROLLUPS_ENABLED", True)
+
+    # deploy: the rollup tables appear and the first new outcome creates a rollup row
+    await st.init_models(engine)
+    await _insert(sessionmaker, 30, "EURUSD", "bullish_choch", "win", 10.0)
+    assert not await st.rollups_backfilled(sessionmaker)
+    service = OutcomeStatsService(sessionmaker, use_rollups=True)
+    assert await service.get_win_rate(symbol="EURUSD") == pytest.approx(0.1)
+    assert await service.get_loss_streak("EURUSD", "4H", "bullish_choch") == {"current": 0, "max": 9}
+
+    await st.rebuild_outcome_rollups(sessionmaker)
+    assert await st.rollups_backfilled(sessionmaker)
+    fresh = OutcomeStatsService(sessionmaker, use_rollups=True)
+    assert await fresh._read_rollups()
+    assert await fresh.get_win_rate(symbol="EURUSD") == pytest.approx(0.1)
+    await engine.dispose()
@@ -0,0 +1,198 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from reasoner_service import storage as st
+
+from reasoner_service.outcome_snapshot import (
+    ANY,
+    OutcomeMetricsSnapshot,
+    OutcomeSnapshotRefresher,
+    SnapshotStatsService,
+)
+
+
+def _row(symbol, outcome, pnl, signal_type="bullish_bos", timeframe="4H", r=None, model="m1", session="london"):
+    return {
+        "symbol": symbol, "timeframe": timeframe, "signal_type": signal_type,
+        "model": model, "session": session, "outcome": outcome, "pnl": pnl, "r_multiple": r,
+    }
+
+
+ROWS = [
+    _row("EURUSD", "win", 100.0, r=2.0),
+    _row("EURUSD", "loss", -50.0, r=-1.0),
+    _row("EURUSD", "loss", -50.0, r=-1.0),
+    _row("GBPUSD", "win", 80.0, signal_type="bearish_choch", r=1.5),
+    _row("EURUSD", "loss", -40.0),
+]
+
+
+def _fake_batches(source):
+    """_fetch_batches stand-in over ``source()`` rows; the row index plays the keyset id."""
+    calls = []
+
+    async def fetch(after):
+        rows = source()
+        if rows is None:
+            raise RuntimeError("db down")
+        start = 0 if after is None else after[1] + 1
+        calls.append(start)
+        base = datetime(2025, 3, 1)
+        batch = [dict(row, closed_at=base + timedelta(hours=i), id=i) for i, row in enumerate(rows)][start:]
+        if batch:
+            yield batch
+
+    fetch.calls = calls
+    return fetch
+
+
+class FallbackStats:
+    def __init__(self):
+        self.calls = []
+
+    async def get_win_rate(self, *args):
+        self.calls.append(("get_win_rate", args))
+        return 0.123
+
+    async def get_session_metrics(self, session):
+        return {"session": session}
+
+
+def test_build_computes_per_key_metrics_and_rollups():
+    snap = OutcomeMetricsSnapshot.build(ROWS)
+    assert snap.ready and snap.row_count == 5
+
+    eur = snap.get("EURUSD", "4H", "bullish_bos")
+    assert eur["count"] == 4 and eur["wins"] == 1 and eur["losses"] == 3
+    assert eur["win_rate"] == 0.25
+    assert eur["avg_pnl"] == pytest.approx(-10.0)
+    assert eur["current_loss_streak"] == 3 and eur["max_loss_streak"] == 3
+    assert eur["max_drawdown"] == pytest.approx(140.0)
+
+    total = snap.get()
+    assert total is snap.metrics[(ANY, ANY, ANY)]
+    assert total["count"] == 5 and total["wins"] == 2
+    assert set(snap.by_signal[("EURUSD", ANY)]) == {"bullish_bos"}
+    assert set(snap.by_symbol[(ANY, ANY)]) == {"EURUSD", "GBPUSD"}
+
+    # the outcome veto only counts rows with a numeric r_multiple
+    policy = snap.by_model_session[("EURUSD", "m1", "london")]
+    assert policy["count"] == 3
+    assert policy["expectancy"] == pytest.approx(0.0)
+    assert policy["win_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_stats_service_serves_snapshot_and_falls_back():
+    refresher = OutcomeSnapshotRefresher(sessionmaker=None)
+    fallback = FallbackStats()
+    stats = SnapshotStatsService(refresher, fallback=fallback)
+
+    # not built yet: database path
+    assert await stats.get_win_rate("EURUSD") == 0.123
+    refresher.publish(OutcomeMetricsSnapshot.build(ROWS))
+
+    assert await stats.get_win_rate("EURUSD") == 0.25
+    assert await stats.get_win_rate(None, None, "bearish_choch") == 1.0
+    assert await stats.get_avg_pnl() == pytest.approx(8.0)
+    assert await stats.get_loss_streak("EURUSD") == {"current": 3, "max": 3}
+    by_signal = await stats.aggregate_by_signal_type(symbol="EURUSD")
+    assert by_signal["bullish_bos"]["total_pnl"] == pytest.approx(-40.0)
+    by_symbol = await stats.aggregate_by_symbol(signal_type="bullish_bos")
+    assert set(by_symbol) == {"EURUSD"}
+    assert await stats.get_win_rate("USDJPY") is None
+    assert len(fallback.calls) == 1
+
+    # windowed queries and methods the snapshot does not cover use the fallback
+    assert await stats.get_win_rate("EURUSD", None, None, 10) == 0.123
+    assert await stats.get_session_metrics("london") == {"session": "london"}
+    assert len(fallback.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_swaps_snapshot_and_keeps_previous_on_error():
+    refresher = OutcomeSnapshotRefresher(sessionmaker=None)
+    published = []
+    refresher.add_listener(published.append)
+    rows = list(ROWS)
+    refresher._fetch_batches = _fake_batches(lambda: rows)
+    first = await refresher.refresh()
+    assert refresher.snapshot is first and published == [first]
+    assert refresher.age_seconds() < 5
+
+    rows = None
+    assert await refresher.refresh() is first
+    assert refresher.snapshot is first and len(published) == 1
+
+
+@pytest.mark.asyncio
+async def test_mark_dirty_triggers_early_rebuild():
+    refresher = OutcomeSnapshotRefresher(sessionmaker=None, interval=60, min_interval=0)
+    rows = [ROWS[0]]
+    refresher._fetch_batches = fetch = _fake_batches(lambda: rows)
+    refresher.start()
+    try:
+        for _ in range(50):
+            if refresher.snapshot.ready:
+                break
+            await asyncio.sleep(0.01)
+        assert refresher.snapshot.row_count == 1
+
+        rows.append(ROWS[1])
+        refresher.mark_dirty()
+        for _ in range(50):
+            if refresher.snapshot.row_count == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert refresher.snapshot.row_count == 2
+        # the second pass only asked for rows after the first one
+        assert fetch.calls == [0, 1]
+    finally:
+        await refresher.stop()
+
+
+@pytest.mark.asyncio
+async def test_incremental_passes_match_a_full_build_and_late_closes_rebuild(tmp_path):
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'snap.db'}")
+    await st.init_models(engine)
+    base = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+    async def insert(i, row):
+        await st.insert_decision_outcome(
+            sessionmaker, decision_id=f"d{i}", symbol=row["symbol"], timeframe=row["timeframe"],
+            signal_type=row["signal_type"], model=row["model"], session_id=row["session"], entry_price=1.0,
+            exit_price=1.0, pnl=row["pnl"], outcome=row["outcome"], exit_reason="tp",
+            closed_at=base + timedelta(hours=i), r_multiple=row["r_multiple"],
+        )
+
+    refresher = OutcomeSnapshotRefresher(sessionmaker, batch_size=2)
+    try:
+        for i, row in enumerate(ROWS[:2]):
+            await insert(i, row)
+        await refresher.refresh()
+        for i, row in enumerate(ROWS[2:], start=2):
+            await insert(i, row)
+        fetched = []
+        real = refresher._fetch_batches
+
+        async def spy(after):
+            async for batch in real(after):
+                fetched.extend(batch)
+                yield batch
+
+        refresher._fetch_batches = spy
+        snap = await refresher.refresh()
+        assert len(fetched) == 3
+        assert snap.metrics == OutcomeMetricsSnapshot.build(ROWS).metrics
+
+        # a trade closed before the last folded-in row reorders streaks: full rebuild
+        late = _row("EURUSD", "win", 10.0)
+        await insert(-1, late)
+        fetched.clear()
+        snap = await refresher.refresh()
+        assert len(fetched) == 6
+        assert snap.metrics == OutcomeMetricsSnapshot.build([late] + ROWS).metrics
+    finally:
+        await engine.dispose()
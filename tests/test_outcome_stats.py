@@ -589,3 +589,72 @@ class TestHelperMethodsExist:
         service = OutcomeStatsService(mock_sessionmaker)
         assert service._get_filtered_outcomes.__doc__ is not None
         assert len(service._get_filtered_outcomes.__doc__) > 50
+
+
+@pytest.fixture
+async def seeded_stats():
+    """In-memory DB with a few outcomes; yields (service, executed SQL statements)."""
+    from sqlalchemy import event
+
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        ("EURUSD", "4H", "bullish_choch", "win", 100.0),
+        ("EURUSD", "4H", "bullish_choch", "loss", -40.0),
+        ("EURUSD", "1H", "bearish_bos", "breakeven", 0.0),
+        ("GBPUSD", "4H", "bullish_choch", "loss", -60.0),
+        ("GBPUSD", "4H", "bearish_bos", "win", 80.0),
+    ]
+    for i, (symbol, tf, sig, outcome, pnl) in enumerate(rows):
+        await st.insert_decision_outcome(
+            sessionmaker, decision_id=f"d{i}", symbol=symbol, timeframe=tf, signal_type=sig,
+            entry_price=1.0, exit_price=1.0, pnl=pnl, outcome=outcome, exit_reason="tp",
+            closed_at=base + timedelta(hours=i),
+        )
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, params, ctx, many: statements.append(sql))
+    yield OutcomeStatsService(sessionmaker, use_rollups=False), statements
+    await engine.dispose()
+
+
+class TestSqlAggregation:
+    """Aggregates are computed by GROUP BY queries that return only aggregate rows."""
+
+    @pytest.mark.asyncio
+    async def test_grouped_aggregates(self, seeded_stats):
+        service, statements = seeded_stats
+        by_signal = await service.aggregate_by_signal_type()
+        assert by_signal["bullish_choch"] == {
+            "count": 3, "wins": 1, "losses": 2, "breakevens": 0,
+            "total_pnl": 0.0, "win_rate": pytest.approx(1 / 3), "avg_pnl": 0.0,
+        }
+        assert by_signal["bearish_bos"]["breakevens"] == 1
+        by_symbol = await service.aggregate_by_symbol(timeframe="4H")
+        assert {k: v["count"] for k, v in by_symbol.items()} == {"EURUSD": 2, "GBPUSD": 2}
+        by_tf = await service.aggregate_by_timeframe(symbol="EURUSD")
+        assert by_tf["1H"]["breakevens"] == 1 and by_tf["4H"]["total_pnl"] == 60.0
+
+        assert all("GROUP BY" in sql for sql in statements)
+        assert not any("entry_price" in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_scalar_metrics_and_last_n_window(self, seeded_stats):
+        service, _ = seeded_stats
+        assert await service.get_win_rate() == pytest.approx(2 / 5)
+        assert await service.get_avg_pnl(symbol="GBPUSD") == pytest.approx(10.0)
+        # the two most recently closed trades are both GBPUSD
+        assert await service.get_win_rate(last_n_trades=2) == pytest.approx(0.5)
+        assert (await service.aggregate_by_symbol(last_n_trades=2)).keys() == {"GBPUSD"}
+        assert await service.get_win_rate(symbol="USDJPY") is None
+        assert await service.aggregate_by_signal_type(symbol="USDJPY") is None
+
+    @pytest.mark.asyncio
+    async def test_session_metrics(self, seeded_stats):
+        service, _ = seeded_stats
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        metrics = await service.get_session_metrics(start, start + timedelta(days=1))
+        assert metrics["count"] == 5 and metrics["breakevens"] == 1
+        assert metrics["max_loss"] == -60.0 and metrics["max_win"] == 100.0
+        assert await service.get_session_metrics(start - timedelta(days=2), start - timedelta(days=1)) is None
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from reasoner_service import storage as st
+from reasoner_service.outcome_analytics_service import OutcomeAnalyticsService
+
+BASE = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def db():
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    # 25 outcomes; pairs share a closed_at so ties are broken by id
+    for i in range(25):
+        await st.insert_decision_outcome(
+            sessionmaker, decision_id=f"d{i}", symbol="EURUSD" if i % 5 else "GBPUSD", timeframe="4H",
+            signal_type="bullish_choch", entry_price=1.0, exit_price=1.0, pnl=float(i - 12),
+            outcome="win" if i > 12 else "loss" if i < 12 else "breakeven", exit_reason="tp",
+            closed_at=BASE + timedelta(hours=i // 2),
+        )
+    yield engine, sessionmaker
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batches_cover_every_row_once_in_keyset_order(db):
+    engine, sessionmaker = db
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, params, ctx, many: statements.append(sql))
+
+    batches = [b async for b in st.iter_outcome_batches(sessionmaker, columns=["pnl"], batch_size=4)]
+    assert [len(b) for b in batches] == [4] * 6 + [1]
+    rows = [row for batch in batches for row in batch]
+    assert sorted(r.pnl for r in rows) == [float(i - 12) for i in range(25)]
+    keys = [(r.closed_at, r.id) for r in rows]
+    assert keys == sorted(keys) and len(set(keys)) == 25
+    # one bounded query per page; later pages seek past the last key instead of skipping rows
+    assert len(statements) == 7
+    assert all("LIMIT" in sql for sql in statements)
+    assert all("decision_outcomes.closed_at >" in sql for sql in statements[1:])
+
+    newest = [r async for r in st.iter_outcomes(sessionmaker, descending=True, batch_size=10)]
+    assert [(r.closed_at, r.id) for r in newest] == keys[::-1]
+
+
+@pytest.mark.asyncio
+async def test_filters_and_columnar_batches(db):
+    _, sessionmaker = db
+    batches = [
+        b async for b in st.iter_outcome_batches(
+            sessionmaker, columns=["symbol", "pnl"], symbol="GBPUSD",
+            since=BASE + timedelta(hours=1), batch_size=2, columnar=True,
+        )
+    ]
+    assert [set(b) for b in batches] == [{"symbol", "pnl", "closed_at", "id"}] * 2
+    assert [b["pnl"] for b in batches] == [[-7.0, -2.0], [3.0, 8.0]]
+
+
+@pytest.mark.asyncio
+async def test_analysis_outcomes_stream_with_same_shape(db):
+    _, sessionmaker = db
+    service = OutcomeAnalyticsService(sessionmaker)
+
+    outcomes = await service.get_outcomes_for_analysis(symbol="EURUSD")
+    assert len(outcomes) == 20
+    assert set(outcomes[0]) == {"id", "symbol", "signal_type", "timeframe", "pnl", "outcome", "exit_reason", "closed_at"}
+    assert [o["closed_at"] for o in outcomes] == sorted(o["closed_at"] for o in outcomes)
+
+    sizes = [len(b) async for b in service.iter_outcomes_for_analysis(batch_size=10)]
+    assert sizes == [10, 10, 5]
@@ -0,0 +1,104 @@
+import json
+import time
+import pytest
+
+from reasoner_service.persist_dlq import PersistDLQ
+
+
+def _entry(symbol, next_ts):
+    return {"decision": {"symbol": symbol}, "error": "x", "ts": int(time.time() * 1000), "attempts": 0, "next_attempt_ts": next_ts}
+
+
+def test_pop_due_returns_only_due_entries_in_order():
+    dlq = PersistDLQ(max_entries=100)
+    dlq.append(_entry("C", 30.0))
+    dlq.append(_entry("A", 10.0))
+    dlq.append(_entry("B", 20.0))
+    dlq.append(_entry("Z", 0.0))
+
+    due = dlq.pop_due(now=20.0)
+
+    assert [e["decision"]["symbol"] for e in due] == ["Z", "A", "B"]
+    assert len(dlq) == 1
+    assert dlq.next_due_ts() == 30.0
+
+
+def test_pop_due_respects_limit():
+    dlq = PersistDLQ(max_entries=100)
+    for i in range(10):
+        dlq.append(_entry(f"S{i}", 0.0))
+    assert len(dlq.pop_due(now=1.0, limit=4)) == 4
+    assert len(dlq) == 6
+
+
+def test_list_compatible_surface():
+    dlq = PersistDLQ()
+    assert dlq == []
+    assert not dlq
+    e = _entry("A", 0.0)
+    dlq.append(e)
+    assert len(dlq) == 1
+    assert any(x["decision"]["symbol"] == "A" for x in dlq)
+    dlq.remove(e)
+    assert dlq == []
+    with pytest.raises(ValueError):
+        dlq.remove(e)
+    dlq.extend([_entry("A", 0.0), _entry("B", 0.0)])
+    assert len(dlq.peek(1)) == 1
+    dlq.clear()
+    assert len(dlq) == 0
+
+
+def test_overflow_spills_to_file(tmp_path):
+    spill = tmp_path / "spill.jsonl"
+    dlq = PersistDLQ(max_entries=2, spill_path=str(spill))
+    for i in range(5):
+        dlq.append(_entry(f"S{i}", 0.0))
+
+    assert len(dlq) == 2
+    assert dlq.spilled_count == 3
+    lines = [json.loads(l) for l in spill.read_text().splitlines()]
+    assert [l["decision"]["symbol"] for l in lines] == ["S2", "S3", "S4"]
+
+
+def test_overflow_without_spill_path_drops():
+    dlq = PersistDLQ(max_entries=1, spill_path=None)
+    dlq.append(_entry("A", 0.0))
+    dlq.append(_entry("B", 0.0))
+    assert len(dlq) == 1
+    assert dlq.spilled_count == 1
+
+
+def test_spill_is_replayed_on_startup_and_when_drained(tmp_path):
+    spill = tmp_path / "dlq" / "spill.jsonl"
+    dlq = PersistDLQ(max_entries=2, spill_path=str(spill))
+    for i in range(5):
+        dlq.append(_entry(f"S{i}", 0.0))
+    assert dlq.spill_pending
+
+    # a restarted process picks the overflow up, as much as fits
+    restarted = PersistDLQ(max_entries=2, spill_path=str(spill))
+    assert restarted.spill_pending
+    assert restarted.replay_spill() == 2
+    assert [e["decision"]["symbol"] for e in restarted.pop_due(1.0)] == ["S2", "S3"]
+    assert restarted.spill_pending and len(spill.read_text().splitlines()) == 1
+
+    assert restarted.replay_spill() == 1
+    assert [e["decision"]["symbol"] for e in restarted] == ["S4"]
+    assert not restarted.spill_pending and not spill.exists()
+    assert restarted.replay_spill() == 0
+
+
+def test_orchestrator_spills_to_configured_dir_and_replays(tmp_path, monkeypatch):
+    from reasoner_service.config import get_settings
+    from reasoner_service.orchestrator import DecisionOrchestrator
+
+    monkeypatch.setattr(get_settings(), "DLQ_SPILL_PATH", "", raising=False)
+    monkeypatch.setattr(get_settings(), "DLQ_SPILL_DIR", str(tmp_path), raising=False)
+    spill = tmp_path / "persist_dlq.jsonl"
+    spill.write_text(json.dumps(_entry("OLD", 0.0)) + "\n")
+
+    orch = DecisionOrchestrator()
+    assert orch._persist_dlq.spill_path == str(spill)
+    assert [e["decision"]["symbol"] for e in orch._persist_dlq] == ["OLD"]
+    assert not spill.exists()
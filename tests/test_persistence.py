@@ -28,3 +28,24 @@ async def test_persistence_dlq_on_failure():
         res = await orch.process_decision({"symbol": "TST", "recommendation": "enter", "confidence": 0.9, "timestamp_ms": 1})
         # After failure, in-memory DLQ should have one entry
         assert len(orch._persist_dlq) >= 1
+
+
+@pytest.mark.asyncio
+async def test_process_decision_persists_to_real_db():
+    # insert_decision receives ts_ms, which is not a Decision column; it must be
+    # ignored rather than fail every insert and send the decision to the DLQ
+    from reasoner_service import storage as st
+
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    orch = DecisionOrchestrator()
+    orch._sessionmaker = sessionmaker
+    try:
+        await orch.process_decision({"symbol": "TST", "recommendation": "enter", "confidence": 0.9, "timestamp_ms": 1})
+        assert len(orch._persist_dlq) == 0
+        [row] = await st.get_recent_decisions(sessionmaker, limit=5)
+        assert row["symbol"] == "TST"
+        dec_id = await st.insert_decision(sessionmaker, symbol="TS2", raw={"a": 1}, ts_ms=1)
+        assert (await st.get_decision_by_id(sessionmaker, dec_id))["symbol"] == "TS2"
+    finally:
+        await engine.dispose()
@@ -0,0 +1,239 @@
+import asyncio
+import json
+
+import pytest
+
+from reasoner_service.orchestrator import DecisionOrchestrator, PolicyStore
+from reasoner_service.policy_backends import DefaultPolicyBackend, PolicyBackend, RedisPolicyBackend
+from reasoner_service.policy_cache import PolicyCache
+
+
+class CountingBackend(PolicyBackend):
+    def __init__(self, result, cache_ttl=30.0, negative_cache_ttl=None, delay=0.0):
+        self.result = result
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self.delay = delay
+        self.calls = 0
+
+    async def get_policy(self, policy_name, context):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return dict(self.result)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+@pytest.mark.asyncio
+async def test_store_caches_opted_in_backends_by_normalized_context():
+    remote = CountingBackend({"active": True})
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[remote])
+
+    assert await store.get_policy("killzone", {"symbol": "EURUSD", "tf": "m5"}) == {"active": True}
+    # key order does not matter
+    assert await store.get_policy("killzone", {"tf": "m5", "symbol": "EURUSD"}) == {"active": True}
+    assert remote.calls == 1
+    await store.get_policy("killzone", {"symbol": "GBPUSD"})
+    await store.get_policy("regime", {"symbol": "EURUSD", "tf": "m5"})
+    assert remote.calls == 3
+
+    store.invalidate("killzone")
+    await store.get_policy("killzone", {"symbol": "EURUSD", "tf": "m5"})
+    assert remote.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_local_backends_are_not_cached():
+    local = CountingBackend({"active": True}, cache_ttl=0)
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[local, DefaultPolicyBackend()])
+    await store.get_policy("killzone", {})
+    await store.get_policy("killzone", {})
+    assert local.calls == 2
+    assert len(store.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_misses_are_negatively_cached_and_fall_through():
+    remote = CountingBackend({}, negative_cache_ttl=60.0)
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[remote, DefaultPolicyBackend()])
+    assert await store.get_policy("killzone", {"killzone": True}) == {"active": True}
+    assert await store.get_policy("killzone", {"killzone": True}) == {"active": True}
+    assert remote.calls == 1
+
+    remote.negative_cache_ttl = 0
+    store.invalidate()
+    await store.get_policy("killzone", {"killzone": True})
+    await store.get_policy("killzone", {"killzone": True})
+    assert remote.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch():
+    remote = CountingBackend({"min_confidence": 0.7}, delay=0.01)
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[remote])
+    results = await asyncio.gather(*(store.get_policy("confidence_threshold", {"symbol": "X"}) for _ in range(10)))
+    assert all(r == {"min_confidence": 0.7} for r in results)
+    assert remote.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_reach_every_waiter_and_are_not_cached():
+    cache = PolicyCache()
+    calls = 0
+
+    async def boom():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    key = (0, "killzone", "")
+    results = await asyncio.gather(*(cache.get_or_fetch(key, boom, 30, 5) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert calls == 1
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(key, boom, 30, 5)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_policy_writes_invalidate_store_cache():
+    backend = RedisPolicyBackend("redis://unused", cache_ttl=300)
+    backend._redis = FakeRedis()
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[backend])
+    ctx = {"symbol": "EURUSD"}
+
+    await backend.set_policy("regime", ctx, {"regime": "normal"})
+    assert await store.get_policy("regime", ctx) == {"regime": "normal"}
+    await backend.set_policy("regime", ctx, {"regime": "restricted"})
+    assert await store.get_policy("regime", ctx) == {"regime": "restricted"}
+    assert backend._redis.published[-1] == (
+        "policy:invalidate",
+        {
+            "policy": "regime",
+            "context_key": backend.cache_key("regime", ctx),
+            "context_hash": backend.context_hash("regime", ctx),
+        },
+    )
+
+    await backend.delete_policy("regime", ctx)
+    assert await store.get_policy("regime", ctx) == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    cache = PolicyCache()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.02)
+        return {"active": True}
+
+    key = (0, "killzone", "")
+    leader = asyncio.ensure_future(cache.get_or_fetch(key, slow, 30, 5))
+    await started.wait()
+    follower = asyncio.ensure_future(cache.get_or_fetch(key, slow, 30, 5))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == {"active": True}
+    assert leader.cancelled()
+    # the shared fetch still completed and was cached
+    assert cache._lookup(key) == {"active": True}
+
+
+def test_default_cache_key_ignores_per_decision_fields():
+    backend = CountingBackend({})
+    a = {"id": "d1", "ts": 1, "symbol": "EURUSD", "timeframe": "4H", "signal_type": "bullish_choch"}
+    b = dict(a, id="d2", ts=2)
+    assert backend.cache_key("killzone", a) == backend.cache_key("killzone", b)
+    assert backend.cache_key("killzone", a) != backend.cache_key("killzone", dict(a, symbol="GBPUSD"))
+
+
+@pytest.mark.asyncio
+async def test_default_cache_key_separates_policy_inputs():
+    remote = CountingBackend({"allowed": True})
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[remote])
+    ctx = {"symbol": "EURUSD", "exposure": 1.0, "max_exposure": 5.0, "confidence": 0.6}
+    await store.get_policy("exposure", ctx)
+    # decisions that differ only in an input the policy reads never share an answer
+    for field, value in (("exposure", 6.0), ("max_exposure", 0.5), ("confidence", 0.2), ("cooldown_until", 99)):
+        await store.get_policy("exposure", dict(ctx, **{field: value}))
+    assert remote.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_fetch_is_not_overwritten():
+    cache = PolicyCache()
+    started, release = asyncio.Event(), asyncio.Event()
+    values = iter([{"regime": "normal"}, {"regime": "restricted"}])
+
+    async def fetch():
+        started.set()
+        await release.wait()
+        return next(values)
+
+    key = (0, "regime", "")
+    first = asyncio.ensure_future(cache.get_or_fetch(key, fetch, 30, 5))
+    await started.wait()
+    # the policy changes while the old value is still being fetched
+    cache.invalidate("regime")
+    release.set()
+    assert await first == {"regime": "normal"}
+    assert len(cache) == 0
+    assert await cache.get_or_fetch(key, fetch, 30, 5) == {"regime": "restricted"}
+
+
+@pytest.mark.asyncio
+async def test_store_starts_and_stops_invalidation_listeners():
+    remote = CountingBackend({"active": True})
+    started, stopped = asyncio.Event(), asyncio.Event()
+
+    async def listen_invalidations():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            stopped.set()
+
+    remote.listen_invalidations = listen_invalidations
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[remote])
+    await store.get_policy("killzone", {"symbol": "EURUSD"})
+    await asyncio.wait_for(started.wait(), 1)
+    await store.get_policy("killzone", {"symbol": "EURUSD"})
+    assert len(store._listen_tasks) == 1
+    await store.close()
+    assert stopped.is_set()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_store_key_ignores_per_decision_fields():
+    backend = RedisPolicyBackend("redis://unused", cache_ttl=300)
+    backend._redis = FakeRedis()
+    store = PolicyStore(DecisionOrchestrator(dsn=None), backends=[backend])
+    ctx = {"symbol": "EURUSD", "decision_id": "d1", "timestamp_ms": 1}
+    await backend.set_policy("regime", ctx, {"regime": "normal"})
+
+    assert backend.cache_key("regime", ctx) == backend.cache_key("regime", dict(ctx, decision_id="d2", timestamp_ms=2))
+    assert backend.context_hash("regime", ctx) != backend.context_hash("regime", dict(ctx, decision_id="d2"))
+    assert await store.get_policy("regime", ctx) == {"regime": "normal"}
+    backend._redis.data.clear()
+    # a later decision for the same symbol is served from the store cache
+    assert await store.get_policy("regime", dict(ctx, decision_id="d2", timestamp_ms=2)) == {"regime": "normal"}
@@ -98,3 +98,166 @@ async def test_redis_dlq_failure_pushback(monkeypatch):
     # list length should be 1
 
     assert len(fake._list) == 1
+
+
+class FakePipelineRedis:
+    """Fake redis list with MULTI/EXEC pipeline support for batch DLQ draining."""
+
+    def __init__(self):
+        self._list = []
+        self.execute_calls = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def close(self):
+        pass
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    def lrange(self, key, start, end):
+        self._ops.append(lambda lst: lst[start:end + 1])
+
+    def ltrim(self, key, start, end):
+        def _op(lst):
+            del lst[:start]
+            return True
+        self._ops.append(_op)
+
+    def llen(self, key):
+        self._ops.append(lambda lst: len(lst))
+
+    def rpush(self, key, *values):
+        def _op(lst):
+            lst.extend(values)
+            return len(lst)
+        self._ops.append(_op)
+
+    async def execute(self):
+        self._client.execute_calls += 1
+        return [op(self._client._list) for op in self._ops]
+
+
+def _batch_settings():
+    from reasoner_service.config import get_settings
+    s = get_settings()
+    s.REDIS_DLQ_ENABLED = True
+    s.REDIS_URL = "redis://unused"
+    s.REDIS_DLQ_KEY = "dlq:test"
+    s.DLQ_BATCH_SIZE = 100
+    s.DLQ_MAX_RETRIES = 5
+    return s
+
+
+@pytest.mark.asyncio
+async def test_redis_dlq_batch_drain_uses_bulk_insert(monkeypatch):
+    _batch_settings()
+    orch = DecisionOrchestrator(dsn=None)
+    fake = FakePipelineRedis()
+    orch._redis = fake
+    fake._list = [json.dumps({"decision": {"symbol": f"S{i}", "confidence": 0.5}, "attempts": 0, "next_attempt_ts": 0}) for i in range(250)]
+
+    bulk_calls = []
+
+    async def fake_bulk(session_arg, rows):
+        bulk_calls.append(len(rows))
+        return [f"id-{i}" for i in range(len(rows))]
+
+    async def single_insert(session_arg, **kwargs):
+        raise AssertionError("single insert should not be used for a batch")
+
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decisions_bulk", fake_bulk)
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decision", single_insert)
+
+    drained = await orch._dlq_retry_once()
+
+    assert drained == 100
+    assert bulk_calls == [100]
+    # a single pipeline round-trip for pop; nothing to push back
+    assert fake.execute_calls == 1
+    assert len(fake._list) == 150
+
+
+@pytest.mark.asyncio
+async def test_redis_dlq_batch_failures_requeued_in_one_pipeline(monkeypatch):
+    _batch_settings()
+    orch = DecisionOrchestrator(dsn=None)
+    fake = FakePipelineRedis()
+    orch._redis = fake
+    future = time.time() + 3600
+    fake._list = [json.dumps({"decision": {"symbol": f"S{i}"}, "attempts": 0, "next_attempt_ts": 0}) for i in range(3)]
+    fake._list.append(json.dumps({"decision": {"symbol": "LATER"}, "attempts": 1, "next_attempt_ts": future}))
+
+    async def failing_bulk(session_arg, rows):
+        raise Exception("db down")
+
+    single_calls = {"n": 0}
+
+    async def failing_insert(session_arg, **kwargs):
+        single_calls["n"] += 1
+        raise Exception("db down")
+
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decisions_bulk", failing_bulk)
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decision", failing_insert)
+
+    drained = await orch._dlq_retry_once()
+
+    # LATER was only rotated back, not processed
+    assert drained == 3
+    assert single_calls["n"] == 3
+    # pop + one push-back pipeline
+    assert fake.execute_calls == 2
+    requeued = [json.loads(v) for v in fake._list]
+    assert len(requeued) == 4
+    later = [e for e in requeued if e["decision"]["symbol"] == "LATER"][0]
+    assert later["attempts"] == 1 and later["next_attempt_ts"] == future
+    failed = [e for e in requeued if e["decision"]["symbol"] != "LATER"]
+    assert all(e["attempts"] == 1 and e["error"] == "db down" for e in failed)
+
+
+@pytest.mark.asyncio
+async def test_redis_dlq_backed_off_backlog_does_not_spin(monkeypatch):
+    _batch_settings()
+    orch = DecisionOrchestrator(dsn=None)
+    fake = FakePipelineRedis()
+    orch._redis = fake
+    future = time.time() + 3600
+    fake._list = [json.dumps({"decision": {"symbol": f"S{i}"}, "attempts": 1, "next_attempt_ts": future}) for i in range(150)]
+
+    async def unexpected_bulk(session_arg, rows):
+        raise AssertionError("nothing is due")
+
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decisions_bulk", unexpected_bulk)
+
+    # a full batch of not-due entries reports no progress, so the loop sleeps its poll interval
+    assert await orch._dlq_retry_once() == 0
+    assert len(fake._list) == 150
+
+
+@pytest.mark.asyncio
+async def test_redis_dlq_batch_pushed_back_when_persist_is_cancelled(monkeypatch):
+    _batch_settings()
+    orch = DecisionOrchestrator(dsn=None)
+    fake = FakePipelineRedis()
+    orch._redis = fake
+    fake._list = [json.dumps({"decision": {"symbol": f"S{i}"}, "attempts": 0, "next_attempt_ts": 0}) for i in range(5)]
+    started = asyncio.Event()
+
+    async def hanging_bulk(session_arg, rows):
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr("reasoner_service.orchestrator.insert_decisions_bulk", hanging_bulk)
+
+    task = asyncio.ensure_future(orch._dlq_retry_once())
+    await started.wait()
+    assert fake._list == []
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # shutdown mid-persist keeps the whole batch in Redis
+    assert sorted(json.loads(v)["decision"]["symbol"] for v in fake._list) == [f"S{i}" for i in range(5)]
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from reasoner_service import storage as st
+from reasoner_service.retention import archive_old_rows, iter_archived_rows
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _ago(days):
+    return (NOW - timedelta(days=days)).replace(tzinfo=None)
+
+
+@pytest.fixture
+async def db():
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    yield sessionmaker
+    await engine.dispose()
+
+
+async def _seed(sessionmaker):
+    # d-old-1/2 in March, d-old-3 in April, d-new recent; d-old-2 has an outcome
+    for id_, days in (("d-old-1", 100), ("d-old-2", 95), ("d-old-3", 70), ("d-new", 5)):
+        await st.insert_decision(sessionmaker, id=id_, symbol="EURUSD", decision_text=f"text {id_}",
+                                 raw={"id": id_}, created_at=_ago(days))
+    await st.insert_decision_outcome(
+        sessionmaker, decision_id="d-old-2", symbol="EURUSD", timeframe="4H", signal_type="bullish_choch",
+        entry_price=1.0, exit_price=1.1, pnl=10.0, outcome="win", exit_reason="tp", closed_at=NOW,
+    )
+    async with sessionmaker() as session:
+        session.add_all([
+            st.NotificationLog(id="n-old", decision_id="d-old-1", channel="slack", status="ok", created_at=_ago(100)),
+            st.NotificationLog(id="n-new", decision_id="d-new", channel="slack", status="ok", created_at=_ago(5)),
+        ])
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_old_rows_move_to_monthly_archives(db, tmp_path):
+    sessionmaker = db
+    await _seed(sessionmaker)
+
+    counts = await archive_old_rows(sessionmaker, str(tmp_path), retention_days=30, now=NOW, batch_size=2)
+    assert counts["notification_logs"] == {"archived": 1, "deleted": 1, "stubbed": 0}
+    assert counts["decisions"] == {"archived": 3, "deleted": 2, "stubbed": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "decisions-2025-03.jsonl.gz", "decisions-2025-04.jsonl.gz", "notification_logs-2025-03.jsonl.gz",
+    ]
+
+    async with sessionmaker() as session:
+        left = {d.id: d for d in (await session.execute(select(st.Decision))).scalars()}
+        logs = (await session.execute(select(st.NotificationLog.id))).scalars().all()
+    # the decision an outcome points at keeps its row, minus the payload
+    assert set(left) == {"d-old-2", "d-new"}
+    assert left["d-old-2"].decision_text is None and left["d-old-2"].raw is None
+    assert left["d-new"].raw == {"id": "d-new"}
+    assert logs == ["n-new"]
+
+    archived = list(iter_archived_rows(str(tmp_path)))
+    assert [r["id"] for r in archived] == ["d-old-1", "d-old-2", "d-old-3"]
+    assert archived[1]["raw"] == {"id": "d-old-2"} and archived[1]["decision_text"] == "text d-old-2"
+    assert archived[0]["created_at"] == _ago(100)
+    assert [r["id"] for r in iter_archived_rows(str(tmp_path), since=datetime(2025, 4, 1))] == ["d-old-3"]
+    assert [r["id"] for r in iter_archived_rows(str(tmp_path), "notification_logs")] == ["n-old"]
+
+
+@pytest.mark.asyncio
+async def test_rerun_is_idempotent(db, tmp_path):
+    sessionmaker = db
+    await _seed(sessionmaker)
+    await archive_old_rows(sessionmaker, str(tmp_path), retention_days=30, now=NOW)
+
+    counts = await archive_old_rows(sessionmaker, str(tmp_path), retention_days=30, now=NOW)
+    assert counts["decisions"]["archived"] == 0 and counts["notification_logs"]["archived"] == 0
+    assert len(list(iter_archived_rows(str(tmp_path)))) == 3
+
+    with pytest.raises(ValueError):
+        await archive_old_rows(sessionmaker, str(tmp_path), retention_days=0)
@@ -0,0 +1,84 @@
+import json
+import os
+from datetime import datetime
+
+from reasoner_service.config import get_settings
+from reasoner_service.orchestrator import DecisionOrchestrator
+from reasoner_service.routing_table import RoutingTable
+
+
+RULES = {
+    "EURUSD": ["slack"],
+    "fx|major": ["discord"],
+    "fx|asia": ["telegram"],
+    "BTC*": ["telegram"],
+}
+
+
+def test_rule_precedence_matches_legacy_resolution():
+    table = RoutingTable(rules=RULES)
+    assert table.resolve({"symbol": "EURUSD", "tags": ["fx", "major"]}) == ["slack"]
+    assert table.resolve({"symbol": "GBPUSD", "tags": ["fx", "major", "asia"]}) == ["discord", "telegram"]
+    assert table.resolve({"symbol": "BTCUSD"}) == ["telegram"]
+    assert table.resolve({"symbol": "XAUUSD"}) == ["slack", "discord", "telegram"]
+
+
+def test_override_windows_are_precomputed_and_wrap_midnight():
+    table = RoutingTable(
+        rules=RULES,
+        overrides=[
+            {"symbol": "EURUSD", "start": "22:00", "end": "06:00", "channels": ["telegram"]},
+            {"symbol": "EURUSD", "start": "bad", "end": "06:00", "channels": ["discord"]},
+        ],
+    )
+    assert table.resolve({"symbol": "EURUSD"}, now=datetime(2024, 1, 1, 23, 30)) == ["telegram"]
+    assert table.resolve({"symbol": "EURUSD"}, now=datetime(2024, 1, 1, 6, 0)) == ["telegram"]
+    assert table.resolve({"symbol": "EURUSD"}, now=datetime(2024, 1, 1, 12, 0)) == ["slack"]
+
+
+def test_decision_table_indexes_recommendation_symbol_and_confidence_band():
+    table = RoutingTable(
+        rules=RULES,
+        table=[
+            {"recommendation": "enter", "symbol": "*", "min_confidence": 0.8, "channels": ["slack", "telegram"]},
+            {"recommendation": "enter", "symbol": "*", "min_confidence": 0.0, "max_confidence": 0.5, "channels": ["discord"]},
+            {"recommendation": "enter", "symbol": "XAUUSD", "min_confidence": 0.0, "channels": ["telegram"]},
+        ],
+    )
+    assert table.resolve({"symbol": "GBPUSD", "recommendation": "enter", "confidence": 0.9}) == ["slack", "telegram"]
+    assert table.resolve({"symbol": "GBPUSD", "recommendation": "enter", "confidence": 0.3}) == ["discord"]
+    # no band covers 0.6: fall through to the legacy rules
+    assert table.resolve({"symbol": "EURUSD", "recommendation": "enter", "confidence": 0.6}) == ["slack"]
+    # symbol-specific entries win over "*"
+    assert table.resolve({"symbol": "XAUUSD", "recommendation": "enter", "confidence": 0.9}) == ["telegram"]
+    assert table.resolve({"symbol": "GBPUSD", "recommendation": "do_nothing", "confidence": 0.9}) == ["slack", "discord", "telegram"]
+
+
+def test_assigning_rules_recompiles_orchestrator_table():
+    orch = DecisionOrchestrator(dsn=None)
+    assert orch._get_routing_for_decision({"symbol": "EURUSD"}) == ["slack", "discord", "telegram"]
+    orch._routing_rules = {"EURUSD": ["slack"]}
+    assert orch._get_routing_for_decision({"symbol": "EURUSD"}) == ["slack"]
+
+
+def test_routing_file_hot_reload(tmp_path):
+    path = tmp_path / "routing.json"
+    path.write_text(json.dumps({"rules": {"EURUSD": ["slack"]}}))
+    s = get_settings()
+    old_path, old_interval = s.ROUTING_CONFIG_PATH, s.ROUTING_RELOAD_INTERVAL_SECONDS
+    s.ROUTING_CONFIG_PATH, s.ROUTING_RELOAD_INTERVAL_SECONDS = str(path), 0
+    try:
+        orch = DecisionOrchestrator(dsn=None)
+        assert orch._get_routing_for_decision({"symbol": "EURUSD"}) == ["slack"]
+
+        path.write_text(json.dumps({"rules": {"EURUSD": ["discord"]}}))
+        st = os.stat(path)
+        os.utime(path, (st.st_atime, st.st_mtime + 10))
+        assert orch._get_routing_for_decision({"symbol": "EURUSD"}) == ["discord"]
+
+        # a broken file keeps the last good table
+        path.write_text("{not json")
+        os.utime(path, (st.st_atime, st.st_mtime + 20))
+        assert orch._get_routing_for_decision({"symbol": "EURUSD"}) == ["discord"]
+    finally:
+        s.ROUTING_CONFIG_PATH, s.ROUTING_RELOAD_INTERVAL_SECONDS = old_path, old_interval
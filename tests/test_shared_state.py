@@ -0,0 +1,122 @@
+import asyncio
+import time
+import pytest
+
+from reasoner_service.config import get_settings
+from reasoner_service.orchestrator import DecisionOrchestrator
+from reasoner_service.orchestrator_events import Event
+from reasoner_service.shared_state import InMemorySharedState
+
+
+@pytest.mark.asyncio
+async def test_in_memory_record_event_mirrors_cooldown_tracker():
+    backend = InMemorySharedState()
+    until, count = await backend.record_event("decision", cooldown_ms=1000, now_ms=10_000)
+    assert (until, count) == (11_000, 0)
+    # inside the window: counter grows, deadline unchanged
+    until, count = await backend.record_event("decision", cooldown_ms=1000, now_ms=10_500)
+    assert (until, count) == (11_000, 1)
+    # window expired: a new one starts
+    until, count = await backend.record_event("decision", cooldown_ms=1000, now_ms=11_000)
+    assert (until, count) == (12_000, 0)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_dedup_counters_and_audit():
+    backend = InMemorySharedState()
+    assert await backend.check_and_set_dedup("k", 60) is True
+    assert await backend.check_and_set_dedup("k", 60) is False
+    await backend.incr_counter("c", "veto")
+    await backend.incr_counter("c", "veto", 2)
+    assert await backend.get_counters("c") == {"veto": 3}
+    for i in range(5):
+        await backend.append_audit("a", {"i": i}, max_len=3)
+    assert [e["i"] for e in await backend.read_audit("a")] == [4, 3, 2]
+    assert [e["i"] for e in await backend.read_audit("a", limit=1)] == [4]
+    assert await backend.extend_cooldown("g", 100) == 100
+    assert await backend.extend_cooldown("g", 50) == 100
+
+
+@pytest.mark.asyncio
+async def test_cooldown_shared_between_replicas(shared):
+    a = DecisionOrchestrator(shared_state=shared)
+    b = DecisionOrchestrator(shared_state=shared)
+    for orch in (a, b):
+        await orch.configure_cooldown("decision", 60_000)
+
+    await a.orchestration_state.cooldown_manager.record_event("decision")
+
+    is_cooling, next_available = await b.orchestration_state.cooldown_manager.check_cooldown("decision")
+    assert is_cooling is True
+    assert next_available > int(time.time() * 1000)
+
+
+@pytest.mark.asyncio
+async def test_global_cooldown_shared_between_replicas(shared):
+    a = DecisionOrchestrator(shared_state=shared)
+    b = DecisionOrchestrator(shared_state=shared)
+    until = int(time.time() * 1000) + 60_000
+    await a.set_global_cooldown(until)
+
+    result = await b.handle_event(Event("decision", {"symbol": "EURUSD"}, None, "corr-1"))
+
+    assert result.status == "deferred"
+    assert result.reason == "global_cooldown_active"
+    assert result.metadata["next_attempt_ts"] == until
+
+
+@pytest.mark.asyncio
+async def test_dedup_shared_between_replicas(shared, monkeypatch):
+    from reasoner_service.config import get_settings
+    s = get_settings()
+    monkeypatch.setattr(s, "DEDUP_ENABLED", True, raising=False)
+    monkeypatch.setattr(s, "REDIS_DEDUP_ENABLED", False, raising=False)
+    a = DecisionOrchestrator(shared_state=shared)
+    b = DecisionOrchestrator(shared_state=shared)
+    decision = {"symbol": "EURUSD", "recommendation": "enter", "confidence": 0.9, "signal_id": "sig-1"}
+
+    first = await a.process_decision(dict(decision), persist=False)
+    second = await b.process_decision(dict(decision), persist=False)
+
+    assert first["skipped"] is False
+    assert second["skipped"] is True
+
+
+@pytest.mark.asyncio
+async def test_policy_counters_aggregate_across_replicas(shared):
+    a = DecisionOrchestrator(shared_state=shared)
+    b = DecisionOrchestrator(shared_state=shared)
+    await a._bump_policy_counter("veto")
+    await b._bump_policy_counter("veto")
+    await b._bump_policy_counter("pass")
+    # b's increments reach shared state with its next batch
+    await b._flush_policy_counters()
+
+    assert a._policy_counters["veto"] == 1
+    assert await a.get_policy_counters() == {"pass": 1, "veto": 2, "defer": 0}
+
+
+@pytest.mark.asyncio
+async def test_policy_counter_bumps_do_not_wait_on_shared_state(shared, monkeypatch):
+    monkeypatch.setattr(get_settings(), "POLICY_COUNTER_FLUSH_SECONDS", 0.01, raising=False)
+    calls = []
+    gate = asyncio.Event()
+    real_incr = shared.incr_counter
+
+    async def slow_incr(name, field, amount=1):
+        calls.append((field, amount))
+        await gate.wait()
+        return await real_incr(name, field, amount)
+
+    shared.incr_counter = slow_incr
+    orch = DecisionOrchestrator(shared_state=shared)
+    for _ in range(3):
+        await asyncio.wait_for(orch._bump_policy_counter("veto"), 0.1)
+    await orch._bump_policy_counter("pass")
+    await asyncio.sleep(0.05)
+    # one batched increment per counter, not one round trip per bump
+    assert calls == [("veto", 3)]
+    gate.set()
+    await asyncio.sleep(0.01)
+    assert calls == [("veto", 3), ("pass", 1)]
+    assert await shared.get_counters("policy_counters") == {"veto": 3, "pass": 1}
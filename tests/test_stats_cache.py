@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from reasoner_service import storage as st
+from reasoner_service.outcome_policy_evaluator import (
+    AvgPnLThresholdRule,
+    LossStreakRule,
+    OutcomePolicyEvaluator,
+    SymbolDrawdownRule,
+    WinRateThresholdRule,
+)
+from reasoner_service.outcome_stats import OutcomeStatsService
+from reasoner_service.stats_cache import StatsCache, request_scope
+
+BASE = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+async def _insert(sessionmaker, i, symbol="EURUSD", outcome="loss", pnl=-10.0):
+    await st.insert_decision_outcome(
+        sessionmaker, decision_id=f"d-{symbol}-{i}", symbol=symbol, timeframe="4H",
+        signal_type="bullish_choch", entry_price=1.0, exit_price=1.0, pnl=pnl, outcome=outcome,
+        exit_reason="sl", closed_at=BASE + timedelta(hours=i),
+    )
+
+
+@pytest.fixture
+async def db():
+    engine, sessionmaker = await st.create_engine_and_sessionmaker("sqlite+aiosqlite:///:memory:")
+    await st.init_models(engine)
+    for i in range(6):
+        await _insert(sessionmaker, i)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, params, ctx, many: statements.append(sql))
+    yield sessionmaker, statements
+    await engine.dispose()
+
+
+def _evaluator(service):
+    evaluator = OutcomePolicyEvaluator(service)
+    # a permissive rule set so every rule runs and none vetoes early
+    for rule in (
+        WinRateThresholdRule(min_win_rate=0.0),
+        LossStreakRule(max_streak=100),
+        AvgPnLThresholdRule(min_avg_pnl=-1000.0),
+        SymbolDrawdownRule(max_drawdown=-10000.0),
+    ):
+        evaluator.add_rule(rule)
+    return evaluator
+
+
+@pytest.mark.asyncio
+async def test_rule_pass_runs_each_distinct_query_once(db):
+    sessionmaker, statements = db
+    evaluator = _evaluator(OutcomeStatsService(sessionmaker, use_rollups=False))
+
+    await evaluator.evaluate(signal_type="bullish_choch", symbol="EURUSD", timeframe="4H")
+    # win rate and avg pnl share aggregate_by_signal_type: 3 queries for 4 rules
+    assert len(statements) == 3
+
+    # the next pass is served from the TTL cache
+    statements.clear()
+    await evaluator.evaluate(signal_type="bullish_choch", symbol="EURUSD", timeframe="4H")
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_request_scope_dedupes_without_ttl(db):
+    sessionmaker, statements = db
+    service = OutcomeStatsService(sessionmaker, use_rollups=False)
+    service._cache.ttl = 0
+
+    with service.request_scope():
+        first = await service.get_win_rate(symbol="EURUSD")
+        assert await service.get_win_rate(symbol="EURUSD") == first
+    assert len(statements) == 1
+    await service.get_win_rate(symbol="EURUSD")
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_insert_invalidates_matching_entries(db):
+    sessionmaker, statements = db
+    service = OutcomeStatsService(sessionmaker, use_rollups=False)
+
+    assert await service.get_win_rate(symbol="EURUSD") == 0.0
+    assert await service.get_win_rate(symbol="GBPUSD") is None
+    await service.aggregate_by_symbol()
+    assert len(service._cache) == 2  # None is not cached
+
+    await _insert(sessionmaker, 10, outcome="win", pnl=60.0)
+    # the EURUSD entry and the unfiltered aggregate are dropped
+    assert len(service._cache) == 0
+    assert await service.get_win_rate(symbol="EURUSD") == pytest.approx(1 / 7)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_fetch():
+    cache = StatsCache(ttl=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"count": 1}
+
+    key = ("get_win_rate", "EURUSD", None, None, None)
+    results = await asyncio.gather(*(cache.get_or_fetch(key, fetch) for _ in range(5)))
+    assert calls == 1 and all(r == {"count": 1} for r in results)
+    assert (cache.hits, cache.misses) == (4, 1)
+
+    # a write landing mid-fetch keeps the stale result out of the cache
+    async def racing_fetch():
+        cache.invalidate(symbol="EURUSD")
+        return {"count": 2}
+
+    cache.invalidate()
+    with request_scope():
+        assert await cache.get_or_fetch(key, racing_fetch) == {"count": 2}
+    assert len(cache) == 0
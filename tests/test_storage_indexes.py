@@ -0,0 +1,116 @@
+"""Query-plan regression tests for the hot decision/outcome reads.
+
+Each test runs the real query helper, captures the SQL it emitted and checks
+SQLite's EXPLAIN QUERY PLAN for the expected index.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, text
+
+from reasoner_service import storage as st
+from reasoner_service.outcome_stats import OutcomeStatsService
+
+
+@pytest.fixture
+async def db(tmp_path):
+    engine, sessionmaker = await st.create_engine_and_sessionmaker(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    await st.init_models(engine)
+    yield engine, sessionmaker
+    await engine.dispose()
+
+
+async def _plans(engine, call):
+    """Run ``call`` and return the query plan of every SELECT it issued."""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in captured:
+            rows = (await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)).all()
+            plans.append(" | ".join(row[-1] for row in rows))
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_recent_decisions_walk_created_at_index(db):
+    engine, sessionmaker = db
+    [plan] = await _plans(engine, lambda: st.get_recent_decisions(sessionmaker, limit=5))
+    assert "USING INDEX ix_decisions_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_outcomes_by_signal_type_range_scan(db):
+    engine, sessionmaker = db
+    [plan] = await _plans(
+        engine, lambda: st.get_outcomes_by_signal_type(sessionmaker, "EURUSD", "bullish_choch", limit=20)
+    )
+    assert "SEARCH decision_outcomes USING INDEX ix_decision_outcomes_symbol_signal_closed" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_stats_window_is_index_only(db):
+    engine, sessionmaker = db
+    service = OutcomeStatsService(sessionmaker, use_rollups=False)
+    [plan] = await _plans(
+        engine,
+        lambda: service.get_win_rate(symbol="EURUSD", timeframe="4H", signal_type="bullish_choch", last_n_trades=20),
+    )
+    assert "USING COVERING INDEX ix_decision_outcomes_stats" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_init_models_adds_indexes_to_existing_tables(db):
+    engine, sessionmaker = db
+    await st.insert_decision(sessionmaker, id="d1", symbol="EURUSD")
+    await st.insert_decision_outcome(
+        sessionmaker, decision_id="d1", symbol="EURUSD", timeframe="4H", signal_type="bullish_choch",
+        entry_price=1.0, exit_price=1.1, pnl=10.0, outcome="win", exit_reason="tp",
+        closed_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+    )
+    new_indexes = ("ix_decisions_created_at", "ix_decision_outcomes_symbol_signal_closed", "ix_decision_outcomes_stats")
+    # a database created before the indexes were declared
+    async with engine.begin() as conn:
+        for name in new_indexes:
+            await conn.execute(text(f"DROP INDEX {name}"))
+
+    await st.init_models(engine)
+    async with engine.connect() as conn:
+        names = {row[0] for row in (await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))).all()}
+        assert set(new_indexes) <= names
+        assert (await conn.execute(text("SELECT count(*) FROM decision_outcomes"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_indexes_tolerate_concurrent_startups(db, monkeypatch):
+    engine, _ = db
+    # another replica built the index between our inspection and our CREATE
+    stale = list(st.Decision.__table__.indexes)
+    monkeypatch.setattr(st, "_missing_indexes", lambda conn: stale)
+    await st.init_models(engine)
+    monkeypatch.undo()
+    assert await st.create_missing_indexes(engine) == []
+
+
+def test_postgres_missing_indexes_are_left_to_the_offline_script(monkeypatch, caplog):
+    from types import SimpleNamespace
+
+    index = next(iter(st.Decision.__table__.indexes))
+    monkeypatch.setattr(st, "_missing_indexes", lambda conn: [index])
+    conn = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))  # no execute: nothing may run
+    with caplog.at_level("WARNING", logger=st.logger.name):
+        st._create_missing_indexes(conn)
+    assert index.name in caplog.text and "create_missing_indexes.py" in caplog.text
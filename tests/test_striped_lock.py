@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+
+from reasoner_service.striped_lock import StripedLock
+
+
+@pytest.mark.asyncio
+async def test_same_key_is_serialized():
+    lock = StripedLock("test", stripes=8)
+    active = {"n": 0, "max": 0}
+
+    async def worker():
+        async with lock.acquire(("decision", "EURUSD")):
+            active["n"] += 1
+            active["max"] = max(active["max"], active["n"])
+            await asyncio.sleep(0.01)
+            active["n"] -= 1
+
+    await asyncio.gather(*(worker() for _ in range(5)))
+    assert active["max"] == 1
+
+
+@pytest.mark.asyncio
+async def test_independent_keys_progress_concurrently():
+    lock = StripedLock("test", stripes=64)
+    keys = []
+    # pick keys that land on distinct stripes
+    for i in range(100):
+        key = ("decision", f"SYM{i}")
+        if all(lock.lock_for(key) is not lock.lock_for(k) for k in keys):
+            keys.append(key)
+        if len(keys) == 4:
+            break
+    started = asyncio.Event()
+    inside = {"n": 0}
+
+    async def worker(key):
+        async with lock.acquire(key):
+            inside["n"] += 1
+            if inside["n"] == len(keys):
+                started.set()
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    await asyncio.gather(*(worker(k) for k in keys))
+    assert inside["n"] == len(keys)
+
+
+def test_lock_for_is_stable():
+    lock = StripedLock("test", stripes=4)
+    assert lock.lock_for("a") is lock.lock_for("a")
@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from reasoner_service import tracing
+from reasoner_service.config import get_settings
+from reasoner_service.metrics import stage_latency_seconds
+from reasoner_service.orchestrator import DecisionOrchestrator
+from reasoner_service.orchestrator_events import Event
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    s = get_settings()
+    old = s.TRACE_EXPORT_PATH
+    path = tmp_path / "spans.jsonl"
+    s.TRACE_EXPORT_PATH = str(path)
+    yield path
+    s.TRACE_EXPORT_PATH = old
+    tracing._exporter = None
+    tracing._exporter_path = None
+
+
+def _read_spans(path):
+    tracing.get_trace_exporter().flush()
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def test_stage_timer_observes_histogram_without_export():
+    assert tracing.get_trace_exporter() is None
+    timer = tracing.StageTimer("unit_test")
+    timer.lap("a")
+    timer.lap("b")
+    assert timer.finish() >= 0.0
+    # second finish is a no-op
+    assert timer.finish() == 0.0
+    if hasattr(stage_latency_seconds, "collect"):
+        samples = [
+            s for m in stage_latency_seconds.collect() for s in m.samples
+            if s.name.endswith("_count") and s.labels.get("pipeline") == "unit_test"
+        ]
+        assert {s.labels["stage"] for s in samples} >= {"a", "b", "total"}
+
+
+@pytest.mark.asyncio
+async def test_process_decision_exports_stage_spans(trace_path):
+    orch = DecisionOrchestrator(dsn=None)
+    await orch.process_decision({"symbol": "EURUSD", "confidence": 0.5}, persist=False)
+
+    spans = _read_spans(trace_path)
+    roots = [s for s in spans if s["name"] == "process_decision"]
+    assert len(roots) == 1
+    stages = {s["name"] for s in spans if s["parentSpanId"] == roots[0]["spanId"]}
+    assert {
+        "process_decision.pre_policy",
+        "process_decision.normalize",
+        "process_decision.post_policy",
+        "process_decision.observers",
+        "process_decision.dedup",
+        "process_decision.persist",
+        "process_decision.routing",
+        "process_decision.notify",
+    } <= stages
+    for span in spans:
+        assert span["endTimeUnixNano"] >= span["startTimeUnixNano"]
+
+
+@pytest.mark.asyncio
+async def test_nested_process_decision_shares_handle_event_trace(trace_path):
+    orch = DecisionOrchestrator(dsn=None)
+    event = Event(event_type="decision", payload={"symbol": "EURUSD", "confidence": 0.5}, timestamp=datetime.now(timezone.utc), correlation_id="c-1")
+    await orch.handle_event(event)
+
+    spans = _read_spans(trace_path)
+    outer = next(s for s in spans if s["name"] == "handle_event")
+    inner = next(s for s in spans if s["name"] == "process_decision")
+    assert inner["traceId"] == outer["traceId"]
+    assert inner["parentSpanId"] == outer["spanId"]
+    assert "handle_event.process_decision" in {s["name"] for s in spans}
+
+
+@pytest.mark.asyncio
+async def test_process_decision_finishes_timer_when_a_stage_raises(trace_path):
+    orch = DecisionOrchestrator(dsn=None)
+
+    def boom(decision):
+        raise RuntimeError("routing broke")
+
+    orch._get_routing_for_decision = boom
+    with pytest.raises(RuntimeError):
+        await orch.process_decision({"symbol": "EURUSD", "confidence": 0.5}, persist=False)
+
+    # the root span is still exported and no longer the current trace parent
+    assert [s["name"] for s in _read_spans(trace_path) if s["name"] == "process_decision"] == ["process_decision"]
+    assert tracing._current_timer.get() is None